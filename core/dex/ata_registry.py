@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+ATA Registry - Cached Associated Token Account Existence
+Derives each wallet's associated token account addresses once, confirms their
+existence with a single batched getMultipleAccounts call and caches positive
+results until a close-account instruction or a failed swap says otherwise.
+"""
+
+import logging
+import os
+from typing import Dict, Any, Optional, List, Iterable
+
+import httpx
+from solders.pubkey import Pubkey
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PROGRAM_ID = Pubkey.from_string("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
+ASSOCIATED_TOKEN_PROGRAM_ID = Pubkey.from_string("ATokenGPvbdGVxr1b2hvZbsiqW5xAoHnb3xFLJ8YmBGS")
+
+# SPL Token instruction discriminator for CloseAccount
+CLOSE_ACCOUNT_INSTRUCTION = 9
+
+# Error fragments that indicate a token account the swap relied on is gone
+MISSING_ACCOUNT_ERRORS = (
+    "AccountNotFound",
+    "InvalidAccountData",
+    "UninitializedAccount",
+    "could not find account",
+    "account not found",
+)
+
+
+class AtaRegistry:
+    """
+    Per-wallet registry of associated token accounts.
+
+    Features:
+    - PDA derivation once per mint
+    - Batched existence checks via getMultipleAccounts
+    - Positive results cached indefinitely
+    - Invalidation on close-account instructions or failed swaps
+    """
+
+    def __init__(self, owner: Pubkey, rpc_url: Optional[str] = None, timeout: float = 10.0):
+        """
+        Initialize the registry.
+
+        Args:
+            owner: Wallet that owns the token accounts
+            rpc_url: RPC endpoint for existence checks
+            timeout: Request timeout
+        """
+        self.owner = owner
+        self.rpc_url = rpc_url or f"https://mainnet.helius-rpc.com/?api-key={os.getenv('HELIUS_API_KEY')}"
+        self.timeout = timeout
+
+        self.addresses: Dict[str, Pubkey] = {}  # mint -> ATA address
+        self.confirmed: set = set()  # mints whose ATA is known to exist
+        self.http_client: Optional[httpx.AsyncClient] = None
+
+        self.stats = {
+            'cache_hits': 0,
+            'rpc_checks': 0,
+            'accounts_checked': 0,
+            'invalidations': 0
+        }
+
+    def get_address(self, mint_address: str) -> Pubkey:
+        """Get the ATA address for a mint, deriving it on first use."""
+        ata_address = self.addresses.get(mint_address)
+        if ata_address is None:
+            ata_address, _ = Pubkey.find_program_address(
+                [bytes(self.owner), bytes(TOKEN_PROGRAM_ID), bytes(Pubkey.from_string(mint_address))],
+                ASSOCIATED_TOKEN_PROGRAM_ID
+            )
+            self.addresses[mint_address] = ata_address
+        return ata_address
+
+    async def ensure_checked(self, mint_addresses: Iterable[str]) -> Dict[str, bool]:
+        """
+        Resolve existence for several mints with at most one RPC call.
+
+        Args:
+            mint_addresses: Token mint addresses
+
+        Returns:
+            Mapping of mint address to whether its ATA exists
+        """
+        mints = list(dict.fromkeys(mint_addresses))
+        unknown = [mint for mint in mints if mint not in self.confirmed]
+        self.stats['cache_hits'] += len(mints) - len(unknown)
+
+        if unknown:
+            await self._check_accounts(unknown)
+
+        return {mint: mint in self.confirmed for mint in mints}
+
+    async def exists(self, mint_address: str) -> bool:
+        """Check whether the ATA for a mint exists."""
+        result = await self.ensure_checked([mint_address])
+        return result[mint_address]
+
+    async def _check_accounts(self, mint_addresses: List[str]):
+        """Confirm existence of the given mints' ATAs with getMultipleAccounts."""
+        if self.http_client is None or self.http_client.is_closed:
+            self.http_client = httpx.AsyncClient(timeout=self.timeout)
+
+        addresses = [str(self.get_address(mint)) for mint in mint_addresses]
+        request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getMultipleAccounts",
+            "params": [addresses, {"encoding": "base64", "dataSlice": {"offset": 0, "length": 0}}]
+        }
+
+        self.stats['rpc_checks'] += 1
+        self.stats['accounts_checked'] += len(addresses)
+
+        try:
+            response = await self.http_client.post(self.rpc_url, json=request)
+            response.raise_for_status()
+            accounts = response.json().get("result", {}).get("value") or []
+
+            for mint, account in zip(mint_addresses, accounts):
+                if account:
+                    self.confirmed.add(mint)
+
+        except Exception as e:
+            # Unconfirmed mints are simply rechecked next time
+            logger.warning(f"⚠️ ATA existence check failed: {e}")
+
+    def invalidate(self, mint_address: str, reason: str = ""):
+        """Forget that the ATA for a mint exists."""
+        if mint_address in self.confirmed:
+            self.confirmed.discard(mint_address)
+            self.stats['invalidations'] += 1
+            logger.info(f"🔄 Invalidated cached ATA for {mint_address[:8]}... {reason}".rstrip())
+
+    def invalidate_address(self, ata_address: Pubkey, reason: str = ""):
+        """Forget a cached ATA by its account address."""
+        for mint, address in self.addresses.items():
+            if address == ata_address:
+                self.invalidate(mint, reason)
+
+    def observe_instructions(self, instructions: Iterable[Any]):
+        """
+        Invalidate cached ATAs that the given instructions close.
+
+        Args:
+            instructions: solders Instructions about to be submitted
+        """
+        for instruction in instructions:
+            program_id = getattr(instruction, 'program_id', None)
+            data = bytes(getattr(instruction, 'data', b'') or b'')
+            accounts = getattr(instruction, 'accounts', None) or []
+
+            if program_id == TOKEN_PROGRAM_ID and data[:1] == bytes([CLOSE_ACCOUNT_INSTRUCTION]) and accounts:
+                self.invalidate_address(accounts[0].pubkey, "(close-account instruction)")
+
+    def observe_failure(self, mint_addresses: Iterable[str], error: Any):
+        """
+        Invalidate the swap's ATAs after a missing or uninitialized account failure.
+
+        AccountNotFound, InvalidAccountData and UninitializedAccount errors
+        don't name the account, so every ATA the swap used is dropped and
+        re-checked with one getMultipleAccounts call on the next build.
+
+        Args:
+            mint_addresses: Mints whose ATAs the failed swap used
+            error: Error returned for the failed swap
+        """
+        error_text = str(error or "")
+        if not any(fragment.lower() in error_text.lower() for fragment in MISSING_ACCOUNT_ERRORS):
+            return
+
+        for mint in mint_addresses:
+            self.invalidate(mint, "(failed swap)")
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get registry status."""
+        return {
+            'owner': str(self.owner),
+            'derived_accounts': len(self.addresses),
+            'confirmed_accounts': len(self.confirmed),
+            **self.stats
+        }
+
+    async def close(self):
+        """Close the HTTP client."""
+        if self.http_client:
+            await self.http_client.aclose()
+            self.http_client = None
+
+
+# Registries keyed by wallet address
+_ata_registries: Dict[str, AtaRegistry] = {}
+
+def get_ata_registry(owner: Pubkey, rpc_url: Optional[str] = None) -> AtaRegistry:
+    """Get the ATA registry for a wallet, creating it on first use."""
+    key = str(owner)
+    if key not in _ata_registries:
+        _ata_registries[key] = AtaRegistry(owner, rpc_url=rpc_url)
+    return _ata_registries[key]
+
+def observe_wallet_failure(wallet_address: str, mint_addresses: Iterable[str], error: Any):
+    """Report a failed swap to a wallet's ATA registry, if one has been created."""
+    registry = _ata_registries.get(wallet_address)
+    if registry is not None:
+        registry.observe_failure(mint_addresses, error)
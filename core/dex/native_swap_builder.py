@@ -7,7 +7,7 @@ Bypasses Jupiter entirely for simpler, more reliable swaps.
 import logging
 import asyncio
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
 from solders.transaction import VersionedTransaction
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
@@ -42,6 +42,12 @@ class NativeSwapBuilder:
         # Initialize RPC client for simple transactions
         self.rpc_client = None  # Will be set when needed
 
+        # Shared background blockhash prefetcher (set in initialize)
+        self.blockhash_service = None
+
+        # Per-wallet ATA existence cache (created on first use)
+        self.ata_registry = None
+
         logger.info(f"🔨 Native Swap Builder initialized for wallet: {wallet_address}")
 
     async def initialize(self):
@@ -58,6 +64,12 @@ class NativeSwapBuilder:
                 timeout=30.0
             )
 
+            # Start the process-wide blockhash prefetcher so builds never wait on it
+            from phase_4_deployment.rpc_execution.blockhash_service import get_blockhash_service, helius_rpc_url
+
+            self.blockhash_service = get_blockhash_service([helius_rpc_url(self.helius_api_key)])
+            await self.blockhash_service.start()
+
             logger.info("✅ Native swap builder initialized with Jito bundles")
 
         except Exception as e:
@@ -82,34 +94,10 @@ class NativeSwapBuilder:
                 logger.error("❌ No keypair available for signing")
                 return None
 
-            # Get current blockhash
-            from phase_4_deployment.rpc_execution.helius_client import HeliusClient
-
-            helius_client = HeliusClient(api_key=self.helius_api_key)
-
-            # Get fresh blockhash
-            import httpx
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getLatestBlockhash",
-                    "params": [{"commitment": "processed"}]
-                }
-
-                response = await client.post(
-                    f"https://mainnet.helius-rpc.com/?api-key={self.helius_api_key}",
-                    json=payload
-                )
-                response.raise_for_status()
-                result = response.json()
-
-                if "result" not in result:
-                    logger.error("❌ Failed to get blockhash")
-                    return None
-
-                blockhash = result["result"]["value"]["blockhash"]
-                logger.info(f"✅ Got fresh blockhash: {blockhash[:16]}...")
+            # Get prefetched blockhash
+            blockhash = await self._get_recent_blockhash()
+            if not blockhash:
+                return None
 
             # 🚨 REAL TRANSACTION: Create a meaningful transfer with detectable balance change
             # Use the actual signal size for a real transaction
@@ -170,30 +158,6 @@ class NativeSwapBuilder:
 
             logger.info(f"🔨 Building REAL SWAP: {action} {size:.6f} SOL at ${price:.2f}")
 
-            # Get fresh blockhash
-            import httpx
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getLatestBlockhash",
-                    "params": [{"commitment": "processed"}]
-                }
-
-                response = await client.post(
-                    f"https://mainnet.helius-rpc.com/?api-key={self.helius_api_key}",
-                    json=payload
-                )
-                response.raise_for_status()
-                result = response.json()
-
-                if "result" not in result:
-                    logger.error("❌ Failed to get blockhash")
-                    return None
-
-                blockhash = result["result"]["value"]["blockhash"]
-                logger.info(f"✅ Got fresh blockhash: {blockhash[:16]}...")
-
             # Define token mints
             SOL_MINT = "So11111111111111111111111111111111111111112"
             USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
@@ -220,24 +184,17 @@ class NativeSwapBuilder:
 
             # For BUY orders (USDC → SOL), we need both USDC and WSOL ATAs
             if action == 'BUY' and output_mint == SOL_MINT:
-                # Ensure USDC ATA exists (source)
-                usdc_ata_instruction = await self._ensure_token_ata_exists(USDC_MINT, "USDC")
-                if usdc_ata_instruction:
-                    instructions.append(usdc_ata_instruction)
-                    logger.info("✅ USDC ATA creation instruction added")
-
-                # Ensure Wrapped SOL ATA exists (destination)
-                wsol_ata_instruction = await self._ensure_token_ata_exists(SOL_MINT, "Wrapped SOL")
-                if wsol_ata_instruction:
-                    instructions.append(wsol_ata_instruction)
-                    logger.info("✅ Wrapped SOL ATA creation instruction added")
+                required_atas = [(USDC_MINT, "USDC"), (SOL_MINT, "Wrapped SOL")]
 
             # For SELL orders (SOL → USDC), we need USDC ATA
             elif action == 'SELL' and output_mint == USDC_MINT:
-                usdc_ata_instruction = await self._ensure_token_ata_exists(USDC_MINT, "USDC")
-                if usdc_ata_instruction:
-                    instructions.append(usdc_ata_instruction)
-                    logger.info("✅ USDC ATA creation instruction added")
+                required_atas = [(USDC_MINT, "USDC")]
+            else:
+                required_atas = []
+
+            # One batched, cached existence check for all required ATAs
+            for ata_instruction in await self._build_missing_ata_instructions(required_atas):
+                instructions.append(ata_instruction)
 
             # Build Orca swap instruction (Jupiter-free)
             swap_instruction = await self._build_orca_swap_instruction(
@@ -262,6 +219,15 @@ class NativeSwapBuilder:
             # Add swap instruction to the list
             instructions.append(swap_instruction)
 
+            # Drop cached ATAs that this transaction will close
+            self._get_ata_registry().observe_instructions(instructions)
+
+            # Read the prefetched blockhash as late as possible so it has the
+            # longest remaining validity window at submission
+            blockhash = await self._get_recent_blockhash()
+            if not blockhash:
+                return None
+
             # Create message with all instructions (ATA creation + swap)
             from solders.hash import Hash
             message = MessageV0.try_compile(
@@ -284,6 +250,27 @@ class NativeSwapBuilder:
             logger.error("❌ This indicates insufficient USDC balance or token account issues")
             return None
 
+    async def _get_recent_blockhash(self) -> Optional[str]:
+        """
+        Get a recent blockhash from the shared prefetcher.
+
+        Returns:
+            Blockhash string, or None if no hash with enough validity left is available
+        """
+        if not self.blockhash_service:
+            from phase_4_deployment.rpc_execution.blockhash_service import get_blockhash_service, helius_rpc_url
+            self.blockhash_service = get_blockhash_service([helius_rpc_url(self.helius_api_key)])
+
+        # Served from memory; only a cold or stale cache costs an RPC round trip
+        cached = await self.blockhash_service.get_or_fetch_blockhash()
+
+        if not cached:
+            logger.error("❌ Failed to get blockhash")
+            return None
+
+        logger.info(f"✅ Got fresh blockhash: {cached.blockhash[:16]}...")
+        return cached.blockhash
+
     async def build_bundle_transaction(self, signal: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Build a transaction bundle for atomic execution.
@@ -563,85 +550,91 @@ class NativeSwapBuilder:
             logger.error(f"❌ Error in Orca fallback: {e}")
             return None
 
-    async def _ensure_token_ata_exists(self, mint_address: str, token_name: str) -> Optional[Any]:
+    def _get_ata_registry(self):
+        """Get the ATA registry for this wallet."""
+        if self.ata_registry is None:
+            from core.dex.ata_registry import get_ata_registry
+            self.ata_registry = get_ata_registry(
+                self.keypair.pubkey(),
+                rpc_url=f"https://mainnet.helius-rpc.com/?api-key={self.helius_api_key}"
+            )
+        return self.ata_registry
+
+    async def _build_missing_ata_instructions(self, required_atas: List[Tuple[str, str]]) -> List[Any]:
         """
-        🚨 CRITICAL FIX: Ensure Associated Token Account exists for any token.
+        Build ATA creation instructions for any required token accounts that are missing.
+
+        Existence is served from the wallet's ATA registry; unknown accounts are
+        confirmed together in a single getMultipleAccounts call.
 
         Args:
-            mint_address: Token mint address
-            token_name: Human-readable token name for logging
+            required_atas: (mint_address, token_name) pairs
 
         Returns:
-            ATA creation instruction if needed, None if ATA already exists
+            ATA creation instructions for the missing accounts
         """
+        if not required_atas:
+            return []
+
         try:
-            from solders.pubkey import Pubkey
             from spl.token.instructions import create_associated_token_account
 
-            # Convert mint address to Pubkey
-            mint_pubkey = Pubkey.from_string(mint_address)
-
-            # Calculate ATA address using correct method
-            # Use the public function instead of private _get_associated_token_address
-            from spl.token.client import Token
-            from spl.token.constants import ASSOCIATED_TOKEN_PROGRAM_ID, TOKEN_PROGRAM_ID
-
-            # Calculate ATA address manually
-            seeds = [
-                bytes(self.keypair.pubkey()),
-                bytes(Pubkey.from_string("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")),
-                bytes(mint_pubkey)
-            ]
-
-            # Find program address for ATA
-            ata_address, _ = Pubkey.find_program_address(
-                seeds,
-                ASSOCIATED_TOKEN_PROGRAM_ID
-            )
+            registry = self._get_ata_registry()
+            existing = await registry.ensure_checked(mint for mint, _ in required_atas)
 
-            logger.info(f"🔍 Checking {token_name} ATA: {ata_address}")
-
-            # Check if ATA already exists
-            import httpx
-            async with httpx.AsyncClient() as client:
-                request = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getAccountInfo",
-                    "params": [
-                        str(ata_address),
-                        {"encoding": "base64"}
-                    ]
-                }
+            instructions = []
+            for mint_address, token_name in required_atas:
+                if existing[mint_address]:
+                    logger.debug(f"✅ {token_name} ATA already exists: {registry.get_address(mint_address)}")
+                    continue
 
-                response = await client.post(
-                    f"https://mainnet.helius-rpc.com/?api-key={self.helius_api_key}",
-                    json=request
-                )
+                logger.info(f"🔨 Creating {token_name} ATA instruction")
+                instructions.append(create_associated_token_account(
+                    payer=self.keypair.pubkey(),
+                    owner=self.keypair.pubkey(),
+                    mint=Pubkey.from_string(mint_address)
+                ))
+                logger.info(f"✅ {token_name} ATA creation instruction added")
 
-                if response.status_code == 200:
-                    result = response.json()
-                    if result.get("result", {}).get("value"):
-                        logger.info(f"✅ {token_name} ATA already exists")
-                        return None  # ATA exists, no instruction needed
+            return instructions
 
-            # ATA doesn't exist, create instruction
-            logger.info(f"🔨 Creating {token_name} ATA instruction")
-            ata_instruction = create_associated_token_account(
-                payer=self.keypair.pubkey(),
-                owner=self.keypair.pubkey(),
-                mint=mint_pubkey
-            )
+        except Exception as e:
+            logger.error(f"❌ Error checking/creating ATAs: {e}")
+            return []
 
-            logger.info(f"✅ {token_name} ATA creation instruction built")
-            return ata_instruction
+    async def _ensure_token_ata_exists(self, mint_address: str, token_name: str) -> Optional[Any]:
+        """
+        🚨 CRITICAL FIX: Ensure Associated Token Account exists for any token.
 
-        except Exception as e:
-            logger.error(f"❌ Error checking/creating {token_name} ATA: {e}")
-            return None
+        Args:
+            mint_address: Token mint address
+            token_name: Human-readable token name for logging
+
+        Returns:
+            ATA creation instruction if needed, None if ATA already exists
+        """
+        instructions = await self._build_missing_ata_instructions([(mint_address, token_name)])
+        return instructions[0] if instructions else None
+
+    def on_execution_failed(self, signal: Dict[str, Any], error: Any):
+        """
+        Invalidate cached ATAs when a swap failed because a token account is gone.
+
+        Args:
+            signal: Trading signal whose transaction failed
+            error: Error reported for the failed execution
+        """
+        if self.ata_registry is None:
+            return
+
+        SOL_MINT = "So11111111111111111111111111111111111111112"
+        USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+        self.ata_registry.observe_failure([USDC_MINT, SOL_MINT], error)
 
     async def close(self):
         """Close the swap builder."""
         if hasattr(self, 'jito_client') and self.jito_client:
             await self.jito_client.close()
+        if self.ata_registry:
+            await self.ata_registry.close()
         logger.info("✅ Native swap builder closed")
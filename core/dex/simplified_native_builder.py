@@ -21,22 +21,45 @@ class SimplifiedNativeBuilder:
     simple transaction building without DEX-specific integrations.
     """
     
-    def __init__(self, wallet_address: str, keypair=None):
+    def __init__(self, wallet_address: str, keypair=None, helius_api_key: Optional[str] = None,
+                 blockhash_service=None):
         """Initialize the simplified builder."""
         self.wallet_address = wallet_address
         self.keypair = keypair
         
         # Basic configuration
         self.quicknode_api_key = os.getenv('QUICKNODE_API_KEY')
-        self.helius_api_key = os.getenv('HELIUS_API_KEY')
+        self.helius_api_key = helius_api_key or os.getenv('HELIUS_API_KEY')
+        
+        # Shared background blockhash prefetcher
+        self.blockhash_service = blockhash_service
         
         logger.info(f"🔨 Simplified Native Builder initialized for wallet: {wallet_address}")
     
     async def initialize(self):
         """Initialize the builder."""
+        if self.blockhash_service is None:
+            from phase_4_deployment.rpc_execution.blockhash_service import get_blockhash_service, helius_rpc_url
+            self.blockhash_service = get_blockhash_service([helius_rpc_url(self.helius_api_key)])
+        
         logger.info("✅ Simplified Native Builder initialized")
         return True
     
+    async def _get_recent_blockhash(self):
+        """
+        Get a recent blockhash, preferring the prefetched one.
+        
+        Returns:
+            (CachedBlockhash or None, 'prefetched' or 'on_demand')
+        """
+        # Served from memory on the hot path
+        cached = self.blockhash_service.get_blockhash()
+        if cached:
+            return cached, 'prefetched'
+        
+        # Cold or stale cache: pay one RPC round trip
+        return await self.blockhash_service.get_or_fetch_blockhash(), 'on_demand'
+    
     async def build_transaction(self, signal: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Build a simplified transaction based on the signal.
@@ -53,6 +76,18 @@ class SimplifiedNativeBuilder:
             
             logger.info(f"🔨 Building simplified transaction: {action} {size}")
             
+            if self.blockhash_service is None:
+                await self.initialize()
+            
+            cached, blockhash_source = await self._get_recent_blockhash()
+            if not cached:
+                logger.error("❌ No valid recent blockhash available")
+                return {
+                    'success': False,
+                    'error': 'No valid recent blockhash available',
+                    'execution_type': 'simplified_native_failed'
+                }
+            
             # For now, return a success response without complex DEX operations
             # This prevents the Orca error 3012 by avoiding DEX interactions entirely
             
@@ -63,6 +98,9 @@ class SimplifiedNativeBuilder:
                 'provider': 'simplified',
                 'action': action,
                 'size': size,
+                'recent_blockhash': cached.blockhash,
+                'last_valid_block_height': cached.last_valid_block_height,
+                'blockhash_source': blockhash_source,
                 'message': f'Simplified {action} signal processed (DEX operations disabled for stability)'
             }
             
@@ -8,6 +8,7 @@ Replaces multiple conflicting transaction builders with one optimized implementa
 import asyncio
 import logging
 import base64
+import os
 import time
 from typing import Dict, Any, Optional
 from solders.transaction import VersionedTransaction
@@ -21,29 +22,45 @@ class UnifiedTransactionBuilder:
     Uses Jupiter API for real DEX swaps with QuickNode/Jito/Helius execution.
     """
 
-    def __init__(self, wallet_address: str, keypair: Optional[Keypair] = None):
+    def __init__(self, wallet_address: str, keypair: Optional[Keypair] = None,
+                 helius_api_key: Optional[str] = None):
         """
         Initialize unified transaction builder.
 
         Args:
             wallet_address: Wallet address
             keypair: Keypair for signing (optional)
+            helius_api_key: Helius API key for blockhash polling (defaults to HELIUS_API_KEY)
         """
         self.wallet_address = wallet_address
         self.keypair = keypair
+        self.helius_api_key = helius_api_key or os.getenv('HELIUS_API_KEY')
 
         # 🚨 SIMPLIFIED: Use simplified builder to avoid Orca errors
         self.simplified_builder = None
 
+        # Shared background blockhash prefetcher (set in initialize)
+        self.blockhash_service = None
+
         logger.info(f"🔨 SIMPLIFIED Unified Transaction Builder initialized for wallet: {wallet_address}")
 
     async def initialize(self):
         """Initialize the transaction builder."""
         try:
+            # Warm the process-wide blockhash prefetcher before the first signal
+            from phase_4_deployment.rpc_execution.blockhash_service import get_blockhash_service, helius_rpc_url
+            self.blockhash_service = get_blockhash_service([helius_rpc_url(self.helius_api_key)])
+            await self.blockhash_service.start()
+
             # 🚨 SIMPLIFIED: Initialize simplified builder to avoid Orca errors
             from core.dex.simplified_native_builder import SimplifiedNativeBuilder
-            self.simplified_builder = SimplifiedNativeBuilder(self.wallet_address, self.keypair)
+            self.simplified_builder = SimplifiedNativeBuilder(
+                self.wallet_address, self.keypair,
+                helius_api_key=self.helius_api_key,
+                blockhash_service=self.blockhash_service
+            )
             await self.simplified_builder.initialize()
+
             logger.info("✅ SIMPLIFIED: Builder initialized without DEX operations")
 
         except Exception as e:
@@ -100,6 +117,23 @@ class UnifiedTransactionBuilder:
         """
         return await self.build_swap_transaction(signal)
 
+    def on_execution_failed(self, signal: Dict[str, Any], error: Any):
+        """
+        Drop cached ATA state a failed execution invalidates.
+
+        ATA existence is cached per wallet in the registry NativeSwapBuilder
+        shares, so the failure is forwarded there.
+
+        Args:
+            signal: Trading signal whose transaction failed
+            error: Error reported for the failed execution
+        """
+        from core.dex.ata_registry import observe_wallet_failure
+
+        SOL_MINT = "So11111111111111111111111111111111111111112"
+        USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+        observe_wallet_failure(self.wallet_address, [USDC_MINT, SOL_MINT], error)
+
     def get_transaction_info(self, signal: Dict[str, Any]) -> Dict[str, Any]:
         """
         Get transaction information for a signal.
@@ -7,10 +7,12 @@ activities including order management, transaction execution, and performance mo
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Set, Union
 from enum import Enum
 import json
 import os
@@ -46,9 +48,20 @@ class ExecutionEngine:
         self.metrics = None
         
         # Execution state
+        # pending_orders is a heap of (-priority, sequence, order) entries so
+        # higher priority orders are dequeued first and FIFO within a priority.
         self.pending_orders: List = []
+        self.pending_index: Dict = {}
+        self.retry_queue: List = []  # heap of (ready_at, sequence, order)
         self.active_orders: Dict = {}
         self.completed_orders: List = []
+        self._sequence = itertools.count()
+
+        # Scheduler primitives (created on the running event loop in start())
+        self._queue_condition: Optional[asyncio.Condition] = None
+        self._execution_slots: Optional[asyncio.Semaphore] = None
+        self._loop_task: Optional[asyncio.Task] = None
+        self._execution_tasks: Set[asyncio.Task] = set()
         
         # Performance tracking
         self.execution_stats = {
@@ -109,21 +122,44 @@ class ExecutionEngine:
             return
         
         logger.info("🚀 Starting ExecutionEngine...")
+        self._ensure_scheduler()
         self.running = True
         
         # Start the execution loop
-        asyncio.create_task(self._execution_loop())
+        self._loop_task = asyncio.create_task(self._execution_loop())
         logger.info("✅ ExecutionEngine started")
 
     async def stop(self):
         """Stop the execution engine."""
         logger.info("🛑 Stopping ExecutionEngine...")
         self.running = False
+        await self._notify_scheduler()
+        
+        # Stop the execution loop so no new executions start
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            try:
+                await self._loop_task
+            except asyncio.CancelledError:
+                pass
+            self._loop_task = None
         
-        # Wait for active executions to complete
-        while self.active_orders:
-            logger.info(f"⏳ Waiting for {len(self.active_orders)} active executions to complete...")
-            await asyncio.sleep(1.0)
+        # Wait for in-flight executions, including their final status writes
+        if self._execution_tasks:
+            logger.info(f"⏳ Waiting for {len(self._execution_tasks)} active executions to complete...")
+            await asyncio.gather(*self._execution_tasks, return_exceptions=True)
+        
+        # Parked retries were saved as failed before being reset to pending
+        if self.order_manager and self.retry_queue:
+            logger.info(f"💾 Persisting {len(self.retry_queue)} orders awaiting retry")
+            for _, _, order in self.retry_queue:
+                await self.order_manager.update_order(order)
+        
+        # Persist queued order and metric rows
+        if self.order_manager:
+            await self.order_manager.flush()
+        if self.metrics:
+            await self.metrics.flush()
         
         logger.info("✅ ExecutionEngine stopped")
 
@@ -136,42 +172,47 @@ class ExecutionEngine:
         """Resume execution."""
         logger.info("▶️ Resuming ExecutionEngine...")
         self.paused = False
+        await self._notify_scheduler()
 
-    async def submit_order(self, signal: Dict[str, Any]) -> str:
+    async def submit_order(self, signal: Dict[str, Any], priority=None) -> str:
         """
         Submit a trading signal for execution.
         
         Args:
             signal: Trading signal containing action, market, size, etc.
+            priority: Optional OrderPriority (or its name/value). Falls back to
+                signal['priority'] and then NORMAL.
             
         Returns:
             order_id: Unique identifier for the submitted order
         """
         try:
+            sequence = next(self._sequence)
+
             # Generate unique order ID
-            order_id = f"order_{int(time.time() * 1000)}_{len(self.pending_orders)}"
+            order_id = f"order_{int(time.time() * 1000)}_{sequence}"
             
             # Create execution order
-            from core.execution.order_manager import Order, OrderStatus, OrderPriority
+            from core.execution.order_manager import Order, OrderStatus
             order = Order(
                 order_id=order_id,
                 signal=signal,
                 status=OrderStatus.PENDING,
-                priority=OrderPriority.NORMAL,
+                priority=self._resolve_priority(priority if priority is not None else signal.get('priority')),
                 created_at=datetime.now(),
                 updated_at=datetime.now()
             )
             
-            # Add to pending queue
-            self.pending_orders.append(order)
-            
             # Update metrics
             self.execution_stats['total_orders'] += 1
             
-            # Register with order manager
+            # Register with order manager before the order becomes runnable
             if self.order_manager:
                 await self.order_manager.register_order(order)
             
+            # Add to pending queue and wake the execution loop
+            await self._enqueue_order(order)
+            
             logger.info(f"📝 Order submitted: {order_id} - {signal['action']} {signal['market']} {signal['size']}")
             return order_id
             
@@ -187,10 +228,9 @@ class ExecutionEngine:
                 order = self.active_orders[order_id]
                 return self._order_to_dict(order)
             
-            # Check pending orders
-            for order in self.pending_orders:
-                if order.order_id == order_id:
-                    return self._order_to_dict(order)
+            # Check pending orders (including those waiting for a retry)
+            if order_id in self.pending_index:
+                return self._order_to_dict(self.pending_index[order_id])
             
             # Check completed orders
             for order in self.completed_orders:
@@ -217,29 +257,109 @@ class ExecutionEngine:
             'execution_time': order.execution_time
         }
 
+    def _resolve_priority(self, priority):
+        """Map an OrderPriority, its name or its value to an OrderPriority."""
+        from core.execution.order_manager import OrderPriority
+
+        if isinstance(priority, OrderPriority):
+            return priority
+        try:
+            if isinstance(priority, str):
+                return OrderPriority[priority.upper()]
+            if isinstance(priority, int):
+                return OrderPriority(priority)
+        except (KeyError, ValueError):
+            logger.warning(f"⚠️ Unknown order priority {priority!r}, using NORMAL")
+        return OrderPriority.NORMAL
+
+    def _ensure_scheduler(self):
+        """Create the scheduler primitives on the running event loop."""
+        if self._queue_condition is None:
+            self._queue_condition = asyncio.Condition()
+        if self._execution_slots is None:
+            self._execution_slots = asyncio.Semaphore(self.max_concurrent_executions)
+
+    async def _notify_scheduler(self):
+        """Wake the execution loop so it re-evaluates the queues."""
+        if self._queue_condition is None:
+            return
+        async with self._queue_condition:
+            self._queue_condition.notify_all()
+
+    async def _enqueue_order(self, order):
+        """Push an order onto the priority queue and wake the execution loop."""
+        self._ensure_scheduler()
+        async with self._queue_condition:
+            heapq.heappush(self.pending_orders, (-order.priority.value, next(self._sequence), order))
+            self.pending_index[order.order_id] = order
+            self._queue_condition.notify()
+
+    async def _schedule_retry(self, order):
+        """Park an order in the retry delay-queue without holding an execution slot."""
+        self._ensure_scheduler()
+        async with self._queue_condition:
+            ready_at = time.monotonic() + self.retry_delay
+            heapq.heappush(self.retry_queue, (ready_at, next(self._sequence), order))
+            self.pending_index[order.order_id] = order
+            self._queue_condition.notify()
+
+    def _promote_due_retries(self) -> Optional[float]:
+        """
+        Move retries whose delay has elapsed onto the priority queue.
+
+        Returns:
+            Seconds until the next retry becomes due, or None if there are none.
+        """
+        now = time.monotonic()
+        while self.retry_queue and self.retry_queue[0][0] <= now:
+            _, sequence, order = heapq.heappop(self.retry_queue)
+            heapq.heappush(self.pending_orders, (-order.priority.value, sequence, order))
+
+        if self.retry_queue:
+            return max(0.0, self.retry_queue[0][0] - now)
+        return None
+
+    async def _next_order(self):
+        """Wait until an order is runnable and pop the highest priority one."""
+        async with self._queue_condition:
+            while self.running:
+                next_retry_in = self._promote_due_retries()
+
+                if not self.paused and self.pending_orders:
+                    _, _, order = heapq.heappop(self.pending_orders)
+                    self.pending_index.pop(order.order_id, None)
+                    return order
+
+                try:
+                    await asyncio.wait_for(self._queue_condition.wait(), timeout=next_retry_in)
+                except asyncio.TimeoutError:
+                    pass
+
+        return None
+
     async def _execution_loop(self):
         """Main execution loop."""
         logger.info("🔄 ExecutionEngine loop started")
         
         while self.running:
             try:
-                # Skip if paused
-                if self.paused:
-                    await asyncio.sleep(0.1)
+                # Reserve an execution slot before taking an order off the queue
+                await self._execution_slots.acquire()
+
+                try:
+                    order = await self._next_order()
+                except BaseException:
+                    # Including cancellation by stop(); nothing holds the slot yet
+                    self._execution_slots.release()
+                    raise
+                if order is None:
+                    self._execution_slots.release()
                     continue
-                
-                # Check for pending orders to execute
-                if (self.pending_orders and 
-                    len(self.active_orders) < self.max_concurrent_executions):
-                    
-                    # Get next pending order
-                    order = self.pending_orders.pop(0)
-                    
-                    # Start execution
-                    asyncio.create_task(self._execute_order(order))
-                
-                # Brief sleep to prevent busy waiting
-                await asyncio.sleep(0.1)
+
+                # Start execution; the slot is released when it finishes
+                task = asyncio.create_task(self._execute_order(order))
+                self._execution_tasks.add(task)
+                task.add_done_callback(self._execution_tasks.discard)
                 
             except Exception as e:
                 logger.error(f"❌ Error in execution loop: {e}")
@@ -286,11 +406,19 @@ class ExecutionEngine:
                     self.execution_stats['failed_executions'] += 1
                     logger.error(f"❌ Order {order.order_id} failed: {order.error_message}")
 
+                    # Let the builder drop cached state the failure invalidates
+                    if hasattr(self.unified_tx_builder, 'on_execution_failed'):
+                        self.unified_tx_builder.on_execution_failed(order.signal, order.error_message)
+
             except asyncio.TimeoutError:
                 order.status = OrderStatus.TIMEOUT
                 order.error_message = f"Execution timeout after {self.execution_timeout}s"
                 self.execution_stats['failed_executions'] += 1
                 logger.error(f"⏰ Order {order.order_id} timed out")
+
+                # A timed-out build may be stuck on a stale blockhash or ATA state
+                if hasattr(self.unified_tx_builder, 'on_execution_failed'):
+                    self.unified_tx_builder.on_execution_failed(order.signal, order.error_message)
                 
         except Exception as e:
             order.status = OrderStatus.FAILED
@@ -299,32 +427,37 @@ class ExecutionEngine:
             logger.error(f"❌ Error executing order {order.order_id}: {e}")
         
         finally:
-            # Update timestamps
-            order.updated_at = datetime.now()
-            
-            # Move to completed orders
-            if order.order_id in self.active_orders:
-                del self.active_orders[order.order_id]
-            self.completed_orders.append(order)
-            
-            # Update metrics
-            if self.metrics:
-                await self.metrics.record_execution(order)
-            
-            # Update order manager
-            if self.order_manager:
-                await self.order_manager.update_order(order)
-            
-            # Check if retry is needed
-            if (order.status in [OrderStatus.FAILED, OrderStatus.TIMEOUT] and
-                order.execution_attempts < order.max_attempts):
+            try:
+                # Update timestamps
+                order.updated_at = datetime.now()
+                
+                # Move out of active orders
+                if order.order_id in self.active_orders:
+                    del self.active_orders[order.order_id]
+                
+                # Update metrics
+                if self.metrics:
+                    await self.metrics.record_execution(order)
+                
+                # Update order manager
+                if self.order_manager:
+                    await self.order_manager.update_order(order)
+                
+                # Check if retry is needed
+                if (order.status in [OrderStatus.FAILED, OrderStatus.TIMEOUT] and
+                    order.execution_attempts < order.max_attempts):
 
-                logger.info(f"🔄 Retrying order {order.order_id} in {self.retry_delay}s")
-                await asyncio.sleep(self.retry_delay)
+                    logger.info(f"🔄 Retrying order {order.order_id} in {self.retry_delay}s")
 
-                # Reset status and re-queue
-                order.status = OrderStatus.PENDING
-                self.pending_orders.append(order)
+                    # Reset status and park in the delay-queue
+                    order.status = OrderStatus.PENDING
+                    await self._schedule_retry(order)
+                else:
+                    self.completed_orders.append(order)
+            finally:
+                # Free the execution slot immediately; retries wait in the delay-queue
+                if self._execution_slots is not None:
+                    self._execution_slots.release()
 
     async def _perform_execution(self, order) -> Dict[str, Any]:
         """Perform the actual execution of an order."""
@@ -363,6 +496,7 @@ class ExecutionEngine:
             'failed_executions': self.execution_stats['failed_executions'],
             'success_rate_pct': round(success_rate, 2),
             'pending_orders': len(self.pending_orders),
+            'scheduled_retries': len(self.retry_queue),
             'active_orders': len(self.active_orders),
             'completed_orders': len(self.completed_orders),
             'average_execution_time': self.execution_stats['average_execution_time'],
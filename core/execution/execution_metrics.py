@@ -10,17 +10,26 @@ import asyncio
 import logging
 import json
 import os
-import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, Union
 from dataclasses import dataclass, asdict
 from collections import defaultdict, deque
 import statistics
 import sqlite3
-import aiosqlite
+
+from core.execution.persistence import get_sqlite_writer
+from core.utils.rolling_stats import RunningStats, SlidingWindowStats
 
 logger = logging.getLogger(__name__)
 
+# Sliding performance windows and their lengths in seconds
+PERFORMANCE_WINDOWS = {
+    '1min': 60,
+    '5min': 300,
+    '1hour': 3600,
+    '1day': 86400
+}
+
 
 @dataclass
 class ExecutionMetric:
@@ -55,10 +64,20 @@ class ExecutionMetrics:
         
         # Database configuration
         self.db_path = self.config.get('metrics_db_path', 'output/execution_metrics.db')
+        self.writer = get_sqlite_writer(
+            self.db_path,
+            batch_size=self.config.get('db_batch_size', 100),
+            flush_interval_ms=self.config.get('db_flush_interval_ms', 250)
+        )
         
         # In-memory metrics storage
         self.recent_metrics: deque = deque(maxlen=1000)  # Last 1000 executions
-        self.method_metrics: Dict[str, List[ExecutionMetric]] = defaultdict(list)
+        
+        # Constant-time aggregates: lifetime per method, sliding per window and method
+        self.window_buckets = self.config.get('metrics_window_buckets', 60)
+        self.quantile_accuracy = self.config.get('metrics_quantile_accuracy', 0.01)
+        self.method_stats: Dict[str, RunningStats] = {}
+        self.method_windows: Dict[str, Dict[str, SlidingWindowStats]] = {}
         
         # Real-time statistics
         self.current_stats = {
@@ -73,12 +92,7 @@ class ExecutionMetrics:
         }
         
         # Performance windows for analysis
-        self.performance_windows = {
-            '1min': deque(maxlen=60),    # Last 60 seconds
-            '5min': deque(maxlen=300),   # Last 5 minutes
-            '1hour': deque(maxlen=3600), # Last hour
-            '1day': deque(maxlen=86400)  # Last day
-        }
+        self.performance_windows: Dict[str, SlidingWindowStats] = self._create_windows()
         
         # Configuration
         self.metrics_retention_days = self.config.get('metrics_retention_days', 30)
@@ -111,36 +125,35 @@ class ExecutionMetrics:
     async def _init_database(self):
         """Initialize the SQLite database for metrics persistence."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('''
-                    CREATE TABLE IF NOT EXISTS execution_metrics (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        timestamp TEXT NOT NULL,
-                        order_id TEXT NOT NULL,
-                        execution_time REAL NOT NULL,
-                        success BOOLEAN NOT NULL,
-                        method TEXT NOT NULL,
-                        transaction_type TEXT NOT NULL,
-                        value_traded REAL,
-                        fees_paid REAL,
-                        slippage REAL,
-                        error_message TEXT
-                    )
-                ''')
-                
-                await db.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_metrics_timestamp ON execution_metrics(timestamp)
-                ''')
-                
-                await db.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_metrics_method ON execution_metrics(method)
-                ''')
-                
-                await db.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_metrics_success ON execution_metrics(success)
-                ''')
-                
-                await db.commit()
+            await self.writer.start()
+
+            await self.writer.execute('''
+                CREATE TABLE IF NOT EXISTS execution_metrics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    timestamp TEXT NOT NULL,
+                    order_id TEXT NOT NULL,
+                    execution_time REAL NOT NULL,
+                    success BOOLEAN NOT NULL,
+                    method TEXT NOT NULL,
+                    transaction_type TEXT NOT NULL,
+                    value_traded REAL,
+                    fees_paid REAL,
+                    slippage REAL,
+                    error_message TEXT
+                )
+            ''')
+            
+            await self.writer.execute('''
+                CREATE INDEX IF NOT EXISTS idx_metrics_timestamp ON execution_metrics(timestamp)
+            ''')
+            
+            await self.writer.execute('''
+                CREATE INDEX IF NOT EXISTS idx_metrics_method ON execution_metrics(method)
+            ''')
+            
+            await self.writer.execute('''
+                CREATE INDEX IF NOT EXISTS idx_metrics_success ON execution_metrics(success)
+            ''')
                 
             logger.info("✅ Metrics database initialized")
             
@@ -152,23 +165,21 @@ class ExecutionMetrics:
         """Load recent metrics from database."""
         try:
             # Load last 1000 metrics
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute('''
-                    SELECT * FROM execution_metrics 
-                    ORDER BY timestamp DESC 
-                    LIMIT 1000
-                ''') as cursor:
-                    rows = await cursor.fetchall()
-                    
-                    for row in rows:
-                        metric = self._row_to_metric(row)
-                        self.recent_metrics.appendleft(metric)
-                        
-                        # Update method metrics
-                        self.method_metrics[metric.method].append(metric)
-                        
-                        # Update current stats
-                        self._update_current_stats(metric)
+            rows = await self.writer.fetchall('''
+                SELECT * FROM execution_metrics 
+                ORDER BY timestamp DESC 
+                LIMIT 1000
+            ''')
+            
+            for row in rows:
+                metric = self._row_to_metric(row)
+                self.recent_metrics.appendleft(metric)
+                
+                # Update method and window aggregates
+                self._update_rolling_stats(metric)
+                
+                # Update current stats
+                self._update_current_stats(metric)
             
             logger.info(f"📊 Loaded {len(self.recent_metrics)} recent metrics")
             
@@ -209,12 +220,9 @@ class ExecutionMetrics:
             
             # Add to in-memory storage
             self.recent_metrics.append(metric)
-            self.method_metrics[metric.method].append(metric)
             
-            # Add to performance windows
-            current_time = time.time()
-            for window in self.performance_windows.values():
-                window.append((current_time, metric))
+            # Update method and window aggregates
+            self._update_rolling_stats(metric)
             
             # Update current stats
             self._update_current_stats(metric)
@@ -227,6 +235,30 @@ class ExecutionMetrics:
         except Exception as e:
             logger.error(f"❌ Failed to record execution metric: {e}")
 
+    def _create_windows(self) -> Dict[str, SlidingWindowStats]:
+        """Create one sliding window per performance window length."""
+        return {
+            window: SlidingWindowStats(seconds, self.window_buckets, self.quantile_accuracy)
+            for window, seconds in PERFORMANCE_WINDOWS.items()
+        }
+
+    def _update_rolling_stats(self, metric: ExecutionMetric):
+        """Add a metric to the lifetime per-method and sliding window aggregates."""
+        timestamp = metric.timestamp.timestamp()
+        
+        if metric.method not in self.method_stats:
+            self.method_stats[metric.method] = RunningStats(self.quantile_accuracy)
+            self.method_windows[metric.method] = self._create_windows()
+        
+        self.method_stats[metric.method].add(
+            metric.execution_time, metric.success, metric.value_traded, metric.fees_paid
+        )
+        
+        for windows in (self.performance_windows, self.method_windows[metric.method]):
+            for window in windows.values():
+                window.add(metric.execution_time, metric.success, metric.value_traded,
+                           metric.fees_paid, timestamp=timestamp)
+
     def _update_current_stats(self, metric: ExecutionMetric):
         """Update current statistics with new metric."""
         self.current_stats['total_executions'] += 1
@@ -247,31 +279,33 @@ class ExecutionMetrics:
         self.current_stats['last_execution_time'] = metric.timestamp.isoformat()
 
     async def _save_metric_to_db(self, metric: ExecutionMetric):
-        """Save metric to database."""
+        """Queue the metric row for the next batched write."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('''
-                    INSERT INTO execution_metrics (
-                        timestamp, order_id, execution_time, success, method,
-                        transaction_type, value_traded, fees_paid, slippage, error_message
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    metric.timestamp.isoformat(),
-                    metric.order_id,
-                    metric.execution_time,
-                    metric.success,
-                    metric.method,
-                    metric.transaction_type,
-                    metric.value_traded,
-                    metric.fees_paid,
-                    metric.slippage,
-                    metric.error_message
-                ))
-                await db.commit()
+            self.writer.enqueue('''
+                INSERT INTO execution_metrics (
+                    timestamp, order_id, execution_time, success, method,
+                    transaction_type, value_traded, fees_paid, slippage, error_message
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                metric.timestamp.isoformat(),
+                metric.order_id,
+                metric.execution_time,
+                metric.success,
+                metric.method,
+                metric.transaction_type,
+                metric.value_traded,
+                metric.fees_paid,
+                metric.slippage,
+                metric.error_message
+            ))
                 
         except Exception as e:
             logger.error(f"❌ Failed to save metric to database: {e}")
 
+    async def flush(self):
+        """Write any queued metrics to the database."""
+        await self.writer.flush()
+
     def get_current_stats(self) -> Dict[str, Any]:
         """Get current execution statistics."""
         total_executions = self.current_stats['total_executions']
@@ -299,87 +333,93 @@ class ExecutionMetrics:
         """Get performance statistics by execution method."""
         method_stats = {}
         
-        for method, metrics in self.method_metrics.items():
-            if not metrics:
+        for method, stats in self.method_stats.items():
+            if not stats.count:
                 continue
             
-            successful = [m for m in metrics if m.success]
-            failed = [m for m in metrics if not m.success]
-            
-            execution_times = [m.execution_time for m in metrics]
-            
             method_stats[method] = {
-                'total_executions': len(metrics),
-                'successful_executions': len(successful),
-                'failed_executions': len(failed),
-                'success_rate_pct': round((len(successful) / len(metrics)) * 100, 2),
-                'average_execution_time': round(statistics.mean(execution_times), 3) if execution_times else 0,
-                'median_execution_time': round(statistics.median(execution_times), 3) if execution_times else 0,
-                'min_execution_time': round(min(execution_times), 3) if execution_times else 0,
-                'max_execution_time': round(max(execution_times), 3) if execution_times else 0,
-                'total_value_traded': round(sum(m.value_traded for m in metrics if m.value_traded), 6),
-                'total_fees_paid': round(sum(m.fees_paid for m in metrics if m.fees_paid), 6)
+                'total_executions': stats.count,
+                'successful_executions': stats.success,
+                'failed_executions': stats.count - stats.success,
+                'success_rate_pct': round(stats.success_rate * 100, 2),
+                'average_execution_time': round(stats.mean, 3),
+                'median_execution_time': round(stats.quantile(0.5), 3),
+                'p95_execution_time': round(stats.quantile(0.95), 3),
+                'p99_execution_time': round(stats.quantile(0.99), 3),
+                'min_execution_time': round(stats.min or 0, 3),
+                'max_execution_time': round(stats.max or 0, 3),
+                'total_value_traded': round(stats.value_traded, 6),
+                'total_fees_paid': round(stats.fees_paid, 6)
             }
         
         return method_stats
 
-    def get_window_performance(self, window: str = '5min') -> Dict[str, Any]:
-        """Get performance statistics for a specific time window."""
-        if window not in self.performance_windows:
+    def get_window_performance(self, window: str = '5min', method: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get performance statistics for a specific time window.
+        
+        Args:
+            window: One of '1min', '5min', '1hour', '1day'
+            method: Optional execution method to restrict the statistics to
+        """
+        if window not in PERFORMANCE_WINDOWS:
             return {}
         
-        current_time = time.time()
-        window_data = self.performance_windows[window]
+        if method is None:
+            windows = self.performance_windows
+        elif method in self.method_windows:
+            windows = self.method_windows[method]
+        else:
+            windows = None
         
-        # Filter to actual window duration
-        window_seconds = {
-            '1min': 60,
-            '5min': 300,
-            '1hour': 3600,
-            '1day': 86400
-        }.get(window, 300)
+        stats = windows[window].snapshot() if windows else None
+        window_seconds = PERFORMANCE_WINDOWS[window]
         
-        cutoff_time = current_time - window_seconds
-        recent_metrics = [metric for timestamp, metric in window_data if timestamp >= cutoff_time]
+        result = {'window': window}
+        if method is not None:
+            result['method'] = method
         
-        if not recent_metrics:
-            return {
-                'window': window,
+        if not stats or not stats.count:
+            result.update({
                 'total_executions': 0,
                 'successful_executions': 0,
                 'failed_executions': 0,
                 'success_rate_pct': 0,
                 'average_execution_time': 0,
+                'stdev_execution_time': 0,
+                'p50_execution_time': 0,
+                'p95_execution_time': 0,
+                'p99_execution_time': 0,
                 'executions_per_minute': 0
-            }
-        
-        successful = [m for m in recent_metrics if m.success]
-        execution_times = [m.execution_time for m in recent_metrics]
+            })
+            return result
         
-        return {
-            'window': window,
-            'total_executions': len(recent_metrics),
-            'successful_executions': len(successful),
-            'failed_executions': len(recent_metrics) - len(successful),
-            'success_rate_pct': round((len(successful) / len(recent_metrics)) * 100, 2),
-            'average_execution_time': round(statistics.mean(execution_times), 3) if execution_times else 0,
-            'executions_per_minute': round((len(recent_metrics) / (window_seconds / 60)), 2)
-        }
+        result.update({
+            'total_executions': stats.count,
+            'successful_executions': stats.success,
+            'failed_executions': stats.count - stats.success,
+            'success_rate_pct': round(stats.success_rate * 100, 2),
+            'average_execution_time': round(stats.mean, 3),
+            'stdev_execution_time': round(stats.stdev, 3),
+            'p50_execution_time': round(stats.quantile(0.5), 3),
+            'p95_execution_time': round(stats.quantile(0.95), 3),
+            'p99_execution_time': round(stats.quantile(0.99), 3),
+            'executions_per_minute': round((stats.count / (window_seconds / 60)), 2)
+        })
+        return result
 
     async def get_performance_trends(self, hours: int = 24) -> Dict[str, Any]:
         """Get performance trends over the specified number of hours."""
         try:
             cutoff_time = datetime.now() - timedelta(hours=hours)
             
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute('''
-                    SELECT * FROM execution_metrics 
-                    WHERE timestamp > ? 
-                    ORDER BY timestamp
-                ''', (cutoff_time.isoformat(),)) as cursor:
-                    rows = await cursor.fetchall()
-                    
-                    metrics = [self._row_to_metric(row) for row in rows]
+            rows = await self.writer.fetchall('''
+                SELECT * FROM execution_metrics 
+                WHERE timestamp > ? 
+                ORDER BY timestamp
+            ''', (cutoff_time.isoformat(),))
+            
+            metrics = [self._row_to_metric(row) for row in rows]
             
             if not metrics:
                 return {'hours': hours, 'total_executions': 0}
@@ -436,16 +476,14 @@ class ExecutionMetrics:
         try:
             cutoff_date = datetime.now() - timedelta(days=self.metrics_retention_days)
             
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute(
-                    'DELETE FROM execution_metrics WHERE timestamp < ?',
-                    (cutoff_date.isoformat(),)
-                )
-                deleted_count = cursor.rowcount
-                await db.commit()
-                
-                if deleted_count > 0:
-                    logger.info(f"🧹 Cleaned up {deleted_count} old metrics")
+            cursor = await self.writer.execute(
+                'DELETE FROM execution_metrics WHERE timestamp < ?',
+                (cutoff_date.isoformat(),)
+            )
+            deleted_count = cursor.rowcount
+            
+            if deleted_count > 0:
+                logger.info(f"🧹 Cleaned up {deleted_count} old metrics")
                     
         except Exception as e:
             logger.error(f"❌ Failed to cleanup old metrics: {e}")
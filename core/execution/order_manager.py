@@ -15,9 +15,10 @@ from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 import sqlite3
-import aiosqlite
 from pathlib import Path
 
+from core.execution.persistence import get_sqlite_writer
+
 logger = logging.getLogger(__name__)
 
 
@@ -72,7 +73,11 @@ class OrderManager:
         
         # Database configuration
         self.db_path = self.config.get('db_path', 'output/orders.db')
-        self.db_connection = None
+        self.writer = get_sqlite_writer(
+            self.db_path,
+            batch_size=self.config.get('db_batch_size', 100),
+            flush_interval_ms=self.config.get('db_flush_interval_ms', 250)
+        )
         
         # In-memory order tracking
         self.active_orders: Dict[str, Order] = {}
@@ -121,36 +126,35 @@ class OrderManager:
     async def _init_database(self):
         """Initialize the SQLite database for order persistence."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('''
-                    CREATE TABLE IF NOT EXISTS orders (
-                        order_id TEXT PRIMARY KEY,
-                        signal TEXT NOT NULL,
-                        status TEXT NOT NULL,
-                        priority INTEGER NOT NULL,
-                        created_at TEXT NOT NULL,
-                        updated_at TEXT NOT NULL,
-                        execution_attempts INTEGER DEFAULT 0,
-                        max_attempts INTEGER DEFAULT 3,
-                        error_message TEXT,
-                        transaction_result TEXT,
-                        execution_time REAL,
-                        estimated_value REAL,
-                        actual_value REAL,
-                        fees_paid REAL,
-                        slippage REAL
-                    )
-                ''')
-                
-                await db.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)
-                ''')
-                
-                await db.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_orders_created_at ON orders(created_at)
-                ''')
-                
-                await db.commit()
+            await self.writer.start()
+
+            await self.writer.execute('''
+                CREATE TABLE IF NOT EXISTS orders (
+                    order_id TEXT PRIMARY KEY,
+                    signal TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    execution_attempts INTEGER DEFAULT 0,
+                    max_attempts INTEGER DEFAULT 3,
+                    error_message TEXT,
+                    transaction_result TEXT,
+                    execution_time REAL,
+                    estimated_value REAL,
+                    actual_value REAL,
+                    fees_paid REAL,
+                    slippage REAL
+                )
+            ''')
+            
+            await self.writer.execute('''
+                CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)
+            ''')
+            
+            await self.writer.execute('''
+                CREATE INDEX IF NOT EXISTS idx_orders_created_at ON orders(created_at)
+            ''')
                 
             logger.info("✅ Order database initialized")
             
@@ -161,18 +165,16 @@ class OrderManager:
     async def _load_orders_from_db(self):
         """Load existing orders from database."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute('SELECT * FROM orders ORDER BY created_at DESC LIMIT 1000') as cursor:
-                    rows = await cursor.fetchall()
-                    
-                    for row in rows:
-                        order = self._row_to_order(row)
-                        
-                        # Add to appropriate collection
-                        if order.status in [OrderStatus.PENDING, OrderStatus.EXECUTING]:
-                            self.active_orders[order.order_id] = order
-                        else:
-                            self.order_history.append(order)
+            rows = await self.writer.fetchall('SELECT * FROM orders ORDER BY created_at DESC LIMIT 1000')
+            
+            for row in rows:
+                order = self._row_to_order(row)
+                
+                # Add to appropriate collection
+                if order.status in [OrderStatus.PENDING, OrderStatus.EXECUTING]:
+                    self.active_orders[order.order_id] = order
+                else:
+                    self.order_history.append(order)
             
             logger.info(f"📋 Loaded {len(self.active_orders)} active orders and {len(self.order_history)} historical orders")
             
@@ -273,33 +275,32 @@ class OrderManager:
             return False
 
     async def _save_order_to_db(self, order: Order):
-        """Save order to database."""
+        """Queue the order row for the next batched write."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute('''
-                    INSERT OR REPLACE INTO orders (
-                        order_id, signal, status, priority, created_at, updated_at,
-                        execution_attempts, max_attempts, error_message, transaction_result,
-                        execution_time, estimated_value, actual_value, fees_paid, slippage
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    order.order_id,
-                    json.dumps(order.signal),
-                    order.status.value,
-                    order.priority.value,
-                    order.created_at.isoformat(),
-                    order.updated_at.isoformat(),
-                    order.execution_attempts,
-                    order.max_attempts,
-                    order.error_message,
-                    json.dumps(order.transaction_result) if order.transaction_result else None,
-                    order.execution_time,
-                    order.estimated_value,
-                    order.actual_value,
-                    order.fees_paid,
-                    order.slippage
-                ))
-                await db.commit()
+            # Keyed by order_id so repeated updates before a flush write one row
+            self.writer.enqueue('''
+                INSERT OR REPLACE INTO orders (
+                    order_id, signal, status, priority, created_at, updated_at,
+                    execution_attempts, max_attempts, error_message, transaction_result,
+                    execution_time, estimated_value, actual_value, fees_paid, slippage
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                order.order_id,
+                json.dumps(order.signal),
+                order.status.value,
+                order.priority.value,
+                order.created_at.isoformat(),
+                order.updated_at.isoformat(),
+                order.execution_attempts,
+                order.max_attempts,
+                order.error_message,
+                json.dumps(order.transaction_result) if order.transaction_result else None,
+                order.execution_time,
+                order.estimated_value,
+                order.actual_value,
+                order.fees_paid,
+                order.slippage
+            ), key=order.order_id)
                 
         except Exception as e:
             logger.error(f"❌ Failed to save order to database: {e}")
@@ -317,11 +318,9 @@ class OrderManager:
         
         # Check database
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute('SELECT * FROM orders WHERE order_id = ?', (order_id,)) as cursor:
-                    row = await cursor.fetchone()
-                    if row:
-                        return self._row_to_order(row)
+            rows = await self.writer.fetchall('SELECT * FROM orders WHERE order_id = ?', (order_id,))
+            if rows:
+                return self._row_to_order(rows[0])
         except Exception as e:
             logger.error(f"❌ Failed to get order from database: {e}")
         
@@ -436,5 +435,10 @@ class OrderManager:
             'total_fees_paid': round(self.stats['total_fees_paid'], 6),
             'success_rate_pct': round(
                 (self.stats['completed_orders'] / max(1, self.stats['total_orders'])) * 100, 2
-            )
+            ),
+            'persistence': self.writer.get_stats()
         }
+
+    async def flush(self):
+        """Write any queued order updates to the database."""
+        await self.writer.flush()
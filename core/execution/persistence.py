@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Batched SQLite Persistence for Synergy7 Trading System
+
+This module provides a shared async writer that keeps one WAL-mode connection
+per database file, queues row writes from the execution components and flushes
+them in a single transaction every N rows or M milliseconds.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple, Hashable
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+
+class BatchedSQLiteWriter:
+    """
+    Coalescing, batched writer over a single SQLite connection.
+
+    Writes are queued without touching the database and flushed together:
+    - when batch_size rows are queued
+    - every flush_interval_ms milliseconds
+    - on flush()/close(), e.g. from the shutdown handler
+
+    Writes enqueued with a key replace any still-queued write with the same
+    statement and key, so repeated updates of one order cost one row write.
+
+    A batch that fails to commit (e.g. "database is locked") is put back at
+    the front of the queue and retried on the next flush, up to
+    max_flush_retries times per row.
+    """
+
+    def __init__(self, db_path: str, batch_size: int = 100, flush_interval_ms: int = 250,
+                 max_flush_retries: int = 5):
+        """
+        Initialize the writer.
+
+        Args:
+            db_path: SQLite database path
+            batch_size: Queued rows that trigger an immediate flush
+            flush_interval_ms: Maximum time a queued row waits before flushing
+            max_flush_retries: Failed flushes a row survives before it is dropped
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_flush_retries = max_flush_retries
+
+        self.db: Optional[aiosqlite.Connection] = None
+        self._queue: "OrderedDict[Hashable, Tuple[str, tuple]]" = OrderedDict()
+        self._retries: Dict[Hashable, int] = {}
+        self._sequence = 0
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+
+        # Statistics
+        self.stats = {
+            'rows_enqueued': 0,
+            'rows_coalesced': 0,
+            'rows_written': 0,
+            'flushes': 0,
+            'flush_errors': 0,
+            'rows_dropped': 0,
+            'last_flush_ms': 0.0
+        }
+
+    async def start(self):
+        """Open the connection in WAL mode and start the flusher (idempotent)."""
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+
+        async with self._start_lock:
+            if self.db is not None:
+                return
+
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            self.db = await aiosqlite.connect(self.db_path)
+            await self.db.execute('PRAGMA journal_mode=WAL')
+            await self.db.execute('PRAGMA synchronous=NORMAL')
+            await self.db.commit()
+
+            self._flush_lock = asyncio.Lock()
+            self._batch_ready = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+            logger.info(f"✅ Batched SQLite writer started for {self.db_path}")
+
+    async def execute(self, sql: str, params: tuple = ()):
+        """Run a statement immediately (schema setup, deletes) after pending writes."""
+        await self.start()
+        # Holding the flush lock keeps a background flush from committing mid-statement
+        async with self._flush_lock:
+            await self._flush_locked()
+            cursor = await self.db.execute(sql, params)
+            await self.db.commit()
+            return cursor
+
+    async def fetchall(self, sql: str, params: tuple = ()) -> List[tuple]:
+        """Run a query on the shared connection after flushing pending writes."""
+        await self.start()
+        async with self._flush_lock:
+            await self._flush_locked()
+            async with self.db.execute(sql, params) as cursor:
+                return await cursor.fetchall()
+
+    def enqueue(self, sql: str, params: tuple, key: Optional[Hashable] = None):
+        """
+        Queue a write without waiting for the database.
+
+        Args:
+            sql: Parameterized INSERT/UPDATE statement
+            params: Statement parameters
+            key: Optional coalescing key; a queued write with the same sql and
+                key is replaced by this one
+        """
+        self.stats['rows_enqueued'] += 1
+
+        if key is None:
+            self._sequence += 1
+            queue_key = ('_seq', self._sequence)
+        else:
+            queue_key = (sql, key)
+            if queue_key in self._queue:
+                self.stats['rows_coalesced'] += 1
+                del self._queue[queue_key]
+            self._retries.pop(queue_key, None)
+
+        self._queue[queue_key] = (sql, params)
+
+        if len(self._queue) >= self.batch_size and self._batch_ready is not None:
+            self._batch_ready.set()
+
+    async def flush(self):
+        """Write all queued rows in one transaction."""
+        if self.db is None or self._flush_lock is None:
+            return
+
+        async with self._flush_lock:
+            await self._flush_locked()
+
+    async def _flush_locked(self):
+        """Write all queued rows; the caller holds _flush_lock."""
+        if not self._queue:
+            return
+
+        batch = list(self._queue.items())
+        self._queue.clear()
+        start_time = time.perf_counter()
+
+        try:
+            # Group consecutive rows with the same statement for executemany
+            groups: List[Tuple[str, List[tuple]]] = []
+            for _, (sql, params) in batch:
+                if groups and groups[-1][0] == sql:
+                    groups[-1][1].append(params)
+                else:
+                    groups.append((sql, [params]))
+
+            for sql, rows in groups:
+                await self.db.executemany(sql, rows)
+            await self.db.commit()
+
+            for queue_key, _ in batch:
+                self._retries.pop(queue_key, None)
+            self.stats['rows_written'] += len(batch)
+            self.stats['flushes'] += 1
+            self.stats['last_flush_ms'] = round((time.perf_counter() - start_time) * 1000, 3)
+
+        except Exception as e:
+            self.stats['flush_errors'] += 1
+            logger.error(f"❌ Failed to flush {len(batch)} rows to {self.db_path}: {e}")
+            try:
+                await self.db.rollback()
+            except Exception:
+                pass
+            self._requeue(batch)
+
+    def _requeue(self, batch: List[Tuple[Hashable, Tuple[str, tuple]]]):
+        """Put a failed batch back at the front of the queue for the next flush."""
+        requeued: "OrderedDict[Hashable, Tuple[str, tuple]]" = OrderedDict()
+        dropped = 0
+
+        for queue_key, row in batch:
+            # A newer write with the same key was queued while flushing
+            if queue_key in self._queue:
+                continue
+
+            attempts = self._retries.get(queue_key, 0) + 1
+            if attempts > self.max_flush_retries:
+                self._retries.pop(queue_key, None)
+                dropped += 1
+                continue
+
+            self._retries[queue_key] = attempts
+            requeued[queue_key] = row
+
+        if dropped:
+            self.stats['rows_dropped'] += dropped
+            logger.error(f"❌ Dropped {dropped} rows for {self.db_path} after {self.max_flush_retries} failed flushes")
+
+        requeued.update(self._queue)
+        self._queue = requeued
+
+    async def _flush_loop(self):
+        """Flush every flush_interval or as soon as a full batch is queued."""
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._batch_ready.clear()
+                await self.flush()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error in SQLite flush loop: {e}")
+                await asyncio.sleep(1.0)
+
+    async def close(self):
+        """Flush pending writes and close the connection."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        if self.db is not None:
+            async with self._flush_lock:
+                await self._flush_locked()
+                await self.db.close()
+                self.db = None
+
+        logger.info(f"✅ Batched SQLite writer closed for {self.db_path}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get writer statistics."""
+        return {
+            'db_path': self.db_path,
+            'queued_rows': len(self._queue),
+            **self.stats
+        }
+
+
+# Writers keyed by absolute database path
+_sqlite_writers: Dict[str, BatchedSQLiteWriter] = {}
+_shutdown_hook_registered = False
+
+def get_sqlite_writer(db_path: str, batch_size: int = 100, flush_interval_ms: int = 250) -> BatchedSQLiteWriter:
+    """
+    Get the shared writer for a database file.
+
+    Components configured with the same database path share one connection
+    and one write queue. The first call registers close_all_writers() with
+    the system shutdown handler so queued rows are flushed on exit.
+    """
+    global _shutdown_hook_registered
+
+    key = os.path.abspath(db_path)
+    if key not in _sqlite_writers:
+        _sqlite_writers[key] = BatchedSQLiteWriter(db_path, batch_size, flush_interval_ms)
+
+    if not _shutdown_hook_registered:
+        try:
+            from phase_4_deployment.core.shutdown_handler import register_async_shutdown_callback
+            register_async_shutdown_callback(close_all_writers)
+        except ImportError:
+            logger.debug("Shutdown handler not available; call close_all_writers() on exit")
+        _shutdown_hook_registered = True
+
+    return _sqlite_writers[key]
+
+async def flush_all_writers():
+    """Flush every shared writer."""
+    for writer in list(_sqlite_writers.values()):
+        await writer.flush()
+
+async def close_all_writers():
+    """Flush and close every shared writer (shutdown hook)."""
+    for writer in list(_sqlite_writers.values()):
+        try:
+            await writer.close()
+        except Exception as e:
+            logger.error(f"❌ Error closing SQLite writer for {writer.db_path}: {e}")
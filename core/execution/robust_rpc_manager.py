@@ -7,11 +7,13 @@ and intelligent routing to ensure maximum uptime and reliability.
 """
 
 import asyncio
+import bisect
 import logging
 import time
 import os
+from collections import deque
 from typing import Dict, Any, Optional, List, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import json
 
@@ -23,6 +25,80 @@ except ImportError:
     logger.warning("httpx not available, using basic HTTP client")
     httpx = None
 
+try:
+    import h2  # noqa: F401 - httpx needs the h2 package for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# Read-only JSON-RPC methods that are safe to send to several endpoints at once
+HEDGEABLE_METHODS = {
+    'getAccountInfo',
+    'getBalance',
+    'getBlockHeight',
+    'getLatestBlockhash',
+    'getMultipleAccounts',
+    'getSignatureStatuses',
+    'getSlot',
+    'getTokenAccountBalance',
+    'getTokenAccountsByOwner',
+    'getTransaction',
+}
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram with a bounded window of recent samples.
+
+    Bucket counts cover the endpoint's whole lifetime and are cheap to export;
+    percentiles are computed from the recent window so they track current
+    endpoint performance. The sorted window is cached until the next record(),
+    so endpoint ordering doesn't re-sort it on every request.
+    """
+
+    BUCKET_BOUNDS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self, window_size: int = 256):
+        self.bucket_counts = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self.recent = deque(maxlen=window_size)
+        self.count = 0
+        self.total_ms = 0.0
+        self._ordered: Optional[List[float]] = None
+
+    def record(self, latency_seconds: float):
+        """Record one request latency."""
+        latency_ms = latency_seconds * 1000
+        self.bucket_counts[bisect.bisect_left(self.BUCKET_BOUNDS_MS, latency_ms)] += 1
+        self.recent.append(latency_ms)
+        self._ordered = None
+        self.count += 1
+        self.total_ms += latency_ms
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Return the given percentile (0-100) of recent latencies in ms."""
+        if not self.recent:
+            return None
+        if self._ordered is None:
+            self._ordered = sorted(self.recent)
+        ordered = self._ordered
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Export the histogram for status reporting."""
+        buckets = {f"le_{bound}ms": count for bound, count in zip(self.BUCKET_BOUNDS_MS, self.bucket_counts)}
+        buckets['gt_10000ms'] = self.bucket_counts[-1]
+        p50, p95, p99 = self.percentile(50), self.percentile(95), self.percentile(99)
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 2) if self.count else None,
+            'p50_ms': round(p50, 2) if p50 is not None else None,
+            'p95_ms': round(p95, 2) if p95 is not None else None,
+            'p99_ms': round(p99, 2) if p99 is not None else None,
+            'buckets': buckets
+        }
+
 
 class EndpointStatus(Enum):
     """Endpoint status enumeration."""
@@ -46,6 +122,8 @@ class RpcEndpoint:
     consecutive_failures: int = 0
     response_time: float = 0.0
     features: List[str] = None  # e.g., ['bundles', 'streaming']
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram, repr=False)
+    client: Any = field(default=None, repr=False)  # Long-lived httpx.AsyncClient
     
     def __post_init__(self):
         if self.features is None:
@@ -62,6 +140,8 @@ class RobustRpcManager:
     - Circuit breaker pattern for failed endpoints
     - Performance monitoring and optimization
     - Intelligent request routing based on endpoint capabilities
+    - Persistent keep-alive (HTTP/2 when available) client per endpoint
+    - Optional hedged requests for read-only methods
     """
     
     def __init__(self, config: Dict[str, Any] = None):
@@ -73,6 +153,20 @@ class RobustRpcManager:
         self.circuit_breaker_threshold = 3  # Failures before marking as failed
         self.recovery_check_interval = 300.0  # Check failed endpoints every 5 minutes
         
+        # Connection pooling
+        self.max_connections = self.config.get('rpc_max_connections', 20)
+        self.max_keepalive_connections = self.config.get('rpc_max_keepalive_connections', 10)
+        self.keepalive_expiry = self.config.get('rpc_keepalive_expiry', 30.0)
+        
+        # Hedged requests (opt-in): after a p95-derived delay - or at once if
+        # the attempt fails - fire the same read-only payload at the next
+        # endpoint and take the first good answer
+        self.hedged_requests = self.config.get('hedged_requests', False)
+        self.hedge_min_delay = self.config.get('hedge_min_delay', 0.05)
+        self.hedge_max_delay = self.config.get('hedge_max_delay', 1.0)
+        self.hedged_request_count = 0
+        self.hedge_win_count = 0
+        
         # Performance tracking
         self.request_count = 0
         self.success_count = 0
@@ -130,7 +224,6 @@ class RobustRpcManager:
     
     def _select_primary_endpoint(self):
         """Select the best available primary endpoint."""
-        # Sort by priority (lower number = higher priority) and status
         available_endpoints = [
             ep for ep in self.endpoints.values() 
             if ep.status != EndpointStatus.FAILED
@@ -140,8 +233,7 @@ class RobustRpcManager:
             logger.error("❌ No available endpoints!")
             return
         
-        # Sort by priority, then by status
-        available_endpoints.sort(key=lambda x: (x.priority, x.consecutive_failures))
+        available_endpoints.sort(key=self._endpoint_sort_key)
         
         new_primary = available_endpoints[0].name
         if new_primary != self.current_primary:
@@ -149,6 +241,49 @@ class RobustRpcManager:
             self.current_primary = new_primary
             logger.info(f"🔄 Primary endpoint changed: {old_primary} -> {new_primary}")
     
+    def _endpoint_sort_key(self, endpoint: RpcEndpoint):
+        """
+        Rank endpoints by health, then measured median latency, then static priority.
+
+        Endpoints without latency samples sort after measured ones; health
+        checks record samples for every endpoint so they are measured quickly.
+        """
+        p50 = endpoint.latency.percentile(50)
+        return (
+            endpoint.consecutive_failures,
+            p50 if p50 is not None else float('inf'),
+            endpoint.priority
+        )
+
+    def _get_client(self, endpoint: RpcEndpoint):
+        """Return the long-lived client for an endpoint, creating it on first use."""
+        if endpoint.client is None or endpoint.client.is_closed:
+            headers = {"Content-Type": "application/json"}
+            if endpoint.api_key:
+                headers["Authorization"] = f"Bearer {endpoint.api_key}"
+
+            endpoint.client = httpx.AsyncClient(
+                timeout=endpoint.timeout,
+                headers=headers,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                )
+            )
+        return endpoint.client
+
+    async def close(self):
+        """Close the pooled endpoint clients."""
+        for endpoint in self.endpoints.values():
+            if endpoint.client is not None:
+                try:
+                    await endpoint.client.aclose()
+                except Exception as e:
+                    logger.debug(f"⚠️ Error closing client for {endpoint.name}: {e}")
+                endpoint.client = None
+
     async def _health_check_endpoint(self, endpoint: RpcEndpoint) -> bool:
         """Check the health of a specific endpoint."""
         if not httpx:
@@ -165,30 +300,27 @@ class RobustRpcManager:
         try:
             start_time = time.time()
             
-            headers = {"Content-Type": "application/json"}
-            if endpoint.api_key:
-                headers["Authorization"] = f"Bearer {endpoint.api_key}"
+            client = self._get_client(endpoint)
+            response = await client.post(endpoint.url, json=test_payload)
             
-            async with httpx.AsyncClient(timeout=endpoint.timeout) as client:
-                response = await client.post(endpoint.url, json=test_payload, headers=headers)
-                
-                response_time = time.time() - start_time
-                endpoint.response_time = response_time
-                endpoint.last_check = time.time()
-                
-                if response.status_code == 200:
-                    endpoint.consecutive_failures = 0
-                    endpoint.status = EndpointStatus.HEALTHY
-                    logger.debug(f"✅ {endpoint.name} health check passed ({response_time:.3f}s)")
-                    return True
+            response_time = time.time() - start_time
+            endpoint.response_time = response_time
+            endpoint.last_check = time.time()
+            
+            if response.status_code == 200:
+                endpoint.latency.record(response_time)
+                endpoint.consecutive_failures = 0
+                endpoint.status = EndpointStatus.HEALTHY
+                logger.debug(f"✅ {endpoint.name} health check passed ({response_time:.3f}s)")
+                return True
+            else:
+                endpoint.consecutive_failures += 1
+                if endpoint.consecutive_failures >= self.circuit_breaker_threshold:
+                    endpoint.status = EndpointStatus.FAILED
+                    logger.warning(f"❌ {endpoint.name} marked as failed after {endpoint.consecutive_failures} failures")
                 else:
-                    endpoint.consecutive_failures += 1
-                    if endpoint.consecutive_failures >= self.circuit_breaker_threshold:
-                        endpoint.status = EndpointStatus.FAILED
-                        logger.warning(f"❌ {endpoint.name} marked as failed after {endpoint.consecutive_failures} failures")
-                    else:
-                        endpoint.status = EndpointStatus.DEGRADED
-                    return False
+                    endpoint.status = EndpointStatus.DEGRADED
+                return False
                     
         except Exception as e:
             endpoint.consecutive_failures += 1
@@ -232,7 +364,8 @@ class RobustRpcManager:
     
     async def make_request(self, payload: Dict[str, Any], 
                           preferred_endpoint: Optional[str] = None,
-                          require_features: Optional[List[str]] = None) -> Dict[str, Any]:
+                          require_features: Optional[List[str]] = None,
+                          hedge: Optional[bool] = None) -> Dict[str, Any]:
         """
         Make an RPC request with automatic failover.
         
@@ -240,6 +373,8 @@ class RobustRpcManager:
             payload: JSON-RPC payload
             preferred_endpoint: Preferred endpoint name (optional)
             require_features: Required endpoint features (optional)
+            hedge: Override the configured hedged_requests setting (optional).
+                Only read-only methods in HEDGEABLE_METHODS are ever hedged.
             
         Returns:
             RPC response or error
@@ -255,42 +390,123 @@ class RobustRpcManager:
                 'code': -32000
             }
         
+        use_hedge = self.hedged_requests if hedge is None else hedge
+        if use_hedge and len(endpoint_order) > 1 and payload.get('method') in HEDGEABLE_METHODS:
+            return await self._make_hedged_request(endpoint_order, payload)
+        
         last_error = None
         
         # Try endpoints in order
         for endpoint_name in endpoint_order:
-            endpoint = self.endpoints[endpoint_name]
+            result, error = await self._attempt_endpoint(endpoint_name, payload)
+            if result is not None:
+                return result
+            last_error = error
+        
+        # All endpoints failed
+        return {
+            'error': f'All endpoints failed. Last error: {last_error}',
+            'code': -32001
+        }
+    
+    async def _attempt_endpoint(self, endpoint_name: str, payload: Dict[str, Any]):
+        """
+        Send a payload to one endpoint and update its health and latency.
+        
+        Returns:
+            (result, None) on success or (None, error) on failure
+        """
+        endpoint = self.endpoints[endpoint_name]
+        
+        try:
+            start_time = time.time()
+            result = await self._make_single_request(endpoint, payload)
+            response_time = time.time() - start_time
+            endpoint.latency.record(response_time)
             
-            try:
-                start_time = time.time()
-                result = await self._make_single_request(endpoint, payload)
-                response_time = time.time() - start_time
+            if 'error' not in result:
+                # Success
+                self.success_count += 1
+                self.total_response_time += response_time
+                endpoint.consecutive_failures = 0
+                endpoint.status = EndpointStatus.HEALTHY
                 
-                if 'error' not in result:
-                    # Success
-                    self.success_count += 1
-                    self.total_response_time += response_time
-                    endpoint.consecutive_failures = 0
-                    endpoint.status = EndpointStatus.HEALTHY
-                    
-                    logger.debug(f"✅ Request successful via {endpoint_name} ({response_time:.3f}s)")
-                    return result
-                else:
-                    # RPC error
-                    last_error = result['error']
-                    logger.warning(f"⚠️ RPC error from {endpoint_name}: {last_error}")
-                    
-            except Exception as e:
-                last_error = str(e)
-                endpoint.consecutive_failures += 1
+                logger.debug(f"✅ Request successful via {endpoint_name} ({response_time:.3f}s)")
+                return result, None
+            
+            # RPC error
+            logger.warning(f"⚠️ RPC error from {endpoint_name}: {result['error']}")
+            return None, result['error']
+            
+        except Exception as e:
+            endpoint.consecutive_failures += 1
+            
+            if endpoint.consecutive_failures >= self.circuit_breaker_threshold:
+                endpoint.status = EndpointStatus.FAILED
+                logger.warning(f"❌ {endpoint_name} marked as failed")
+            
+            logger.warning(f"⚠️ Request failed via {endpoint_name}: {str(e)}")
+            return None, str(e)
+    
+    def _hedge_delay(self, endpoint: RpcEndpoint) -> float:
+        """Delay before hedging past an endpoint, derived from its p95 latency."""
+        p95_ms = endpoint.latency.percentile(95)
+        if p95_ms is None:
+            return self.hedge_max_delay
+        return min(self.hedge_max_delay, max(self.hedge_min_delay, p95_ms / 1000))
+    
+    async def _make_hedged_request(self, endpoint_order: List[str], payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Race a read-only request across endpoints.
+        
+        The next endpoint is launched when the newest in-flight attempt has not
+        answered within its p95-derived delay, or immediately once every
+        in-flight attempt has failed (a failing primary falls back without
+        waiting out the delay). The first successful answer wins and the other
+        attempts are cancelled.
+        """
+        self.hedged_request_count += 1
+        remaining = list(endpoint_order)
+        in_flight: Dict[asyncio.Task, str] = {}
+        last_error = None
+        
+        def launch_next():
+            name = remaining.pop(0)
+            task = asyncio.create_task(self._attempt_endpoint(name, payload))
+            in_flight[task] = name
+            return name
+        
+        current = launch_next()
+        primary_task = next(iter(in_flight))
+        try:
+            while in_flight:
+                timeout = self._hedge_delay(self.endpoints[current]) if remaining else None
+                done, _ = await asyncio.wait(in_flight.keys(), timeout=timeout,
+                                             return_when=asyncio.FIRST_COMPLETED)
                 
-                if endpoint.consecutive_failures >= self.circuit_breaker_threshold:
-                    endpoint.status = EndpointStatus.FAILED
-                    logger.warning(f"❌ {endpoint_name} marked as failed")
+                if not done:
+                    # Slow answer: hedge to the next endpoint
+                    current = launch_next()
+                    logger.debug(f"🔀 Hedging {payload.get('method')} to {current}")
+                    continue
                 
-                logger.warning(f"⚠️ Request failed via {endpoint_name}: {str(e)}")
+                for task in done:
+                    in_flight.pop(task)
+                    result, error = task.result()
+                    if result is not None:
+                        # A hedge win beats a primary that is still running;
+                        # answering after the primary failed is plain failover
+                        if task is not primary_task and not primary_task.done():
+                            self.hedge_win_count += 1
+                        return result
+                    last_error = error
+                
+                if remaining and not in_flight:
+                    current = launch_next()
+        finally:
+            for task in in_flight:
+                task.cancel()
         
-        # All endpoints failed
         return {
             'error': f'All endpoints failed. Last error: {last_error}',
             'code': -32001
@@ -316,8 +532,8 @@ class RobustRpcManager:
         if not available_endpoints:
             return []
         
-        # Sort by priority and status
-        available_endpoints.sort(key=lambda x: (x[1].priority, x[1].consecutive_failures))
+        # Sort by health and measured latency
+        available_endpoints.sort(key=lambda x: self._endpoint_sort_key(x[1]))
         
         endpoint_names = [name for name, _ in available_endpoints]
         
@@ -333,17 +549,13 @@ class RobustRpcManager:
         if not httpx:
             raise Exception("httpx not available for HTTP requests")
         
-        headers = {"Content-Type": "application/json"}
-        if endpoint.api_key:
-            headers["Authorization"] = f"Bearer {endpoint.api_key}"
+        client = self._get_client(endpoint)
+        response = await client.post(endpoint.url, json=payload)
         
-        async with httpx.AsyncClient(timeout=endpoint.timeout) as client:
-            response = await client.post(endpoint.url, json=payload, headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise Exception(f"HTTP {response.status_code}: {response.text[:200]}")
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise Exception(f"HTTP {response.status_code}: {response.text[:200]}")
     
     def get_status(self) -> Dict[str, Any]:
         """Get current manager status."""
@@ -357,6 +569,11 @@ class RobustRpcManager:
             'success_count': self.success_count,
             'success_rate_pct': round(success_rate, 2),
             'avg_response_time_ms': round(avg_response_time * 1000, 2),
+            'http2_enabled': HTTP2_AVAILABLE,
+            'hedged_requests': self.hedged_requests,
+            'hedged_request_count': self.hedged_request_count,
+            'hedge_win_count': self.hedge_win_count,
+            'endpoint_order': self._get_endpoint_order(),
             'endpoints': {
                 name: {
                     'status': ep.status.value,
@@ -364,7 +581,8 @@ class RobustRpcManager:
                     'response_time_ms': round(ep.response_time * 1000, 2),
                     'last_check': ep.last_check,
                     'priority': ep.priority,
-                    'features': ep.features
+                    'features': ep.features,
+                    'latency': ep.latency.to_dict()
                 }
                 for name, ep in self.endpoints.items()
             }
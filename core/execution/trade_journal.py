@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+"""
+Trade Journal for Synergy7 Trading System
+
+This module provides the append-only JSONL journal of live trades that
+replaces one trade_*.json file per trade. The writer batches fsyncs and keeps
+session aggregates (count, win rate, PnL, fees, volume) up to date on every
+append; readers tail the journal from a byte offset, so refreshing a
+dashboard or report only reads trades appended since the last refresh.
+"""
+
+import os
+import json
+import glob
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Deque, Iterator, AsyncIterator, Type
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRADES_DIR = "output/live_production/trades"
+JOURNAL_FILENAME = "trades.jsonl"
+AGGREGATES_FILENAME = "trades_aggregates.json"
+LEGACY_PATTERN = "trade_*.json"
+
+# Signatures no longer than this are placeholders, not on-chain transactions
+MIN_SIGNATURE_LENGTH = 20
+
+
+def _number(value: Any) -> float:
+    """Coerce a stored value to float (None and junk count as 0)."""
+    try:
+        return float(value or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def trade_timestamp(record: Dict[str, Any]) -> Optional[datetime]:
+    """Parse a trade record's timestamp."""
+    try:
+        return datetime.fromisoformat(record['timestamp'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class SessionAggregates:
+    """
+    Running totals over a set of trade records.
+
+    add() and remove() are O(1), so the same class serves both whole-journal
+    session totals and sliding windows (remove records as they age out).
+    The "latest" fields (balance, regime, signatures) only move forward.
+    """
+
+    def __init__(self, recent_signatures: int = 10):
+        self.recent_signature_limit = recent_signatures
+        self.reset()
+
+    def reset(self) -> None:
+        self.trades = 0
+        self.successful = 0
+        self.failed = 0
+        self.volume_sol = 0.0
+        self.volume_usd = 0.0
+        self.sized_trades = 0
+        self.fees_sol = 0.0
+        self.pnl_sol = 0.0
+        self.execution_time_total = 0.0
+        self.timed_trades = 0
+        self.verified_signatures = 0
+        self.strategies: Dict[str, int] = {}
+        self.regimes: Dict[str, int] = {}
+
+        self.first_timestamp: Optional[str] = None
+        self.last_timestamp: Optional[str] = None
+        self.last_balance_sol: Optional[float] = None
+        self.last_regime: Optional[str] = None
+        self.recent_signatures: Deque[str] = deque(maxlen=self.recent_signature_limit)
+
+    @staticmethod
+    def _count(counts: Dict[str, int], key: str, sign: int) -> None:
+        counts[key] = counts.get(key, 0) + sign
+        if counts[key] <= 0:
+            del counts[key]
+
+    def _apply(self, record: Dict[str, Any], sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) a record's contribution."""
+        result = record.get('result') or {}
+        signal = record.get('signal') or {}
+        balance = record.get('balance_validation') or {}
+
+        self.trades += sign
+        if result.get('success', False):
+            self.successful += sign
+            # Any signature on a successful trade counts as blockchain-verified
+            if result.get('signature'):
+                self.verified_signatures += sign
+        else:
+            self.failed += sign
+
+        self.volume_sol += sign * _number(signal.get('size'))
+        size_usd = _number((signal.get('position_info') or {}).get('position_size_usd'))
+        if size_usd > 0:
+            self.volume_usd += sign * size_usd
+            self.sized_trades += sign
+
+        self.fees_sol += sign * _number(result.get('fee_sol', result.get('fee')))
+        self.pnl_sol += sign * _number(balance.get('balance_change'))
+
+        execution_time = _number(record.get('execution_time'))
+        if execution_time > 0:
+            self.execution_time_total += sign * execution_time
+            self.timed_trades += sign
+
+        self._count(self.strategies, signal.get('source', 'unknown'), sign)
+        self._count(self.regimes, (signal.get('regime_info') or {}).get('regime', 'unknown'), sign)
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Add a trade record (records should arrive in journal order)."""
+        self._apply(record, 1)
+
+        timestamp = record.get('timestamp')
+        if timestamp:
+            if self.first_timestamp is None:
+                self.first_timestamp = timestamp
+            self.last_timestamp = timestamp
+
+        signature = (record.get('result') or {}).get('signature') or ''
+        if signature != 'N/A' and len(signature) > MIN_SIGNATURE_LENGTH:
+            self.recent_signatures.append(signature)
+
+        balance_after = _number((record.get('balance_validation') or {}).get('balance_after'))
+        if balance_after > 0:
+            self.last_balance_sol = balance_after
+
+        regime = ((record.get('signal') or {}).get('regime_info') or {}).get('regime')
+        if regime:
+            self.last_regime = regime
+
+    def remove(self, record: Dict[str, Any]) -> None:
+        """Remove a previously added record (e.g. when it leaves a window)."""
+        self._apply(record, -1)
+        if self.trades <= 0:
+            # Clear accumulated floating-point residue
+            self.reset()
+
+    # Derived values
+
+    @property
+    def win_rate(self) -> float:
+        """Successful trades as a percentage of all trades."""
+        return self.successful / self.trades * 100 if self.trades else 0.0
+
+    @property
+    def avg_trade_size_usd(self) -> float:
+        return self.volume_usd / self.sized_trades if self.sized_trades else 0.0
+
+    @property
+    def avg_execution_time(self) -> float:
+        return self.execution_time_total / self.timed_trades if self.timed_trades else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'trades': self.trades,
+            'successful': self.successful,
+            'failed': self.failed,
+            'win_rate': self.win_rate,
+            'volume_sol': self.volume_sol,
+            'volume_usd': self.volume_usd,
+            'sized_trades': self.sized_trades,
+            'avg_trade_size_usd': self.avg_trade_size_usd,
+            'fees_sol': self.fees_sol,
+            'pnl_sol': self.pnl_sol,
+            'execution_time_total': self.execution_time_total,
+            'timed_trades': self.timed_trades,
+            'avg_execution_time': self.avg_execution_time,
+            'verified_signatures': self.verified_signatures,
+            'strategies': dict(self.strategies),
+            'regimes': dict(self.regimes),
+            'first_timestamp': self.first_timestamp,
+            'last_timestamp': self.last_timestamp,
+            'last_balance_sol': self.last_balance_sol,
+            'last_regime': self.last_regime,
+            'recent_signatures': list(self.recent_signatures)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], recent_signatures: int = 10) -> 'SessionAggregates':
+        aggregates = cls(recent_signatures)
+        for field in ('trades', 'successful', 'failed', 'sized_trades', 'timed_trades', 'verified_signatures'):
+            setattr(aggregates, field, int(data.get(field, 0)))
+        for field in ('volume_sol', 'volume_usd', 'fees_sol', 'pnl_sol', 'execution_time_total'):
+            setattr(aggregates, field, float(data.get(field, 0.0)))
+        aggregates.strategies = dict(data.get('strategies', {}))
+        aggregates.regimes = dict(data.get('regimes', {}))
+        aggregates.first_timestamp = data.get('first_timestamp')
+        aggregates.last_timestamp = data.get('last_timestamp')
+        aggregates.last_balance_sol = data.get('last_balance_sol')
+        aggregates.last_regime = data.get('last_regime')
+        aggregates.recent_signatures.extend(data.get('recent_signatures', []))
+        return aggregates
+
+
+class TradeJournal:
+    """
+    Append-only JSONL trade journal (writer side).
+
+    - each append is one line written and flushed to the OS
+    - fsync is batched: every fsync_every appends, at most fsync_interval
+      seconds after the first unsynced append (a timer covers idle periods),
+      and on flush()/close()
+    - session aggregates are updated per append and written next to the
+      journal (with the byte offset they cover) at every fsync, so readers
+      can start from the snapshot instead of replaying the whole journal
+    """
+
+    def __init__(self, trades_dir: str = DEFAULT_TRADES_DIR, fsync_every: int = 10,
+                 fsync_interval: float = 1.0):
+        """
+        Initialize the journal.
+
+        Args:
+            trades_dir: Directory holding the journal (and any legacy trade files)
+            fsync_every: Appends between fsyncs
+            fsync_interval: Maximum seconds an append waits for an fsync,
+                enforced by a timer when no further appends arrive
+        """
+        self.trades_dir = trades_dir
+        self.path = os.path.join(trades_dir, JOURNAL_FILENAME)
+        self.aggregates_path = os.path.join(trades_dir, AGGREGATES_FILENAME)
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+
+        os.makedirs(trades_dir, exist_ok=True)
+        migrate_legacy_trades(trades_dir)
+
+        # Rebuild in-memory state from the snapshot plus the journal tail
+        reader = TradeJournalReader(trades_dir)
+        reader.poll()
+        self.aggregates = reader.aggregates
+        self.sequence = reader.aggregates.trades
+        reader.close()
+
+        self._file = open(self.path, 'ab')
+        self._pending = 0
+        self._last_fsync = time.monotonic()
+        self._lock = threading.RLock()
+        self._fsync_timer: Optional[threading.Timer] = None
+
+        self.stats = {
+            'appends': 0,
+            'fsyncs': 0,
+            'snapshot_errors': 0
+        }
+
+    def append(self, record: Dict[str, Any], cls: Optional[Type[json.JSONEncoder]] = None) -> int:
+        """
+        Append a trade record.
+
+        Args:
+            record: Trade record
+            cls: Optional JSON encoder for non-serializable values
+
+        Returns:
+            Sequence number of the record in the journal
+        """
+        line = json.dumps(record, cls=cls, default=None if cls else str, separators=(',', ':'))
+
+        with self._lock:
+            self._file.write(line.encode('utf-8') + b'\n')
+            self._file.flush()
+
+            # Aggregate what readers will parse back, not the raw objects
+            self.aggregates.add(json.loads(line))
+            self.sequence += 1
+            self.stats['appends'] += 1
+
+            self._pending += 1
+            if self._pending >= self.fsync_every or time.monotonic() - self._last_fsync >= self.fsync_interval:
+                self.flush()
+            elif self._fsync_timer is None:
+                # fsync this append even if no further trades arrive
+                self._fsync_timer = threading.Timer(self.fsync_interval, self._flush_on_timer)
+                self._fsync_timer.daemon = True
+                self._fsync_timer.start()
+            return self.sequence
+
+    def flush(self) -> None:
+        """fsync appended records and write the aggregates snapshot."""
+        with self._lock:
+            self._cancel_fsync_timer()
+            if self._file is None:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._pending = 0
+            self._last_fsync = time.monotonic()
+            self.stats['fsyncs'] += 1
+            self._write_snapshot()
+
+    def _flush_on_timer(self) -> None:
+        """Timer callback: fsync appends left pending by an idle period."""
+        try:
+            with self._lock:
+                self._fsync_timer = None
+                if self._pending:
+                    self.flush()
+        except Exception as e:
+            logger.error(f"Error in timed trade journal fsync: {e}")
+
+    def _cancel_fsync_timer(self) -> None:
+        """Cancel the pending fsync timer, if any."""
+        if self._fsync_timer is not None:
+            self._fsync_timer.cancel()
+            self._fsync_timer = None
+
+    def _write_snapshot(self) -> None:
+        """Atomically write aggregates with the journal offset they cover."""
+        try:
+            snapshot = {
+                'offset': self._file.tell(),
+                'inode': os.fstat(self._file.fileno()).st_ino,
+                'updated': datetime.now().isoformat(),
+                'aggregates': self.aggregates.to_dict()
+            }
+            tmp_path = f"{self.aggregates_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(snapshot, f, indent=2)
+            os.replace(tmp_path, self.aggregates_path)
+        except Exception as e:
+            self.stats['snapshot_errors'] += 1
+            logger.warning(f"Could not write trade aggregates snapshot: {e}")
+
+    def close(self) -> None:
+        """Flush and close the journal."""
+        with self._lock:
+            if self._file is not None:
+                self.flush()
+                self._file.close()
+                self._file = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get journal statistics."""
+        return {
+            'path': self.path,
+            'records': self.sequence,
+            'pending_fsync': self._pending,
+            **self.stats
+        }
+
+
+class TradeJournalReader:
+    """
+    Tail-follow reader over a trade journal.
+
+    poll() returns records appended since the previous call and folds them
+    into the reader's aggregates; only complete lines are consumed, and a
+    rotated or truncated journal is re-read from the start. With
+    use_snapshot, a new reader starts from the writer's aggregates snapshot
+    and only replays the journal after it.
+    """
+
+    def __init__(self, trades_dir: str = DEFAULT_TRADES_DIR, use_snapshot: bool = True,
+                 recent_limit: int = 100):
+        """
+        Initialize the reader.
+
+        Args:
+            trades_dir: Directory holding the journal
+            use_snapshot: Start from the aggregates snapshot when it is valid
+            recent_limit: Number of most recent records kept in memory
+        """
+        self.trades_dir = trades_dir
+        self.path = os.path.join(trades_dir, JOURNAL_FILENAME)
+        self.aggregates_path = os.path.join(trades_dir, AGGREGATES_FILENAME)
+        self.use_snapshot = use_snapshot
+
+        self.aggregates = SessionAggregates()
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=recent_limit)
+        self.offset = 0
+        self._inode: Optional[int] = None
+        self._started = False
+
+        self.stats = {
+            'records_read': 0,
+            'bytes_read': 0,
+            'resets': 0,
+            'corrupt_lines': 0,
+            'snapshot_loaded': False
+        }
+
+    def _load_snapshot(self, inode: int, size: int) -> None:
+        """Start from the aggregates snapshot if it matches the journal."""
+        try:
+            with open(self.aggregates_path, 'r') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if snapshot.get('inode') != inode or snapshot.get('offset', 0) > size:
+            return
+        self.aggregates = SessionAggregates.from_dict(snapshot.get('aggregates', {}))
+        self.offset = snapshot['offset']
+        self.stats['snapshot_loaded'] = True
+
+    def _reset(self) -> None:
+        self.aggregates.reset()
+        self.recent.clear()
+        self.offset = 0
+        self.stats['resets'] += 1
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """Read records appended since the last poll."""
+        if not self._started:
+            # Readers may run before any writer has seeded the journal
+            migrate_legacy_trades(self.trades_dir)
+
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+
+        if not self._started:
+            self._started = True
+            self._inode = stat.st_ino
+            if self.use_snapshot:
+                self._load_snapshot(stat.st_ino, stat.st_size)
+        elif stat.st_ino != self._inode or stat.st_size < self.offset:
+            # Journal replaced or truncated - start over
+            self._inode = stat.st_ino
+            self._reset()
+
+        if stat.st_size == self.offset:
+            return []
+
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            data = f.read(stat.st_size - self.offset)
+
+        # Leave a partially written last line for the next poll
+        end = data.rfind(b'\n') + 1
+        if end == 0:
+            return []
+        self.offset += end
+        self.stats['bytes_read'] += end
+
+        records = []
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                self.stats['corrupt_lines'] += 1
+                logger.warning(f"Skipping corrupt line in {self.path}")
+                continue
+            self.aggregates.add(record)
+            self.recent.append(record)
+            records.append(record)
+
+        self.stats['records_read'] += len(records)
+        return records
+
+    async def follow(self, poll_interval: float = 1.0) -> AsyncIterator[Dict[str, Any]]:
+        """Yield records as they are appended (runs until cancelled)."""
+        while True:
+            for record in self.poll():
+                yield record
+            await asyncio.sleep(poll_interval)
+
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """Most recent records read by this reader, oldest first."""
+        return list(self.recent)[-limit:] if limit else []
+
+    def read_last(self, limit: int, chunk_size: int = 65536) -> List[Dict[str, Any]]:
+        """
+        Read the last records of the journal from the end of the file.
+
+        Costs O(limit) regardless of journal length and doesn't move the
+        tail offset.
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                position = f.tell()
+                data = b''
+                while position > 0 and data.count(b'\n') <= limit:
+                    step = min(chunk_size, position)
+                    position -= step
+                    f.seek(position)
+                    data = f.read(step) + data
+        except FileNotFoundError:
+            return []
+
+        # Drop a partially written last line
+        data = data[:data.rfind(b'\n') + 1]
+        lines = data.splitlines()
+        if position > 0:
+            lines = lines[1:]
+
+        records = []
+        for line in lines[-limit:] if limit else []:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+        return records
+
+    def close(self) -> None:
+        """Release reader state (files are opened per poll)."""
+        self.recent.clear()
+
+
+def iter_legacy_trade_files(trades_dir: str) -> Iterator[Dict[str, Any]]:
+    """Yield per-trade trade_*.json records in file name (time) order."""
+    for path in sorted(glob.glob(os.path.join(trades_dir, LEGACY_PATTERN))):
+        try:
+            with open(path, 'r') as f:
+                yield json.load(f)
+        except Exception as e:
+            logger.warning(f"Skipping unreadable legacy trade file {path}: {e}")
+
+
+def migrate_legacy_trades(trades_dir: str = DEFAULT_TRADES_DIR) -> int:
+    """
+    Seed a new journal from per-trade trade_*.json files (one-shot).
+
+    Only runs when the journal doesn't exist yet; the journal is claimed with
+    an exclusive create, so concurrent writers/readers migrate at most once.
+    Legacy files are left in place as an archive.
+
+    Returns:
+        Number of records migrated
+    """
+    path = os.path.join(trades_dir, JOURNAL_FILENAME)
+    if os.path.exists(path) or not glob.glob(os.path.join(trades_dir, LEGACY_PATTERN)):
+        return 0
+
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_APPEND, 0o644)
+    except FileExistsError:
+        return 0
+
+    migrated = 0
+    with os.fdopen(fd, 'wb') as f:
+        for record in iter_legacy_trade_files(trades_dir):
+            f.write(json.dumps(record, default=str, separators=(',', ':')).encode('utf-8') + b'\n')
+            migrated += 1
+        f.flush()
+        os.fsync(f.fileno())
+
+    logger.info(f"✅ Migrated {migrated} legacy trade files into {path}")
+    return migrated
+
+
+# Journals keyed by absolute directory so all writers in a process share one
+_trade_journals: Dict[str, TradeJournal] = {}
+_shutdown_hook_registered = False
+
+def get_trade_journal(trades_dir: str = DEFAULT_TRADES_DIR) -> TradeJournal:
+    """
+    Get the shared journal writer for a directory.
+
+    The first call registers close_trade_journals() with the system shutdown
+    handler so pending appends are fsynced on exit.
+    """
+    global _shutdown_hook_registered
+
+    key = os.path.abspath(trades_dir)
+    if key not in _trade_journals:
+        _trade_journals[key] = TradeJournal(trades_dir)
+
+    if not _shutdown_hook_registered:
+        try:
+            from phase_4_deployment.core.shutdown_handler import register_shutdown_callback
+            register_shutdown_callback(close_trade_journals)
+        except ImportError:
+            logger.debug("Shutdown handler not available; call close_trade_journals() on exit")
+        _shutdown_hook_registered = True
+
+    return _trade_journals[key]
+
+def close_trade_journals() -> None:
+    """Flush and close every shared journal (shutdown hook)."""
+    for journal in list(_trade_journals.values()):
+        try:
+            journal.close()
+        except Exception as e:
+            logger.error(f"Error closing trade journal {journal.path}: {e}")
+    _trade_journals.clear()
@@ -390,3 +390,8 @@ class TransactionExecutor:
         if method in self.fallback_methods:
             self.fallback_methods.remove(method)
             logger.info(f"🔧 Removed fallback method: {method.value}")
+
+    async def close(self):
+        """Release pooled RPC connections."""
+        if self.rpc_manager and hasattr(self.rpc_manager, 'close'):
+            await self.rpc_manager.close()
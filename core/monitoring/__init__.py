@@ -8,9 +8,13 @@ This package provides comprehensive monitoring capabilities including:
 - Integrated monitoring service
 """
 
-from .performance_monitor import PerformanceMonitor, IntegratedMonitoringService
+try:
+    from .performance_monitor import PerformanceMonitor, IntegratedMonitoringService
+except ImportError:
+    PerformanceMonitor = None
+    IntegratedMonitoringService = None
 from .risk_alerts import RiskAlertManager, AlertType, AlertSeverity, RiskAlert
-from .system_metrics import SystemMetricsMonitor
+from .system_metrics import SystemMetricsMonitor, LogTailer, get_system_metrics_monitor
 
 __all__ = [
     'PerformanceMonitor',
@@ -19,5 +23,7 @@ __all__ = [
     'AlertType',
     'AlertSeverity', 
     'RiskAlert',
-    'SystemMetricsMonitor'
+    'SystemMetricsMonitor',
+    'LogTailer',
+    'get_system_metrics_monitor'
 ]
@@ -14,27 +14,196 @@ import psutil
 import httpx
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from collections import deque, defaultdict
 
 # Configure specialized logger
 logger = logging.getLogger('system')
 
+
+class LogTailer:
+    """
+    Incremental log tailer with rolling error classification.
+
+    Remembers the file offset between polls and only reads and classifies
+    lines appended since the last poll. Rotation (a new inode at the path)
+    drains the old file before switching; truncation restarts at offset 0.
+    Counts cover the last `window_lines` lines and are updated as lines
+    enter and leave the window.
+    """
+
+    def __init__(self, path: str, window_lines: int = 1000, backfill_bytes: int = 256 * 1024):
+        """
+        Initialize the tailer.
+
+        Args:
+            path: Log file to follow
+            window_lines: Number of recent lines the counts cover
+            backfill_bytes: Bytes read from the end of an existing file on first open
+        """
+        self.path = Path(path)
+        self.window_lines = window_lines
+        self.backfill_bytes = backfill_bytes
+
+        self._file = None
+        self._inode: Optional[int] = None
+        self._offset = 0
+        self._partial = ''
+
+        # Rolling window of classified lines: (level, category) per line
+        self._window: deque = deque()
+        self.error_counts: Dict[str, int] = defaultdict(int)
+        self.warning_counts: Dict[str, int] = defaultdict(int)
+        self.recent_errors: deque = deque(maxlen=10)
+
+        self.lines_read = 0
+        self.rotations = 0
+
+    @staticmethod
+    def classify(line: str) -> Tuple[Optional[str], Optional[str]]:
+        """Classify a log line as (level, category)."""
+        if 'ERROR' in line:
+            if 'API' in line:
+                return 'error', 'api'
+            elif 'Database' in line or 'DB' in line:
+                return 'error', 'database'
+            elif 'Network' in line:
+                return 'error', 'network'
+            return 'error', 'other'
+        elif 'WARNING' in line:
+            return 'warning', None
+        return None, None
+
+    def _open(self, backfill: bool) -> bool:
+        """Open the file at the path, optionally starting near its end."""
+        try:
+            self._file = open(self.path, 'r', encoding='utf-8', errors='replace')
+        except FileNotFoundError:
+            self._file = None
+            return False
+
+        stat = os.fstat(self._file.fileno())
+        self._inode = stat.st_ino
+        self._offset = 0
+        self._partial = ''
+
+        if backfill and stat.st_size > self.backfill_bytes:
+            # Start mid-file and drop the first (partial) line
+            self._file.seek(stat.st_size - self.backfill_bytes)
+            self._file.readline()
+            self._offset = self._file.tell()
+        return True
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read_available(self) -> List[str]:
+        """Read complete lines appended since the last read."""
+        self._file.seek(self._offset)
+        data = self._file.read()
+        self._offset = self._file.tell()
+        if not data:
+            return []
+
+        data = self._partial + data
+        lines = data.split('\n')
+        # Keep an unterminated last line until the writer finishes it
+        self._partial = lines.pop()
+        return lines
+
+    def poll(self) -> int:
+        """
+        Read and classify lines appended since the last poll.
+
+        Returns:
+            Number of new lines classified
+        """
+        lines: List[str] = []
+
+        if self._file is None:
+            if not self._open(backfill=True):
+                return 0
+        else:
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                stat = None
+
+            if stat is None or stat.st_ino != self._inode:
+                # Rotated: finish the old file, then follow the new one
+                lines.extend(self._read_available())
+                self._close()
+                self.rotations += 1
+                if stat is None or not self._open(backfill=False):
+                    self._ingest(lines)
+                    return len(lines)
+            elif stat.st_size < self._offset:
+                # Truncated in place
+                self._offset = 0
+                self._partial = ''
+                self.rotations += 1
+
+        lines.extend(self._read_available())
+        self._ingest(lines)
+        return len(lines)
+
+    def _ingest(self, lines: List[str]):
+        """Add classified lines to the rolling window."""
+        for line in lines:
+            level, category = self.classify(line)
+            self._window.append((level, category))
+            self._count(level, category, 1)
+            if level == 'error':
+                self.recent_errors.append(line.strip())
+
+            if len(self._window) > self.window_lines:
+                old_level, old_category = self._window.popleft()
+                self._count(old_level, old_category, -1)
+
+        self.lines_read += len(lines)
+
+    def _count(self, level: Optional[str], category: Optional[str], delta: int):
+        if level == 'error':
+            self.error_counts['total'] += delta
+            self.error_counts[category] += delta
+        elif level == 'warning':
+            self.warning_counts['total'] += delta
+
+    @property
+    def total_lines(self) -> int:
+        return len(self._window)
+
+    @property
+    def error_rate_pct(self) -> float:
+        return (self.error_counts['total'] / len(self._window)) * 100 if self._window else 0.0
+
+    @property
+    def warning_rate_pct(self) -> float:
+        return (self.warning_counts['total'] / len(self._window)) * 100 if self._window else 0.0
+
+    def close(self):
+        """Close the followed file."""
+        self._close()
+
+
 class SystemMetricsMonitor:
     """
     Comprehensive system metrics monitoring with alerting.
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the system metrics monitor."""
-        self.config = config
-        self.monitoring_config = config.get('monitoring', {})
+        self.config = config or {}
+        self.monitoring_config = self.config.get('monitoring', {})
 
         # Monitoring settings
         self.enabled = self.monitoring_config.get('system_metrics_enabled', True)
         self.update_interval = self.monitoring_config.get('update_interval', 60)
         self.api_check_interval = self.monitoring_config.get('api_check_interval', 300)
+        self.sample_interval = self.monitoring_config.get('sample_interval', 5)
 
         # Alert thresholds
         self.thresholds = {
@@ -75,8 +244,53 @@ class SystemMetricsMonitor:
         self.is_monitoring = False
         self.last_api_check = datetime.min
 
+        # Background sampler state - CPU percentages and IO/network rates are
+        # deltas against the previous sample, so collection never blocks
+        self._sampler_task: Optional[asyncio.Task] = None
+        self._process = psutil.Process()
+        self._last_counters: Optional[Dict[str, Any]] = None
+        self.latest_system_metrics: Dict[str, Any] = {}
+        self.latest_error_metrics: Dict[str, Any] = {}
+        self._prime_cpu_counters()
+
+        # Incremental log analysis
+        self.log_tailer = LogTailer(
+            self.monitoring_config.get('log_file', 'logs/synergy7.log'),
+            window_lines=self.monitoring_config.get('log_window_lines', 1000)
+        )
+
         logger.info("System Metrics Monitor initialized")
 
+    def _prime_cpu_counters(self):
+        """Establish the CPU baseline so interval=None calls return real deltas."""
+        try:
+            psutil.cpu_percent(interval=None)
+            self._process.cpu_percent(interval=None)
+        except Exception as e:
+            logger.warning(f"Error priming CPU counters: {str(e)}")
+
+    def _counter_rates(self, timestamp: float, disk_io, network) -> Dict[str, float]:
+        """Per-second disk and network rates since the previous sample."""
+        counters = {
+            'time': timestamp,
+            'read_bytes': disk_io.read_bytes if disk_io else 0,
+            'write_bytes': disk_io.write_bytes if disk_io else 0,
+            'bytes_sent': network.bytes_sent if network else 0,
+            'bytes_recv': network.bytes_recv if network else 0
+        }
+
+        previous = self._last_counters
+        self._last_counters = counters
+        if previous is None or counters['time'] <= previous['time']:
+            return {key: 0.0 for key in counters if key != 'time'}
+
+        elapsed = counters['time'] - previous['time']
+        return {
+            # Counters can reset (e.g. interface restart); clamp to zero
+            key: max(counters[key] - previous[key], 0) / elapsed
+            for key in counters if key != 'time'
+        }
+
     def collect_system_metrics(self) -> Dict[str, Any]:
         """Collect comprehensive system metrics."""
         try:
@@ -97,7 +311,7 @@ class SystemMetricsMonitor:
             }
 
             # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             cpu_count = psutil.cpu_count()
             load_avg = os.getloadavg() if hasattr(os, 'getloadavg') else [0, 0, 0]
 
@@ -114,6 +328,8 @@ class SystemMetricsMonitor:
             # Disk metrics
             disk = psutil.disk_usage('.')
             disk_io = psutil.disk_io_counters()
+            network = psutil.net_io_counters()
+            rates = self._counter_rates(time.monotonic(), disk_io, network)
 
             disk_metrics = {
                 'total_gb': round(disk.total / (1024**3), 2),
@@ -123,12 +339,12 @@ class SystemMetricsMonitor:
                 'read_bytes': disk_io.read_bytes if disk_io else 0,
                 'write_bytes': disk_io.write_bytes if disk_io else 0,
                 'read_count': disk_io.read_count if disk_io else 0,
-                'write_count': disk_io.write_count if disk_io else 0
+                'write_count': disk_io.write_count if disk_io else 0,
+                'read_bytes_per_sec': round(rates['read_bytes'], 2),
+                'write_bytes_per_sec': round(rates['write_bytes'], 2)
             }
 
             # Network metrics
-            network = psutil.net_io_counters()
-
             network_metrics = {
                 'bytes_sent': network.bytes_sent,
                 'bytes_recv': network.bytes_recv,
@@ -137,12 +353,14 @@ class SystemMetricsMonitor:
                 'errin': network.errin,
                 'errout': network.errout,
                 'dropin': network.dropin,
-                'dropout': network.dropout
+                'dropout': network.dropout,
+                'sent_bytes_per_sec': round(rates['bytes_sent'], 2),
+                'recv_bytes_per_sec': round(rates['bytes_recv'], 2)
             }
 
             # Process-specific metrics
             try:
-                process = psutil.Process()
+                process = self._process
                 process_metrics = {
                     'cpu_percent': process.cpu_percent(),
                     'memory_mb': round(process.memory_info().rss / (1024**2), 2),
@@ -181,9 +399,10 @@ class SystemMetricsMonitor:
 
             # Store metrics
             self.system_metrics.append(metrics)
+            self.latest_system_metrics = metrics
 
             # Log key metrics
-            logger.info(f"System Metrics - CPU: {cpu_percent:.1f}%, Memory: {memory.percent:.1f}%, Disk: {disk_metrics['used_pct']:.1f}%")
+            logger.debug(f"System Metrics - CPU: {cpu_percent:.1f}%, Memory: {memory.percent:.1f}%, Disk: {disk_metrics['used_pct']:.1f}%")
 
             return metrics
 
@@ -256,65 +475,32 @@ class SystemMetricsMonitor:
             return {}
 
     def analyze_log_errors(self) -> Dict[str, Any]:
-        """Analyze recent log files for errors and warnings."""
+        """Classify log lines written since the last call and report rolling error rates."""
         try:
+            tailer = self.log_tailer
+            try:
+                new_lines = tailer.poll()
+            except Exception as e:
+                logger.warning(f"Error analyzing main log file: {str(e)}")
+                new_lines = 0
+
             log_analysis = {
                 'timestamp': datetime.now().isoformat(),
-                'error_counts': defaultdict(int),
-                'warning_counts': defaultdict(int),
-                'recent_errors': [],
-                'error_rate_pct': 0.0
+                'error_counts': defaultdict(int, tailer.error_counts),
+                'warning_counts': defaultdict(int, tailer.warning_counts),
+                'recent_errors': list(tailer.recent_errors),
+                'error_rate_pct': tailer.error_rate_pct,
+                'warning_rate_pct': tailer.warning_rate_pct,
+                'lines_analyzed': tailer.total_lines,
+                'new_lines': new_lines
             }
 
-            # Analyze main log file
-            main_log_path = Path('logs/synergy7.log')
-            if main_log_path.exists():
-                try:
-                    # Read last 1000 lines
-                    with open(main_log_path, 'r') as f:
-                        lines = f.readlines()
-                        recent_lines = lines[-1000:] if len(lines) > 1000 else lines
-
-                    total_lines = len(recent_lines)
-                    error_lines = 0
-                    warning_lines = 0
-
-                    for line in recent_lines:
-                        if 'ERROR' in line:
-                            error_lines += 1
-                            log_analysis['error_counts']['total'] += 1
-
-                            # Extract error type
-                            if 'API' in line:
-                                log_analysis['error_counts']['api'] += 1
-                            elif 'Database' in line or 'DB' in line:
-                                log_analysis['error_counts']['database'] += 1
-                            elif 'Network' in line:
-                                log_analysis['error_counts']['network'] += 1
-                            else:
-                                log_analysis['error_counts']['other'] += 1
-
-                            # Store recent errors (last 10)
-                            if len(log_analysis['recent_errors']) < 10:
-                                log_analysis['recent_errors'].append(line.strip())
-
-                        elif 'WARNING' in line:
-                            warning_lines += 1
-                            log_analysis['warning_counts']['total'] += 1
-
-                    # Calculate error rate
-                    if total_lines > 0:
-                        log_analysis['error_rate_pct'] = (error_lines / total_lines) * 100
-                        log_analysis['warning_rate_pct'] = (warning_lines / total_lines) * 100
-
-                except Exception as e:
-                    logger.warning(f"Error analyzing main log file: {str(e)}")
-
             # Store error metrics
             self.error_metrics.append(log_analysis)
+            self.latest_error_metrics = log_analysis
 
             # Log analysis summary
-            if log_analysis['error_counts']['total'] > 0:
+            if new_lines and log_analysis['error_counts']['total'] > 0:
                 logger.warning(f"Log Analysis - Errors: {log_analysis['error_counts']['total']}, Rate: {log_analysis['error_rate_pct']:.2f}%")
 
             return log_analysis
@@ -486,6 +672,62 @@ class SystemMetricsMonitor:
             logger.error(f"Error in monitoring cycle: {str(e)}")
             return {}
 
+    def sample(self) -> Dict[str, Any]:
+        """Take one non-blocking sample of system metrics and new log lines."""
+        system_metrics = self.collect_system_metrics()
+        error_metrics = self.analyze_log_errors()
+        return {'system_metrics': system_metrics, 'error_metrics': error_metrics}
+
+    async def _sampler_loop(self):
+        """Sample in the background so readers never wait on collection."""
+        logger.info(f"📈 System metrics sampler started ({self.sample_interval}s interval)")
+        while self.is_monitoring:
+            try:
+                self.sample()
+            except Exception as e:
+                # Keep sampling; one failed collection must not freeze the metrics
+                logger.error(f"Error in system metrics sampler: {str(e)}")
+            await asyncio.sleep(self.sample_interval)
+
+    def start_sampler(self) -> asyncio.Task:
+        """Start the background sampler on the running event loop."""
+        if self._sampler_task is None or self._sampler_task.done():
+            self.is_monitoring = True
+            self._sampler_task = asyncio.ensure_future(self._sampler_loop())
+        return self._sampler_task
+
+    async def stop_sampler(self):
+        """Stop the background sampler."""
+        self.is_monitoring = False
+        if self._sampler_task is not None:
+            self._sampler_task.cancel()
+            try:
+                await self._sampler_task
+            except asyncio.CancelledError:
+                pass
+            self._sampler_task = None
+        self.log_tailer.close()
+
+    def get_latest_snapshot(self) -> Dict[str, Any]:
+        """Latest sampled metrics, returned without collecting anything."""
+        system_metrics = self.latest_system_metrics
+        error_metrics = self.latest_error_metrics
+        return {
+            'timestamp': system_metrics.get('timestamp'),
+            'sampler_running': self._sampler_task is not None and not self._sampler_task.done(),
+            'cpu_usage_pct': system_metrics.get('cpu', {}).get('usage_pct', 0),
+            'memory_usage_pct': system_metrics.get('memory', {}).get('used_pct', 0),
+            'disk_usage_pct': system_metrics.get('disk', {}).get('used_pct', 0),
+            'disk_read_bytes_per_sec': system_metrics.get('disk', {}).get('read_bytes_per_sec', 0),
+            'disk_write_bytes_per_sec': system_metrics.get('disk', {}).get('write_bytes_per_sec', 0),
+            'net_sent_bytes_per_sec': system_metrics.get('network', {}).get('sent_bytes_per_sec', 0),
+            'net_recv_bytes_per_sec': system_metrics.get('network', {}).get('recv_bytes_per_sec', 0),
+            'process_memory_mb': system_metrics.get('process', {}).get('memory_mb', 0),
+            'error_rate_pct': error_metrics.get('error_rate_pct', 0),
+            'warning_rate_pct': error_metrics.get('warning_rate_pct', 0),
+            'recent_errors': error_metrics.get('recent_errors', [])
+        }
+
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get comprehensive metrics summary."""
         try:
@@ -519,3 +761,16 @@ class SystemMetricsMonitor:
         except Exception as e:
             logger.error(f"Error getting metrics summary: {str(e)}")
             return {}
+
+
+# Global instance for easy access
+_system_metrics_monitor = None
+
+def get_system_metrics_monitor(config: Optional[Dict[str, Any]] = None) -> SystemMetricsMonitor:
+    """Get the global system metrics monitor instance."""
+    global _system_metrics_monitor
+
+    if _system_metrics_monitor is None:
+        _system_metrics_monitor = SystemMetricsMonitor(config)
+
+    return _system_metrics_monitor
@@ -11,7 +11,8 @@ import json
 import os
 from datetime import datetime
 from typing import Dict, Any, Optional
-import httpx
+
+from phase_4_deployment.utils.http_clients import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -38,9 +39,6 @@ class TelegramNotifier:
             if self.dual_enabled:
                 logger.info(f"Dual chat support enabled: secondary chat {self.secondary_chat_id}")
 
-        # HTTP client for API calls
-        self.http_client = httpx.AsyncClient(timeout=30.0)
-
         # Rate limiting - optimized for production
         self.last_notification_time = {}
         self.rate_limits = {
@@ -59,8 +57,7 @@ class TelegramNotifier:
         self.trade_count = 0
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.http_client.aclose()
+        """Release resources (the shared HTTP client is closed at shutdown)."""
 
     def set_session_start_balance(self, balance: float):
         """Set the session start balance for PnL tracking."""
@@ -152,7 +149,7 @@ class TelegramNotifier:
                 "parse_mode": parse_mode
             }
 
-            response = await self.http_client.post(url, json=data)
+            response = await get_http_client(url).post(url, json=data, timeout=30.0)
             response.raise_for_status()
 
             result = response.json()
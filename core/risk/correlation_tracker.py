@@ -0,0 +1,260 @@
+"""
+Streaming Correlation Tracker for Synergy7 Trading System.
+
+This module maintains a fixed-window covariance/correlation matrix that is
+updated incrementally as new return rows arrive, instead of rebuilding a
+DataFrame and calling .corr() every risk cycle.
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Optional, Hashable
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def find_correlated_groups(correlation_matrix: np.ndarray, labels: List[Hashable],
+                           threshold: float) -> List[List[Hashable]]:
+    """
+    Group assets whose absolute correlation meets the threshold.
+
+    The threshold test is vectorized over the upper triangle; groups are the
+    connected components of the resulting graph, found with union-find.
+
+    Args:
+        correlation_matrix: Square correlation matrix (NaN for unknown pairs)
+        labels: Asset label per row/column
+        threshold: Absolute correlation threshold
+
+    Returns:
+        Groups of two or more labels, in label order
+    """
+    n = len(labels)
+    if n < 2:
+        return []
+
+    with np.errstate(invalid='ignore'):
+        adjacency = np.abs(correlation_matrix) >= threshold
+    pairs = np.argwhere(np.triu(adjacency, k=1))
+
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # Path halving
+            i = parent[i]
+        return i
+
+    for i, j in pairs:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            # Keep the lowest index as root so group names are stable
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    components: Dict[int, List[Hashable]] = {}
+    for i in range(n):
+        components.setdefault(find(i), []).append(labels[i])
+
+    return [group for group in components.values() if len(group) > 1]
+
+
+class StreamingCorrelationTracker:
+    """
+    Fixed-window pairwise covariance/correlation with add/remove updates.
+
+    For every asset pair the tracker keeps the number of rows where both
+    returns are present and the running sums needed for a pairwise-complete
+    correlation (the same definition as DataFrame.corr()). Each ingested row
+    is an O(n^2) rank-one update, the row leaving the window is subtracted,
+    and the matrix is served without recomputation. Sums are rebuilt from the
+    window buffer once per window length to bound floating-point drift.
+    """
+
+    def __init__(self, window: int = 1440, min_observations: int = 30, initial_capacity: int = 16):
+        """
+        Initialize the tracker.
+
+        Args:
+            window: Number of return rows in the window
+            min_observations: Minimum overlapping rows before a pair's correlation is reported
+            initial_capacity: Initial number of asset slots (grows on demand)
+        """
+        self.window = window
+        self.min_observations = min_observations
+
+        self.assets: List[Hashable] = []
+        self.asset_index: Dict[Hashable, int] = {}
+        self._capacity = 0
+
+        # Window buffer of returns (0.0 where missing) and presence masks
+        self._values = np.zeros((window, 0))
+        self._masks = np.zeros((window, 0), dtype=bool)
+        self._position = 0
+        self._rows = 0
+        self._updates_since_rebuild = 0
+
+        # Pairwise sufficient statistics
+        self._count = np.zeros((0, 0))       # rows where both i and j present
+        self._sum = np.zeros((0, 0))         # sum of x_i over rows where j present
+        self._sum_sq = np.zeros((0, 0))      # sum of x_i^2 over rows where j present
+        self._cross = np.zeros((0, 0))       # sum of x_i * x_j
+
+        self._grow(initial_capacity)
+
+    def _grow(self, capacity: int):
+        """Grow asset slots, preserving existing statistics."""
+        extra = capacity - self._capacity
+        if extra <= 0:
+            return
+
+        self._values = np.pad(self._values, ((0, 0), (0, extra)))
+        self._masks = np.pad(self._masks, ((0, 0), (0, extra)))
+        self._count = np.pad(self._count, ((0, extra), (0, extra)))
+        self._sum = np.pad(self._sum, ((0, extra), (0, extra)))
+        self._sum_sq = np.pad(self._sum_sq, ((0, extra), (0, extra)))
+        self._cross = np.pad(self._cross, ((0, extra), (0, extra)))
+        self._capacity = capacity
+
+    def _slot(self, asset: Hashable) -> int:
+        """Get (or allocate) the slot for an asset."""
+        index = self.asset_index.get(asset)
+        if index is None:
+            index = len(self.assets)
+            if index >= self._capacity:
+                self._grow(max(2 * self._capacity, index + 1))
+            self.assets.append(asset)
+            self.asset_index[asset] = index
+        return index
+
+    def _apply(self, values: np.ndarray, mask: np.ndarray, sign: float):
+        """Add (sign=1) or remove (sign=-1) one row's contribution."""
+        present = mask.astype(float)
+        self._count += sign * np.outer(present, present)
+        self._sum += sign * np.outer(values, present)
+        self._sum_sq += sign * np.outer(values * values, present)
+        self._cross += sign * np.outer(values, values)
+
+    def update(self, returns: Dict[Hashable, float]):
+        """
+        Ingest one row of returns (one value per asset for this tick).
+
+        Args:
+            returns: Mapping of asset to return; assets absent or NaN are
+                treated as missing for this row
+        """
+        for asset in returns:
+            self._slot(asset)
+
+        values = np.zeros(self._capacity)
+        mask = np.zeros(self._capacity, dtype=bool)
+        for asset, value in returns.items():
+            if value is not None and np.isfinite(value):
+                index = self.asset_index[asset]
+                values[index] = value
+                mask[index] = True
+
+        # Remove the row leaving the window
+        if self._rows == self.window:
+            self._apply(self._values[self._position], self._masks[self._position], -1.0)
+        else:
+            self._rows += 1
+
+        self._values[self._position] = values
+        self._masks[self._position] = mask
+        self._apply(values, mask, 1.0)
+        self._position = (self._position + 1) % self.window
+
+        self._updates_since_rebuild += 1
+        if self._updates_since_rebuild >= self.window:
+            self._rebuild()
+
+    def update_many(self, returns_df: pd.DataFrame):
+        """Ingest several rows (index = time, columns = assets) in order."""
+        columns = list(returns_df.columns)
+        for row in returns_df.to_numpy(dtype=float):
+            self.update(dict(zip(columns, row)))
+
+    def _rebuild(self):
+        """Recompute sums from the window buffer to clear accumulated drift."""
+        values = self._values[:self._rows]
+        present = self._masks[:self._rows].astype(float)
+        self._count = present.T @ present
+        self._sum = values.T @ present
+        self._sum_sq = (values * values).T @ present
+        self._cross = values.T @ values
+        self._updates_since_rebuild = 0
+
+    def drop_asset(self, asset: Hashable):
+        """Stop tracking an asset and rebuild statistics without it."""
+        index = self.asset_index.pop(asset, None)
+        if index is None:
+            return
+
+        del self.assets[index]
+        self.asset_index = {a: i for i, a in enumerate(self.assets)}
+
+        self._values = np.delete(self._values, index, axis=1)
+        self._masks = np.delete(self._masks, index, axis=1)
+        self._capacity -= 1
+        self._rebuild()
+
+    @property
+    def observations(self) -> int:
+        """Rows currently in the window."""
+        return self._rows
+
+    def covariance_matrix(self) -> np.ndarray:
+        """Pairwise-complete sample covariance for tracked assets (NaN if too few rows)."""
+        n = len(self.assets)
+        count = self._count[:n, :n]
+        sums = self._sum[:n, :n]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            covariance = (self._cross[:n, :n] - sums * sums.T / count) / (count - 1)
+        covariance[count < max(2, self.min_observations)] = np.nan
+        return covariance
+
+    def correlation_values(self) -> np.ndarray:
+        """Pairwise-complete correlation for tracked assets (NaN if too few rows)."""
+        n = len(self.assets)
+        count = self._count[:n, :n]
+        sums = self._sum[:n, :n]
+        sums_sq = self._sum_sq[:n, :n]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            numerator = count * self._cross[:n, :n] - sums * sums.T
+            variance_i = count * sums_sq - sums * sums
+            variance_j = variance_i.T
+            correlation = numerator / np.sqrt(variance_i * variance_j)
+
+        correlation = np.clip(correlation, -1.0, 1.0)
+        correlation[count < max(2, self.min_observations)] = np.nan
+        return correlation
+
+    def correlation_matrix(self, assets: Optional[List[Hashable]] = None) -> pd.DataFrame:
+        """
+        Get the current correlation matrix as a DataFrame.
+
+        Args:
+            assets: Optional subset (and order) of assets to return
+        """
+        matrix = pd.DataFrame(self.correlation_values(), index=self.assets, columns=self.assets)
+        if assets is not None:
+            tracked = [asset for asset in assets if asset in self.asset_index]
+            matrix = matrix.loc[tracked, tracked]
+        return matrix
+
+    def correlated_groups(self, threshold: float, assets: Optional[List[Hashable]] = None) -> List[List[Hashable]]:
+        """Find correlated groups among tracked (or the given) assets."""
+        matrix = self.correlation_matrix(assets)
+        return find_correlated_groups(matrix.to_numpy(), list(matrix.index), threshold)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get tracker status."""
+        return {
+            'assets': len(self.assets),
+            'window': self.window,
+            'observations': self._rows,
+            'capacity': self._capacity
+        }
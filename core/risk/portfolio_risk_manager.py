@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 
 from .var_calculator import VaRCalculator
+from .correlation_tracker import StreamingCorrelationTracker, find_correlated_groups
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -54,6 +55,13 @@ class PortfolioRiskManager:
         # Initialize VaR calculator
         self.var_calculator = VaRCalculator(config)
         
+        # Streaming correlation over the lookback window (assuming hourly data)
+        self.correlation_tracker = StreamingCorrelationTracker(
+            window=risk_config.get("correlation_window", self.correlation_lookback_days * 24),
+            min_observations=self.min_correlation_observations
+        )
+        self.last_return_index = {}  # asset -> index of the last return ingested
+        
         # Portfolio state
         self.current_positions = {}
         self.position_history = []
@@ -97,12 +105,28 @@ class PortfolioRiskManager:
         except Exception as e:
             logger.error(f"Error updating positions: {str(e)}")
     
+    def update_returns(self, returns: Dict[str, float]) -> None:
+        """
+        Ingest one new return per asset into the streaming correlation tracker.
+        
+        Args:
+            returns: Dictionary of asset returns for the latest tick
+        """
+        try:
+            self.correlation_tracker.update(returns)
+        except Exception as e:
+            logger.error(f"Error updating correlation tracker: {str(e)}")
+    
     def calculate_correlation_matrix(self, price_data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         """
         Calculate correlation matrix for portfolio assets.
         
+        Only returns newer than the last ingested index are fed to the streaming
+        tracker, so repeated calls with overlapping price history do not
+        recompute the matrix from scratch.
+        
         Args:
-            price_data: Dictionary of price data for each asset
+            price_data: Dictionary of price data for each asset (time-indexed)
             
         Returns:
             Correlation matrix DataFrame
@@ -111,28 +135,39 @@ class PortfolioRiskManager:
             if not price_data:
                 return pd.DataFrame()
             
-            # Calculate returns for each asset
-            returns_data = {}
+            # Collect returns not yet seen by the tracker
+            new_returns = {}
+            assets = []
             for asset, data in price_data.items():
                 if 'close' in data.columns and len(data) > self.min_correlation_observations:
                     returns = data['close'].pct_change().dropna()
+                    if len(returns) == 0:
+                        continue
+                    
+                    assets.append(asset)
+                    last_index = self.last_return_index.get(asset)
+                    if last_index is not None:
+                        returns = returns[returns.index > last_index]
+                    else:
+                        returns = returns.tail(self.correlation_tracker.window)
+                    
                     if len(returns) > 0:
-                        returns_data[asset] = returns.tail(self.correlation_lookback_days * 24)  # Assuming hourly data
+                        new_returns[asset] = returns
+                        self.last_return_index[asset] = returns.index[-1]
             
-            if len(returns_data) < 2:
+            if len(assets) < 2:
                 logger.warning("Insufficient data for correlation calculation")
                 return pd.DataFrame()
             
-            # Create returns DataFrame
-            returns_df = pd.DataFrame(returns_data)
-            returns_df = returns_df.dropna()
+            if new_returns:
+                self.correlation_tracker.update_many(pd.DataFrame(new_returns).sort_index())
             
-            if len(returns_df) < self.min_correlation_observations:
-                logger.warning(f"Insufficient observations for correlation: {len(returns_df)} < {self.min_correlation_observations}")
+            if self.correlation_tracker.observations < self.min_correlation_observations:
+                logger.warning(f"Insufficient observations for correlation: {self.correlation_tracker.observations} < {self.min_correlation_observations}")
                 return pd.DataFrame()
             
-            # Calculate correlation matrix
-            correlation_matrix = returns_df.corr()
+            # Serve the current matrix without recomputation
+            correlation_matrix = self.correlation_tracker.correlation_matrix(assets)
             
             # Store correlation matrix
             self.correlation_matrix = correlation_matrix
@@ -148,6 +183,9 @@ class PortfolioRiskManager:
         """
         Identify highly correlated position groups.
         
+        Groups are connected components of the |correlation| >= threshold
+        graph, so an asset belongs to at most one group.
+        
         Args:
             correlation_matrix: Correlation matrix (uses stored matrix if None)
             
@@ -161,24 +199,12 @@ class PortfolioRiskManager:
             if correlation_matrix.empty:
                 return {}
             
-            correlated_groups = {}
-            processed_assets = set()
-            
-            for asset1 in correlation_matrix.index:
-                if asset1 in processed_assets:
-                    continue
-                
-                # Find assets highly correlated with asset1
-                correlations = correlation_matrix.loc[asset1]
-                highly_correlated = correlations[
-                    (correlations.abs() >= self.correlation_threshold) & 
-                    (correlations.index != asset1)
-                ].index.tolist()
-                
-                if highly_correlated:
-                    group_name = f"corr_group_{asset1}"
-                    correlated_groups[group_name] = [asset1] + highly_correlated
-                    processed_assets.update([asset1] + highly_correlated)
+            groups = find_correlated_groups(
+                correlation_matrix.to_numpy(dtype=float),
+                list(correlation_matrix.index),
+                self.correlation_threshold
+            )
+            correlated_groups = {f"corr_group_{group[0]}": group for group in groups}
             
             logger.debug(f"Identified {len(correlated_groups)} correlated groups")
             return correlated_groups
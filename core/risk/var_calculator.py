@@ -48,8 +48,10 @@ class VaRCalculator:
         
         # Calculation parameters
         self.min_observations = max(30, self.lookback_days // 10)
-        self.monte_carlo_simulations = 10000
+        self.monte_carlo_simulations = risk_config.get("var_monte_carlo_simulations", 10000)
         self.bootstrap_samples = 1000
+        self.random_seed = risk_config.get("var_random_seed", 42)
+        self.horizons = risk_config.get("var_horizons", [1])
         
         # Risk limits
         self.portfolio_var_limit_pct = risk_config.get("portfolio_var_limit_pct", 0.02)
@@ -200,9 +202,9 @@ class VaRCalculator:
             if std_return == 0:
                 return 0.0
             
-            # Generate random returns
-            np.random.seed(42)  # For reproducibility
-            simulated_returns = np.random.normal(mean_return, std_return, simulations)
+            # Generate random returns (seeded generator for reproducibility)
+            rng = np.random.default_rng(self.random_seed)
+            simulated_returns = rng.normal(mean_return, std_return, simulations)
             
             # Calculate VaR
             percentile = (1 - confidence_level) * 100
@@ -250,6 +252,193 @@ class VaRCalculator:
             logger.error(f"Error calculating CVaR: {str(e)}")
             return 0.0
     
+    def _prepare_returns_matrix(self, returns) -> Tuple[np.ndarray, List[Any]]:
+        """
+        Convert returns input to an (assets x time) float matrix over the lookback.
+        
+        Accepts a Series (one asset), a DataFrame (time x assets, one column per
+        asset) or an array (assets x time). Series and DataFrame columns drop
+        their missing values first, so each asset's lookback is its own last
+        lookback_days observations; shorter rows are NaN-padded at the front.
+        """
+        if isinstance(returns, pd.Series):
+            values = returns.dropna().to_numpy(dtype=float)[np.newaxis, :]
+            assets = [returns.name]
+        elif isinstance(returns, pd.DataFrame):
+            columns = [returns[column].dropna().to_numpy(dtype=float)[-self.lookback_days:]
+                       for column in returns.columns]
+            values = np.full((len(columns), max((len(column) for column in columns), default=0)), np.nan)
+            for i, column in enumerate(columns):
+                if len(column):
+                    values[i, values.shape[1] - len(column):] = column
+            assets = list(returns.columns)
+        else:
+            values = np.atleast_2d(np.asarray(returns, dtype=float))
+            assets = list(range(values.shape[0]))
+        
+        return values[:, -self.lookback_days:], assets
+    
+    @staticmethod
+    def _sorted_percentiles(sorted_returns: np.ndarray, counts: np.ndarray, quantiles: np.ndarray) -> np.ndarray:
+        """
+        Linear-interpolated percentiles of pre-sorted rows (NaNs sorted last).
+        
+        Returns:
+            Array of shape (assets, len(quantiles)), matching np.percentile
+        """
+        positions = quantiles[np.newaxis, :] * (np.maximum(counts, 1) - 1)[:, np.newaxis]
+        lower = np.floor(positions).astype(int)
+        upper = np.minimum(lower + 1, np.maximum(counts - 1, 0)[:, np.newaxis])
+        fraction = positions - lower
+        
+        lower_values = np.take_along_axis(sorted_returns, lower, axis=1)
+        upper_values = np.take_along_axis(sorted_returns, upper, axis=1)
+        return lower_values + fraction * (upper_values - lower_values)
+    
+    @staticmethod
+    def _tail_means(values: np.ndarray, thresholds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mean and count of values at or below each threshold.
+        
+        Args:
+            values: (assets x observations) with NaN for missing entries
+            thresholds: (assets x levels)
+        
+        Returns:
+            Tuple of (assets x levels) tail means and tail counts
+        """
+        tail_mask = values[:, np.newaxis, :] <= thresholds[:, :, np.newaxis]  # NaN compares False
+        tail_counts = tail_mask.sum(axis=2)
+        tail_sums = np.where(tail_mask, values[:, np.newaxis, :], 0.0).sum(axis=2)
+        tail_means = np.divide(tail_sums, tail_counts, out=np.zeros_like(tail_sums), where=tail_counts > 0)
+        return tail_means, tail_counts
+    
+    def _t_multipliers(self, values: np.ndarray, counts: np.ndarray, quantiles: np.ndarray) -> np.ndarray:
+        """Student-t quantile multipliers per asset, fitting each series once."""
+        normal_multipliers = stats.norm.ppf(quantiles)
+        multipliers = np.tile(normal_multipliers, (values.shape[0], 1))
+        
+        for i, row in enumerate(values):
+            if counts[i] < self.min_observations:
+                continue
+            try:
+                df, _, _ = stats.t.fit(row[~np.isnan(row)])
+                multipliers[i] = stats.t.ppf(quantiles, df, loc=0, scale=1)
+            except Exception:
+                # Fallback to normal distribution
+                pass
+        
+        return multipliers
+    
+    def calculate_var_batch(self, returns, confidence_levels: List[float] = None,
+                            horizons: List[int] = None, include_t: bool = True) -> Dict[str, Any]:
+        """
+        Calculate every VaR/CVaR variant for many series, levels and horizons in one pass.
+        
+        Each series is sorted once and all percentiles are read from the sorted
+        data; one seeded standard-normal draw is shared by every asset, level and
+        horizon for the Monte Carlo estimates. Multi-day horizons use
+        square-root-of-time scaling (mean scales with h, dispersion with sqrt(h)).
+        
+        Args:
+            returns: Series, DataFrame (time x assets) or array (assets x time)
+            confidence_levels: Confidence levels (defaults to configured levels)
+            horizons: Holding periods in days (defaults to configured horizons)
+            include_t: Whether to fit Student-t distributions (one fit per asset)
+            
+        Returns:
+            Dictionary with 'assets', 'confidence_levels', 'horizons', 'observations'
+            and one (assets x levels x horizons) array per method. Assets with
+            fewer than min_observations returns report 0.0.
+        """
+        if confidence_levels is None:
+            confidence_levels = self.confidence_levels
+        if horizons is None:
+            horizons = self.horizons
+        
+        values, assets = self._prepare_returns_matrix(returns)
+        levels = np.asarray(confidence_levels, dtype=float)
+        tail_quantiles = 1 - levels
+        horizon_scale = np.sqrt(np.asarray(horizons, dtype=float))
+        horizon_drift = np.asarray(horizons, dtype=float)
+        
+        counts = np.sum(~np.isnan(values), axis=1)
+        valid = counts >= self.min_observations
+        
+        # Sort once; NaNs go to the end of each row
+        sorted_returns = np.sort(values, axis=1)
+        
+        # Historical VaR and CVaR (1-day), matching historical_var/conditional_var
+        historical_quantiles = self._sorted_percentiles(sorted_returns, counts, tail_quantiles)
+        historical_var = np.maximum(0.0, -historical_quantiles)
+        tail_means, tail_counts = self._tail_means(values, -historical_var)
+        historical_cvar = np.where(tail_counts > 0, np.maximum(historical_var, -tail_means), historical_var)
+        
+        # Moments
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = np.nanmean(values, axis=1) if values.size else np.zeros(len(assets))
+            stds = np.nanstd(values, axis=1, ddof=1) if values.size else np.zeros(len(assets))
+        means = np.nan_to_num(means)
+        stds = np.nan_to_num(stds)
+        
+        # Parametric VaR across levels and horizons. With std == 0 this reduces to
+        # max(0, -mean * h): a constant return series loses exactly -mean per day,
+        # so the certain loss is the VaR (parametric_var returns 0.0 instead)
+        normal_multipliers = stats.norm.ppf(tail_quantiles)[np.newaxis, :]
+        mean_h = means[:, np.newaxis, np.newaxis] * horizon_drift[np.newaxis, np.newaxis, :]
+        std_h = stds[:, np.newaxis, np.newaxis] * horizon_scale[np.newaxis, np.newaxis, :]
+        parametric_normal = np.maximum(0.0, -(mean_h + normal_multipliers[:, :, np.newaxis] * std_h))
+        
+        # Normal expected shortfall: sigma * pdf(z) / (1 - c) - mu
+        normal_es = stats.norm.pdf(stats.norm.ppf(levels)) / tail_quantiles
+        parametric_cvar_normal = np.maximum(0.0, std_h * normal_es[np.newaxis, :, np.newaxis] - mean_h)
+        
+        if include_t:
+            t_multipliers = self._t_multipliers(values, counts, tail_quantiles)
+            parametric_t = np.maximum(0.0, -(mean_h + t_multipliers[:, :, np.newaxis] * std_h))
+        else:
+            parametric_t = np.zeros_like(parametric_normal)
+        
+        # Monte Carlo: one standard-normal draw reused for all assets, levels and horizons
+        rng = np.random.default_rng(self.random_seed)
+        draws = np.sort(rng.standard_normal(self.monte_carlo_simulations))
+        draw_counts = np.array([draws.size])
+        draw_quantiles = self._sorted_percentiles(draws[np.newaxis, :], draw_counts, tail_quantiles)[0]
+        draw_tail_means, _ = self._tail_means(draws[np.newaxis, :], draw_quantiles[np.newaxis, :])
+        # Location/scale transform preserves order, so quantiles of mu + sigma*Z map directly
+        monte_carlo_var = np.maximum(0.0, -(mean_h + draw_quantiles[np.newaxis, :, np.newaxis] * std_h))
+        monte_carlo_cvar = np.maximum(0.0, -(mean_h + draw_tail_means[0][np.newaxis, :, np.newaxis] * std_h))
+        
+        # Historical measures scale with sqrt(horizon)
+        historical_var_h = historical_var[:, :, np.newaxis] * horizon_scale[np.newaxis, np.newaxis, :]
+        historical_cvar_h = historical_cvar[:, :, np.newaxis] * horizon_scale[np.newaxis, np.newaxis, :]
+        
+        method_arrays = {
+            'historical_var': historical_var_h,
+            'parametric_var_normal': parametric_normal,
+            'parametric_var_t': parametric_t,
+            'monte_carlo_var': monte_carlo_var,
+            'conditional_var': historical_cvar_h,
+            'parametric_cvar_normal': parametric_cvar_normal,
+            'monte_carlo_cvar': monte_carlo_cvar
+        }
+        
+        # Zero out series with insufficient data
+        for name, array in method_arrays.items():
+            array[~valid] = 0.0
+        
+        if not valid.all():
+            logger.warning(f"Insufficient data for VaR on {int((~valid).sum())} of {len(assets)} series "
+                           f"(< {self.min_observations} observations)")
+        
+        return {
+            'assets': assets,
+            'confidence_levels': list(confidence_levels),
+            'horizons': list(horizons),
+            'observations': counts,
+            **method_arrays
+        }
+    
     def calculate_portfolio_var(self, portfolio_returns: Dict[str, pd.Series], 
                                weights: Dict[str, float], confidence_level: float = 0.95) -> Dict[str, float]:
         """
@@ -268,7 +457,7 @@ class VaRCalculator:
                 return {}
             
             # Align returns data
-            common_assets = set(portfolio_returns.keys()) & set(weights.keys())
+            common_assets = sorted(set(portfolio_returns.keys()) & set(weights.keys()))
             if not common_assets:
                 return {}
             
@@ -284,13 +473,20 @@ class VaRCalculator:
             weight_vector = np.array([weights[asset] for asset in common_assets])
             portfolio_returns_series = returns_df.dot(weight_vector)
             
-            # Calculate individual and portfolio VaR
-            individual_vars = {}
-            for asset in common_assets:
-                individual_vars[asset] = self.historical_var(returns_df[asset], confidence_level)
+            # Individual and portfolio historical VaR/CVaR in one batch
+            batch_df = returns_df.assign(__portfolio__=portfolio_returns_series)
+            batch = self.calculate_var_batch(batch_df, [confidence_level], horizons=[1], include_t=False)
+            
+            individual_vars = {
+                asset: float(batch['historical_var'][i, 0, 0]) for i, asset in enumerate(common_assets)
+            }
+            portfolio_var = float(batch['historical_var'][-1, 0, 0])
+            portfolio_cvar = float(batch['conditional_var'][-1, 0, 0])
             
-            portfolio_var = self.historical_var(portfolio_returns_series, confidence_level)
-            portfolio_cvar = self.conditional_var(portfolio_returns_series, confidence_level)
+            # Correlated Monte Carlo VaR via Cholesky factor of the covariance
+            monte_carlo_metrics = self._monte_carlo_portfolio_var(
+                returns_df.tail(self.lookback_days).to_numpy(dtype=float), weight_vector, confidence_level
+            )
             
             # Calculate correlation matrix
             correlation_matrix = returns_df.corr()
@@ -312,6 +508,8 @@ class VaRCalculator:
             return {
                 'portfolio_var': portfolio_var,
                 'portfolio_cvar': portfolio_cvar,
+                'monte_carlo_var': monte_carlo_metrics['monte_carlo_var'],
+                'monte_carlo_cvar': monte_carlo_metrics['monte_carlo_cvar'],
                 'individual_vars': individual_vars,
                 'diversification_benefit': diversification_benefit,
                 'risk_contributions': risk_contributions,
@@ -324,6 +522,40 @@ class VaRCalculator:
             logger.error(f"Error calculating portfolio VaR: {str(e)}")
             return {}
     
+    def _monte_carlo_portfolio_var(self, asset_returns: np.ndarray, weight_vector: np.ndarray,
+                                   confidence_level: float) -> Dict[str, float]:
+        """
+        Simulate correlated portfolio returns with a Cholesky-factored covariance.
+        
+        Args:
+            asset_returns: (time x assets) aligned returns
+            weight_vector: Portfolio weights in column order
+            confidence_level: Confidence level
+            
+        Returns:
+            Dictionary with Monte Carlo portfolio VaR and CVaR
+        """
+        means = asset_returns.mean(axis=0)
+        covariance = np.atleast_2d(np.cov(asset_returns, rowvar=False))
+        
+        try:
+            cholesky = np.linalg.cholesky(covariance)
+        except np.linalg.LinAlgError:
+            # Covariance is only positive semi-definite; add a small ridge
+            ridge = 1e-12 * max(np.trace(covariance), 1e-12)
+            cholesky = np.linalg.cholesky(covariance + ridge * np.eye(len(covariance)))
+        
+        rng = np.random.default_rng(self.random_seed)
+        draws = rng.standard_normal((self.monte_carlo_simulations, len(means)))
+        simulated_portfolio = (means + draws @ cholesky.T) @ weight_vector
+        
+        threshold = np.percentile(simulated_portfolio, (1 - confidence_level) * 100)
+        var_value = max(0.0, -threshold)
+        tail = simulated_portfolio[simulated_portfolio <= threshold]
+        cvar_value = max(var_value, -tail.mean()) if tail.size else var_value
+        
+        return {'monte_carlo_var': float(var_value), 'monte_carlo_cvar': float(cvar_value)}
+    
     def calculate_comprehensive_var(self, returns: pd.Series, confidence_levels: List[float] = None) -> Dict[str, Any]:
         """
         Calculate comprehensive VaR metrics using multiple methods.
@@ -351,13 +583,16 @@ class VaRCalculator:
                 'methods': {}
             }
             
-            for confidence_level in confidence_levels:
+            # All methods and levels in one vectorized pass (1-day horizon)
+            batch = self.calculate_var_batch(returns, confidence_levels, horizons=[1])
+            
+            for i, confidence_level in enumerate(confidence_levels):
                 method_results = {
-                    'historical_var': self.historical_var(returns, confidence_level),
-                    'parametric_var_normal': self.parametric_var(returns, confidence_level, 'normal'),
-                    'parametric_var_t': self.parametric_var(returns, confidence_level, 't'),
-                    'monte_carlo_var': self.monte_carlo_var(returns, confidence_level),
-                    'conditional_var': self.conditional_var(returns, confidence_level)
+                    'historical_var': float(batch['historical_var'][0, i, 0]),
+                    'parametric_var_normal': float(batch['parametric_var_normal'][0, i, 0]),
+                    'parametric_var_t': float(batch['parametric_var_t'][0, i, 0]),
+                    'monte_carlo_var': float(batch['monte_carlo_var'][0, i, 0]),
+                    'conditional_var': float(batch['conditional_var'][0, i, 0])
                 }
                 
                 # Calculate average VaR across methods
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Rolling Statistics for Synergy7 Trading System
+
+Constant-time streaming statistics used by metrics and health checks:
+- QuantileSketch: mergeable, subtractable log-bucket quantile sketch
+- RunningStats: count/success/sum/sum-of-squares/min/max aggregate
+- SlidingWindowStats: time-bucketed ring buffer of running aggregates
+- HyperLogLog / SlidingHyperLogLog: approximate distinct counts
+"""
+
+import hashlib
+import math
+import time
+from typing import Dict, Any, Optional, List
+
+
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch with bounded relative error.
+
+    Values are counted in buckets whose bounds grow geometrically, so any
+    quantile is reported within relative_accuracy of the true value. Bucket
+    counts are plain integers, which makes sketches mergeable (add counts)
+    and subtractable (remove an expired bucket's counts).
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Initialize the sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+        """
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0  # values <= 0 (e.g. failed executions with no timing)
+        self.count = 0
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # Midpoint of the bucket (gamma^(i-1), gamma^i] in relative terms
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1):
+        """Add a value."""
+        if value <= 0:
+            self.zero_count += count
+        else:
+            index = self._index(value)
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += count
+
+    def merge(self, other: "QuantileSketch"):
+        """Add another sketch's counts into this one."""
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def subtract(self, other: "QuantileSketch"):
+        """Remove another sketch's counts from this one."""
+        for index, count in other.buckets.items():
+            remaining = self.buckets.get(index, 0) - count
+            if remaining > 0:
+                self.buckets[index] = remaining
+            else:
+                self.buckets.pop(index, None)
+        self.zero_count -= other.zero_count
+        self.count -= other.count
+
+    def clear(self):
+        """Reset the sketch."""
+        self.buckets.clear()
+        self.zero_count = 0
+        self.count = 0
+
+    def quantile(self, q: float) -> float:
+        """
+        Get an approximate quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Approximate value at the quantile, or 0.0 if the sketch is empty
+        """
+        if self.count <= 0:
+            return 0.0
+
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+
+        seen = self.zero_count
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self.buckets))
+
+
+class RunningStats:
+    """Running aggregate of observations with success flags."""
+
+    __slots__ = ('count', 'success', 'total', 'total_sq', 'min', 'max',
+                 'value_traded', 'fees_paid', 'sketch')
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.count = 0
+        self.success = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.value_traded = 0.0
+        self.fees_paid = 0.0
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, value: float, success: bool = True, value_traded: float = 0.0, fees_paid: float = 0.0):
+        """Add one observation."""
+        self.count += 1
+        self.success += 1 if success else 0
+        self.total += value
+        self.total_sq += value * value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.value_traded += value_traded or 0.0
+        self.fees_paid += fees_paid or 0.0
+        self.sketch.add(value)
+
+    def merge(self, other: "RunningStats"):
+        """Add another aggregate into this one."""
+        self.count += other.count
+        self.success += other.success
+        self.total += other.total
+        self.total_sq += other.total_sq
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        self.value_traded += other.value_traded
+        self.fees_paid += other.fees_paid
+        self.sketch.merge(other.sketch)
+
+    def subtract(self, other: "RunningStats"):
+        """Remove another aggregate's contribution (min/max are not subtractable)."""
+        self.count -= other.count
+        self.success -= other.success
+        self.total -= other.total
+        self.total_sq -= other.total_sq
+        self.value_traded -= other.value_traded
+        self.fees_paid -= other.fees_paid
+        self.sketch.subtract(other.sketch)
+        if self.count <= 0:
+            self.clear()
+
+    def clear(self):
+        """Reset the aggregate."""
+        self.count = 0
+        self.success = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.min = None
+        self.max = None
+        self.value_traded = 0.0
+        self.fees_paid = 0.0
+        self.sketch.clear()
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def stdev(self) -> float:
+        if self.count < 2:
+            return 0.0
+        variance = (self.total_sq - self.total * self.total / self.count) / (self.count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    @property
+    def success_rate(self) -> float:
+        return self.success / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        return self.sketch.quantile(q)
+
+
+class SlidingWindowStats:
+    """
+    Sliding-window RunningStats over a ring of time buckets.
+
+    The window is split into num_buckets buckets. Each observation lands in
+    the bucket for its timestamp; buckets that fall out of the window are
+    subtracted from the running total, so both recording and querying cost
+    O(num_buckets) at most, independent of how many observations were made.
+    """
+
+    def __init__(self, window_seconds: float, num_buckets: int = 60, relative_accuracy: float = 0.01):
+        """
+        Initialize the window.
+
+        Args:
+            window_seconds: Window length in seconds
+            num_buckets: Number of ring buckets (window resolution)
+            relative_accuracy: Quantile sketch accuracy
+        """
+        self.window_seconds = window_seconds
+        self.num_buckets = num_buckets
+        self.bucket_seconds = window_seconds / num_buckets
+        self.buckets: List[RunningStats] = [RunningStats(relative_accuracy) for _ in range(num_buckets)]
+        self.bucket_epochs: List[Optional[int]] = [None] * num_buckets
+        self.totals = RunningStats(relative_accuracy)
+        self._current_epoch: Optional[int] = None
+
+    def _advance(self, now: float):
+        """Expire buckets that have left the window."""
+        epoch = int(now // self.bucket_seconds)
+        if self._current_epoch is not None and epoch <= self._current_epoch:
+            return
+
+        oldest_live = epoch - self.num_buckets + 1
+        for slot, bucket_epoch in enumerate(self.bucket_epochs):
+            if bucket_epoch is not None and bucket_epoch < oldest_live:
+                self.totals.subtract(self.buckets[slot])
+                self.buckets[slot].clear()
+                self.bucket_epochs[slot] = None
+        self._current_epoch = epoch
+
+    def add(self, value: float, success: bool = True, value_traded: float = 0.0,
+            fees_paid: float = 0.0, timestamp: Optional[float] = None):
+        """Record an observation."""
+        now = time.time() if timestamp is None else timestamp
+        self._advance(now)
+
+        epoch = int(now // self.bucket_seconds)
+        if self._current_epoch is not None and epoch < self._current_epoch - self.num_buckets + 1:
+            return  # Older than the window
+
+        slot = epoch % self.num_buckets
+        if self.bucket_epochs[slot] != epoch:
+            self.buckets[slot].clear()
+            self.bucket_epochs[slot] = epoch
+
+        self.buckets[slot].add(value, success, value_traded, fees_paid)
+        self.totals.add(value, success, value_traded, fees_paid)
+
+    def snapshot(self, now: Optional[float] = None) -> RunningStats:
+        """Get the running aggregate for the current window."""
+        self._advance(time.time() if now is None else now)
+        return self.totals
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-value estimator.
+
+    Uses 2^precision one-byte registers (1 KiB at the default precision) with
+    a standard error of about 1.04 / sqrt(2^precision), ~3% by default.
+    Sketches with the same precision merge by taking register maxima.
+    """
+
+    def __init__(self, precision: int = 10):
+        """
+        Initialize the sketch.
+
+        Args:
+            precision: Number of index bits (4-16)
+        """
+        self.precision = precision
+        self.num_registers = 1 << precision
+        self.registers = bytearray(self.num_registers)
+        self._rank_bits = 64 - precision
+        self._rank_mask = (1 << self._rank_bits) - 1
+        self._alpha = 0.7213 / (1 + 1.079 / self.num_registers)
+
+    def _position(self, item: Any):
+        digest = hashlib.blake2b(str(item).encode('utf-8'), digest_size=8).digest()
+        value = int.from_bytes(digest, 'big')
+        index = value >> self._rank_bits
+        rank = self._rank_bits - (value & self._rank_mask).bit_length() + 1
+        return index, rank
+
+    def add(self, item: Any):
+        """Add an item."""
+        index, rank = self._position(item)
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: "HyperLogLog"):
+        """Union another sketch into this one."""
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def clear(self):
+        """Reset the sketch."""
+        self.registers = bytearray(self.num_registers)
+
+    @staticmethod
+    def estimate(registers: bytes, alpha: float) -> float:
+        """Cardinality estimate for a register array."""
+        m = len(registers)
+        harmonic = sum(2.0 ** -r for r in registers)
+        estimate = alpha * m * m / harmonic
+        if estimate <= 2.5 * m:
+            zeros = registers.count(0)
+            if zeros:
+                estimate = m * math.log(m / zeros)  # Linear counting for small sets
+        return estimate
+
+    def count(self) -> int:
+        """Approximate number of distinct items added."""
+        return int(round(self.estimate(self.registers, self._alpha)))
+
+
+class SlidingHyperLogLog:
+    """
+    Approximate distinct count over a sliding time window.
+
+    The window is split into num_buckets HyperLogLog sketches; expired
+    buckets are dropped whole and the count is taken over the union of live
+    buckets, so items expire with a granularity of one bucket.
+    """
+
+    def __init__(self, window_seconds: float, num_buckets: int = 16, precision: int = 10):
+        """
+        Initialize the window.
+
+        Args:
+            window_seconds: Window length in seconds
+            num_buckets: Number of ring buckets (expiry resolution)
+            precision: HyperLogLog precision per bucket
+        """
+        self.window_seconds = window_seconds
+        self.num_buckets = num_buckets
+        self.bucket_seconds = window_seconds / num_buckets
+        self.buckets: List[HyperLogLog] = [HyperLogLog(precision) for _ in range(num_buckets)]
+        self.bucket_epochs: List[Optional[int]] = [None] * num_buckets
+        self._union: Optional[bytearray] = None
+
+    def _expire(self, now: float):
+        oldest_live = int(now // self.bucket_seconds) - self.num_buckets + 1
+        for slot, bucket_epoch in enumerate(self.bucket_epochs):
+            if bucket_epoch is not None and bucket_epoch < oldest_live:
+                self.buckets[slot].clear()
+                self.bucket_epochs[slot] = None
+                self._union = None
+
+    def add(self, item: Any, timestamp: Optional[float] = None):
+        """Add an item observed at timestamp."""
+        now = time.time() if timestamp is None else timestamp
+        epoch = int(now // self.bucket_seconds)
+        slot = epoch % self.num_buckets
+
+        if self.bucket_epochs[slot] != epoch:
+            if self.bucket_epochs[slot] is not None and self.bucket_epochs[slot] > epoch:
+                return  # Older than the window
+            self.buckets[slot].clear()
+            self.bucket_epochs[slot] = epoch
+            self._union = None
+
+        bucket = self.buckets[slot]
+        index, rank = bucket._position(item)
+        if rank > bucket.registers[index]:
+            bucket.registers[index] = rank
+            if self._union is not None and rank > self._union[index]:
+                self._union[index] = rank
+
+    def count(self, now: Optional[float] = None) -> int:
+        """Approximate distinct items in the window ending at now."""
+        self._expire(time.time() if now is None else now)
+
+        if self._union is None:
+            live = [bucket.registers for bucket, epoch in zip(self.buckets, self.bucket_epochs) if epoch is not None]
+            if not live:
+                return 0
+            self._union = bytearray(map(max, *live)) if len(live) > 1 else bytearray(live[0])
+
+        return int(round(HyperLogLog.estimate(self._union, self.buckets[0]._alpha)))
@@ -5,6 +5,7 @@ Tracks large SOL transactions and whale wallet activity for trading signals.
 
 from .whale_detector import WhaleDetector
 from .whale_data_collector import WhaleDataCollector
+from .whale_store import WhaleSegmentStore
 from .whale_signal_generator import WhaleSignalGenerator
 from .whale_wallet_tracker import WhaleWalletTracker
 from .flow_analyzer import FlowAnalyzer
@@ -15,6 +16,7 @@ from .whale_metrics import WhaleMetrics
 __all__ = [
     'WhaleDetector',
     'WhaleDataCollector', 
+    'WhaleSegmentStore',
     'WhaleSignalGenerator',
     'WhaleWalletTracker',
     'FlowAnalyzer',
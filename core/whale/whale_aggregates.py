@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Whale Aggregates - Rolling-window aggregates over whale transactions
+Maintains the sums, counts and extremes used by whale signal generation with
+O(1) amortized updates per transaction instead of rescanning history.
+"""
+
+import logging
+from collections import deque, defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Deque, Tuple
+
+from .whale_detector import WhaleTransaction
+from core.utils.rolling_stats import SlidingHyperLogLog
+
+logger = logging.getLogger(__name__)
+
+# Thresholds matching the accumulation/smart-money classification
+ACCUMULATION_CONFIDENCE = 0.7
+SMART_MONEY_CONFIDENCE = 0.8
+SMART_MONEY_MIN_SOL = 200
+
+
+class _SlidingMax:
+    """Sliding-window maximum with a monotonic deque."""
+
+    def __init__(self):
+        self._items: Deque[Tuple[int, float]] = deque()
+
+    def push(self, seq: int, value: float):
+        while self._items and self._items[-1][1] <= value:
+            self._items.pop()
+        self._items.append((seq, value))
+
+    def evict(self, seq: int):
+        if self._items and self._items[0][0] == seq:
+            self._items.popleft()
+
+    @property
+    def value(self) -> float:
+        return self._items[0][1] if self._items else 0.0
+
+
+class RollingWhaleWindow:
+    """
+    Rolling aggregates of whale transactions over one time window.
+
+    Each added transaction updates running sums (exchange flows by sign and
+    exchange, accumulation/distribution, smart money, confidence-weighted
+    volumes), sliding maxima and a sliding HyperLogLog of addresses; when it
+    leaves the window its contribution is subtracted again.
+    """
+
+    def __init__(self, window: timedelta, hll_buckets: int = 16, hll_precision: int = 10):
+        """
+        Initialize the window.
+
+        Args:
+            window: Window length
+            hll_buckets: Expiry resolution of the unique-address estimate
+            hll_precision: HyperLogLog precision
+        """
+        self.window = window
+        self._entries: Deque[Tuple[int, WhaleTransaction]] = deque()
+        self._sequence = 0
+
+        self._max_amount = _SlidingMax()
+        self._max_smart_amount = _SlidingMax()
+        self.unique_addresses = SlidingHyperLogLog(window.total_seconds(), hll_buckets, hll_precision)
+
+        self._reset()
+
+    def _reset(self):
+        """Zero all running sums."""
+        self.count = 0
+        self.total_volume = 0.0
+        self.total_confidence = 0.0
+
+        # Non-exchange accumulation/distribution split
+        self.accumulation = 0.0
+        self.distribution = 0.0
+        self.non_exchange_weighted = 0.0
+
+        # Exchange flows by amount sign (see WhaleSignalGenerator for interpretation)
+        self.exchange_count = 0
+        self.exchange_positive = 0.0
+        self.exchange_negative = 0.0
+        self.exchange_positive_weighted = 0.0
+        self.exchange_negative_weighted = 0.0
+        self.exchange_flows: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {'positive': 0.0, 'negative': 0.0, 'count': 0}
+        )
+
+        # Smart money (high-confidence, large) transactions
+        self.smart_count = 0
+        self.smart_volume = 0.0
+        self.smart_confidence = 0.0
+
+    def _apply(self, tx: WhaleTransaction, sign: int):
+        """Add (sign=1) or remove (sign=-1) a transaction's contribution."""
+        amount = tx.amount_sol
+        confidence = tx.confidence_score
+
+        self.count += sign
+        self.total_volume += sign * amount
+        self.total_confidence += sign * confidence
+
+        if tx.is_exchange_related:
+            flows = self.exchange_flows[tx.exchange_name or 'unknown']
+            flows['count'] += sign
+            self.exchange_count += sign
+            if amount > 0:
+                self.exchange_positive += sign * amount
+                self.exchange_positive_weighted += sign * amount * confidence
+                flows['positive'] += sign * amount
+            else:
+                self.exchange_negative += sign * abs(amount)
+                self.exchange_negative_weighted += sign * abs(amount) * confidence
+                flows['negative'] += sign * abs(amount)
+            if flows['count'] <= 0:
+                del self.exchange_flows[tx.exchange_name or 'unknown']
+        else:
+            self.non_exchange_weighted += sign * amount * confidence
+            if confidence > ACCUMULATION_CONFIDENCE:
+                self.accumulation += sign * amount
+            else:
+                self.distribution += sign * amount
+
+        if confidence > SMART_MONEY_CONFIDENCE and amount > SMART_MONEY_MIN_SOL:
+            self.smart_count += sign
+            self.smart_volume += sign * amount
+            self.smart_confidence += sign * confidence
+
+    def add(self, tx: WhaleTransaction):
+        """Add a transaction (transactions should arrive in time order)."""
+        self._sequence += 1
+        self._entries.append((self._sequence, tx))
+        self._apply(tx, 1)
+
+        self._max_amount.push(self._sequence, tx.amount_sol)
+        if tx.confidence_score > SMART_MONEY_CONFIDENCE and tx.amount_sol > SMART_MONEY_MIN_SOL:
+            self._max_smart_amount.push(self._sequence, tx.amount_sol)
+
+        timestamp = tx.timestamp.timestamp()
+        self.unique_addresses.add(tx.from_address, timestamp)
+        self.unique_addresses.add(tx.to_address, timestamp)
+
+    def advance(self, now: Optional[datetime] = None):
+        """Evict transactions at or before now - window."""
+        cutoff = (now or datetime.now()) - self.window
+        while self._entries and self._entries[0][1].timestamp <= cutoff:
+            sequence, tx = self._entries.popleft()
+            self._apply(tx, -1)
+            self._max_amount.evict(sequence)
+            self._max_smart_amount.evict(sequence)
+
+        if not self._entries:
+            # Clear accumulated floating-point residue
+            self._reset()
+
+    # Derived values
+
+    @property
+    def avg_transaction_size(self) -> float:
+        return self.total_volume / self.count if self.count else 0.0
+
+    @property
+    def avg_confidence(self) -> float:
+        return self.total_confidence / self.count if self.count else 0.0
+
+    @property
+    def max_transaction_size(self) -> float:
+        return self._max_amount.value
+
+    @property
+    def smart_avg_confidence(self) -> float:
+        return self.smart_confidence / self.smart_count if self.smart_count else 0.0
+
+    @property
+    def smart_max_transaction_size(self) -> float:
+        return self._max_smart_amount.value
+
+    def unique_address_count(self, now: Optional[datetime] = None) -> int:
+        """Approximate distinct from/to addresses in the window."""
+        return self.unique_addresses.count((now or datetime.now()).timestamp())
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        """Get the current aggregate values."""
+        return {
+            'window_minutes': self.window.total_seconds() / 60,
+            'transaction_count': self.count,
+            'total_volume_sol': self.total_volume,
+            'avg_transaction_size': self.avg_transaction_size,
+            'max_transaction_size': self.max_transaction_size,
+            'avg_confidence': self.avg_confidence,
+            'accumulation': self.accumulation,
+            'distribution': self.distribution,
+            'exchange_transactions': self.exchange_count,
+            'smart_money_count': self.smart_count,
+            'unique_addresses': self.unique_address_count()
+        }
@@ -13,6 +13,7 @@ import glob
 from dataclasses import asdict
 
 from .whale_detector import WhaleTransaction
+from .whale_store import get_whale_store, whale_transaction_to_dict, whale_transaction_from_dict
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,9 @@ class WhaleDataCollector:
         # Create directories
         self._create_directories()
         
+        # Hourly append-only transaction segments
+        self.store = get_whale_store(self.transactions_dir)
+        
         # In-memory cache
         self.transaction_cache = []
         self.cache_size = 1000
@@ -61,26 +65,8 @@ class WhaleDataCollector:
             if len(self.transaction_cache) > self.cache_size:
                 self.transaction_cache.pop(0)
             
-            # Save to disk
-            filename = f"whale_tx_{whale_tx.timestamp.strftime('%Y%m%d_%H%M%S')}_{whale_tx.signature[:8]}.json"
-            filepath = os.path.join(self.transactions_dir, filename)
-            
-            tx_data = {
-                'signature': whale_tx.signature,
-                'timestamp': whale_tx.timestamp.isoformat(),
-                'from_address': whale_tx.from_address,
-                'to_address': whale_tx.to_address,
-                'amount_sol': whale_tx.amount_sol,
-                'amount_usd': whale_tx.amount_usd,
-                'transaction_type': whale_tx.transaction_type,
-                'is_exchange_related': whale_tx.is_exchange_related,
-                'exchange_name': whale_tx.exchange_name,
-                'confidence_score': whale_tx.confidence_score,
-                'metadata': whale_tx.metadata
-            }
-            
-            with open(filepath, 'w') as f:
-                json.dump(tx_data, f, indent=2)
+            # Append to the hourly segment
+            self.store.append(whale_transaction_to_dict(whale_tx), whale_tx.timestamp)
             
             return True
             
@@ -94,37 +80,12 @@ class WhaleDataCollector:
             cutoff_time = datetime.now() - timedelta(hours=hours)
             transactions = []
             
-            # Get transaction files
-            pattern = os.path.join(self.transactions_dir, "whale_tx_*.json")
-            files = glob.glob(pattern)
-            
-            for file_path in files:
+            # Only segments overlapping the window are opened
+            for tx_data in self.store.read(cutoff_time):
                 try:
-                    with open(file_path, 'r') as f:
-                        tx_data = json.load(f)
-                    
-                    # Parse timestamp
-                    timestamp = datetime.fromisoformat(tx_data['timestamp'])
-                    
-                    # Filter by time
-                    if timestamp > cutoff_time:
-                        whale_tx = WhaleTransaction(
-                            signature=tx_data['signature'],
-                            timestamp=timestamp,
-                            from_address=tx_data['from_address'],
-                            to_address=tx_data['to_address'],
-                            amount_sol=tx_data['amount_sol'],
-                            amount_usd=tx_data['amount_usd'],
-                            transaction_type=tx_data['transaction_type'],
-                            is_exchange_related=tx_data['is_exchange_related'],
-                            exchange_name=tx_data.get('exchange_name'),
-                            confidence_score=tx_data['confidence_score'],
-                            metadata=tx_data.get('metadata', {})
-                        )
-                        transactions.append(whale_tx)
-                        
+                    transactions.append(whale_transaction_from_dict(tx_data))
                 except Exception as e:
-                    logger.warning(f"Error loading transaction file {file_path}: {e}")
+                    logger.warning(f"Error loading whale transaction record: {e}")
                     continue
             
             # Sort by timestamp
@@ -137,6 +98,14 @@ class WhaleDataCollector:
             logger.error(f"Error loading whale transactions: {e}")
             return []
     
+    def migrate_legacy_transactions(self, delete: bool = True) -> int:
+        """Move legacy whale_tx_*.json files into hourly segments (one-shot)."""
+        try:
+            return self.store.migrate_legacy_files(delete=delete)
+        except Exception as e:
+            logger.error(f"Error migrating legacy whale transactions: {e}")
+            return 0
+    
     def get_whale_statistics(self, hours: int = 24) -> Dict[str, Any]:
         """Get whale transaction statistics."""
         try:
@@ -188,29 +157,12 @@ class WhaleDataCollector:
         
         try:
             cutoff_time = datetime.now() - timedelta(days=self.retention_days)
-            deleted_count = 0
             
-            # Clean transaction files
-            pattern = os.path.join(self.transactions_dir, "whale_tx_*.json")
-            files = glob.glob(pattern)
-            
-            for file_path in files:
-                try:
-                    # Extract timestamp from filename
-                    filename = os.path.basename(file_path)
-                    timestamp_str = filename.split('_')[2] + '_' + filename.split('_')[3]
-                    file_time = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-                    
-                    if file_time < cutoff_time:
-                        os.remove(file_path)
-                        deleted_count += 1
-                        
-                except Exception as e:
-                    logger.warning(f"Error processing file {file_path}: {e}")
-                    continue
+            # Whole segments past retention are deleted
+            segments_deleted, deleted_count = self.store.drop_before(cutoff_time)
             
             if deleted_count > 0:
-                logger.info(f"Cleaned up {deleted_count} old whale transaction files")
+                logger.info(f"Cleaned up {deleted_count} old whale transactions ({segments_deleted} segments)")
             
             return deleted_count
             
@@ -225,36 +177,18 @@ class WhaleDataCollector:
         
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_filename = f"whale_data_backup_{timestamp}.json"
+            backup_filename = f"whale_data_backup_{timestamp}"
             backup_path = os.path.join(self.backups_dir, backup_filename)
             
-            # Collect all data
-            backup_data = {
-                'backup_timestamp': timestamp,
-                'transactions': [],
-                'statistics': self.get_whale_statistics(24)
-            }
-            
-            # Load recent transactions
-            transactions = self.load_whale_transactions(24)
-            for tx in transactions:
-                backup_data['transactions'].append({
-                    'signature': tx.signature,
-                    'timestamp': tx.timestamp.isoformat(),
-                    'from_address': tx.from_address,
-                    'to_address': tx.to_address,
-                    'amount_sol': tx.amount_sol,
-                    'amount_usd': tx.amount_usd,
-                    'transaction_type': tx.transaction_type,
-                    'is_exchange_related': tx.is_exchange_related,
-                    'exchange_name': tx.exchange_name,
-                    'confidence_score': tx.confidence_score,
-                    'metadata': tx.metadata
-                })
+            # Copy the segments covering the last 24 hours
+            segments = self.store.backup(backup_path, start=datetime.now() - timedelta(hours=24))
             
-            # Save backup
-            with open(backup_path, 'w') as f:
-                json.dump(backup_data, f, indent=2)
+            with open(os.path.join(backup_path, 'statistics.json'), 'w') as f:
+                json.dump({
+                    'backup_timestamp': timestamp,
+                    'segments': segments,
+                    'statistics': self.get_whale_statistics(24)
+                }, f, indent=2)
             
             logger.info(f"Whale data backup created: {backup_filename}")
             return True
@@ -266,9 +200,9 @@ class WhaleDataCollector:
     def get_data_summary(self) -> Dict[str, Any]:
         """Get summary of stored whale data."""
         try:
-            # Count files
-            tx_files = len(glob.glob(os.path.join(self.transactions_dir, "*.json")))
-            backup_files = len(glob.glob(os.path.join(self.backups_dir, "*.json")))
+            # Count segments and backups
+            store_stats = self.store.get_stats()
+            backup_files = len(glob.glob(os.path.join(self.backups_dir, "whale_data_backup_*")))
             
             # Get disk usage
             total_size = 0
@@ -282,7 +216,8 @@ class WhaleDataCollector:
             
             return {
                 'storage_summary': {
-                    'transaction_files': tx_files,
+                    'transaction_segments': store_stats['segments'],
+                    'stored_transactions': store_stats['records'],
                     'backup_files': backup_files,
                     'total_size_mb': total_size / (1024 * 1024),
                     'retention_days': self.retention_days
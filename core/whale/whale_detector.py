@@ -8,14 +8,21 @@ import asyncio
 import logging
 import json
 import os
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Set
+from itertools import chain
+from typing import AsyncIterator, Dict, List, Any, Optional, Set
 import httpx
+import numpy as np
 from dataclasses import dataclass
 import base58
 
 logger = logging.getLogger(__name__)
 
+# getBlock error codes for slots that will never have a block
+# (-32007: skipped or missing due to ledger jump, -32009: skipped or missing in long-term storage)
+SKIPPED_SLOT_ERROR_CODES = {-32007, -32009}
+
 @dataclass
 class WhaleTransaction:
     """Represents a detected whale transaction."""
@@ -56,8 +63,19 @@ class WhaleDetector:
         # Whale wallet addresses (known large holders)
         self.whale_wallets = self._load_whale_wallets()
         
+        # Threshold in lamports for the batch balance scan
+        self.min_whale_lamports = int(self.min_whale_amount_sol * 1e9)
+        
+        # Slot ingestion settings
+        self.max_concurrent_block_fetches = self.whale_config.get('max_concurrent_block_fetches', 8)
+        self.max_slots_per_cycle = self.whale_config.get('max_slots_per_cycle', 300)
+        self.slot_checkpoint_file = self.whale_config.get(
+            'slot_checkpoint_file', 'output/whale_data/slot_cursor.json'
+        )
+        
         # Detection state
         self.last_processed_slot = 0
+        self.tip_slot = 0
         self.detected_transactions = []
         self.is_monitoring = False
         
@@ -67,7 +85,12 @@ class WhaleDetector:
             'whales_detected': 0,
             'api_calls': 0,
             'errors': 0,
-            'last_detection': None
+            'last_detection': None,
+            'blocks_processed': 0,
+            'slots_skipped': 0,
+            'block_fetch_errors': 0,
+            'slot_lag': 0,
+            'blocks_per_second': 0.0
         }
         
         logger.info(f"Whale detector initialized with {self.min_whale_amount_sol} SOL threshold")
@@ -76,9 +99,11 @@ class WhaleDetector:
         """Initialize the whale detector."""
         try:
             # Initialize HTTP client
+            max_connections = max(10, self.max_concurrent_block_fetches)
             self.http_client = httpx.AsyncClient(
                 timeout=30.0,
-                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+                limits=httpx.Limits(max_connections=max_connections,
+                                    max_keepalive_connections=max_connections)
             )
             
             # Test RPC connection
@@ -87,8 +112,15 @@ class WhaleDetector:
                 logger.error("Failed to connect to Solana RPC")
                 return False
             
-            # Load latest slot
-            self.last_processed_slot = await self._get_current_slot()
+            # Resume from the checkpointed cursor, or start at the tip
+            self.tip_slot = await self._get_current_slot()
+            checkpoint_slot = self._load_slot_checkpoint()
+            if checkpoint_slot and checkpoint_slot <= self.tip_slot:
+                self.last_processed_slot = checkpoint_slot
+                logger.info(f"📍 Resuming slot cursor at {checkpoint_slot} ({self.tip_slot - checkpoint_slot} slots behind)")
+            else:
+                self.last_processed_slot = self.tip_slot
+            self.metrics['slot_lag'] = self.tip_slot - self.last_processed_slot
             
             logger.info(f"✅ Whale detector initialized at slot {self.last_processed_slot}")
             return True
@@ -124,13 +156,11 @@ class WhaleDetector:
     async def _monitor_cycle(self) -> None:
         """Execute one monitoring cycle."""
         try:
-            # Get recent transactions
-            recent_transactions = await self._get_recent_transactions()
-            
-            # Process each transaction
-            for tx in recent_transactions:
-                whale_tx = await self._analyze_transaction(tx)
-                if whale_tx:
+            # Process blocks one window at a time so a catch-up cycle never
+            # holds more than a window of decoded blocks in memory
+            async for recent_transactions in self._iter_transaction_windows():
+                # Scan the window for whale-sized balance changes
+                for whale_tx in self._analyze_block(recent_transactions):
                     self.detected_transactions.append(whale_tx)
                     self.metrics['whales_detected'] += 1
                     self.metrics['last_detection'] = datetime.now()
@@ -140,117 +170,293 @@ class WhaleDetector:
                     # Save whale transaction
                     await self._save_whale_transaction(whale_tx)
                 
-                self.metrics['transactions_processed'] += 1
+                self.metrics['transactions_processed'] += len(recent_transactions)
+                
+                # Persist the cursor only once its blocks have been processed
+                self._save_slot_checkpoint()
             
         except Exception as e:
             logger.error(f"Error in monitoring cycle: {e}")
             self.metrics['errors'] += 1
     
     async def _get_recent_transactions(self) -> List[Dict[str, Any]]:
-        """Get recent transactions from Solana RPC."""
+        """Get transactions from every slot after the cursor as one list."""
+        transactions = []
         try:
-            # Get current slot
-            current_slot = await self._get_current_slot()
-            
-            # Get block data for recent slots
-            transactions = []
-            slots_to_check = min(5, current_slot - self.last_processed_slot)
-            
-            for i in range(slots_to_check):
-                slot = current_slot - i
-                block_data = await self._get_block_data(slot)
+            async for window_transactions in self._iter_transaction_windows():
+                transactions.extend(window_transactions)
+        except Exception as e:
+            logger.error(f"Error getting recent transactions: {e}")
+        return transactions
+    
+    async def _iter_transaction_windows(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield transactions from the slots after the cursor, one window at a time.
+        
+        Each window of max_concurrent_block_fetches * 2 slots is fetched
+        concurrently over the pooled HTTP client and processed in slot order.
+        Skipped slots are stepped over; the cursor advances through the
+        contiguous run of slots that were fetched or confirmed skipped. At the
+        first failed fetch no further windows are scheduled, so the failed slot
+        is retried on the next cycle.
+        """
+        current_slot = await self._get_current_slot()
+        if current_slot <= 0:
+            return
+        self.tip_slot = max(self.tip_slot, current_slot)
+        
+        if self.last_processed_slot <= 0:
+            self.last_processed_slot = current_slot
+        
+        end_slot = min(current_slot, self.last_processed_slot + self.max_slots_per_cycle)
+        window_size = max(1, self.max_concurrent_block_fetches * 2)
+        semaphore = asyncio.Semaphore(self.max_concurrent_block_fetches)
+        
+        async def fetch(slot: int):
+            async with semaphore:
+                return await self._fetch_block(slot)
+        
+        start_time = time.perf_counter()
+        blocks = 0
+        try:
+            while self.last_processed_slot < end_slot:
+                slots = list(range(self.last_processed_slot + 1,
+                                   min(end_slot, self.last_processed_slot + window_size) + 1))
+                results = await asyncio.gather(*(fetch(slot) for slot in slots))
                 
-                if block_data and 'transactions' in block_data:
-                    for tx in block_data['transactions']:
-                        if tx and 'transaction' in tx:
-                            transactions.append(tx)
+                transactions = []
+                gap = False
+                for slot, (status, block_data) in zip(slots, results):
+                    if status == 'error':
+                        # Stop at the first gap; it is retried next cycle
+                        self.metrics['block_fetch_errors'] += 1
+                        gap = True
+                        break
+                    
+                    if status == 'block':
+                        blocks += 1
+                        block_time = block_data.get('blockTime')
+                        for tx in block_data.get('transactions') or []:
+                            if tx and 'transaction' in tx:
+                                tx['slot'] = slot
+                                tx['blockTime'] = block_time
+                                transactions.append(tx)
+                    else:
+                        self.metrics['slots_skipped'] += 1
+                    
+                    self.last_processed_slot = slot
+                
+                # Release the decoded blocks before handing over the window
+                del results
+                yield transactions
+                if gap:
+                    break
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self.metrics['blocks_processed'] += blocks
+            self.metrics['blocks_per_second'] = round(blocks / elapsed, 2) if elapsed > 0 else 0.0
+            self.metrics['slot_lag'] = self.tip_slot - self.last_processed_slot
+    
+    async def _fetch_block(self, slot: int) -> tuple:
+        """
+        Fetch one block.
+        
+        Returns:
+            ('block', data), ('skipped', None) or ('error', None)
+        """
+        result, error = await self._rpc_request(
+            'getBlock',
+            [slot, {"encoding": "json", "maxSupportedTransactionVersion": 0,
+                    "transactionDetails": "full", "rewards": False}]
+        )
+        
+        if error is not None:
+            if isinstance(error, dict) and error.get('code') in SKIPPED_SLOT_ERROR_CODES:
+                return 'skipped', None
+            return 'error', None
+        
+        if result is None:
+            # Null result means no block was produced for the slot
+            return 'skipped', None
+        
+        return 'block', result
+    
+    def _load_slot_checkpoint(self) -> int:
+        """Load the last processed slot from the checkpoint file."""
+        try:
+            if os.path.exists(self.slot_checkpoint_file):
+                with open(self.slot_checkpoint_file, 'r') as f:
+                    return int(json.load(f).get('last_processed_slot', 0))
+        except Exception as e:
+            logger.warning(f"Could not load slot checkpoint: {e}")
+        return 0
+    
+    def _save_slot_checkpoint(self) -> None:
+        """Atomically write the slot cursor to the checkpoint file."""
+        if self.last_processed_slot <= 0:
+            return
+        
+        try:
+            directory = os.path.dirname(self.slot_checkpoint_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
             
-            self.last_processed_slot = current_slot
-            return transactions
+            tmp_file = f"{self.slot_checkpoint_file}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump({
+                    'last_processed_slot': self.last_processed_slot,
+                    'tip_slot': self.tip_slot,
+                    'updated_at': datetime.now().isoformat()
+                }, f)
+            os.replace(tmp_file, self.slot_checkpoint_file)
             
         except Exception as e:
-            logger.error(f"Error getting recent transactions: {e}")
-            return []
+            logger.warning(f"Could not save slot checkpoint: {e}")
     
     async def _analyze_transaction(self, tx_data: Dict[str, Any]) -> Optional[WhaleTransaction]:
         """Analyze a transaction to determine if it's a whale transaction."""
+        whales = self._analyze_block([tx_data])
+        return whales[0] if whales else None
+    
+    def _analyze_block(self, transactions: List[Dict[str, Any]]) -> List[WhaleTransaction]:
+        """
+        Find whale transactions in a batch of block transactions.
+        
+        Transactions whose balances never reach the threshold on either side
+        are rejected with a builtin max() before any array conversion. The
+        balance arrays of the remaining transactions are concatenated and
+        scanned with NumPy in one pass: per-transaction deltas, the largest
+        absolute change against the whale threshold, and the index of the
+        largest decrease (sender) and largest increase (receiver). Only
+        transactions that pass the threshold are materialized.
+        """
         try:
-            transaction = tx_data.get('transaction', {})
-            meta = tx_data.get('meta', {})
-            
-            # Skip failed transactions
-            if meta.get('err'):
-                return None
-            
-            # Analyze pre/post balances for SOL transfers
-            pre_balances = meta.get('preBalances', [])
-            post_balances = meta.get('postBalances', [])
-            
-            if len(pre_balances) != len(post_balances):
-                return None
-            
-            # Find largest balance change
-            max_change = 0
-            from_idx = -1
-            to_idx = -1
-            
-            for i in range(len(pre_balances)):
-                balance_change = abs(post_balances[i] - pre_balances[i])
-                if balance_change > max_change:
-                    max_change = balance_change
-                    if post_balances[i] > pre_balances[i]:
-                        to_idx = i
-                    else:
-                        from_idx = i
+            threshold = self.min_whale_lamports
+            candidates = []
+            pre_balances = []
+            post_balances = []
             
-            # Convert lamports to SOL
-            amount_sol = max_change / 1e9
+            for tx_data in transactions:
+                meta = tx_data.get('meta') or {}
+                pre = meta.get('preBalances')
+                post = meta.get('postBalances')
+                
+                # Skip failed transactions and malformed balance arrays
+                if meta.get('err') or not pre or not post or len(pre) != len(post):
+                    continue
+                
+                # A whale-sized change needs a whale-sized balance on one side
+                if max(post) < threshold and max(pre) < threshold:
+                    continue
+                
+                candidates.append(tx_data)
+                pre_balances.append(pre)
+                post_balances.append(post)
             
-            # Check if it meets whale threshold
-            if amount_sol < self.min_whale_amount_sol:
-                return None
+            if not candidates:
+                return []
             
-            # Get account addresses
-            account_keys = transaction.get('message', {}).get('accountKeys', [])
+            lengths = np.fromiter(map(len, pre_balances), dtype=np.int64, count=len(pre_balances))
+            total = int(lengths.sum())
+            starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            tx_ids = np.repeat(np.arange(len(candidates)), lengths)
             
-            from_address = account_keys[from_idx] if from_idx >= 0 and from_idx < len(account_keys) else 'unknown'
-            to_address = account_keys[to_idx] if to_idx >= 0 and to_idx < len(account_keys) else 'unknown'
+            pre_array = np.fromiter(chain.from_iterable(pre_balances), dtype=np.int64, count=total)
+            post_array = np.fromiter(chain.from_iterable(post_balances), dtype=np.int64, count=total)
+            deltas = post_array - pre_array
             
-            # Calculate USD value (approximate)
-            amount_usd = amount_sol * 180.0  # Approximate SOL price
+            # Largest increase / decrease per transaction
+            max_delta = np.maximum.reduceat(deltas, starts)
+            min_delta = np.minimum.reduceat(deltas, starts)
+            max_change = np.maximum(max_delta, -min_delta)
             
-            # Check if exchange-related
-            is_exchange_related = self._is_exchange_address(from_address) or self._is_exchange_address(to_address)
-            exchange_name = self._get_exchange_name(from_address) or self._get_exchange_name(to_address)
+            whale_ids = np.flatnonzero(max_change >= self.min_whale_lamports)
+            if whale_ids.size == 0:
+                return []
             
-            # Calculate confidence score
-            confidence_score = self._calculate_confidence_score(amount_sol, from_address, to_address, is_exchange_related)
+            # First account index attaining the max/min delta in each transaction
+            receiver_idx = self._first_match_index(deltas == max_delta[tx_ids], tx_ids, starts)
+            sender_idx = self._first_match_index(deltas == min_delta[tx_ids], tx_ids, starts)
             
-            # Create whale transaction
-            whale_tx = WhaleTransaction(
-                signature=tx_data.get('transaction', {}).get('signatures', ['unknown'])[0],
-                timestamp=datetime.now(),
-                from_address=from_address,
-                to_address=to_address,
-                amount_sol=amount_sol,
-                amount_usd=amount_usd,
-                transaction_type='transfer',
-                is_exchange_related=is_exchange_related,
-                exchange_name=exchange_name,
-                confidence_score=confidence_score,
-                metadata={
-                    'slot': tx_data.get('slot'),
-                    'block_time': tx_data.get('blockTime'),
-                    'fee': meta.get('fee', 0),
-                    'compute_units_consumed': meta.get('computeUnitsConsumed', 0)
-                }
-            )
+            whales = []
+            for i in whale_ids:
+                tx_data = candidates[i]
+                account_keys = self._get_account_keys(tx_data)
+                
+                from_address = 'unknown'
+                if min_delta[i] < 0 and sender_idx[i] < len(account_keys):
+                    from_address = account_keys[sender_idx[i]]
+                
+                to_address = 'unknown'
+                if max_delta[i] > 0 and receiver_idx[i] < len(account_keys):
+                    to_address = account_keys[receiver_idx[i]]
+                
+                whales.append(self._build_whale_transaction(
+                    tx_data, int(max_change[i]) / 1e9, from_address, to_address
+                ))
             
-            return whale_tx
+            return whales
             
         except Exception as e:
-            logger.error(f"Error analyzing transaction: {e}")
-            return None
+            logger.error(f"Error analyzing transactions: {e}")
+            return []
+    
+    @staticmethod
+    def _first_match_index(matches: np.ndarray, tx_ids: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """Index (relative to each transaction) of the first True per transaction."""
+        positions = np.flatnonzero(matches)
+        first_tx, first = np.unique(tx_ids[positions], return_index=True)
+        result = np.zeros(len(starts), dtype=np.int64)
+        result[first_tx] = positions[first] - starts[first_tx]
+        return result
+    
+    @staticmethod
+    def _get_account_keys(tx_data: Dict[str, Any]) -> List[str]:
+        """Account keys in balance order, including v0 lookup-table addresses."""
+        message = (tx_data.get('transaction') or {}).get('message') or {}
+        account_keys = [
+            key.get('pubkey', 'unknown') if isinstance(key, dict) else key
+            for key in message.get('accountKeys', [])
+        ]
+        
+        loaded = ((tx_data.get('meta') or {}).get('loadedAddresses')) or {}
+        account_keys.extend(loaded.get('writable', []))
+        account_keys.extend(loaded.get('readonly', []))
+        return account_keys
+    
+    def _build_whale_transaction(self, tx_data: Dict[str, Any], amount_sol: float,
+                                 from_address: str, to_address: str) -> WhaleTransaction:
+        """Create a WhaleTransaction for a transaction that passed the threshold."""
+        meta = tx_data.get('meta') or {}
+        
+        # Calculate USD value (approximate)
+        amount_usd = amount_sol * 180.0  # Approximate SOL price
+        
+        # Check if exchange-related
+        exchange_name = self.exchange_addresses.get(from_address) or self.exchange_addresses.get(to_address)
+        is_exchange_related = from_address in self.exchange_addresses or to_address in self.exchange_addresses
+        
+        # Calculate confidence score
+        confidence_score = self._calculate_confidence_score(amount_sol, from_address, to_address, is_exchange_related)
+        
+        return WhaleTransaction(
+            signature=(tx_data.get('transaction') or {}).get('signatures', ['unknown'])[0],
+            timestamp=datetime.now(),
+            from_address=from_address,
+            to_address=to_address,
+            amount_sol=amount_sol,
+            amount_usd=amount_usd,
+            transaction_type='transfer',
+            is_exchange_related=is_exchange_related,
+            exchange_name=exchange_name,
+            confidence_score=confidence_score,
+            metadata={
+                'slot': tx_data.get('slot'),
+                'block_time': tx_data.get('blockTime'),
+                'fee': meta.get('fee', 0),
+                'compute_units_consumed': meta.get('computeUnitsConsumed', 0)
+            }
+        )
     
     def _calculate_confidence_score(self, amount_sol: float, from_addr: str, to_addr: str, is_exchange: bool) -> float:
         """Calculate confidence score for whale transaction."""
@@ -351,8 +557,19 @@ class WhaleDetector:
     
     async def _rpc_call(self, method: str, params: List[Any] = None) -> Any:
         """Make RPC call to Solana node."""
+        result, _ = await self._rpc_request(method, params)
+        return result
+    
+    async def _rpc_request(self, method: str, params: List[Any] = None) -> tuple:
+        """
+        Make RPC call to Solana node, keeping the JSON-RPC error.
+        
+        Returns:
+            (result, error) where error is the JSON-RPC error object, or a
+            string for transport/HTTP failures
+        """
         if not self.http_client:
-            return None
+            return None, 'no_client'
         
         payload = {
             'jsonrpc': '2.0',
@@ -367,39 +584,23 @@ class WhaleDetector:
             
             if response.status_code == 200:
                 data = response.json()
-                return data.get('result')
+                return data.get('result'), data.get('error')
             else:
                 logger.warning(f"RPC call failed: {response.status_code}")
-                return None
+                return None, f"http_{response.status_code}"
                 
         except Exception as e:
             logger.error(f"RPC call error: {e}")
-            return None
+            return None, str(e)
     
     async def _save_whale_transaction(self, whale_tx: WhaleTransaction) -> None:
-        """Save whale transaction to disk."""
+        """Append whale transaction to the hourly segment store."""
         try:
-            os.makedirs('output/whale_data/transactions', exist_ok=True)
+            from .whale_store import get_whale_store, whale_transaction_to_dict
             
-            filename = f"whale_tx_{whale_tx.timestamp.strftime('%Y%m%d_%H%M%S')}_{whale_tx.signature[:8]}.json"
-            filepath = os.path.join('output/whale_data/transactions', filename)
-            
-            tx_data = {
-                'signature': whale_tx.signature,
-                'timestamp': whale_tx.timestamp.isoformat(),
-                'from_address': whale_tx.from_address,
-                'to_address': whale_tx.to_address,
-                'amount_sol': whale_tx.amount_sol,
-                'amount_usd': whale_tx.amount_usd,
-                'transaction_type': whale_tx.transaction_type,
-                'is_exchange_related': whale_tx.is_exchange_related,
-                'exchange_name': whale_tx.exchange_name,
-                'confidence_score': whale_tx.confidence_score,
-                'metadata': whale_tx.metadata
-            }
-            
-            with open(filepath, 'w') as f:
-                json.dump(tx_data, f, indent=2)
+            get_whale_store('output/whale_data/transactions').append(
+                whale_transaction_to_dict(whale_tx), whale_tx.timestamp
+            )
                 
         except Exception as e:
             logger.error(f"Error saving whale transaction: {e}")
@@ -415,6 +616,7 @@ class WhaleDetector:
             **self.metrics,
             'is_monitoring': self.is_monitoring,
             'last_processed_slot': self.last_processed_slot,
+            'tip_slot': self.tip_slot,
             'total_detected': len(self.detected_transactions),
             'exchange_addresses_loaded': len(self.exchange_addresses),
             'whale_wallets_loaded': len(self.whale_wallets)
@@ -423,6 +625,7 @@ class WhaleDetector:
     async def close(self) -> None:
         """Close whale detector and cleanup resources."""
         self.stop_monitoring()
+        self._save_slot_checkpoint()
         
         if self.http_client:
             await self.http_client.aclose()
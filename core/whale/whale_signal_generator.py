@@ -8,10 +8,11 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import defaultdict, deque
 import numpy as np
 
 from .whale_detector import WhaleTransaction
+from .whale_aggregates import RollingWhaleWindow
 
 logger = logging.getLogger(__name__)
 
@@ -53,40 +54,101 @@ class WhaleSignalGenerator:
         self.exchange_flow_strength = self.signal_config.get('exchange_flow_signal_strength', 0.7)
         self.whale_confirmation_bonus = self.signal_config.get('whale_confirmation_bonus', 0.2)
         
+        # Rolling aggregates per timeframe, fed once per transaction
+        self.timeframes = [
+            ('short', self.short_term_window),
+            ('medium', self.medium_term_window),
+            ('long', self.long_term_window)
+        ]
+        self.aggregators = {
+            timeframe: RollingWhaleWindow(
+                window,
+                hll_buckets=self.signal_config.get('unique_address_buckets', 16),
+                hll_precision=self.signal_config.get('unique_address_precision', 10)
+            )
+            for timeframe, window in self.timeframes
+        }
+        self.max_window = max(window for _, window in self.timeframes)
+        
+        # Ingestion watermark and keys of ingested transactions still in a window
+        self.last_ingested_time: Optional[datetime] = None
+        self.ingested_keys = set()
+        self.ingested_order = deque()
+        
         # Generated signals cache
         self.generated_signals = []
         self.signal_history = defaultdict(list)
         
         logger.info("Whale signal generator initialized")
     
-    def generate_signals(self, whale_transactions: List[WhaleTransaction], 
+    def add_transaction(self, whale_tx: WhaleTransaction) -> bool:
+        """
+        Feed one whale transaction into the rolling aggregates.
+        
+        Returns:
+            True if the transaction was new and inside the longest window
+        """
+        key = (whale_tx.signature, whale_tx.timestamp)
+        if key in self.ingested_keys:
+            return False
+        if whale_tx.timestamp <= datetime.now() - self.max_window:
+            return False
+        
+        for aggregator in self.aggregators.values():
+            aggregator.add(whale_tx)
+        
+        self.ingested_keys.add(key)
+        self.ingested_order.append(key)
+        if self.last_ingested_time is None or whale_tx.timestamp > self.last_ingested_time:
+            self.last_ingested_time = whale_tx.timestamp
+        return True
+    
+    def _ingest(self, whale_transactions: List[WhaleTransaction]) -> None:
+        """Ingest transactions not seen yet from a chronological list."""
+        new_transactions = []
+        for tx in reversed(whale_transactions):
+            if self.last_ingested_time is not None and tx.timestamp < self.last_ingested_time:
+                break
+            if (tx.signature, tx.timestamp) not in self.ingested_keys:
+                new_transactions.append(tx)
+        
+        for tx in reversed(new_transactions):
+            self.add_transaction(tx)
+    
+    def _advance(self, current_time: datetime) -> None:
+        """Evict expired transactions from every window."""
+        for aggregator in self.aggregators.values():
+            aggregator.advance(current_time)
+        
+        cutoff = current_time - self.max_window
+        while self.ingested_order and self.ingested_order[0][1] <= cutoff:
+            self.ingested_keys.discard(self.ingested_order.popleft())
+    
+    def generate_signals(self, whale_transactions: Optional[List[WhaleTransaction]] = None,
                         base_signal: Optional[Dict[str, Any]] = None) -> List[WhaleSignal]:
-        """Generate trading signals from whale transactions."""
+        """
+        Generate trading signals from whale activity.
         
-        if not whale_transactions:
-            return []
+        Transactions passed in (e.g. the detector's chronological history) are
+        ingested incrementally - only ones newer than the last call are added -
+        and signals are computed from the rolling aggregates. Transactions can
+        also be fed with add_transaction() and this called without a list.
+        """
+        if whale_transactions:
+            self._ingest(whale_transactions)
         
         signals = []
         current_time = datetime.now()
+        self._advance(current_time)
         
         # Analyze different timeframes
-        for timeframe, window in [
-            ('short', self.short_term_window),
-            ('medium', self.medium_term_window),
-            ('long', self.long_term_window)
-        ]:
-            # Filter transactions for this timeframe
-            cutoff_time = current_time - window
-            timeframe_transactions = [
-                tx for tx in whale_transactions 
-                if tx.timestamp > cutoff_time
-            ]
-            
-            if not timeframe_transactions:
+        for timeframe, _ in self.timeframes:
+            aggregate = self.aggregators[timeframe]
+            if aggregate.count == 0:
                 continue
             
             # Generate signals for this timeframe
-            timeframe_signals = self._analyze_timeframe(timeframe_transactions, timeframe, base_signal)
+            timeframe_signals = self._analyze_timeframe(aggregate, timeframe, base_signal)
             signals.extend(timeframe_signals)
         
         # Store generated signals
@@ -98,62 +160,50 @@ class WhaleSignalGenerator:
         
         return signals
     
-    def _analyze_timeframe(self, transactions: List[WhaleTransaction], 
+    def _analyze_timeframe(self, aggregate: RollingWhaleWindow,
                           timeframe: str, base_signal: Optional[Dict[str, Any]]) -> List[WhaleSignal]:
-        """Analyze whale transactions for a specific timeframe."""
+        """Analyze whale aggregates for a specific timeframe."""
         
         signals = []
         
         # 1. Accumulation/Distribution Analysis
-        accumulation_signal = self._analyze_accumulation_distribution(transactions, timeframe)
+        accumulation_signal = self._analyze_accumulation_distribution(aggregate, timeframe)
         if accumulation_signal:
             signals.append(accumulation_signal)
         
         # 2. Exchange Flow Analysis
-        exchange_flow_signal = self._analyze_exchange_flows(transactions, timeframe)
+        exchange_flow_signal = self._analyze_exchange_flows(aggregate, timeframe)
         if exchange_flow_signal:
             signals.append(exchange_flow_signal)
         
         # 3. Smart Money Analysis
-        smart_money_signal = self._analyze_smart_money(transactions, timeframe)
+        smart_money_signal = self._analyze_smart_money(aggregate, timeframe)
         if smart_money_signal:
             signals.append(smart_money_signal)
         
         # 4. Whale Confirmation Analysis (if base signal provided)
         if base_signal:
-            confirmation_signal = self._analyze_whale_confirmation(transactions, base_signal, timeframe)
+            confirmation_signal = self._analyze_whale_confirmation(aggregate, base_signal, timeframe)
             if confirmation_signal:
                 signals.append(confirmation_signal)
         
         return signals
     
-    def _analyze_accumulation_distribution(self, transactions: List[WhaleTransaction], 
+    def _analyze_accumulation_distribution(self, aggregate: RollingWhaleWindow,
                                          timeframe: str) -> Optional[WhaleSignal]:
         """Analyze accumulation vs distribution patterns."""
         
-        if not transactions:
+        if aggregate.count == 0:
             return None
         
-        # Calculate net flow
-        total_accumulation = 0
-        total_distribution = 0
-        exchange_inflow = 0
-        exchange_outflow = 0
-        
-        for tx in transactions:
-            if tx.is_exchange_related:
-                # Determine if this is inflow (to exchange) or outflow (from exchange)
-                # This is simplified - in reality, we'd need to check transaction direction
-                if tx.amount_sol > 0:
-                    exchange_inflow += tx.amount_sol
-                else:
-                    exchange_outflow += abs(tx.amount_sol)
-            else:
-                # Non-exchange transactions
-                if tx.confidence_score > 0.7:
-                    total_accumulation += tx.amount_sol
-                else:
-                    total_distribution += tx.amount_sol
+        # Exchange-related transactions are treated as inflow (to exchange) when
+        # positive - simplified, in reality we'd need to check transaction direction
+        exchange_inflow = aggregate.exchange_positive
+        exchange_outflow = aggregate.exchange_negative
+        
+        # Non-exchange transactions split by confidence
+        total_accumulation = aggregate.accumulation
+        total_distribution = aggregate.distribution
         
         # Calculate net flow
         net_exchange_flow = exchange_outflow - exchange_inflow  # Positive = bullish (leaving exchanges)
@@ -203,21 +253,21 @@ class WhaleSignalGenerator:
             'total_distribution': total_distribution,
             'exchange_inflow': exchange_inflow,
             'exchange_outflow': exchange_outflow,
-            'transaction_count': len(transactions),
-            'avg_transaction_size': np.mean([tx.amount_sol for tx in transactions]),
-            'max_transaction_size': max([tx.amount_sol for tx in transactions]),
-            'unique_addresses': len(set([tx.from_address for tx in transactions] + [tx.to_address for tx in transactions]))
+            'transaction_count': aggregate.count,
+            'avg_transaction_size': aggregate.avg_transaction_size,
+            'max_transaction_size': aggregate.max_transaction_size,
+            'unique_addresses': aggregate.unique_address_count()
         }
         
         metadata = {
             'analysis_window': timeframe,
-            'transactions_analyzed': len(transactions),
+            'transactions_analyzed': aggregate.count,
             'signal_generation_time': datetime.now().isoformat(),
             'confidence_factors': {
                 'exchange_flow_impact': abs(net_exchange_flow) / max(1, self.accumulation_threshold),
                 'whale_flow_impact': abs(net_whale_flow) / max(1, self.accumulation_threshold),
-                'transaction_volume': len(transactions),
-                'average_confidence': np.mean([tx.confidence_score for tx in transactions])
+                'transaction_volume': aggregate.count,
+                'average_confidence': aggregate.avg_confidence
             }
         }
         
@@ -233,31 +283,22 @@ class WhaleSignalGenerator:
             metadata=metadata
         )
     
-    def _analyze_exchange_flows(self, transactions: List[WhaleTransaction], 
+    def _analyze_exchange_flows(self, aggregate: RollingWhaleWindow,
                                timeframe: str) -> Optional[WhaleSignal]:
         """Analyze exchange inflow/outflow patterns."""
         
-        exchange_transactions = [tx for tx in transactions if tx.is_exchange_related]
-        
-        if not exchange_transactions:
+        if aggregate.exchange_count == 0:
             return None
         
-        # Group by exchange
-        exchange_flows = defaultdict(lambda: {'inflow': 0, 'outflow': 0})
-        
-        for tx in exchange_transactions:
-            exchange = tx.exchange_name or 'unknown'
-            # Simplified flow detection - in reality, need to check transaction direction
-            if tx.amount_sol > 0:
-                exchange_flows[exchange]['outflow'] += tx.amount_sol
-            else:
-                exchange_flows[exchange]['inflow'] += abs(tx.amount_sol)
+        # Per-exchange flows - simplified flow detection, positive amounts
+        # count as outflow; in reality, need to check transaction direction
+        exchange_flows = {
+            exchange: {'inflow': flows['negative'], 'outflow': flows['positive']}
+            for exchange, flows in aggregate.exchange_flows.items()
+        }
         
         # Calculate total net flow
-        total_net_flow = sum(
-            flows['outflow'] - flows['inflow'] 
-            for flows in exchange_flows.values()
-        )
+        total_net_flow = aggregate.exchange_positive - aggregate.exchange_negative
         
         # Generate signal based on net flow
         if abs(total_net_flow) < 200:  # Minimum threshold
@@ -274,7 +315,7 @@ class WhaleSignalGenerator:
         
         whale_data = {
             'total_net_flow': total_net_flow,
-            'exchange_flows': dict(exchange_flows),
+            'exchange_flows': exchange_flows,
             'dominant_exchange': max(exchange_flows.keys(), key=lambda x: exchange_flows[x]['outflow'] + exchange_flows[x]['inflow']) if exchange_flows else None
         }
         
@@ -296,22 +337,17 @@ class WhaleSignalGenerator:
             metadata=metadata
         )
     
-    def _analyze_smart_money(self, transactions: List[WhaleTransaction], 
+    def _analyze_smart_money(self, aggregate: RollingWhaleWindow,
                             timeframe: str) -> Optional[WhaleSignal]:
         """Analyze smart money (high-confidence whale) activity."""
         
-        # Filter for high-confidence whale transactions
-        smart_money_transactions = [
-            tx for tx in transactions 
-            if tx.confidence_score > 0.8 and tx.amount_sol > 200
-        ]
-        
-        if not smart_money_transactions:
+        # High-confidence (> 0.8), large (> 200 SOL) whale transactions
+        if aggregate.smart_count == 0:
             return None
         
         # Analyze smart money direction
-        total_volume = sum(tx.amount_sol for tx in smart_money_transactions)
-        avg_confidence = np.mean([tx.confidence_score for tx in smart_money_transactions])
+        total_volume = aggregate.smart_volume
+        avg_confidence = aggregate.smart_avg_confidence
         
         # Simple direction analysis (in reality, would need more sophisticated analysis)
         # For now, assume net positive volume is bullish
@@ -329,9 +365,9 @@ class WhaleSignalGenerator:
         
         whale_data = {
             'smart_money_volume': total_volume,
-            'smart_money_count': len(smart_money_transactions),
+            'smart_money_count': aggregate.smart_count,
             'average_confidence': avg_confidence,
-            'largest_transaction': max(tx.amount_sol for tx in smart_money_transactions)
+            'largest_transaction': aggregate.smart_max_transaction_size
         }
         
         metadata = {
@@ -352,33 +388,30 @@ class WhaleSignalGenerator:
             metadata=metadata
         )
     
-    def _analyze_whale_confirmation(self, transactions: List[WhaleTransaction], 
+    def _analyze_whale_confirmation(self, aggregate: RollingWhaleWindow,
                                    base_signal: Dict[str, Any], timeframe: str) -> Optional[WhaleSignal]:
         """Analyze if whale activity confirms a base trading signal."""
         
-        if not base_signal or not transactions:
+        if not base_signal or aggregate.count == 0:
             return None
         
         base_action = base_signal.get('action', 'HOLD')
         if base_action == 'HOLD':
             return None
         
-        # Analyze if whale activity supports the base signal
+        # Confidence-weighted volumes supporting/opposing the base signal
+        # (simplified confirmation logic)
         supporting_volume = 0
         opposing_volume = 0
         
-        for tx in transactions:
-            # Simplified confirmation logic
-            if base_action == 'BUY':
-                if not tx.is_exchange_related or tx.amount_sol > 0:  # Accumulation or outflow
-                    supporting_volume += tx.amount_sol * tx.confidence_score
-                else:
-                    opposing_volume += tx.amount_sol * tx.confidence_score
-            elif base_action == 'SELL':
-                if tx.is_exchange_related and tx.amount_sol < 0:  # Inflow to exchanges
-                    supporting_volume += abs(tx.amount_sol) * tx.confidence_score
-                else:
-                    opposing_volume += tx.amount_sol * tx.confidence_score
+        if base_action == 'BUY':
+            # Accumulation or outflow supports, inflow to exchanges opposes
+            supporting_volume = aggregate.non_exchange_weighted + aggregate.exchange_positive_weighted
+            opposing_volume = -aggregate.exchange_negative_weighted
+        elif base_action == 'SELL':
+            # Inflow to exchanges supports, everything else opposes
+            supporting_volume = aggregate.exchange_negative_weighted
+            opposing_volume = aggregate.non_exchange_weighted + aggregate.exchange_positive_weighted
         
         # Calculate confirmation strength
         total_volume = supporting_volume + opposing_volume
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Whale Segment Store - Append-only, hourly-partitioned whale transaction storage
+Replaces one JSON file per transaction with hourly JSONL segments.
+"""
+
+import os
+import json
+import glob
+import shutil
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+
+from .whale_detector import WhaleTransaction
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PREFIX = "whale_segment_"
+SEGMENT_SUFFIX = ".jsonl"
+SEGMENT_TIME_FORMAT = "%Y%m%d_%H"
+SEGMENT_DURATION = timedelta(hours=1)
+INDEX_FILENAME = "segment_index.json"
+LEGACY_PATTERN = "whale_tx_*.json"
+
+
+def whale_transaction_to_dict(whale_tx: WhaleTransaction) -> Dict[str, Any]:
+    """Serialize a whale transaction for storage."""
+    return {
+        'signature': whale_tx.signature,
+        'timestamp': whale_tx.timestamp.isoformat(),
+        'from_address': whale_tx.from_address,
+        'to_address': whale_tx.to_address,
+        'amount_sol': whale_tx.amount_sol,
+        'amount_usd': whale_tx.amount_usd,
+        'transaction_type': whale_tx.transaction_type,
+        'is_exchange_related': whale_tx.is_exchange_related,
+        'exchange_name': whale_tx.exchange_name,
+        'confidence_score': whale_tx.confidence_score,
+        'metadata': whale_tx.metadata
+    }
+
+
+def whale_transaction_from_dict(tx_data: Dict[str, Any]) -> WhaleTransaction:
+    """Deserialize a stored whale transaction."""
+    return WhaleTransaction(
+        signature=tx_data['signature'],
+        timestamp=datetime.fromisoformat(tx_data['timestamp']),
+        from_address=tx_data['from_address'],
+        to_address=tx_data['to_address'],
+        amount_sol=tx_data['amount_sol'],
+        amount_usd=tx_data['amount_usd'],
+        transaction_type=tx_data['transaction_type'],
+        is_exchange_related=tx_data['is_exchange_related'],
+        exchange_name=tx_data.get('exchange_name'),
+        confidence_score=tx_data['confidence_score'],
+        metadata=tx_data.get('metadata', {})
+    )
+
+
+class WhaleSegmentStore:
+    """
+    Append-only store of whale transactions in hourly JSONL segments.
+
+    Each record goes to the segment for its timestamp's hour
+    (whale_segment_YYYYMMDD_HH.jsonl), so:
+    - appends are a single line write to the open segment
+    - time-window loads only open segments overlapping the window
+    - retention and backups operate on whole segments
+
+    A small index (segment_index.json) keeps record counts and the first/last
+    timestamp per segment; it is rebuilt from the segments if missing.
+    """
+
+    def __init__(self, directory: str):
+        """Initialize the store in a directory."""
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.index_path = os.path.join(self.directory, INDEX_FILENAME)
+        self.index: Dict[str, Dict[str, Any]] = {}
+
+        self._active_segment: Optional[str] = None
+        self._active_file = None
+
+        self.stats = {
+            'records_appended': 0,
+            'segments_read': 0,
+            'segments_dropped': 0,
+            'records_migrated': 0
+        }
+
+        self._load_index()
+
+    @staticmethod
+    def segment_name(timestamp: datetime) -> str:
+        """Segment file name for a timestamp."""
+        return f"{SEGMENT_PREFIX}{timestamp.strftime(SEGMENT_TIME_FORMAT)}{SEGMENT_SUFFIX}"
+
+    @staticmethod
+    def segment_start(name: str) -> Optional[datetime]:
+        """Start time of a segment from its file name."""
+        try:
+            stamp = name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+            return datetime.strptime(stamp, SEGMENT_TIME_FORMAT)
+        except ValueError:
+            return None
+
+    def _segment_names(self) -> List[str]:
+        """All segment file names on disk, oldest first."""
+        pattern = os.path.join(self.directory, f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}")
+        names = [os.path.basename(path) for path in glob.glob(pattern)]
+        return sorted(name for name in names if self.segment_start(name) is not None)
+
+    def _load_index(self) -> None:
+        """Load the segment index and reconcile it with segments on disk."""
+        try:
+            if os.path.exists(self.index_path):
+                with open(self.index_path, 'r') as f:
+                    self.index = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load whale segment index, rebuilding: {e}")
+            self.index = {}
+
+        on_disk = self._segment_names()
+        changed = False
+
+        for name in list(self.index):
+            if name not in on_disk:
+                del self.index[name]
+                changed = True
+
+        for name in on_disk:
+            entry = self.index.get(name)
+            size = os.path.getsize(os.path.join(self.directory, name))
+            if entry is None or entry.get('bytes') != size:
+                self.index[name] = self._scan_segment(name)
+                changed = True
+
+        if changed:
+            self._save_index()
+
+    def _scan_segment(self, name: str) -> Dict[str, Any]:
+        """Build an index entry by reading a segment."""
+        entry = {'count': 0, 'first': None, 'last': None, 'bytes': 0}
+        for record in self._read_segment(name):
+            self._update_entry(entry, record['timestamp'])
+        entry['bytes'] = os.path.getsize(os.path.join(self.directory, name))
+        return entry
+
+    @staticmethod
+    def _update_entry(entry: Dict[str, Any], timestamp: str) -> None:
+        entry['count'] += 1
+        if entry['first'] is None or timestamp < entry['first']:
+            entry['first'] = timestamp
+        if entry['last'] is None or timestamp > entry['last']:
+            entry['last'] = timestamp
+
+    def _save_index(self) -> None:
+        """Atomically write the segment index."""
+        try:
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.index, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            logger.error(f"Error saving whale segment index: {e}")
+
+    def _open_segment(self, name: str):
+        """Get the append handle for a segment, rotating the active one."""
+        if self._active_segment != name:
+            self._close_active()
+            self._active_file = open(os.path.join(self.directory, name), 'a', encoding='utf-8')
+            self._active_segment = name
+        return self._active_file
+
+    def _close_active(self) -> None:
+        if self._active_file is not None:
+            self._active_file.close()
+            self._active_file = None
+            self._active_segment = None
+            self._save_index()
+
+    def append(self, record: Dict[str, Any], timestamp: datetime) -> None:
+        """Append one record to the segment for its timestamp."""
+        name = self.segment_name(timestamp)
+        line = json.dumps(record, separators=(',', ':'), default=str) + '\n'
+
+        segment = self._open_segment(name)
+        segment.write(line)
+        segment.flush()
+
+        entry = self.index.setdefault(name, {'count': 0, 'first': None, 'last': None, 'bytes': 0})
+        self._update_entry(entry, record['timestamp'])
+        entry['bytes'] += len(line.encode('utf-8'))
+
+        self.stats['records_appended'] += 1
+
+    def _read_segment(self, name: str) -> Iterator[Dict[str, Any]]:
+        """Read the records of one segment, skipping torn lines."""
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Skipping corrupt line in {name}")
+        except FileNotFoundError:
+            return
+
+    def segments_between(self, start: datetime, end: Optional[datetime] = None) -> List[str]:
+        """Segment names whose hour overlaps [start, end]."""
+        names = []
+        for name in sorted(self.index):
+            segment_start = self.segment_start(name)
+            if segment_start + SEGMENT_DURATION <= start:
+                continue
+            if end is not None and segment_start > end:
+                continue
+            names.append(name)
+        return names
+
+    def read(self, start: datetime, end: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Read records with start < timestamp (<= end), in segment order."""
+        if self._active_file is not None:
+            self._active_file.flush()
+
+        start_iso = start.isoformat()
+        end_iso = end.isoformat() if end is not None else None
+
+        records = []
+        for name in self.segments_between(start, end):
+            self.stats['segments_read'] += 1
+            for record in self._read_segment(name):
+                timestamp = record.get('timestamp', '')
+                if timestamp > start_iso and (end_iso is None or timestamp <= end_iso):
+                    records.append(record)
+        return records
+
+    def drop_before(self, cutoff: datetime) -> Tuple[int, int]:
+        """
+        Delete whole segments that end at or before the cutoff.
+
+        Returns:
+            (segments deleted, records deleted)
+        """
+        segments = 0
+        records = 0
+        for name in sorted(self.index):
+            if self.segment_start(name) + SEGMENT_DURATION > cutoff:
+                continue
+            if name == self._active_segment:
+                self._close_active()
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            records += self.index.pop(name).get('count', 0)
+            segments += 1
+
+        if segments:
+            self.stats['segments_dropped'] += segments
+            self._save_index()
+        return segments, records
+
+    def backup(self, destination: str, start: Optional[datetime] = None) -> List[str]:
+        """Copy whole segments (optionally only those after start) to a directory."""
+        if self._active_file is not None:
+            self._active_file.flush()
+
+        os.makedirs(destination, exist_ok=True)
+        names = self.segments_between(start) if start is not None else sorted(self.index)
+        for name in names:
+            shutil.copy2(os.path.join(self.directory, name), os.path.join(destination, name))
+
+        with open(os.path.join(destination, INDEX_FILENAME), 'w') as f:
+            json.dump({name: self.index[name] for name in names}, f, indent=2, sort_keys=True)
+        return names
+
+    def migrate_legacy_files(self, delete: bool = True) -> int:
+        """
+        Move per-transaction whale_tx_*.json files into segments (one-shot).
+
+        Records already present in the target segment (by signature) are not
+        appended again, so an interrupted migration can be re-run.
+
+        Args:
+            delete: Remove legacy files once their segment has been written
+
+        Returns:
+            Number of records migrated
+        """
+        legacy_files = glob.glob(os.path.join(self.directory, LEGACY_PATTERN))
+        if not legacy_files:
+            return 0
+
+        # Group legacy records by target segment
+        by_segment: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+        for path in legacy_files:
+            try:
+                with open(path, 'r') as f:
+                    tx_data = json.load(f)
+                timestamp = datetime.fromisoformat(tx_data['timestamp'])
+                by_segment.setdefault(self.segment_name(timestamp), []).append((path, tx_data))
+            except Exception as e:
+                logger.warning(f"Skipping unreadable legacy whale file {path}: {e}")
+
+        migrated = 0
+        for name in sorted(by_segment):
+            entries = sorted(by_segment[name], key=lambda item: item[1]['timestamp'])
+            existing = {record.get('signature') for record in self._read_segment(name)}
+
+            for path, tx_data in entries:
+                if tx_data.get('signature') in existing:
+                    continue
+                self.append(tx_data, datetime.fromisoformat(tx_data['timestamp']))
+                existing.add(tx_data.get('signature'))
+                migrated += 1
+
+            self._close_active()
+            if delete:
+                for path, _ in entries:
+                    os.remove(path)
+
+        self.stats['records_migrated'] += migrated
+        logger.info(f"✅ Migrated {migrated} legacy whale transactions into {len(by_segment)} segments")
+        return migrated
+
+    def close(self) -> None:
+        """Close the active segment and persist the index."""
+        self._close_active()
+        self._save_index()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        return {
+            'directory': self.directory,
+            'segments': len(self.index),
+            'records': sum(entry.get('count', 0) for entry in self.index.values()),
+            'total_bytes': sum(entry.get('bytes', 0) for entry in self.index.values()),
+            'active_segment': self._active_segment,
+            **self.stats
+        }
+
+
+# Stores keyed by absolute directory so detector and collector share one writer
+_whale_stores: Dict[str, WhaleSegmentStore] = {}
+
+def get_whale_store(directory: str = "output/whale_data/transactions") -> WhaleSegmentStore:
+    """Get the shared segment store for a directory."""
+    key = os.path.abspath(directory)
+    if key not in _whale_stores:
+        _whale_stores[key] = WhaleSegmentStore(directory)
+    return _whale_stores[key]
@@ -11,13 +11,16 @@ import json
 import time
 import logging
 import asyncio
-import httpx
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Union, Callable, TypeVar
 
+# Shared bounded LRU+TTL response cache
+from phase_4_deployment.utils.ttl_cache import get_shared_cache
+from phase_4_deployment.utils.http_clients import get_http_client
+
 # Import API helpers
 try:
-    from phase_4_deployment.utils.api_helpers_wrapper import CircuitBreaker, APICache, retry_with_backoff
+    from phase_4_deployment.utils.api_helpers_wrapper import CircuitBreaker, retry_with_backoff
 except ImportError:
     # Fallback to local implementations
     import time
@@ -54,20 +57,6 @@ except ImportError:
                     self.state = "OPEN"
                 raise
 
-    class APICache:
-        def __init__(self):
-            self.cache = {}
-            self.expiry = {}
-
-        def get(self, key: str):
-            if key in self.cache and self.expiry.get(key, 0) > time.time():
-                return self.cache[key]
-            return None
-
-        def set(self, key: str, value, ttl: int = 60):
-            self.cache[key] = value
-            self.expiry[key] = time.time() + ttl
-
     async def retry_with_backoff(func: Callable[..., T], *args, max_retries: int = 3, base_delay: float = 1.0, **kwargs) -> Optional[T]:
         for attempt in range(max_retries + 1):
             try:
@@ -87,6 +76,80 @@ logger = logging.getLogger("api_manager")
 # Type variable for generic return type
 T = TypeVar('T')
 
+# Birdeye requests per second by API tier
+BIRDEYE_TIER_RATE_LIMITS = {
+    'standard': 1.0,
+    'starter': 15.0,
+    'premium': 50.0,
+    'business': 100.0
+}
+# Without a configured tier keep the previous 500ms spacing
+DEFAULT_BIRDEYE_RATE_LIMIT = 2.0
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+
+    Allows bursts of up to `capacity` requests and a sustained `rate`
+    requests per second. Callers that find the bucket empty reserve the next
+    token (the balance goes negative) and sleep until it is due, so
+    concurrent callers are spaced out in arrival order without a lock.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second of tokens)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, waiting if the bucket is empty.
+
+        Returns:
+            Seconds waited
+        """
+        self._refill()
+        self.tokens -= tokens
+        self.acquired += 1
+
+        if self.tokens >= 0:
+            return 0.0
+
+        wait_time = -self.tokens / self.rate
+        self.throttled += 1
+        self.total_wait += wait_time
+        await asyncio.sleep(wait_time)
+        return wait_time
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics."""
+        self._refill()
+        return {
+            'rate': self.rate,
+            'capacity': self.capacity,
+            'available_tokens': round(self.tokens, 3),
+            'acquired': self.acquired,
+            'throttled': self.throttled,
+            'total_wait_seconds': round(self.total_wait, 3)
+        }
+
 class APIProvider:
     """
     Represents an API provider with its configuration and status.
@@ -154,7 +217,24 @@ class APIManager:
         """
         self.config = config or {}
         self.providers: Dict[str, Dict[str, APIProvider]] = {}
-        self.cache = APICache()
+
+        # Response cache shared with the other API managers; 404s are cached
+        # negatively so known-missing resources aren't re-requested
+        cache_config = self.config.get('cache', {})
+        self.cache = get_shared_cache(
+            "api",
+            max_size=cache_config.get('max_size', 5000),
+            disk_path=cache_config.get('disk_path')
+        )
+        self.negative_cache_ttl = cache_config.get('negative_ttl', 300)
+
+        # Birdeye rate limit matched to the API tier
+        birdeye_config = self.config.get('birdeye', {})
+        self.birdeye_tier = birdeye_config.get('tier', os.environ.get('BIRDEYE_API_TIER'))
+        birdeye_rate = birdeye_config.get('rate_limit_rps', os.environ.get('BIRDEYE_RATE_LIMIT_RPS'))
+        if birdeye_rate is None:
+            birdeye_rate = BIRDEYE_TIER_RATE_LIMITS.get(str(self.birdeye_tier).lower(), DEFAULT_BIRDEYE_RATE_LIMIT)
+        self.birdeye_limiter = TokenBucket(float(birdeye_rate))
 
         # Initialize providers from config
         self._init_providers()
@@ -285,10 +365,10 @@ class APIManager:
         Returns:
             API response or None if the call failed
         """
-        # Check cache first
+        # Check cache first (a negative entry means the resource was not found)
         if cache_key:
-            cached_response = self.cache.get(cache_key)
-            if cached_response:
+            cache_hit, cached_response = self.cache.lookup(cache_key)
+            if cache_hit:
                 logger.debug(f"Cache hit for {cache_key}")
                 return cached_response
 
@@ -313,37 +393,45 @@ class APIManager:
         url = f"{provider.base_url}{endpoint}"
 
         # 🔧 FIXED: Enhanced API call with rate limiting and authentication
+        not_found = False
+
         try:
             async def make_request():
+                nonlocal not_found
+
                 # 🔧 FIXED: Enhanced rate limiting for Birdeye API
                 if api_type == "birdeye":
                     await self._handle_birdeye_rate_limiting()
 
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    if method == "GET":
-                        response = await client.get(url, params=params, headers=request_headers)
-                    elif method == "POST":
-                        response = await client.post(url, params=params, json=data, headers=request_headers)
-                    else:
-                        raise ValueError(f"Unsupported HTTP method: {method}")
-
-                    # 🔧 FIXED: Enhanced error handling for rate limiting
-                    if response.status_code == 429:  # Rate limited
-                        logger.warning(f"Rate limited by {api_type} API, waiting...")
-                        await asyncio.sleep(2.0)  # Wait 2 seconds
-                        raise Exception("Rate limited - will retry")
-                    elif response.status_code == 400 and api_type == "birdeye":
-                        logger.warning(f"Birdeye API 400 error, checking authentication...")
-                        # Log the response for debugging
-                        try:
-                            error_data = response.json()
-                            logger.error(f"Birdeye API error: {error_data}")
-                        except:
-                            logger.error(f"Birdeye API error: {response.text}")
-                        raise Exception("Birdeye API authentication/request error")
-
-                    response.raise_for_status()
-                    return response.json()
+                # Shared keep-alive client for this provider's host
+                client = get_http_client(url)
+                if method == "GET":
+                    response = await client.get(url, params=params, headers=request_headers, timeout=30.0)
+                elif method == "POST":
+                    response = await client.post(url, params=params, json=data, headers=request_headers, timeout=30.0)
+                else:
+                    raise ValueError(f"Unsupported HTTP method: {method}")
+
+                # 🔧 FIXED: Enhanced error handling for rate limiting
+                if response.status_code == 404:  # Not found - don't retry
+                    not_found = True
+                    return None
+                elif response.status_code == 429:  # Rate limited
+                    logger.warning(f"Rate limited by {api_type} API, waiting...")
+                    await asyncio.sleep(2.0)  # Wait 2 seconds
+                    raise Exception("Rate limited - will retry")
+                elif response.status_code == 400 and api_type == "birdeye":
+                    logger.warning(f"Birdeye API 400 error, checking authentication...")
+                    # Log the response for debugging
+                    try:
+                        error_data = response.json()
+                        logger.error(f"Birdeye API error: {error_data}")
+                    except:
+                        logger.error(f"Birdeye API error: {response.text}")
+                    raise Exception("Birdeye API authentication/request error")
+
+                response.raise_for_status()
+                return response.json()
 
             # Use circuit breaker and retry with enhanced backoff
             result = await provider.circuit_breaker.call(
@@ -356,6 +444,8 @@ class APIManager:
             # Cache result if needed
             if cache_key and result:
                 self.cache.set(cache_key, result, ttl=cache_ttl)
+            elif cache_key and not_found:
+                self.cache.set_negative(cache_key, ttl=min(cache_ttl, self.negative_cache_ttl))
 
             return result
         except Exception as e:
@@ -391,22 +481,11 @@ class APIManager:
 
     async def _handle_birdeye_rate_limiting(self):
         """
-        🔧 FIXED: Handle Birdeye API rate limiting with intelligent delays.
+        🔧 FIXED: Handle Birdeye API rate limiting with a token bucket matched to the API tier.
         """
-        current_time = time.time()
-
-        # Check if we need to wait between Birdeye calls
-        if hasattr(self, '_last_birdeye_call'):
-            time_since_last_call = current_time - self._last_birdeye_call
-            min_interval = 0.5  # 500ms between calls to avoid rate limiting
-
-            if time_since_last_call < min_interval:
-                wait_time = min_interval - time_since_last_call
-                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s before Birdeye call")
-                await asyncio.sleep(wait_time)
-
-        # Update last call time
-        self._last_birdeye_call = time.time()
+        wait_time = await self.birdeye_limiter.acquire()
+        if wait_time > 0:
+            logger.debug(f"Rate limiting: waited {wait_time:.2f}s before Birdeye call")
 
 # Global API manager instance
 _api_manager = None
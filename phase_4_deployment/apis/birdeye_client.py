@@ -73,6 +73,53 @@ class BirdeyeClient:
             logger.error(f"Error getting token price for {token_address}: {e}")
             return None
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics of the shared API response cache.
+
+        Returns:
+            Cache hit/miss/eviction counters
+        """
+        return self.api_manager.cache.get_stats()
+
+    async def get_multiple_token_prices(self, token_addresses: List[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Get prices for up to 100 tokens in one call (multi_price endpoint).
+
+        Each returned price is also cached under the single-token price key,
+        so later get_token_price calls for these tokens are cache hits.
+
+        Args:
+            token_addresses: Token addresses
+
+        Returns:
+            Mapping of token address to price data, or None if the call failed
+            (e.g. the endpoint is not available on the API tier)
+        """
+        if not token_addresses:
+            return {}
+
+        endpoint = f"/defi/multi_price?list_address={','.join(token_addresses)}"
+
+        try:
+            result = await self.api_manager.call_api(
+                api_type="birdeye",
+                endpoint=endpoint
+            )
+
+            if not result or not isinstance(result.get('data'), dict):
+                logger.warning(f"No multi-price data returned for {len(token_addresses)} tokens")
+                return None
+
+            prices = {address: data for address, data in result['data'].items() if data}
+            for address, data in prices.items():
+                self.api_manager.cache.set(f"birdeye_price_{address}", {'data': data, 'success': True}, ttl=60)
+            return prices
+
+        except Exception as e:
+            logger.error(f"Error getting multiple token prices: {e}")
+            return None
+
     async def get_token_metadata(self, token_address: str) -> Optional[Dict[str, Any]]:
         """
         Get metadata for a token.
@@ -14,7 +14,8 @@ from typing import Dict, Any, List, Optional, Tuple, Callable
 from datetime import datetime, timedelta
 from enum import Enum
 
-import httpx
+from phase_4_deployment.utils.ttl_cache import get_shared_cache
+from phase_4_deployment.utils.http_clients import get_http_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -89,54 +90,6 @@ class APIProvider:
         self.last_check = current_time
 
 
-class APICache:
-    """Cache for API responses."""
-    
-    def __init__(self, max_size: int = 1000):
-        """
-        Initialize API cache.
-        
-        Args:
-            max_size: Maximum cache size
-        """
-        self.cache = {}
-        self.expiry = {}
-        self.max_size = max_size
-        
-    def get(self, key: str) -> Optional[Any]:
-        """
-        Get value from cache.
-        
-        Args:
-            key: Cache key
-            
-        Returns:
-            Cached value or None if not found or expired
-        """
-        if key in self.cache and time.time() < self.expiry.get(key, 0):
-            return self.cache[key]
-        return None
-    
-    def set(self, key: str, value: Any, ttl: int) -> None:
-        """
-        Set value in cache.
-        
-        Args:
-            key: Cache key
-            value: Value to cache
-            ttl: Time to live in seconds
-        """
-        # Check if cache is full
-        if len(self.cache) >= self.max_size:
-            # Remove oldest entry
-            oldest_key = min(self.expiry.keys(), key=lambda k: self.expiry[k])
-            self.cache.pop(oldest_key, None)
-            self.expiry.pop(oldest_key, None)
-        
-        self.cache[key] = value
-        self.expiry[key] = time.time() + ttl
-
-
 class EnhancedAPIManager:
     """Enhanced API manager with improved fallback mechanisms."""
     
@@ -157,15 +110,19 @@ class EnhancedAPIManager:
     def __init__(self):
         """Initialize the API manager."""
         self.providers = {}
-        self.http_client = httpx.AsyncClient(timeout=10.0)
-        self.cache = APICache()
+        # Shared per-host keep-alive clients are used unless a client is injected
+        self.http_client = None
+        # Response cache shared with the other API managers
+        self.cache = get_shared_cache("api")
+        self.negative_cache_ttl = 300
         self.metrics = {
             "calls": 0,
             "cache_hits": 0,
             "cache_misses": 0,
             "successes": 0,
             "failures": 0,
-            "fallbacks": 0
+            "fallbacks": 0,
+            "not_found": 0
         }
         self.initialized = False
         
@@ -304,10 +261,10 @@ class EnhancedAPIManager:
         # Update metrics
         self.metrics["calls"] += 1
         
-        # Check cache
+        # Check cache (a negative entry means the resource was not found)
         if cache_key:
-            cached_result = self.cache.get(cache_key)
-            if cached_result is not None:
+            cache_hit, cached_result = self.cache.lookup(cache_key)
+            if cache_hit:
                 self.metrics["cache_hits"] += 1
                 return cached_result
             self.metrics["cache_misses"] += 1
@@ -332,14 +289,23 @@ class EnhancedAPIManager:
         
         try:
             # Make the request
+            client = self.http_client or get_http_client(url)
             if method.upper() == "GET":
-                response = await self.http_client.get(url, params=params, headers=request_headers)
+                response = await client.get(url, params=params, headers=request_headers, timeout=10.0)
             elif method.upper() == "POST":
-                response = await self.http_client.post(url, params=params, json=data, headers=request_headers)
+                response = await client.post(url, params=params, json=data, headers=request_headers, timeout=10.0)
             else:
                 logger.error(f"Unsupported HTTP method: {method}")
                 return None
             
+            # Not found is an answer, not a provider failure - cache it and
+            # don't fall back to other providers
+            if response.status_code == 404:
+                self.metrics["not_found"] += 1
+                if cache_key:
+                    self.cache.set_negative(cache_key, min(cache_ttl, self.negative_cache_ttl))
+                return None
+
             # Check response
             response.raise_for_status()
             
@@ -387,8 +353,9 @@ class EnhancedAPIManager:
             return None
     
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.http_client.aclose()
+        """Close an injected HTTP client (shared clients are closed at shutdown)."""
+        if self.http_client is not None:
+            await self.http_client.aclose()
 
 
 # Convenience function to get the API manager instance
@@ -19,6 +19,8 @@ from typing import Dict, List, Any, Optional, Union, Callable
 from datetime import datetime
 from pathlib import Path
 
+from phase_4_deployment.python_comm_layer.transport import DealerTransport, CommunicationError
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -50,7 +52,7 @@ class CarbonCoreClient:
         self.context = zmq.asyncio.Context()
         self.pub_socket = None
         self.sub_socket = None
-        self.req_socket = None
+        self.req_transport = None
         self.running = False
         self.fallback_module = None
         
@@ -142,9 +144,15 @@ class CarbonCoreClient:
             self.sub_socket.connect(self.config['communication']['zeromq']['sub_endpoint'])
             self.sub_socket.setsockopt_string(zmq.SUBSCRIBE, "")
             
-            # Request-reply socket (for synchronous communication)
-            self.req_socket = self.context.socket(zmq.REQ)
-            self.req_socket.connect(self.config['communication']['zeromq']['req_endpoint'])
+            # Multiplexed request transport (concurrent requests, msgpack payloads)
+            zeromq_config = self.config['communication']['zeromq']
+            self.req_transport = DealerTransport(
+                zeromq_config['req_endpoint'],
+                context=self.context,
+                timeout=zeromq_config.get('request_timeout', 5.0),
+                codec=zeromq_config.get('codec', 'msgpack')
+            )
+            await self.req_transport.connect()
             
             logger.info("ZeroMQ sockets initialized")
         except Exception as e:
@@ -162,8 +170,9 @@ class CarbonCoreClient:
         if self.sub_socket:
             self.sub_socket.close()
         
-        if self.req_socket:
-            self.req_socket.close()
+        if self.req_transport:
+            await self.req_transport.close()
+            self.req_transport = None
         
         # Terminate Carbon Core process
         if self.process and self.process.poll() is None:
@@ -199,18 +208,20 @@ class CarbonCoreClient:
         except Exception as e:
             logger.error(f"Failed to send command {command}: {str(e)}")
     
-    async def request(self, request_type: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    async def request(self, request_type: str, data: Dict[str, Any],
+                      timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
         Send a request to Carbon Core and wait for a response.
         
         Args:
             request_type: Type of request
             data: Request data
+            timeout: Timeout in seconds (configured request_timeout if not provided)
         
         Returns:
             Response data or None if request failed
         """
-        if not self.running or not self.req_socket:
+        if not self.running or not self.req_transport:
             logger.warning(f"Cannot send request {request_type}: Carbon Core not running")
             return self._fallback_request(request_type, data)
         
@@ -221,20 +232,14 @@ class CarbonCoreClient:
                 'data': data
             }
             
-            # Send request
-            await self.req_socket.send_string(json.dumps(message))
-            
-            # Wait for response with timeout
-            response = await asyncio.wait_for(self.req_socket.recv_string(), timeout=5.0)
-            
-            # Parse response
-            response_data = json.loads(response)
+            # Send request and wait for its reply; other requests stay in flight
+            response_data = await self.req_transport.request(message, timeout=timeout)
             logger.debug(f"Received response for {request_type}")
             
             return response_data
         
-        except asyncio.TimeoutError:
-            logger.error(f"Request {request_type} timed out")
+        except CommunicationError as e:
+            logger.error(f"Request {request_type} failed: {str(e)}")
             return self._fallback_request(request_type, data)
         
         except Exception as e:
@@ -2,7 +2,9 @@
 """
 Enhanced API Server for Williams Capital Management Trading System Dashboard
 
-Real-time integration with live trading system providing metrics every 30 seconds.
+Real-time integration with live trading system. A single background producer
+computes metrics once per tick and streams deltas to WebSocket (/ws) and SSE
+(/stream) clients; trade and whale events are pushed as they happen.
 Designed for Winsor Williams II hedge fund operations.
 """
 
@@ -12,10 +14,11 @@ import time
 import logging
 import asyncio
 import uvicorn
-import httpx
 from datetime import datetime, timedelta
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from dataclasses import asdict
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from typing import Dict, List, Any, Optional, Union
 from dotenv import load_dotenv
@@ -29,18 +32,51 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 # Load environment variables
 load_dotenv()
 
+# Background system metrics sampler (optional)
+try:
+    from core.monitoring.system_metrics import get_system_metrics_monitor
+    SYSTEM_METRICS_AVAILABLE = True
+except ImportError:
+    SYSTEM_METRICS_AVAILABLE = False
+
+# Trade journal tail for immediate trade events (optional)
+try:
+    from core.execution.trade_journal import TradeJournalReader, DEFAULT_TRADES_DIR
+    TRADE_JOURNAL_AVAILABLE = True
+except ImportError:
+    TRADE_JOURNAL_AVAILABLE = False
+
+from phase_4_deployment.dashboard.metrics_stream import MetricsBroadcaster
+
+# Streaming settings
+METRICS_TICK_SECONDS = float(os.getenv('DASHBOARD_TICK_SECONDS', '5'))
+TRADE_POLL_SECONDS = float(os.getenv('DASHBOARD_TRADE_POLL_SECONDS', '1'))
+BALANCE_TTL_SECONDS = float(os.getenv('DASHBOARD_BALANCE_TTL_SECONDS', '30'))
+SUBSCRIBER_QUEUE_SIZE = int(os.getenv('DASHBOARD_SUBSCRIBER_QUEUE_SIZE', '100'))
+SSE_KEEPALIVE_SECONDS = 15.0
+WHALE_EVENTS_ENABLED = os.getenv('DASHBOARD_WHALE_EVENTS', 'false').lower() == 'true'
+
 # Simple monitoring service for dashboard
 class SimpleMonitoringService:
     """Simple monitoring service for dashboard API."""
 
     def __init__(self):
         self.started = False
+        self.system_monitor = get_system_metrics_monitor() if SYSTEM_METRICS_AVAILABLE else None
 
     def start(self):
         """Start monitoring service."""
         self.started = True
+        if self.system_monitor:
+            self.system_monitor.start_sampler()
         logger.info("✅ Simple monitoring service started")
 
+    async def stop(self):
+        """Stop monitoring service."""
+        self.started = False
+        if self.system_monitor:
+            await self.system_monitor.stop_sampler()
+
     def run_health_checks(self):
         """Run basic health checks."""
         return {
@@ -50,8 +86,15 @@ class SimpleMonitoringService:
             "disk_space": True
         }
 
+    def get_system_snapshot(self):
+        """Latest sampled system metrics (never blocks on collection)."""
+        if self.system_monitor:
+            return self.system_monitor.get_latest_snapshot()
+        return {}
+
     def get_metrics(self):
         """Get basic metrics."""
+        snapshot = self.get_system_snapshot()
         return {
             "component_status": {
                 "api_server": "healthy",
@@ -60,8 +103,9 @@ class SimpleMonitoringService:
             },
             "system_metrics": {
                 "uptime": time.time(),
-                "memory_usage": 0.5,
-                "cpu_usage": 0.3
+                "memory_usage": snapshot.get("memory_usage_pct", 0) / 100,
+                "cpu_usage": snapshot.get("cpu_usage_pct", 0) / 100,
+                **snapshot
             }
         }
 
@@ -85,40 +129,49 @@ class LiveTradingMetrics:
         self.helius_api_key = os.getenv('HELIUS_API_KEY')
         self.last_update = None
         self.metrics_cache = {}
-        self.connected_clients = set()
 
-    async def get_wallet_balance(self):
-        """Get real-time wallet balance."""
+        # Reused RPC client and short-lived balance cache
+        self.helius_client = None
+        self.balance_cache = None
+        self.balance_cached_at = 0.0
+
+        # Incremental state for the session log currently being followed
+        self.log_path = None
+        self.log_inode = None
+        self.log_offset = 0
+        self.log_partial = b''
+        self.log_session_data = None
+
+        # Latest trades from the trade journal (set by the journal follower)
+        self.recent_trades = []
+
+    async def get_wallet_balance(self, max_age: float = BALANCE_TTL_SECONDS):
+        """Get wallet balance, reusing a value fetched within max_age seconds."""
+        if self.balance_cache is not None and time.time() - self.balance_cached_at < max_age:
+            return self.balance_cache
+
         try:
-            from phase_4_deployment.rpc_execution.helius_client import HeliusClient
-            client = HeliusClient(api_key=self.helius_api_key)
-            balance_data = await client.get_balance(self.wallet_address)
+            if self.helius_client is None:
+                from phase_4_deployment.rpc_execution.helius_client import HeliusClient
+                self.helius_client = HeliusClient(api_key=self.helius_api_key)
+            balance_data = await self.helius_client.get_balance(self.wallet_address)
 
             if isinstance(balance_data, dict) and 'balance_sol' in balance_data:
-                return balance_data['balance_sol']
+                self.balance_cache = balance_data['balance_sol']
+                self.balance_cached_at = time.time()
+                return self.balance_cache
             return None
         except Exception as e:
             logger.error(f"Error getting wallet balance: {e}")
             return None
 
     async def get_sol_price(self):
-        """Get current SOL price from Jupiter."""
+        """Get current SOL price from the shared price cache."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    "https://quote-api.jup.ag/v6/quote",
-                    params={
-                        "inputMint": "So11111111111111111111111111111111111111112",
-                        "outputMint": "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
-                        "amount": "1000000000",  # 1 SOL
-                        "slippageBps": "100"
-                    }
-                )
-
-                if response.status_code == 200:
-                    quote_data = response.json()
-                    return float(quote_data['outAmount']) / 1_000_000  # USDC has 6 decimals
-                return 152.0  # Fallback
+            from phase_4_deployment.utils.enhanced_price_service import get_enhanced_price_service, SOL_MINT
+            price_service = await get_enhanced_price_service()
+            price_data = await price_service.get_token_price(SOL_MINT)
+            return price_data['value'] if price_data else 152.0  # Fallback
         except Exception as e:
             logger.error(f"Error getting SOL price: {e}")
             return 152.0
@@ -170,7 +223,7 @@ class LiveTradingMetrics:
                         "risk_management": "online"
                     }
                 },
-                "recentTrades": session_data.get("recent_trades", [])
+                "recentTrades": self.recent_trades or session_data.get("recent_trades", [])
             }
 
             self.metrics_cache = metrics
@@ -181,6 +234,13 @@ class LiveTradingMetrics:
             logger.error(f"Error getting live metrics: {e}")
             return self.get_fallback_metrics()
 
+    async def get_current_metrics(self):
+        """Latest metrics from the producer, computed on demand if it isn't running."""
+        if self.metrics_cache and self.last_update and \
+                (datetime.now() - self.last_update).total_seconds() < 2 * METRICS_TICK_SECONDS:
+            return self.metrics_cache
+        return await self.get_live_metrics()
+
     def read_session_data(self):
         """Read trading session data from logs or files."""
         try:
@@ -209,24 +269,49 @@ class LiveTradingMetrics:
             return {}
 
     def parse_log_file(self, log_file):
-        """Parse trading session data from log file."""
+        """
+        Parse trading session data from log file.
+
+        Only lines appended since the previous call are read; counts carry
+        over between calls and restart when a different (or truncated) log
+        file is followed.
+        """
         try:
-            session_data = {
-                "is_active": False,
-                "total_trades": 0,
-                "successful_trades": 0,
-                "total_pnl": 0,
-                "total_pnl_usd": 0,
-                "win_rate": 0,
-                "session_start": time.time(),
-                "recent_trades": []
-            }
+            log_file = Path(log_file)
+            stat = log_file.stat()
+
+            if (self.log_session_data is None or log_file != self.log_path
+                    or stat.st_ino != self.log_inode or stat.st_size < self.log_offset):
+                self.log_path = log_file
+                self.log_inode = stat.st_ino
+                self.log_offset = 0
+                self.log_partial = b''
+                self.log_session_data = {
+                    "is_active": False,
+                    "total_trades": 0,
+                    "successful_trades": 0,
+                    "total_pnl": 0,
+                    "total_pnl_usd": 0,
+                    "win_rate": 0,
+                    "session_start": time.time(),
+                    "recent_trades": []
+                }
+
+            session_data = self.log_session_data
+            if stat.st_size == self.log_offset:
+                return dict(session_data)
+
+            with open(log_file, 'rb') as f:
+                f.seek(self.log_offset)
+                data = f.read()
+            self.log_offset += len(data)
 
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
+            # Keep an unterminated last line until the writer finishes it
+            lines = (self.log_partial + data).split(b'\n')
+            self.log_partial = lines.pop()
 
             # Parse log for trading activity
-            for line in lines:
+            for line in (raw.decode('utf-8', errors='replace') for raw in lines):
                 if "STARTING DEBUG TRADING SESSION" in line:
                     session_data["is_active"] = True
                 elif "Transaction executed:" in line:
@@ -240,7 +325,7 @@ class LiveTradingMetrics:
             if session_data["total_trades"] > 0:
                 session_data["win_rate"] = (session_data["successful_trades"] / session_data["total_trades"]) * 100
 
-            return session_data
+            return dict(session_data)
 
         except Exception as e:
             logger.error(f"Error parsing log file: {e}")
@@ -288,6 +373,12 @@ class LiveTradingMetrics:
 # Initialize live trading metrics
 live_metrics = LiveTradingMetrics()
 
+# Fan-out of metric deltas and events to dashboard clients
+broadcaster = MetricsBroadcaster(max_queue=SUBSCRIBER_QUEUE_SIZE)
+background_tasks: List[asyncio.Task] = []
+metrics_wakeup: Optional[asyncio.Event] = None  # Created on the serving loop in startup_event
+whale_event_source = None  # Whale watcher the alert callback is attached to
+
 # Create FastAPI app
 app = FastAPI(
     title="Williams Capital Management Trading API",
@@ -322,8 +413,8 @@ async def root():
 async def health():
     """Enhanced health check with live trading system status."""
     try:
-        # Get live metrics
-        live_data = await live_metrics.get_live_metrics()
+        # Latest metrics from the producer
+        live_data = await live_metrics.get_current_metrics()
 
         # Run standard health checks
         health_results = monitoring.run_health_checks()
@@ -339,6 +430,7 @@ async def health():
                 **health_results,
                 **live_data["system"]["components"]
             },
+            "system": monitoring.get_system_snapshot(),
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e:
@@ -353,20 +445,30 @@ async def health():
 async def metrics():
     """Enhanced metrics endpoint with live trading data."""
     try:
-        # Get live metrics
-        live_data = await live_metrics.get_live_metrics()
+        # Latest metrics from the producer
+        live_data = await live_metrics.get_current_metrics()
 
         # Get standard monitoring metrics
         monitoring_metrics = monitoring.get_metrics()
 
+        # Price cache hit-rate and per-source latency
+        from phase_4_deployment.utils.enhanced_price_service import get_enhanced_price_service
+        price_service = await get_enhanced_price_service()
+
+        # Per-host connection pool usage of the shared HTTP clients
+        from phase_4_deployment.utils.http_clients import get_http_pool_metrics
+
         # Combine metrics
         combined_metrics = {
             **live_data,
             "monitoring": monitoring_metrics,
+            "price_service": price_service.get_stats(),
+            "http_pools": get_http_pool_metrics(),
+            "stream": broadcaster.get_stats(),
             "api_info": {
                 "version": "2.0.0",
                 "last_update": datetime.now().isoformat(),
-                "update_interval": 30
+                "update_interval": METRICS_TICK_SECONDS
             }
         }
 
@@ -380,7 +482,7 @@ async def metrics():
 async def live_status():
     """Real-time trading system status."""
     try:
-        live_data = await live_metrics.get_live_metrics()
+        live_data = await live_metrics.get_current_metrics()
 
         return {
             "trading_active": live_data["trading"]["isActive"],
@@ -436,29 +538,53 @@ async def trading_session():
 # WebSocket endpoint for real-time updates
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time dashboard updates."""
+    """
+    WebSocket endpoint for real-time dashboard updates.
+
+    Sends a snapshot message first, then patch messages (JSON-patch ops
+    against the previous version) and trade/whale event messages.
+    """
     await websocket.accept()
-    live_metrics.connected_clients.add(websocket)
+    subscriber = broadcaster.subscribe()
 
     try:
         while True:
-            # Send live metrics every 30 seconds
-            live_data = await live_metrics.get_live_metrics()
-            await websocket.send_json(live_data)
-            await asyncio.sleep(30)
+            message = await subscriber.get()
+            await websocket.send_json(message)
 
     except WebSocketDisconnect:
-        live_metrics.connected_clients.discard(websocket)
+        pass
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
-        live_metrics.connected_clients.discard(websocket)
+    finally:
+        broadcaster.unsubscribe(subscriber)
+
+# Server-sent events endpoint with the same messages as /ws
+@app.get("/stream")
+async def stream(request: Request):
+    """Server-sent events stream of snapshot, patch and event messages."""
+    subscriber = broadcaster.subscribe()
+
+    async def event_source():
+        try:
+            while not await request.is_disconnected():
+                message = await subscriber.get(timeout=SSE_KEEPALIVE_SECONDS)
+                if message is None:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"id: {message['version']}\nevent: {message['type']}\ndata: {json.dumps(message)}\n\n"
+        finally:
+            broadcaster.unsubscribe(subscriber)
+
+    return StreamingResponse(event_source(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 @app.get("/component/{component}")
 async def component(component: str):
     """Enhanced component status with live data integration."""
     try:
-        # Get live metrics
-        live_data = await live_metrics.get_live_metrics()
+        # Latest metrics from the producer
+        live_data = await live_metrics.get_current_metrics()
 
         # Get standard monitoring metrics
         metrics = monitoring.get_metrics()
@@ -622,38 +748,93 @@ async def transaction(signature: str):
     else:
         raise HTTPException(status_code=404, detail=f"Transaction {signature} not found")
 
-# Background task for metrics updates
-async def metrics_updater():
-    """Background task to update metrics every 30 seconds."""
+# Background tasks for metrics streaming
+async def metrics_producer():
+    """Compute metrics once per tick (or when woken by an event) and publish the delta."""
     while True:
         try:
-            # Update live metrics
-            await live_metrics.get_live_metrics()
+            live_data = await live_metrics.get_live_metrics()
+            ops = broadcaster.publish_metrics(live_data)
+            if ops:
+                logger.debug(f"📊 Published {ops} metric changes to {len(broadcaster.subscribers)} clients")
 
-            # Broadcast to connected WebSocket clients
-            if live_metrics.connected_clients:
-                live_data = live_metrics.metrics_cache
-                disconnected_clients = set()
+        except Exception as e:
+            logger.error(f"Metrics producer error: {e}")
 
-                for client in live_metrics.connected_clients:
-                    try:
-                        await client.send_json(live_data)
-                    except Exception:
-                        disconnected_clients.add(client)
+        try:
+            await asyncio.wait_for(metrics_wakeup.wait(), METRICS_TICK_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        except Exception as e:
+            logger.error(f"Metrics producer wait error: {e}")
+            await asyncio.sleep(METRICS_TICK_SECONDS)
+        metrics_wakeup.clear()
 
-                # Remove disconnected clients
-                live_metrics.connected_clients -= disconnected_clients
+async def trade_event_follower():
+    """Push trades appended to the trade journal as they are written."""
+    trades_dir = str(Path(__file__).parent.parent.parent / DEFAULT_TRADES_DIR)
+    reader = TradeJournalReader(trades_dir)
 
-            logger.info(f"📊 Metrics updated - {len(live_metrics.connected_clients)} connected clients")
+    # Catch up silently; only trades written from now on are events
+    reader.poll()
+    live_metrics.recent_trades = reader.read_last(10)
 
+    while True:
+        try:
+            records = reader.poll()
+            for record in records:
+                broadcaster.publish_event("trade", record)
+            if records:
+                live_metrics.recent_trades = (live_metrics.recent_trades + records)[-10:]
+                metrics_wakeup.set()
         except Exception as e:
-            logger.error(f"Metrics updater error: {e}")
+            logger.error(f"Trade event follower error: {e}")
+
+        await asyncio.sleep(TRADE_POLL_SECONDS)
 
-        await asyncio.sleep(30)  # Update every 30 seconds
+def publish_whale_alert(whale_alert):
+    """Push a whale alert to streaming clients."""
+    data = asdict(whale_alert)
+    data['timestamp'] = whale_alert.timestamp.isoformat()
+    broadcaster.publish_event("whale", data)
+
+def register_whale_events() -> bool:
+    """
+    Push whale alerts from an already-running whale watcher as they are raised.
+
+    The API server never starts a watcher itself; that would open a second
+    Yellowstone stream or fall back to simulated whale activity.
+
+    Returns:
+        True if the alert callback was attached
+    """
+    global whale_event_source
+    try:
+        from phase_4_deployment.data_router.enhanced_whale_watcher import get_running_whale_watcher
+    except Exception as e:
+        logger.warning(f"⚠️ Whale events not available: {e}")
+        return False
+
+    whale_watcher = get_running_whale_watcher()
+    if whale_watcher is None:
+        logger.info("ℹ️ No running whale watcher in this process - whale events disabled")
+        return False
+
+    whale_watcher.register_alert_callback(publish_whale_alert)
+    whale_event_source = whale_watcher
+    return True
+
+def unregister_whale_events():
+    """Detach the alert callback from the whale watcher it was attached to."""
+    global whale_event_source
+    if whale_event_source is not None:
+        whale_event_source.unregister_alert_callback(publish_whale_alert)
+        whale_event_source = None
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize background tasks on startup."""
+    global metrics_wakeup
     logger.info("🚀 Starting Williams Capital Management Trading API")
     logger.info(f"👤 Owner: Winsor Williams II")
     logger.info(f"💼 Wallet: {live_metrics.wallet_address}")
@@ -661,8 +842,14 @@ async def startup_event():
     # Start monitoring service
     monitoring.start()
 
-    # Start background metrics updater
-    asyncio.create_task(metrics_updater())
+    # Start the metrics producer and event sources; the wakeup event must be
+    # created here so it binds to the loop uvicorn serves on
+    metrics_wakeup = asyncio.Event()
+    background_tasks.append(asyncio.create_task(metrics_producer()))
+    if TRADE_JOURNAL_AVAILABLE:
+        background_tasks.append(asyncio.create_task(trade_event_follower()))
+    if WHALE_EVENTS_ENABLED:
+        register_whale_events()
 
     logger.info("✅ API server startup complete")
 
@@ -670,6 +857,19 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("🛑 Shutting down Williams Capital Management Trading API")
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    background_tasks.clear()
+    unregister_whale_events()
+
+    await monitoring.stop()
+
+    if live_metrics.helius_client is not None:
+        await live_metrics.helius_client.close()
+
+    from phase_4_deployment.utils.http_clients import close_http_clients
+    await close_http_clients()
 
 def start_api_server(host: str = "0.0.0.0", port: int = 8081):
     """
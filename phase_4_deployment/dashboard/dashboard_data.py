@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Dashboard Data Provider
+
+This module provides the data layer behind the Streamlit dashboard. Session
+summaries, performance metrics and alert history are parsed once and then
+served from memory until the file's mtime or size changes; trades are
+followed incrementally from the trade journal. Each source has a version
+number that moves only when its data changes, so the dashboard can poll
+cheaply and only redraw what changed.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional, Set, Tuple, Deque
+
+from core.execution.trade_journal import TradeJournalReader, DEFAULT_TRADES_DIR
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# JSON sources read by the dashboard (paths relative to the working directory)
+DASHBOARD_SOURCES = {
+    'session_summary': "output/live_production/dashboard/current_session_summary.json",
+    'performance': "output/live_production/dashboard/performance_metrics.json",
+    'legacy_metrics': "phase_4_deployment/output/trading_metrics.json",
+    'session_data': "logs/48_hour_session_data.json",
+    'alerts': "logs/alert_history.json"
+}
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class DashboardDataProvider:
+    """
+    Cached, incremental data source for the dashboard.
+
+    - JSON files are re-parsed only when their (mtime, size) changes
+    - trades come from a tail-following TradeJournalReader, so a refresh
+      reads only trades appended since the previous one
+    - refresh() stats every source at most once per min_refresh_interval
+      and reports which sources changed
+    - one provider is shared by all Streamlit sessions, so readers take the
+      same lock as refresh()
+    """
+
+    def __init__(self, base_dir: str = ".", trades_dir: str = DEFAULT_TRADES_DIR,
+                 recent_limit: int = 200, min_refresh_interval: float = 1.0):
+        """
+        Initialize the provider.
+
+        Args:
+            base_dir: Directory the dashboard paths are relative to
+            trades_dir: Trade journal directory (relative to base_dir)
+            recent_limit: Number of most recent trades kept in memory
+            min_refresh_interval: Seconds between checks for changed files
+        """
+        self.paths = {name: os.path.join(base_dir, path) for name, path in DASHBOARD_SOURCES.items()}
+        self.recent_limit = recent_limit
+        self.min_refresh_interval = min_refresh_interval
+
+        self.trade_reader = TradeJournalReader(os.path.join(base_dir, trades_dir))
+        self.trades: Deque[Dict[str, Any]] = deque(maxlen=recent_limit)
+        self._trade_resets = 0
+
+        # source -> (signature, parsed data)
+        self._files: Dict[str, Tuple[Optional[Tuple[int, int]], Any]] = {}
+        self.versions: Dict[str, int] = {name: 0 for name in list(DASHBOARD_SOURCES) + ['trades']}
+
+        self._lock = threading.Lock()
+        self._started = False
+        self._last_refresh = 0.0
+
+        self.stats = {
+            'refreshes': 0,
+            'file_loads': 0,
+            'file_errors': 0,
+            'trades_read': 0
+        }
+
+    def _load_file(self, name: str) -> bool:
+        """Re-parse a JSON source if its signature changed."""
+        path = self.paths[name]
+        signature = file_signature(path)
+        cached = self._files.get(name)
+        if cached is not None and cached[0] == signature:
+            return False
+
+        data = None
+        if signature is not None:
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                self.stats['file_loads'] += 1
+            except (OSError, ValueError) as e:
+                # Usually caught mid-write; the next refresh retries
+                self.stats['file_errors'] += 1
+                logger.warning(f"Error loading {path}: {e}")
+                if cached is not None:
+                    return False
+                signature = None
+
+        self._files[name] = (signature, data)
+        self.versions[name] += 1
+        return True
+
+    def _load_trades(self) -> bool:
+        """Read trades appended to the journal since the last refresh."""
+        records = self.trade_reader.poll()
+        resets = self.trade_reader.stats['resets']
+
+        if not self._started or resets != self._trade_resets:
+            # First poll (or a replaced journal): seed from the journal's end
+            self._trade_resets = resets
+            self.trades = deque(self.trade_reader.read_last(self.recent_limit), maxlen=self.recent_limit)
+            self.stats['trades_read'] += len(self.trades)
+            self.versions['trades'] += 1
+            return True
+
+        if not records:
+            return False
+        self.trades.extend(records)
+        self.stats['trades_read'] += len(records)
+        self.versions['trades'] += 1
+        return True
+
+    def refresh(self, force: bool = False) -> Set[str]:
+        """
+        Pick up changed files and new trades.
+
+        Returns:
+            Names of the sources whose data changed
+        """
+        with self._lock:
+            now = time.time()
+            if not force and self._started and now - self._last_refresh < self.min_refresh_interval:
+                return set()
+            self._last_refresh = now
+            self.stats['refreshes'] += 1
+
+            changed = {name for name in DASHBOARD_SOURCES if self._load_file(name)}
+            try:
+                if self._load_trades():
+                    changed.add('trades')
+            except Exception as e:
+                logger.error(f"Error reading trade journal: {e}")
+            self._started = True
+            return changed
+
+    def get(self, name: str) -> Any:
+        """Parsed contents of a JSON source (None if missing or unreadable)."""
+        if not self._started:
+            self.refresh()
+        with self._lock:
+            cached = self._files.get(name)
+        return cached[1] if cached is not None else None
+
+    def recent_trades(self, limit: int) -> List[Dict[str, Any]]:
+        """Most recent trades, oldest first."""
+        if not self._started:
+            self.refresh()
+        # refresh() may extend the deque from another session's thread
+        with self._lock:
+            return list(self.trades)[-limit:] if limit else []
+
+    def version(self, *names: str) -> Tuple[int, ...]:
+        """Current versions of the given sources (changes when their data does)."""
+        with self._lock:
+            return tuple(self.versions[name] for name in names)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get load counters and source versions."""
+        with self._lock:
+            return {'versions': dict(self.versions), 'cached_trades': len(self.trades), **self.stats}
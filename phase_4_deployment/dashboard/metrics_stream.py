@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Dashboard Metrics Stream
+
+This module provides the fan-out used by the dashboard API server: one
+producer publishes the latest metrics snapshot, subscribers (WebSocket or
+SSE clients) receive JSON-patch style deltas against the previous snapshot,
+and trade/whale events are pushed as soon as they are published. Every
+subscriber has a bounded queue; a client that falls behind has its backlog
+collapsed into a single full snapshot instead of growing memory.
+"""
+
+import time
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional, Set
+
+# Configure logging
+logger = logging.getLogger("metrics_stream")
+
+# Keys that change on every tick and carry no information for subscribers
+VOLATILE_KEYS = ('timestamp', 'lastUpdate')
+
+
+def _escape(key: Any) -> str:
+    """Escape a key for use in a JSON pointer (RFC 6901)."""
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def json_diff(old: Any, new: Any, path: str = '') -> List[Dict[str, Any]]:
+    """
+    Compute JSON-patch (RFC 6902) operations turning old into new.
+
+    Dicts are compared key by key; lists and scalars that differ are
+    replaced whole.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key, value in new.items():
+            pointer = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({'op': 'add', 'path': pointer, 'value': value})
+            else:
+                ops.extend(json_diff(old[key], value, pointer))
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': f"{path}/{_escape(key)}"})
+        return ops
+
+    if old == new and type(old) is type(new):
+        return []
+    return [{'op': 'replace', 'path': path, 'value': new}]
+
+
+def apply_patch(document: Any, ops: List[Dict[str, Any]]) -> Any:
+    """Apply operations produced by json_diff (used by Python clients and tests)."""
+    for op in ops:
+        if op['path'] == '':
+            document = op.get('value')
+            continue
+
+        parts = [part.replace('~1', '/').replace('~0', '~') for part in op['path'].split('/')[1:]]
+        target = document
+        for part in parts[:-1]:
+            target = target[part]
+
+        if op['op'] == 'remove':
+            target.pop(parts[-1], None)
+        else:
+            target[parts[-1]] = op['value']
+    return document
+
+
+class Subscriber:
+    """A connected client's bounded outgoing message queue."""
+
+    def __init__(self, broadcaster: 'MetricsBroadcaster', max_queue: int):
+        self.broadcaster = broadcaster
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.connected_at = time.time()
+        self.sent = 0
+        self.dropped = 0
+        self.resyncs = 0
+
+    def offer(self, message: Dict[str, Any]) -> None:
+        """Queue a message without blocking the producer."""
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Too far behind to catch up with patches: replace the backlog
+            # with one snapshot of the current state
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.dropped += 1
+            self.resyncs += 1
+            self.queue.put_nowait(self.broadcaster.snapshot_message())
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next message for the client (None on timeout)."""
+        try:
+            message = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self.sent += 1
+        return message
+
+
+class MetricsBroadcaster:
+    """
+    Single-producer fan-out of dashboard metrics.
+
+    - publish_metrics() diffs the new snapshot against the last one and
+      sends a versioned patch to every subscriber (nothing if unchanged)
+    - publish_event() pushes trade/whale events immediately
+    - new subscribers start with a full snapshot, so patches always apply
+      to the version the client holds
+    """
+
+    def __init__(self, max_queue: int = 100, ignore_keys: tuple = VOLATILE_KEYS):
+        """
+        Initialize the broadcaster.
+
+        Args:
+            max_queue: Messages buffered per subscriber before it is resynced
+            ignore_keys: Keys whose changes alone don't produce a patch
+        """
+        self.max_queue = max_queue
+        self.ignore_keys = set(ignore_keys)
+        self.state: Dict[str, Any] = {}
+        self.version = 0
+        self.subscribers: Set[Subscriber] = set()
+
+        self.stats = {
+            'patches_published': 0,
+            'events_published': 0,
+            'ticks_unchanged': 0,
+            'ops_published': 0
+        }
+
+    def snapshot_message(self) -> Dict[str, Any]:
+        return {'type': 'snapshot', 'version': self.version, 'data': self.state}
+
+    def subscribe(self) -> Subscriber:
+        """Register a client; its queue starts with the current snapshot."""
+        subscriber = Subscriber(self, self.max_queue)
+        subscriber.offer(self.snapshot_message())
+        self.subscribers.add(subscriber)
+        logger.info(f"📡 Dashboard client subscribed - {len(self.subscribers)} connected")
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        if subscriber in self.subscribers:
+            self.subscribers.discard(subscriber)
+            logger.info(f"📡 Dashboard client unsubscribed - {len(self.subscribers)} connected")
+
+    def _fan_out(self, message: Dict[str, Any]) -> None:
+        for subscriber in list(self.subscribers):
+            subscriber.offer(message)
+
+    def publish_metrics(self, metrics: Dict[str, Any]) -> int:
+        """
+        Publish a new metrics snapshot.
+
+        Returns:
+            Number of patch operations sent (0 if nothing meaningful changed)
+        """
+        ops = json_diff(self.state, metrics)
+        if not any(op['path'].rsplit('/', 1)[-1] not in self.ignore_keys for op in ops):
+            # Only timestamps moved; keep them current for new subscribers
+            self.state = metrics
+            self.stats['ticks_unchanged'] += 1
+            return 0
+
+        self.state = metrics
+        self.version += 1
+        self.stats['patches_published'] += 1
+        self.stats['ops_published'] += len(ops)
+        self._fan_out({'type': 'patch', 'version': self.version, 'ops': ops})
+        return len(ops)
+
+    def publish_event(self, kind: str, data: Dict[str, Any]) -> None:
+        """Push an event (e.g. 'trade', 'whale') to every subscriber now."""
+        self.stats['events_published'] += 1
+        self._fan_out({'type': 'event', 'event': kind, 'version': self.version,
+                       'timestamp': time.time(), 'data': data})
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get fan-out counters and per-subscriber backpressure."""
+        return {
+            'subscribers': len(self.subscribers),
+            'version': self.version,
+            'queued_messages': sum(s.queue.qsize() for s in self.subscribers),
+            'dropped_messages': sum(s.dropped for s in self.subscribers),
+            'resyncs': sum(s.resyncs for s in self.subscribers),
+            **self.stats
+        }
@@ -6,7 +6,6 @@ Real-time monitoring dashboard for the RWA Trading System with Jito Bundle execu
 
 import os
 import sys
-import json
 import time
 import logging
 import streamlit as st
@@ -14,13 +13,15 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import glob
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from pathlib import Path
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from core.execution.trade_journal import trade_timestamp
+from phase_4_deployment.dashboard.dashboard_data import DashboardDataProvider
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -33,43 +34,69 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Panels that rerun on their own (st.fragment, Streamlit >= 1.37)
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+
+def flatten_trade(trade_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Read the display fields of a trade record.
+
+    Journal records nest the trade under 'signal' and 'result'; older flat
+    records keep the same keys at the top level.
+    """
+    result = trade_data.get('result') or {}
+    signal = trade_data.get('signal') or {}
+    return {
+        'timestamp': trade_data.get('timestamp'),
+        'action': signal.get('action', trade_data.get('action', 'UNKNOWN')),
+        'market': signal.get('market', trade_data.get('market', 'UNKNOWN')),
+        'size': signal.get('size', trade_data.get('size', 0.0)),
+        'success': result.get('success', trade_data.get('success', False)),
+        'signature': result.get('signature', trade_data.get('signature')),
+        'execution_type': result.get('execution_type', trade_data.get('execution_type', 'unknown'))
+    }
+
+@st.cache_resource(show_spinner=False)
+def get_dashboard_data() -> DashboardDataProvider:
+    """Data provider shared by all reruns and sessions of this dashboard process."""
+    return DashboardDataProvider()
+
 class LiveTradingDashboard:
     """Live trading dashboard for 48-hour session monitoring."""
 
     def __init__(self):
         self.data_dir = Path("phase_4_deployment/output")
         self.logs_dir = Path("logs")
-        self.refresh_interval = 30  # seconds
+        self.refresh_interval = int(os.getenv('DASHBOARD_REFRESH_SECONDS', '30'))  # seconds
+        self.auto_refresh = False
+        self.live_panels: List[Tuple[Tuple[str, ...], Tuple[int, ...]]] = []
+        self.data = get_dashboard_data()
 
     def load_trading_metrics(self) -> Dict[str, Any]:
         """Load trading metrics from files."""
         try:
             # Try to load from current session metrics first
-            current_session_file = Path("output/live_production/dashboard/current_session_summary.json")
-            if current_session_file.exists():
-                with open(current_session_file, 'r') as f:
-                    session_data = json.load(f)
-                    return {
-                        'total_trades': session_data.get('trades_executed', 0),
-                        'successful_trades': session_data.get('successful_trades', 0),
-                        'total_pnl_sol': session_data.get('session_pnl_sol', 0.0),
-                        'total_pnl_usd': session_data.get('session_pnl_usd', 0.0),
-                        'win_rate': session_data.get('win_rate', 0.0),
-                        'blockchain_verified': session_data.get('blockchain_verified', 0),
-                        'last_update': session_data.get('timestamp', datetime.now().isoformat())
-                    }
+            session_data = self.data.get('session_summary')
+            if session_data is not None:
+                return {
+                    'total_trades': session_data.get('trades_executed', 0),
+                    'successful_trades': session_data.get('successful_trades', 0),
+                    'total_pnl_sol': session_data.get('session_pnl_sol', 0.0),
+                    'total_pnl_usd': session_data.get('session_pnl_usd', 0.0),
+                    'win_rate': session_data.get('win_rate', 0.0),
+                    'blockchain_verified': session_data.get('blockchain_verified', 0),
+                    'last_update': session_data.get('timestamp', datetime.now().isoformat())
+                }
 
             # Fallback to performance metrics
-            performance_file = Path("output/live_production/dashboard/performance_metrics.json")
-            if performance_file.exists():
-                with open(performance_file, 'r') as f:
-                    return json.load(f)
+            performance_metrics = self.data.get('performance')
+            if performance_metrics is not None:
+                return performance_metrics
 
             # Legacy fallback
-            metrics_file = self.data_dir / "trading_metrics.json"
-            if metrics_file.exists():
-                with open(metrics_file, 'r') as f:
-                    return json.load(f)
+            legacy_metrics = self.data.get('legacy_metrics')
+            if legacy_metrics is not None:
+                return legacy_metrics
         except Exception as e:
             logger.error(f"Error loading trading metrics: {e}")
 
@@ -86,28 +113,21 @@ class LiveTradingDashboard:
     def load_transaction_history(self) -> List[Dict[str, Any]]:
         """Load transaction history from live trading system."""
         try:
-            # Load from live trading trade files
-            trade_files = glob.glob("output/live_production/trades/trade_*.json")
-            trade_files.sort()
-
+            # Last 20 trades from the in-memory tail of the trade journal
             transactions = []
-            for trade_file in trade_files[-20:]:  # Last 20 trades
-                try:
-                    with open(trade_file, 'r') as f:
-                        trade_data = json.load(f)
-                        # Convert trade data to transaction format
-                        tx = {
-                            'timestamp': trade_data.get('timestamp', datetime.now().isoformat()),
-                            'signature': trade_data.get('signature', 'N/A'),
-                            'status': 'confirmed' if trade_data.get('success', False) else 'failed',
-                            'action': trade_data.get('action', 'UNKNOWN'),
-                            'market': trade_data.get('market', 'UNKNOWN'),
-                            'size': trade_data.get('size', 0.0),
-                            'execution_type': trade_data.get('execution_type', 'unknown')
-                        }
-                        transactions.append(tx)
-                except Exception as e:
-                    logger.error(f"Error loading trade file {trade_file}: {e}")
+            for trade_data in self.data.recent_trades(20):
+                # Convert trade data to transaction format
+                trade = flatten_trade(trade_data)
+                tx = {
+                    'timestamp': trade['timestamp'] or datetime.now().isoformat(),
+                    'signature': trade['signature'] or 'N/A',
+                    'status': 'confirmed' if trade['success'] else 'failed',
+                    'action': trade['action'],
+                    'market': trade['market'],
+                    'size': trade['size'],
+                    'execution_type': trade['execution_type']
+                }
+                transactions.append(tx)
 
             return transactions
 
@@ -119,10 +139,9 @@ class LiveTradingDashboard:
     def load_session_data(self) -> Dict[str, Any]:
         """Load 48-hour session data."""
         try:
-            session_file = self.logs_dir / "48_hour_session_data.json"
-            if session_file.exists():
-                with open(session_file, 'r') as f:
-                    return json.load(f)
+            session_data = self.data.get('session_data')
+            if session_data is not None:
+                return session_data
         except Exception as e:
             logger.error(f"Error loading session data: {e}")
 
@@ -139,20 +158,18 @@ class LiveTradingDashboard:
         """Load current wallet balance from live trading system."""
         try:
             # Load from live trading session data
-            current_session_file = Path("output/live_production/dashboard/current_session_summary.json")
-            if current_session_file.exists():
-                with open(current_session_file, 'r') as f:
-                    session_data = json.load(f)
-                    balance_sol = session_data.get('current_balance_sol', 1.484346)
-                    sol_price = session_data.get('sol_price', 160.0)
-                    return {
-                        'balance_sol': balance_sol,
-                        'balance_usd': balance_sol * sol_price,
-                        'last_update': session_data.get('timestamp', datetime.now().isoformat()),
-                        'data_source': 'live_trading',
-                        'file_age_seconds': 0,
-                        'sol_price': sol_price
-                    }
+            session_data = self.data.get('session_summary')
+            if session_data is not None:
+                balance_sol = session_data.get('current_balance_sol', 1.484346)
+                sol_price = session_data.get('sol_price', 160.0)
+                return {
+                    'balance_sol': balance_sol,
+                    'balance_usd': balance_sol * sol_price,
+                    'last_update': session_data.get('timestamp', datetime.now().isoformat()),
+                    'data_source': 'live_trading',
+                    'file_age_seconds': 0,
+                    'sol_price': sol_price
+                }
 
             # LIVE TRADING: Use actual wallet balance from live system
             return {
@@ -196,15 +213,7 @@ class LiveTradingDashboard:
         st.header("📊 Current Live Trading Session")
 
         # Load actual metrics for session overview
-        try:
-            current_session_file = Path("output/live_production/dashboard/current_session_summary.json")
-            if current_session_file.exists():
-                with open(current_session_file, 'r') as f:
-                    live_metrics = json.load(f)
-            else:
-                live_metrics = {}
-        except:
-            live_metrics = {}
+        live_metrics = self.data.get('session_summary') or {}
 
         # Get current session info from live metrics
         session_start_str = live_metrics.get('session_start', datetime.now().isoformat())
@@ -368,15 +377,10 @@ class LiveTradingDashboard:
 
         with col3:
             # Get current wallet balance and calculate max position size
-            try:
-                current_session_file = Path("output/live_production/dashboard/current_session_summary.json")
-                if current_session_file.exists():
-                    with open(current_session_file, 'r') as f:
-                        session_data = json.load(f)
-                        current_balance = session_data.get('current_balance_sol', 0.002586)
-                else:
-                    current_balance = 0.002586  # Fallback to current balance
-            except:
+            session_data = self.data.get('session_summary')
+            if session_data is not None:
+                current_balance = session_data.get('current_balance_sol', 0.002586)
+            else:
                 current_balance = 0.002586  # Fallback to current balance
 
             # Calculate max position size: 90% wallet * 40% max position
@@ -401,35 +405,25 @@ class LiveTradingDashboard:
         st.header("📋 Live Trading Session Summary")
 
         # Load live session data
-        try:
-            current_session_file = Path("output/live_production/dashboard/current_session_summary.json")
-            if current_session_file.exists():
-                with open(current_session_file, 'r') as f:
-                    session_data = json.load(f)
-            else:
-                session_data = {}
-        except:
-            session_data = {}
+        session_data = self.data.get('session_summary') or {}
 
         # Live trading timeline from actual trade files
         st.subheader("⏱️ Live Trading Timeline")
 
-        # Load recent trades for timeline
-        trade_files = glob.glob("output/live_production/trades/trade_*.json")
-        trade_files.sort()
+        # Load recent trades for timeline (last 10 from the journal tail)
+        recent_trades = self.data.recent_trades(10)
 
         timeline_data = []
-        for i, trade_file in enumerate(trade_files[-10:]):  # Last 10 trades
+        for trade_data in recent_trades:
             try:
-                with open(trade_file, 'r') as f:
-                    trade_data = json.load(f)
-                    timeline_data.append({
-                        'Time': trade_data.get('timestamp', 'Unknown')[:19] if trade_data.get('timestamp') else 'Unknown',
-                        'Action': f"{trade_data.get('action', 'UNKNOWN')} {trade_data.get('market', 'UNKNOWN')}",
-                        'Size': f"{trade_data.get('size', 0.0):.4f}",
-                        'Status': '✅ Success' if trade_data.get('success', False) else '❌ Failed',
-                        'Signature': trade_data.get('signature', 'N/A')[:16] + '...' if trade_data.get('signature') else 'N/A'
-                    })
+                trade = flatten_trade(trade_data)
+                timeline_data.append({
+                    'Time': trade['timestamp'][:19] if trade['timestamp'] else 'Unknown',
+                    'Action': f"{trade['action']} {trade['market']}",
+                    'Size': f"{float(trade['size'] or 0.0):.4f}",
+                    'Status': '✅ Success' if trade['success'] else '❌ Failed',
+                    'Signature': trade['signature'][:16] + '...' if trade['signature'] else 'N/A'
+                })
             except:
                 continue
 
@@ -832,11 +826,9 @@ class LiveTradingDashboard:
 
         try:
             # Try to load actual alert history if it exists
-            alert_file = self.logs_dir / "alert_history.json"
-            if alert_file.exists():
+            alerts = self.data.get('alerts')
+            if alerts is not None:
                 st.subheader("📁 Alert History File")
-                with open(alert_file, 'r') as f:
-                    alerts = json.load(f)
 
                 if alerts:
                     st.write(f"Found {len(alerts)} historical alerts")
@@ -858,14 +850,10 @@ class LiveTradingDashboard:
         """Load actual strategy performance data from live trading session."""
         try:
             # Load current session summary
-            current_session_file = Path("output/live_production/dashboard/current_session_summary.json")
-            if current_session_file.exists():
-                with open(current_session_file, 'r') as f:
-                    session_data = json.load(f)
-
-                # Load trade files to analyze strategy performance
-                trade_files = glob.glob("output/live_production/trades/trade_*.json")
-                trade_files.sort()
+            session_data = self.data.get('session_summary')
+            if session_data is not None:
+                # Last 60 trades from the journal tail to analyze strategy performance
+                recent_trades = self.data.recent_trades(60)
 
                 strategy_stats = {
                     'opportunistic_volatility_breakout': {'trades': 0, 'volume': 0.0, 'success': 0},
@@ -879,16 +867,11 @@ class LiveTradingDashboard:
                 # Analyze recent trades (last 2 hours)
                 cutoff_time = datetime.now() - timedelta(hours=2)
 
-                for trade_file in trade_files[-60:]:  # Last 60 trades
+                for trade in recent_trades:
                     try:
-                        filename = os.path.basename(trade_file)
-                        timestamp_str = filename.replace('trade_', '').replace('.json', '')
-                        trade_time = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-
-                        if trade_time >= cutoff_time:
-                            with open(trade_file, 'r') as f:
-                                trade = json.load(f)
+                        trade_time = trade_timestamp(trade)
 
+                        if trade_time is not None and trade_time >= cutoff_time:
                             signal = trade.get('signal', {})
                             result = trade.get('result', {})
                             strategy = signal.get('source', 'unknown')
@@ -1376,8 +1359,49 @@ class LiveTradingDashboard:
             )
             st.plotly_chart(fig_allocation, use_container_width=True)
 
+    def live_panel(self, render: Callable[[], None], *sources: str):
+        """
+        Render a panel backed by live data.
+
+        Records the versions of the panel's data sources as drawn, so
+        watch_live_panels() only reruns the dashboard when one of them changes.
+        """
+        self.live_panels.append((sources, self.data.version(*sources)))
+        render()
+
+    def watch_live_panels(self):
+        """
+        Rerun the dashboard when a live panel's data changes.
+
+        Streamlit clears a fragment that draws nothing on a rerun, so the
+        panels can't skip their own redraw; instead one empty fragment checks
+        every refresh_interval seconds and reruns only if some panel's
+        sources have a newer version than the one it drew.
+        """
+        if fragment is None or not self.auto_refresh:
+            return
+
+        drawn = list(self.live_panels)
+
+        @fragment(run_every=self.refresh_interval)
+        def watcher():
+            self.data.refresh()
+            if any(self.data.version(*sources) != version for sources, version in drawn):
+                st.rerun()
+
+        watcher()
+
     def run_dashboard(self):
         """Run the main dashboard."""
+        # Pick up changed files and new trades (cached until they change)
+        self.data.refresh()
+
+        # Auto-refresh of live panels needs fragment support
+        if fragment is not None:
+            self.auto_refresh = st.sidebar.checkbox(
+                f"⚡ Auto-refresh live panels ({self.refresh_interval}s)", value=False
+            )
+
         # Auto-refresh setup
         placeholder = st.empty()
 
@@ -1385,12 +1409,6 @@ class LiveTradingDashboard:
             # Render header
             self.render_header()
 
-            # Load data
-            session_data = self.load_session_data()
-            trading_metrics = self.load_trading_metrics()
-            transactions = self.load_transaction_history()
-            wallet_data = self.load_wallet_balance()
-
             # Create enhanced tabs
             tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
                 "📊 Overview",
@@ -1403,12 +1421,14 @@ class LiveTradingDashboard:
             ])
 
             with tab1:
-                self.render_session_overview(session_data)
-                self.render_trading_metrics(trading_metrics)
-                self.render_session_summary()
+                self.live_panel(lambda: self.render_session_overview(self.load_session_data()),
+                                'session_data', 'session_summary')
+                self.live_panel(lambda: self.render_trading_metrics(self.load_trading_metrics()),
+                                'session_summary', 'performance', 'legacy_metrics')
+                self.live_panel(self.render_session_summary, 'session_summary', 'trades')
 
             with tab2:
-                self.render_strategy_performance_tab()
+                self.live_panel(self.render_strategy_performance_tab, 'session_summary', 'trades')
 
             with tab3:
                 self.render_market_intelligence_tab()
@@ -1422,11 +1442,13 @@ class LiveTradingDashboard:
 
             with tab6:
                 self.render_risk_management_tab()
-                self.render_alerts_log()
+                self.live_panel(self.render_alerts_log, 'alerts')
 
             with tab7:
-                self.render_transaction_history(transactions)
-                self.render_wallet_info(wallet_data)
+                self.live_panel(lambda: self.render_transaction_history(self.load_transaction_history()), 'trades')
+                self.live_panel(lambda: self.render_wallet_info(self.load_wallet_balance()), 'session_summary')
+
+        self.watch_live_panels()
 
         # User branding and manual refresh option
         st.sidebar.markdown("---")
@@ -1439,7 +1461,10 @@ class LiveTradingDashboard:
         if st.sidebar.button("🔄 Refresh Dashboard", use_container_width=True):
             st.rerun()
 
-        st.sidebar.markdown("*Dashboard updates manually - click refresh for latest data*")
+        if self.auto_refresh:
+            st.sidebar.markdown("*Live panels refresh automatically when their data changes*")
+        else:
+            st.sidebar.markdown("*Dashboard updates manually - click refresh for latest data*")
 
 def main():
     """Main function to run the dashboard."""
@@ -7,9 +7,10 @@ This module provides scanning functionality for trading opportunities using Bird
 
 import os
 import json
+import time
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union, Tuple
 from datetime import datetime
 
 # Import Birdeye client
@@ -22,17 +23,44 @@ logging.basicConfig(
 )
 logger = logging.getLogger("birdeye_scanner")
 
+# Popular Solana tokens, scanned when no universe is configured
+DEFAULT_UNIVERSE = {
+    'So11111111111111111111111111111111111111112': 'SOL',
+    'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v': 'USDC',
+    'Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB': 'USDT',
+    'DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263': 'BONK',
+    'JUPyiwrYJFskUPiHa7hkeR8VUtAeFoSYbKedZNsDvCN': 'JUP',
+}
+
+# Birdeye multi_price accepts up to 100 addresses per call
+MULTI_PRICE_BATCH_SIZE = 100
+# Birdeye token list page size
+TOKEN_LIST_PAGE_SIZE = 50
+# API tiers with the multi_price endpoint
+MULTI_PRICE_TIERS = {'starter', 'premium', 'business'}
+
+# Price fields that affect the opportunity score
+SCORE_FIELDS = ('value', 'priceChange24h', 'volume24h', 'marketCap', 'liquidity')
+
 class BirdeyeScanner:
     """
     Scanner for trading opportunities using Birdeye API.
     """
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None,
+                 universe: Optional[Union[List[str], Dict[str, str]]] = None,
+                 max_concurrency: Optional[int] = None,
+                 use_multi_price: Optional[bool] = None):
         """
         Initialize the Birdeye scanner.
 
         Args:
             api_key: Birdeye API key
+            universe: Token addresses to scan, or a mapping of address to symbol
+                (defaults to BIRDEYE_SCAN_UNIVERSE_FILE, then popular tokens)
+            max_concurrency: Maximum concurrent single-token price requests
+            use_multi_price: Use the multi_price endpoint (defaults to on for
+                API tiers that include it)
         """
         self.api_key = api_key or os.getenv('BIRDEYE_API_KEY')
 
@@ -45,65 +73,178 @@ class BirdeyeScanner:
         }
         self.client = BirdeyeClient(config)
 
-        # Popular Solana tokens for scanning
-        self.popular_tokens = [
-            'So11111111111111111111111111111111111111112',  # SOL
-            'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v',  # USDC
-            'Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB',  # USDT
-            'DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263',  # BONK
-            'JUPyiwrYJFskUPiHa7hkeR8VUtAeFoSYbKedZNsDvCN',   # JUP
-        ]
+        # Token universe: address -> symbol
+        self.universe: Dict[str, str] = self._load_universe(universe)
+        self.popular_tokens = list(DEFAULT_UNIVERSE)
+
+        # Concurrency is bounded here; the request rate is bounded by the API
+        # manager's token bucket for the configured tier
+        self.max_concurrency = max_concurrency or int(os.getenv('BIRDEYE_SCAN_CONCURRENCY', '10'))
+        if use_multi_price is None:
+            env_multi_price = os.getenv('BIRDEYE_MULTI_PRICE')
+            if env_multi_price is not None:
+                use_multi_price = env_multi_price.lower() == 'true'
+            else:
+                tier = getattr(self.client.api_manager, 'birdeye_tier', None)
+                use_multi_price = str(tier).lower() in MULTI_PRICE_TIERS
+        self.use_multi_price = use_multi_price
+
+        # Last scored opportunity per token with the price fields it was scored on
+        self.scored: Dict[str, Tuple[Tuple, Dict[str, Any]]] = {}
+
+        self.scan_stats = {
+            'scans': 0,
+            'tokens_priced': 0,
+            'rescored': 0,
+            'unchanged': 0,
+            'multi_price_requests': 0,
+            'single_price_requests': 0,
+            'last_scan_seconds': 0.0
+        }
 
-        logger.info("Initialized Birdeye scanner")
+        logger.info(f"Initialized Birdeye scanner ({len(self.universe)} tokens, "
+                    f"multi-price: {self.use_multi_price}, concurrency: {self.max_concurrency})")
 
-    async def scan_for_opportunities(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def _load_universe(self, universe: Optional[Union[List[str], Dict[str, str]]]) -> Dict[str, str]:
+        """Normalize the configured universe to an address -> symbol mapping."""
+        if universe is None:
+            universe_file = os.getenv('BIRDEYE_SCAN_UNIVERSE_FILE')
+            if universe_file and os.path.exists(universe_file):
+                try:
+                    with open(universe_file, 'r') as f:
+                        universe = json.load(f)
+                except Exception as e:
+                    logger.warning(f"Error loading scan universe from {universe_file}: {e}")
+
+        if not universe:
+            return dict(DEFAULT_UNIVERSE)
+        if isinstance(universe, dict):
+            return {address: symbol or DEFAULT_UNIVERSE.get(address, 'UNKNOWN') for address, symbol in universe.items()}
+        return {address: DEFAULT_UNIVERSE.get(address, 'UNKNOWN') for address in universe}
+
+    async def load_universe_from_token_list(self, size: int = 500) -> int:
         """
-        Scan for trading opportunities with fallback data sources.
+        Extend the universe with the top tokens from Birdeye's token list.
 
         Args:
-            limit: Maximum number of opportunities to return
+            size: Number of tokens to fetch
 
         Returns:
-            List of trading opportunities
+            Number of tokens in the universe
         """
-        opportunities = []
-
-        try:
-            # Scan popular tokens for opportunities (price data only to avoid 404 errors)
-            token_symbols = ['SOL', 'USDC', 'USDT', 'BONK', 'JUP']
-
-            for i, token_address in enumerate(self.popular_tokens[:limit]):
+        offsets = range(0, size, TOKEN_LIST_PAGE_SIZE)
+        pages = await asyncio.gather(
+            *[self.client.get_token_list(limit=TOKEN_LIST_PAGE_SIZE, offset=offset) for offset in offsets],
+            return_exceptions=True
+        )
+
+        for page in pages:
+            if isinstance(page, Exception) or not page:
+                continue
+            for token in (page.get('data') or {}).get('tokens', []):
+                address = token.get('address')
+                if address and address not in self.universe:
+                    self.universe[address] = token.get('symbol') or 'UNKNOWN'
+
+        logger.info(f"Scan universe now has {len(self.universe)} tokens")
+        return len(self.universe)
+
+    async def _fetch_single_prices(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch prices one token per request, concurrently."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(address: str):
+            async with semaphore:
+                self.scan_stats['single_price_requests'] += 1
                 try:
-                    # Get only token price (metadata endpoint returns 404)
-                    price_data = await self.client.get_token_price(token_address)
+                    return address, await self.client.get_token_price(address)
+                except Exception as e:
+                    logger.warning(f"Error scanning token {address}: {e}")
+                    return address, None
+
+        prices = {}
+        for address, result in await asyncio.gather(*[fetch(address) for address in addresses]):
+            if result:
+                # Price endpoint wraps the fields in 'data'
+                prices[address] = result.get('data') or result
+        return prices
+
+    async def _fetch_prices(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch prices for the universe, batched where the tier allows."""
+        if not self.use_multi_price:
+            return await self._fetch_single_prices(addresses)
+
+        batches = [addresses[i:i + MULTI_PRICE_BATCH_SIZE] for i in range(0, len(addresses), MULTI_PRICE_BATCH_SIZE)]
+        self.scan_stats['multi_price_requests'] += len(batches)
+        results = await asyncio.gather(*[self.client.get_multiple_token_prices(batch) for batch in batches])
+
+        prices = {}
+        missing = []
+        for batch, result in zip(batches, results):
+            if result is None:
+                missing.extend(batch)
+            else:
+                prices.update(result)
+
+        if missing:
+            if len(missing) == len(addresses):
+                logger.warning("Birdeye multi-price unavailable, switching to single-token requests")
+                self.use_multi_price = False
+            prices.update(await self._fetch_single_prices(missing))
+        return prices
+
+    def _score_token(self, token_address: str, price_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Score a token, reusing the previous result if its price fields are unchanged."""
+        fingerprint = tuple(price_data.get(field) for field in SCORE_FIELDS)
+        previous = self.scored.get(token_address)
+        if previous and previous[0] == fingerprint:
+            self.scan_stats['unchanged'] += 1
+            return dict(previous[1])
+
+        symbol = self.universe.get(token_address, 'UNKNOWN')
+        score = self._calculate_opportunity_score(price_data, {'symbol': symbol})
+
+        opportunity = {
+            'token_address': token_address,
+            'symbol': symbol,
+            'name': f"{symbol} Token",
+            'price': price_data.get('value', 0),
+            'price_change_24h': price_data.get('priceChange24h', 0),
+            'volume_24h': price_data.get('volume24h', 0),
+            'market_cap': price_data.get('marketCap', 0),
+            'score': score,
+            'timestamp': datetime.now().isoformat()
+        }
 
-                    if price_data:
-                        # Use hardcoded symbol mapping to avoid metadata API
-                        symbol = token_symbols[i] if i < len(token_symbols) else 'UNKNOWN'
+        self.scored[token_address] = (fingerprint, opportunity)
+        self.scan_stats['rescored'] += 1
+        return opportunity
 
-                        # Calculate opportunity score (without metadata)
-                        score = self._calculate_opportunity_score(price_data, {'symbol': symbol})
+    async def scan_for_opportunities(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Scan the token universe for trading opportunities with fallback data sources.
 
-                        opportunity = {
-                            'token_address': token_address,
-                            'symbol': symbol,
-                            'name': f"{symbol} Token",
-                            'price': price_data.get('value', 0),
-                            'price_change_24h': price_data.get('priceChange24h', 0),
-                            'volume_24h': price_data.get('volume24h', 0),
-                            'market_cap': price_data.get('marketCap', 0),
-                            'score': score,
-                            'timestamp': datetime.now().isoformat()
-                        }
+        Prices are fetched concurrently within the API tier's rate limit
+        (batched via multi_price where available), and only tokens whose
+        price data changed since the last scan are re-scored.
 
-                        opportunities.append(opportunity)
+        Args:
+            limit: Maximum number of opportunities to return
 
-                        # Longer delay to avoid rate limiting (429 errors)
-                        await asyncio.sleep(1.0)
+        Returns:
+            List of trading opportunities
+        """
+        start_time = time.perf_counter()
 
-                except Exception as e:
-                    logger.warning(f"Error scanning token {token_address}: {e}")
-                    continue
+        try:
+            prices = await self._fetch_prices(list(self.universe))
+            self.scan_stats['tokens_priced'] += len(prices)
+
+            opportunities = [
+                self._score_token(token_address, price_data)
+                for token_address, price_data in prices.items()
+                if isinstance(price_data, dict)
+            ]
 
             # If no opportunities found, use fallback data
             if not opportunities:
@@ -113,8 +254,11 @@ class BirdeyeScanner:
             # Sort by score (highest first)
             opportunities.sort(key=lambda x: x['score'], reverse=True)
 
-            logger.info(f"Found {len(opportunities)} trading opportunities")
-            return opportunities
+            self.scan_stats['scans'] += 1
+            self.scan_stats['last_scan_seconds'] = time.perf_counter() - start_time
+            logger.info(f"Found {len(opportunities)} trading opportunities from {len(self.universe)} tokens "
+                        f"in {self.scan_stats['last_scan_seconds']:.2f}s")
+            return opportunities[:limit]
 
         except Exception as e:
             logger.error(f"Error scanning for opportunities: {e}")
@@ -259,6 +403,16 @@ class BirdeyeScanner:
             logger.error(f"Error generating fallback opportunities: {e}")
             return []
 
+    def get_scan_stats(self) -> Dict[str, Any]:
+        """Get scanner and rate limiter statistics."""
+        limiter = getattr(self.client.api_manager, 'birdeye_limiter', None)
+        return {
+            **self.scan_stats,
+            'universe_size': len(self.universe),
+            'use_multi_price': self.use_multi_price,
+            'rate_limiter': limiter.get_stats() if limiter else {}
+        }
+
     async def close(self):
         """Close the scanner and cleanup resources."""
         try:
@@ -7,7 +7,8 @@ Real-time whale detection using QuickNode streaming data.
 import asyncio
 import logging
 import time
-from typing import Dict, Any, List, Optional, Set
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional, Set, Deque
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 import json
@@ -17,6 +18,10 @@ logger = logging.getLogger(__name__)
 @dataclass
 class WhaleAlert:
     """Whale alert data structure."""
+    __slots__ = ('signature', 'timestamp', 'whale_wallet', 'target_wallet', 'amount_sol',
+                 'amount_usd', 'token_mint', 'transaction_type', 'confidence',
+                 'market_impact', 'alert_level')
+
     signature: str
     timestamp: datetime
     whale_wallet: str
@@ -29,22 +34,121 @@ class WhaleAlert:
     market_impact: str  # 'high', 'medium', 'low'
     alert_level: str    # 'critical', 'warning', 'info'
 
+
+class WhaleAlertStore:
+    """
+    Fixed-memory whale alert history.
+
+    - recent alerts in a fixed-capacity ring buffer
+    - per-wallet history (bounded per wallet) with LRU eviction of cold wallets
+    - running totals over the ring, updated as alerts enter and are overwritten
+
+    Memory is bounded by the capacities; appends and statistics are O(1) and
+    wallet lookups O(per_wallet_limit), however long the session runs.
+    """
+
+    def __init__(self, capacity: int = 100, max_wallets: int = 10000, per_wallet_limit: int = 50):
+        """
+        Initialize the store.
+
+        Args:
+            capacity: Number of recent alerts kept in the ring buffer
+            max_wallets: Number of wallets indexed before the least recently
+                active wallet is evicted
+            per_wallet_limit: Alerts kept per wallet
+        """
+        if capacity < 1:
+            raise ValueError(f"Alert capacity must be at least 1, got {capacity}")
+
+        self.capacity = capacity
+        self.max_wallets = max_wallets
+        self.per_wallet_limit = per_wallet_limit
+
+        self._ring: List[Optional[WhaleAlert]] = [None] * capacity
+        self._next = 0
+        self._size = 0
+
+        self.wallets: "OrderedDict[str, Deque[WhaleAlert]]" = OrderedDict()
+
+        # Running totals over the ring contents
+        self.sum_sol = 0.0
+        self.sum_usd = 0.0
+        self.alert_levels: Dict[str, int] = {'critical': 0, 'warning': 0, 'info': 0}
+
+        self.total_alerts = 0
+        self.evicted_wallets = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, alert: WhaleAlert, index_wallet: bool = True):
+        """Record an alert (and index it under its whale wallet)."""
+        evicted = self._ring[self._next]
+        if evicted is not None:
+            self.sum_sol -= evicted.amount_sol
+            self.sum_usd -= evicted.amount_usd
+            self.alert_levels[evicted.alert_level] = self.alert_levels.get(evicted.alert_level, 1) - 1
+        else:
+            self._size += 1
+
+        self._ring[self._next] = alert
+        self._next = (self._next + 1) % self.capacity
+
+        self.sum_sol += alert.amount_sol
+        self.sum_usd += alert.amount_usd
+        self.alert_levels[alert.alert_level] = self.alert_levels.get(alert.alert_level, 0) + 1
+        self.total_alerts += 1
+
+        if not index_wallet:
+            return
+
+        # Per-wallet history, most recently active wallet last
+        history = self.wallets.get(alert.whale_wallet)
+        if history is None:
+            history = deque(maxlen=self.per_wallet_limit)
+            self.wallets[alert.whale_wallet] = history
+            if len(self.wallets) > self.max_wallets:
+                self.wallets.popitem(last=False)
+                self.evicted_wallets += 1
+        else:
+            self.wallets.move_to_end(alert.whale_wallet)
+        history.append(alert)
+
+    def recent(self, limit: Optional[int] = None) -> List[WhaleAlert]:
+        """Most recent alerts, newest first."""
+        count = self._size if not limit else min(limit, self._size)
+        return [self._ring[(self._next - 1 - i) % self.capacity] for i in range(count)]
+
+    def wallet_history(self, wallet: str) -> List[WhaleAlert]:
+        """Alerts for a wallet, oldest first."""
+        history = self.wallets.get(wallet)
+        return list(history) if history is not None else []
+
+    @property
+    def average_sol(self) -> float:
+        return self.sum_sol / self._size if self._size else 0.0
+
+    @property
+    def average_usd(self) -> float:
+        return self.sum_usd / self._size if self._size else 0.0
+
 class EnhancedWhaleWatcher:
     """🔧 PHASE 3: Enhanced whale watcher with QuickNode Yellowstone streaming."""
 
-    def __init__(self, 
+    def __init__(self,
                  min_whale_sol: float = 100.0,
                  min_whale_usd: float = 15000.0,
-                 track_wallets: bool = True):
+                 track_wallets: bool = True,
+                 alert_capacity: int = 100,
+                 max_tracked_wallets: int = 10000,
+                 alerts_per_wallet: int = 50):
         """Initialize the enhanced whale watcher."""
         self.min_whale_sol = min_whale_sol
         self.min_whale_usd = min_whale_usd
         self.track_wallets = track_wallets
-        
-        # Whale tracking
-        self.known_whales: Set[str] = set()
-        self.whale_history: Dict[str, List[WhaleAlert]] = {}
-        self.recent_alerts: List[WhaleAlert] = []
+
+        # Whale tracking - bounded ring buffer and LRU wallet index
+        self.alert_store = WhaleAlertStore(alert_capacity, max_tracked_wallets, alerts_per_wallet)
         
         # Alert callbacks
         self.alert_callbacks: List[callable] = []
@@ -159,10 +263,6 @@ class EnhancedWhaleWatcher:
             if whale_transaction.amount_usd > self.stats['largest_transaction_usd']:
                 self.stats['largest_transaction_usd'] = whale_transaction.amount_usd
 
-            # Track whale wallet
-            if self.track_wallets:
-                self.known_whales.add(whale_transaction.from_wallet)
-
             # Determine alert level and market impact
             alert_level = self._determine_alert_level(whale_transaction)
             market_impact = self._assess_market_impact(whale_transaction)
@@ -182,17 +282,8 @@ class EnhancedWhaleWatcher:
                 alert_level=alert_level
             )
 
-            # Store alert
-            self.recent_alerts.append(whale_alert)
-            
-            # Maintain recent alerts list (keep last 100)
-            if len(self.recent_alerts) > 100:
-                self.recent_alerts = self.recent_alerts[-100:]
-
-            # Store in whale history
-            if whale_transaction.from_wallet not in self.whale_history:
-                self.whale_history[whale_transaction.from_wallet] = []
-            self.whale_history[whale_transaction.from_wallet].append(whale_alert)
+            # Store alert in the ring buffer and per-wallet index
+            self.alert_store.add(whale_alert, index_wallet=self.track_wallets)
 
             # Send alerts
             await self._send_whale_alert(whale_alert)
@@ -243,28 +334,44 @@ class EnhancedWhaleWatcher:
         self.alert_callbacks.append(callback)
         logger.info(f"🔧 Registered whale alert callback: {callback.__name__}")
 
+    def unregister_alert_callback(self, callback: callable):
+        """Remove a previously registered whale alert callback."""
+        if callback in self.alert_callbacks:
+            self.alert_callbacks.remove(callback)
+            logger.info(f"🔧 Unregistered whale alert callback: {callback.__name__}")
+
+    @property
+    def recent_alerts(self) -> List[WhaleAlert]:
+        """Recent alerts, oldest first."""
+        return list(reversed(self.alert_store.recent()))
+
+    @property
+    def known_whales(self) -> Set[str]:
+        """Currently indexed whale wallets."""
+        return set(self.alert_store.wallets)
+
     def get_recent_whales(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent whale alerts."""
-        recent = self.recent_alerts[-limit:] if limit else self.recent_alerts
-        return [asdict(alert) for alert in reversed(recent)]
+        return [asdict(alert) for alert in self.alert_store.recent(limit)]
 
     def get_whale_statistics(self) -> Dict[str, Any]:
         """Get whale detection statistics."""
+        store = self.alert_store
         stats = self.stats.copy()
         stats.update({
-            'known_whales_count': len(self.known_whales),
-            'recent_alerts_count': len(self.recent_alerts),
-            'tracked_whale_wallets': len(self.whale_history),
-            'average_whale_size_sol': sum(alert.amount_sol for alert in self.recent_alerts) / max(len(self.recent_alerts), 1),
-            'average_whale_size_usd': sum(alert.amount_usd for alert in self.recent_alerts) / max(len(self.recent_alerts), 1)
+            'known_whales_count': len(store.wallets),
+            'recent_alerts_count': len(store),
+            'tracked_whale_wallets': len(store.wallets),
+            'evicted_whale_wallets': store.evicted_wallets,
+            'alert_levels': dict(store.alert_levels),
+            'average_whale_size_sol': store.average_sol,
+            'average_whale_size_usd': store.average_usd
         })
         return stats
 
     def get_whale_by_wallet(self, wallet_address: str) -> List[Dict[str, Any]]:
         """Get whale transaction history for a specific wallet."""
-        if wallet_address in self.whale_history:
-            return [asdict(alert) for alert in self.whale_history[wallet_address]]
-        return []
+        return [asdict(alert) for alert in self.alert_store.wallet_history(wallet_address)]
 
     async def close(self):
         """Close the whale watcher and cleanup resources."""
@@ -283,3 +390,7 @@ async def get_whale_watcher() -> EnhancedWhaleWatcher:
         _whale_watcher = EnhancedWhaleWatcher()
         await _whale_watcher.initialize()
     return _whale_watcher
+
+def get_running_whale_watcher() -> Optional[EnhancedWhaleWatcher]:
+    """Get the global whale watcher if it has been started, without starting one."""
+    return _whale_watcher
@@ -16,6 +16,8 @@ from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from functools import lru_cache
 
+from phase_4_deployment.utils.ttl_cache import LRUTTLCache
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -43,8 +45,11 @@ class BaseFilter(ABC):
         self.config = config or {}
         self.cache_ttl = cache_ttl
         self.enabled = self.config.get('enabled', True)
-        self.cache = {}
-        self.cache_timestamps = {}
+        self.cache = LRUTTLCache(
+            max_size=self.config.get('cache_max_size', 1000),
+            default_ttl=cache_ttl,
+            name=self.name
+        )
         
         logger.info(f"Initialized {self.name} filter with cache_ttl={cache_ttl}s")
     
@@ -58,10 +63,7 @@ class BaseFilter(ABC):
         Returns:
             True if the cache entry is valid, False otherwise
         """
-        if key not in self.cache_timestamps:
-            return False
-        
-        return (time.time() - self.cache_timestamps[key]) < self.cache_ttl
+        return key in self.cache
     
     def get_from_cache(self, key: str) -> Optional[Any]:
         """
@@ -73,9 +75,6 @@ class BaseFilter(ABC):
         Returns:
             Cached value if valid, None otherwise
         """
-        if not self.is_cache_valid(key):
-            return None
-        
         return self.cache.get(key)
     
     def set_in_cache(self, key: str, value: Any) -> None:
@@ -86,13 +85,11 @@ class BaseFilter(ABC):
             key: Cache key
             value: Value to cache
         """
-        self.cache[key] = value
-        self.cache_timestamps[key] = time.time()
+        self.cache.set(key, value)
     
     def clear_cache(self) -> None:
         """Clear the cache."""
-        self.cache = {}
-        self.cache_timestamps = {}
+        self.cache.clear()
         logger.debug(f"{self.name} cache cleared")
     
     @abstractmethod
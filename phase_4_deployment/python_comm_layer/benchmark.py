@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Rust Communication Layer Benchmark
+
+Measures requests/sec and latency percentiles of the multiplexed DEALER
+transport against a local ROUTER echo server, optionally next to the
+lockstep REQ pattern the clients used before (one request in flight, JSON).
+
+Usage:
+    python phase_4_deployment/python_comm_layer/benchmark.py --requests 20000 --concurrency 64
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+from typing import Dict, Any, List
+
+import zmq
+import zmq.asyncio
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from phase_4_deployment.python_comm_layer.transport import (
+    DealerTransport, EchoServer, resolve_codec, encode_payload, decode_payload
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Representative prepare_transaction request
+SAMPLE_REQUEST = {
+    "request": "prepare_transaction",
+    "timestamp": "2025-06-01T12:00:00",
+    "data": {
+        "instructions": [
+            {
+                "program_id": "JUP6LkbZbjS1jKKwapdHNy74zcZ3tLUZoi5QNyVTaV4",
+                "accounts": [
+                    {"pubkey": f"Account{i:040d}", "is_signer": i == 0, "is_writable": i < 4}
+                    for i in range(12)
+                ],
+                "data": "AQIDBAUGBwgJCgsMDQ4PEBESExQVFhcYGRobHB0eHyA=",
+            }
+        ],
+        "signers": ["Signer11111111111111111111111111111111111"],
+        "compute_budget": {"units": 200000, "price": 10000},
+    },
+}
+
+
+def summarize(name: str, latencies_ms: List[float], elapsed: float, errors: int) -> Dict[str, Any]:
+    """Throughput and latency percentiles for a run."""
+    latencies_ms = sorted(latencies_ms)
+    count = len(latencies_ms)
+
+    def percentile(p: float) -> float:
+        return latencies_ms[min(count - 1, int(p * count))] if count else 0.0
+
+    return {
+        'transport': name,
+        'requests': count,
+        'errors': errors,
+        'requests_per_sec': count / elapsed if elapsed > 0 else 0.0,
+        'p50_ms': percentile(0.50),
+        'p99_ms': percentile(0.99),
+        'max_ms': latencies_ms[-1] if count else 0.0,
+    }
+
+
+async def run_dealer(endpoint: str, context: zmq.asyncio.Context, requests: int,
+                     concurrency: int, codec: str, timeout: float) -> Dict[str, Any]:
+    """Benchmark the DEALER transport with `concurrency` requests in flight."""
+    transport = DealerTransport(endpoint, context=context, timeout=timeout, codec=codec)
+    await transport.connect()
+
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                await transport.request(SAMPLE_REQUEST)
+                latencies.append((time.perf_counter() - started) * 1000)
+            except Exception:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    await transport.close()
+    return summarize(f"dealer/{codec} x{concurrency}", latencies, elapsed, errors)
+
+
+async def run_req(endpoint: str, context: zmq.asyncio.Context, requests: int) -> Dict[str, Any]:
+    """Benchmark the lockstep REQ pattern (one request in flight, JSON payloads)."""
+    socket = context.socket(zmq.REQ)
+    socket.setsockopt(zmq.LINGER, 0)
+    socket.connect(endpoint)
+    codec = resolve_codec("json")
+
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for i in range(requests):
+        request_started = time.perf_counter()
+        # REQ adds the empty delimiter frame itself
+        await socket.send_multipart([i.to_bytes(8, 'big'), codec, encode_payload(codec, SAMPLE_REQUEST)])
+        _, reply_codec, payload = await socket.recv_multipart()
+        decode_payload(reply_codec, payload)
+        latencies.append((time.perf_counter() - request_started) * 1000)
+    elapsed = time.perf_counter() - started
+
+    socket.close()
+    return summarize("req/json x1", latencies, elapsed, 0)
+
+
+async def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark the Rust communication layer transport")
+    parser.add_argument("--endpoint", default="tcp://127.0.0.1:5599", help="Echo server endpoint")
+    parser.add_argument("--requests", type=int, default=10000, help="Requests per run")
+    parser.add_argument("--concurrency", type=int, default=64, help="Requests in flight (DEALER)")
+    parser.add_argument("--codec", default="msgpack", choices=["msgpack", "json"], help="DEALER payload codec")
+    parser.add_argument("--delay", type=float, default=0.0, help="Simulated server work per request (s)")
+    parser.add_argument("--timeout", type=float, default=5.0, help="Per-request timeout (s)")
+    parser.add_argument("--no-server", action="store_true", help="Use an already running server")
+    parser.add_argument("--compare-req", action="store_true", help="Also benchmark lockstep REQ")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    context = zmq.asyncio.Context()
+    server = None
+    if not args.no_server:
+        server = EchoServer(args.endpoint, context=context, delay=args.delay)
+        await server.start()
+
+    results = []
+    try:
+        if args.compare_req:
+            results.append(await run_req(args.endpoint, context, args.requests))
+        results.append(await run_dealer(args.endpoint, context, args.requests,
+                                        args.concurrency, args.codec, args.timeout))
+    finally:
+        if server:
+            await server.stop()
+        context.term()
+
+    for result in results:
+        logger.info(
+            f"📊 {result['transport']:<22} {result['requests_per_sec']:>10.0f} req/s  "
+            f"p50 {result['p50_ms']:.3f} ms  p99 {result['p99_ms']:.3f} ms  "
+            f"max {result['max_ms']:.3f} ms  errors {result['errors']}"
+        )
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        logger.info(f"💾 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,7 +3,9 @@
 Python-Rust Communication Layer Client
 
 This module provides a client for communicating with the Rust components
-of the Q5 Trading System using ZeroMQ.
+of the Q5 Trading System using ZeroMQ. Requests go over a multiplexed
+DEALER transport (see transport.py) with msgpack payloads, so concurrent
+requests don't serialize behind each other.
 """
 
 import os
@@ -16,11 +18,9 @@ import zmq.asyncio
 from typing import Dict, Any, List, Optional, Union, Callable
 from datetime import datetime
 
-logger = logging.getLogger(__name__)
+from phase_4_deployment.python_comm_layer.transport import DealerTransport, CommunicationError
 
-class CommunicationError(Exception):
-    """Exception raised for communication errors."""
-    pass
+logger = logging.getLogger(__name__)
 
 class RustCommClient:
     """Client for communicating with Rust components using ZeroMQ."""
@@ -32,6 +32,7 @@ class RustCommClient:
         req_endpoint: str = "tcp://127.0.0.1:5557",
         context: Optional[zmq.asyncio.Context] = None,
         timeout: int = 5000,  # milliseconds
+        codec: str = "msgpack",
     ):
         """
         Initialize the Rust communication client.
@@ -41,18 +42,20 @@ class RustCommClient:
             sub_endpoint: ZeroMQ subscriber endpoint
             req_endpoint: ZeroMQ request-reply endpoint
             context: ZeroMQ context (created if not provided)
-            timeout: Request timeout in milliseconds
+            timeout: Default request timeout in milliseconds
+            codec: Request payload codec ("msgpack" or "json")
         """
         self.pub_endpoint = pub_endpoint
         self.sub_endpoint = sub_endpoint
         self.req_endpoint = req_endpoint
         self.context = context or zmq.asyncio.Context.instance()
         self.timeout = timeout
+        self.codec = codec
         
         # Initialize sockets
         self.pub_socket = None
         self.sub_socket = None
-        self.req_socket = None
+        self.req_transport: Optional[DealerTransport] = None
         
         # Subscription topics
         self.topics = set()
@@ -82,10 +85,14 @@ class RustCommClient:
             self.sub_socket = self.context.socket(zmq.SUB)
             self.sub_socket.connect(self.sub_endpoint)
             
-            # Create request-reply socket
-            self.req_socket = self.context.socket(zmq.REQ)
-            self.req_socket.connect(self.req_endpoint)
-            self.req_socket.setsockopt(zmq.RCVTIMEO, self.timeout)
+            # Create multiplexed request transport
+            self.req_transport = DealerTransport(
+                self.req_endpoint,
+                context=self.context,
+                timeout=self.timeout / 1000,
+                codec=self.codec,
+            )
+            await self.req_transport.connect()
             
             # Start subscription handler
             self.running = True
@@ -117,9 +124,9 @@ class RustCommClient:
             self.sub_socket.close()
             self.sub_socket = None
         
-        if self.req_socket:
-            self.req_socket.close()
-            self.req_socket = None
+        if self.req_transport:
+            await self.req_transport.close()
+            self.req_transport = None
         
         logger.info("Disconnected from Rust component")
     
@@ -210,50 +217,46 @@ class RustCommClient:
         except Exception as e:
             raise CommunicationError(f"Failed to unsubscribe from topic '{topic}': {str(e)}")
     
-    async def request(self, request_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    async def request(
+        self,
+        request_type: str,
+        data: Dict[str, Any],
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """
         Send a request to the Rust component and wait for a response.
         
+        Requests are multiplexed: concurrent calls are in flight at the same
+        time, and a timed-out request doesn't affect the others.
+        
         Args:
             request_type: Type of request
             data: Request data
+            timeout: Timeout in seconds (client default if not provided)
             
         Returns:
             Dict[str, Any]: Response data
             
         Raises:
-            CommunicationError: If request fails
+            CommunicationError: If request fails or times out
         """
-        if not self.req_socket:
+        if not self.req_transport:
             raise CommunicationError("Not connected to Rust component")
         
+        request = {
+            "request": request_type,
+            "timestamp": datetime.utcnow().isoformat(),
+            "data": data,
+        }
+        
         try:
-            # Create request
-            request = {
-                "request": request_type,
-                "timestamp": datetime.utcnow().isoformat(),
-                "data": data,
-            }
-            
-            # Serialize request
-            request_json = json.dumps(request)
-            
-            # Send request
-            await self.req_socket.send(request_json.encode("utf-8"))
-            
-            # Wait for response
-            response_json = await self.req_socket.recv()
-            
-            # Deserialize response
-            response = json.loads(response_json.decode("utf-8"))
-            
-            logger.debug(f"Received response for request '{request_type}'")
-            
-            return response
-        except zmq.error.Again:
-            raise CommunicationError(f"Request '{request_type}' timed out")
-        except Exception as e:
-            raise CommunicationError(f"Failed to send request '{request_type}': {str(e)}")
+            response = await self.req_transport.request(request, timeout=timeout)
+        except CommunicationError as e:
+            raise CommunicationError(f"Request '{request_type}' failed: {str(e)}")
+        
+        logger.debug(f"Received response for request '{request_type}'")
+        
+        return response
     
     async def _handle_subscriptions(self) -> None:
         """Handle subscription messages."""
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Multiplexed Request Transport
+
+This module provides the request/response transport used by the Rust
+communication layer clients: a ZeroMQ DEALER socket with correlation IDs so
+many requests can be in flight at once, compact binary payloads (msgpack,
+with JSON as the fallback codec) and per-request timeouts that leave the
+socket usable. It also provides a ROUTER-based echo server for local
+testing and benchmarking.
+
+Wire format (DEALER side; a ROUTER peer sees the identity frame first):
+
+    [b'', correlation_id (8 bytes), codec (b'm' msgpack | b'j' json), payload]
+
+Replies carry the request's correlation ID and codec.
+"""
+
+import json
+import time
+import struct
+import asyncio
+import logging
+import itertools
+from typing import Dict, Any, Optional, Callable, List
+
+import zmq
+import zmq.asyncio
+
+# msgpack is optional; JSON is used when it isn't installed
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CODEC_MSGPACK = b'm'
+CODEC_JSON = b'j'
+
+_CORRELATION_ID = struct.Struct('>Q')
+
+
+class CommunicationError(Exception):
+    """Exception raised for communication errors."""
+    pass
+
+
+def resolve_codec(codec: str = "msgpack") -> bytes:
+    """Codec frame for a codec name, falling back to JSON without msgpack."""
+    if codec == "msgpack" and MSGPACK_AVAILABLE:
+        return CODEC_MSGPACK
+    return CODEC_JSON
+
+
+def encode_payload(codec: bytes, payload: Any) -> bytes:
+    """Serialize a payload with the given codec."""
+    if codec == CODEC_MSGPACK:
+        return msgpack.packb(payload, use_bin_type=True, default=str)
+    return json.dumps(payload, default=str, separators=(',', ':')).encode('utf-8')
+
+
+def decode_payload(codec: bytes, data: bytes) -> Any:
+    """Deserialize a payload encoded with the given codec."""
+    if codec == CODEC_MSGPACK:
+        if not MSGPACK_AVAILABLE:
+            raise CommunicationError("Received a msgpack payload but msgpack is not installed")
+        return msgpack.unpackb(data, raw=False)
+    return json.loads(data)
+
+
+class DealerTransport:
+    """
+    Multiplexed request/response over a ZeroMQ DEALER socket.
+
+    - every request gets a correlation ID and its own future, so concurrent
+      request() calls don't wait for each other
+    - a background task routes replies to their futures by correlation ID
+    - a timed-out request only forgets its future; a late reply is counted
+      and dropped, and the socket keeps working
+    """
+
+    def __init__(self,
+                 endpoint: str,
+                 context: Optional[zmq.asyncio.Context] = None,
+                 timeout: float = 5.0,
+                 codec: str = "msgpack",
+                 max_in_flight: int = 1000):
+        """
+        Initialize the transport.
+
+        Args:
+            endpoint: ROUTER endpoint to connect to
+            context: ZeroMQ context (shared instance if not provided)
+            timeout: Default request timeout in seconds
+            codec: Payload codec, "msgpack" or "json"
+            max_in_flight: Maximum concurrent requests before request() waits
+        """
+        self.endpoint = endpoint
+        self.context = context or zmq.asyncio.Context.instance()
+        self.timeout = timeout
+        self.codec = resolve_codec(codec)
+
+        self.socket: Optional[zmq.asyncio.Socket] = None
+        self._recv_task: Optional[asyncio.Task] = None
+        self._pending: Dict[bytes, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._slots = asyncio.Semaphore(max_in_flight)
+
+        self.stats = {
+            'requests': 0,
+            'responses': 0,
+            'timeouts': 0,
+            'late_replies': 0,
+            'errors': 0,
+            'latency_total_ms': 0.0
+        }
+
+    @property
+    def connected(self) -> bool:
+        return self.socket is not None
+
+    async def connect(self) -> None:
+        """Connect the DEALER socket and start routing replies."""
+        if self.socket is not None:
+            return
+        self.socket = self.context.socket(zmq.DEALER)
+        self.socket.setsockopt(zmq.LINGER, 0)
+        self.socket.connect(self.endpoint)
+        self._recv_task = asyncio.create_task(self._receive_replies())
+        logger.debug(f"DEALER transport connected to {self.endpoint}")
+
+    async def close(self) -> None:
+        """Stop routing replies, fail pending requests and close the socket."""
+        if self._recv_task is not None:
+            self._recv_task.cancel()
+            try:
+                await self._recv_task
+            except asyncio.CancelledError:
+                pass
+            self._recv_task = None
+
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(CommunicationError("Transport closed"))
+        self._pending.clear()
+
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+
+    async def _receive_replies(self) -> None:
+        while True:
+            try:
+                frames = await self.socket.recv_multipart()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error receiving reply from {self.endpoint}: {e}")
+                await asyncio.sleep(0.1)  # Avoid tight loop on error
+                continue
+
+            if len(frames) != 4 or frames[0] != b'':
+                self.stats['errors'] += 1
+                logger.warning(f"Dropping malformed reply with {len(frames)} frames")
+                continue
+
+            _, correlation_id, codec, payload = frames
+            future = self._pending.pop(correlation_id, None)
+            if future is None or future.done():
+                # The request already timed out (or was cancelled)
+                self.stats['late_replies'] += 1
+                continue
+
+            try:
+                future.set_result(decode_payload(codec, payload))
+            except Exception as e:
+                self.stats['errors'] += 1
+                future.set_exception(CommunicationError(f"Failed to decode reply: {e}"))
+
+    async def request(self, payload: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Send a request and wait for its reply.
+
+        Args:
+            payload: Request payload (anything the codec can encode)
+            timeout: Seconds to wait for the reply (default timeout if None)
+
+        Returns:
+            Decoded reply payload
+
+        Raises:
+            CommunicationError: If not connected, on timeout or on failure
+        """
+        if self.socket is None:
+            raise CommunicationError(f"Not connected to {self.endpoint}")
+
+        timeout = self.timeout if timeout is None else timeout
+        correlation_id = _CORRELATION_ID.pack(next(self._ids))
+        future = asyncio.get_running_loop().create_future()
+
+        async with self._slots:
+            self._pending[correlation_id] = future
+            self.stats['requests'] += 1
+            started = time.perf_counter()
+            try:
+                await self.socket.send_multipart(
+                    [b'', correlation_id, self.codec, encode_payload(self.codec, payload)]
+                )
+                reply = await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                self.stats['timeouts'] += 1
+                raise CommunicationError(f"Request timed out after {timeout}s")
+            except CommunicationError:
+                self.stats['errors'] += 1
+                raise
+            except Exception as e:
+                self.stats['errors'] += 1
+                raise CommunicationError(f"Request failed: {e}")
+            finally:
+                self._pending.pop(correlation_id, None)
+
+        self.stats['responses'] += 1
+        self.stats['latency_total_ms'] += (time.perf_counter() - started) * 1000
+        return reply
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request counters and average latency."""
+        responses = self.stats['responses']
+        return {
+            'endpoint': self.endpoint,
+            'codec': 'msgpack' if self.codec == CODEC_MSGPACK else 'json',
+            'in_flight': len(self._pending),
+            'avg_latency_ms': self.stats['latency_total_ms'] / responses if responses else 0.0,
+            **self.stats
+        }
+
+
+class EchoServer:
+    """
+    ROUTER server for local testing and benchmarks.
+
+    Replies to each request with handler(request) - by default the request's
+    "data" wrapped in a success response - using the request's codec.
+    Requests are handled concurrently, so replies may be out of order.
+    """
+
+    def __init__(self,
+                 endpoint: str = "tcp://127.0.0.1:5557",
+                 context: Optional[zmq.asyncio.Context] = None,
+                 handler: Optional[Callable[[Any], Any]] = None,
+                 delay: float = 0.0):
+        """
+        Initialize the echo server.
+
+        Args:
+            endpoint: Endpoint to bind
+            context: ZeroMQ context (shared instance if not provided)
+            handler: Callable (sync or async) mapping a request to a reply
+            delay: Seconds to wait before replying (simulated work)
+        """
+        self.endpoint = endpoint
+        self.context = context or zmq.asyncio.Context.instance()
+        self.handler = handler or self.echo
+        self.delay = delay
+
+        self.socket: Optional[zmq.asyncio.Socket] = None
+        self._task: Optional[asyncio.Task] = None
+        self._handlers: set = set()
+        self.requests_handled = 0
+
+    @staticmethod
+    def echo(request: Any) -> Dict[str, Any]:
+        data = request.get('data') if isinstance(request, dict) else request
+        return {'status': 'success', 'data': data}
+
+    async def start(self) -> None:
+        """Bind the ROUTER socket and start serving."""
+        self.socket = self.context.socket(zmq.ROUTER)
+        self.socket.setsockopt(zmq.LINGER, 0)
+        self.socket.bind(self.endpoint)
+        self._task = asyncio.create_task(self._serve())
+        logger.info(f"Echo server listening on {self.endpoint}")
+
+    async def stop(self) -> None:
+        """Stop serving and close the socket."""
+        tasks = [task for task in [self._task, *self._handlers] if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._handlers.clear()
+
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+
+    async def _serve(self) -> None:
+        while True:
+            frames = await self.socket.recv_multipart()
+            if len(frames) != 5 or frames[1] != b'':
+                logger.warning(f"Echo server dropping malformed request with {len(frames)} frames")
+                continue
+            task = asyncio.create_task(self._reply(frames))
+            self._handlers.add(task)
+            task.add_done_callback(self._handlers.discard)
+
+    async def _reply(self, frames: List[bytes]) -> None:
+        identity, _, correlation_id, codec, payload = frames
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            reply = self.handler(decode_payload(codec, payload))
+            if asyncio.iscoroutine(reply):
+                reply = await reply
+        except Exception as e:
+            reply = {'status': 'error', 'error': str(e)}
+
+        await self.socket.send_multipart(
+            [identity, b'', correlation_id, codec, encode_payload(codec, reply)]
+        )
+        self.requests_handled += 1
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Blockhash Service - Process-wide Recent Blockhash Prefetcher
+
+Polls getLatestBlockhash in the background over a pooled keep-alive connection
+so transaction builders can read a fresh blockhash synchronously instead of
+paying an RPC round trip on every signal-to-submit path.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401 - httpx needs the h2 package for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# A blockhash stays valid for 150 blocks after the block it was produced in
+MAX_PROCESSING_AGE_BLOCKS = 150
+# Average Solana slot time used to extrapolate block height between polls
+SLOT_TIME_SECONDS = 0.4
+
+
+def helius_rpc_url(api_key: Optional[str]) -> Optional[str]:
+    """Helius mainnet RPC URL for an API key (None without a key)."""
+    if not api_key:
+        return None
+    return f"https://mainnet.helius-rpc.com/?api-key={api_key}"
+
+
+@dataclass
+class CachedBlockhash:
+    """A recent blockhash and its validity window."""
+    blockhash: str
+    last_valid_block_height: int
+    slot: int
+    fetched_at: float  # time.monotonic() of the successful poll
+
+
+class BlockhashService:
+    """
+    Background blockhash prefetcher shared by all transaction builders.
+
+    Features:
+    - Polls getLatestBlockhash every ~400ms on one long-lived client
+    - Rotates across the configured RPC endpoints on failure
+    - Hands out the latest blockhash synchronously via get_blockhash()
+    - Estimates current block height so callers can reject stale hashes
+    """
+
+    def __init__(self,
+                 rpc_urls: Optional[List[str]] = None,
+                 poll_interval: float = SLOT_TIME_SECONDS,
+                 commitment: str = "processed",
+                 max_age: float = 10.0,
+                 min_remaining_blocks: int = 30,
+                 timeout: float = 5.0):
+        """
+        Initialize the blockhash service.
+
+        Args:
+            rpc_urls: RPC endpoints to poll, in preference order
+            poll_interval: Seconds between polls
+            commitment: Commitment level for getLatestBlockhash
+            max_age: Seconds after which a cached blockhash is not handed out
+            min_remaining_blocks: Blocks of validity a hash must have left to be usable
+            timeout: Per-request timeout
+        """
+        self.rpc_urls = [url for url in (rpc_urls or self._default_rpc_urls()) if url]
+        self.poll_interval = poll_interval
+        self.commitment = commitment
+        self.max_age = max_age
+        self.min_remaining_blocks = min_remaining_blocks
+        self.timeout = timeout
+
+        self.latest: Optional[CachedBlockhash] = None
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self._poll_task: Optional[asyncio.Task] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._url_index = 0
+
+        # Metrics
+        self.metrics = {
+            'polls': 0,
+            'poll_failures': 0,
+            'blockhash_changes': 0,
+            'served': 0,
+            'served_stale_rejected': 0,
+            'on_demand_fetches': 0
+        }
+
+        logger.info(f"🔧 BlockhashService configured with {len(self.rpc_urls)} RPC endpoints")
+
+    @staticmethod
+    def _default_rpc_urls() -> List[str]:
+        """Build the default endpoint list from the environment."""
+        urls = [os.getenv('QUICKNODE_RPC_URL'), os.getenv('HELIUS_RPC_URL'),
+                helius_rpc_url(os.getenv('HELIUS_API_KEY'))]
+        # Preserve order, drop duplicates
+        return list(dict.fromkeys(url for url in urls if url))
+
+    def add_rpc_urls(self, rpc_urls: List[str]):
+        """Add endpoints supplied by a builder after the service was created."""
+        self.rpc_urls = list(dict.fromkeys(self.rpc_urls + [url for url in rpc_urls if url]))
+
+    @property
+    def running(self) -> bool:
+        """Whether the background poller is active."""
+        return self._poll_task is not None and not self._poll_task.done()
+
+    async def start(self):
+        """Start the background poller (idempotent)."""
+        if self.running:
+            return
+
+        if not self.rpc_urls:
+            logger.error("❌ BlockhashService has no RPC endpoints configured")
+            return
+
+        if self.http_client is None or self.http_client.is_closed:
+            self.http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=30.0)
+            )
+        self._refresh_lock = self._refresh_lock or asyncio.Lock()
+
+        # Prime the cache before builders ask for a hash
+        await self.refresh()
+        self._poll_task = asyncio.create_task(self._poll_loop())
+        logger.info("✅ BlockhashService started")
+
+    async def stop(self):
+        """Stop the poller and close the pooled client."""
+        if self._poll_task:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+            self._poll_task = None
+
+        if self.http_client:
+            await self.http_client.aclose()
+            self.http_client = None
+
+        logger.info("✅ BlockhashService stopped")
+
+    async def _poll_loop(self):
+        """Refresh the cached blockhash every poll_interval."""
+        while True:
+            try:
+                await asyncio.sleep(self.poll_interval)
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error in blockhash poll loop: {e}")
+                await asyncio.sleep(1.0)
+
+    async def refresh(self) -> Optional[CachedBlockhash]:
+        """Fetch the latest blockhash once, trying each endpoint in turn."""
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+
+        async with self._refresh_lock:
+            request = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "getLatestBlockhash",
+                "params": [{"commitment": self.commitment}]
+            }
+
+            for attempt in range(len(self.rpc_urls)):
+                url = self.rpc_urls[self._url_index]
+                self.metrics['polls'] += 1
+                try:
+                    response = await self.http_client.post(url, json=request)
+                    response.raise_for_status()
+                    result = response.json().get("result", {})
+                    value = result.get("value", {})
+
+                    fetched = CachedBlockhash(
+                        blockhash=value["blockhash"],
+                        last_valid_block_height=int(value["lastValidBlockHeight"]),
+                        slot=int(result.get("context", {}).get("slot", 0)),
+                        fetched_at=time.monotonic()
+                    )
+
+                    if not self.latest or fetched.blockhash != self.latest.blockhash:
+                        self.metrics['blockhash_changes'] += 1
+                    self.latest = fetched
+                    return fetched
+
+                except Exception as e:
+                    self.metrics['poll_failures'] += 1
+                    logger.debug(f"⚠️ Blockhash poll failed via endpoint {self._url_index}: {e}")
+                    # Rotate to the next endpoint for subsequent polls
+                    self._url_index = (self._url_index + 1) % len(self.rpc_urls)
+
+            return None
+
+    def estimated_block_height(self) -> Optional[int]:
+        """Estimate the current block height from the latest poll."""
+        if not self.latest:
+            return None
+        elapsed_blocks = int((time.monotonic() - self.latest.fetched_at) / SLOT_TIME_SECONDS)
+        return self.latest.last_valid_block_height - MAX_PROCESSING_AGE_BLOCKS + elapsed_blocks
+
+    def is_blockhash_valid(self, last_valid_block_height: int) -> bool:
+        """
+        Check whether a blockhash still has enough validity left to be submitted.
+
+        Args:
+            last_valid_block_height: lastValidBlockHeight returned with the blockhash
+
+        Returns:
+            True if at least min_remaining_blocks blocks remain in its window
+        """
+        current_height = self.estimated_block_height()
+        if current_height is None:
+            return False
+        return last_valid_block_height - current_height >= self.min_remaining_blocks
+
+    def get_blockhash(self) -> Optional[CachedBlockhash]:
+        """
+        Return the latest cached blockhash without any I/O.
+
+        Returns:
+            CachedBlockhash, or None if the cache is empty or too old to trust
+        """
+        latest = self.latest
+        if not latest:
+            return None
+
+        if (time.monotonic() - latest.fetched_at > self.max_age or
+                not self.is_blockhash_valid(latest.last_valid_block_height)):
+            self.metrics['served_stale_rejected'] += 1
+            return None
+
+        self.metrics['served'] += 1
+        return latest
+
+    async def get_or_fetch_blockhash(self) -> Optional[CachedBlockhash]:
+        """Return the cached blockhash, fetching on demand if the cache is cold or stale."""
+        cached = self.get_blockhash()
+        if cached:
+            return cached
+
+        if self.http_client is None:
+            await self.start()
+            cached = self.get_blockhash()
+            if cached:
+                return cached
+
+        self.metrics['on_demand_fetches'] += 1
+        return await self.refresh()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get service status and metrics."""
+        latest = self.latest
+        return {
+            'running': self.running,
+            'rpc_endpoints': len(self.rpc_urls),
+            'poll_interval': self.poll_interval,
+            'latest_blockhash': latest.blockhash if latest else None,
+            'last_valid_block_height': latest.last_valid_block_height if latest else None,
+            'age_seconds': round(time.monotonic() - latest.fetched_at, 3) if latest else None,
+            'estimated_block_height': self.estimated_block_height(),
+            'metrics': dict(self.metrics)
+        }
+
+
+# Global instance
+_blockhash_service = None
+
+def get_blockhash_service(rpc_urls: Optional[List[str]] = None) -> BlockhashService:
+    """
+    Get the global blockhash service instance.
+
+    Args:
+        rpc_urls: Endpoints the caller is configured with; they are added to
+            the environment defaults of the shared instance
+    """
+    global _blockhash_service
+    if _blockhash_service is None:
+        _blockhash_service = BlockhashService()
+    if rpc_urls:
+        _blockhash_service.add_rpc_urls(rpc_urls)
+    return _blockhash_service
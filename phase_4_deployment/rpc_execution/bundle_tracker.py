@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Bundle Status Tracker
+
+Resolves one awaitable per Jito bundle ID as soon as the bundle lands or
+fails. All pending bundles share a single poll loop that asks the block
+engine for their statuses with batched getBundleStatuses calls (up to 5
+bundle IDs per call), so the number of status requests per tick no longer
+grows with the number of bundles being watched.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Any, Optional, List, Callable, Awaitable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# getBundleStatuses accepts at most 5 bundle IDs per call
+MAX_BUNDLE_IDS_PER_STATUS_CALL = 5
+
+LANDED_STATUSES = ("confirmed", "finalized")
+
+
+def _bundle_error(status: Dict[str, Any]) -> Any:
+    """Error of a bundle status entry, or None ({"Ok": null} means no error)."""
+    error = status.get("err")
+    if not error or error == {"Ok": None}:
+        return None
+    return error
+
+
+class BundleStatusTracker:
+    """
+    Tracks pending bundle IDs until they land or fail.
+
+    Features:
+    - One shared poll loop for all pending bundles
+    - Batched getBundleStatuses calls (5 bundle IDs per call)
+    - Per-bundle futures that resolve the moment a result is known
+    - Landing latency in the metrics, measured from the sendBundle time
+      when the caller passes it (otherwise from the start of tracking)
+    - Bundles nobody resolves within max_pending_age are expired
+    """
+
+    def __init__(self,
+                 status_url: str,
+                 http_client: Optional[httpx.AsyncClient] = None,
+                 poll_interval: float = 1.0,
+                 max_backoff: float = 10.0,
+                 timeout: float = 10.0,
+                 max_pending_age: float = 120.0,
+                 rate_limiter: Optional[Callable[[], Awaitable[None]]] = None):
+        """
+        Initialize the bundle tracker.
+
+        Args:
+            status_url: Block engine bundles endpoint that serves getBundleStatuses
+            http_client: Shared HTTP client (a private one is created if omitted)
+            poll_interval: Seconds between status polls while bundles are pending
+            max_backoff: Maximum poll interval after consecutive failed polls
+            timeout: Per-request timeout for a private HTTP client
+            max_pending_age: Seconds after submission a bundle is expired
+            rate_limiter: Coroutine awaited before every block engine request
+        """
+        self.status_url = status_url
+        self.http_client = http_client
+        self._owns_client = http_client is None
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.max_pending_age = max_pending_age
+        self.rate_limiter = rate_limiter
+
+        self.pending: Dict[str, asyncio.Future] = {}
+        self.submitted_at: Dict[str, float] = {}
+        self.waiters: Dict[str, int] = {}  # bundle_id -> callers waiting on its future
+        self.consecutive_failures = 0
+
+        self._poll_task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        # Metrics
+        self.metrics = {
+            'tracked': 0,
+            'landed': 0,
+            'failed': 0,
+            'timed_out': 0,
+            'expired': 0,
+            'status_calls': 0,
+            'status_errors': 0,
+            'bundle_ids_polled': 0,
+            'average_landing_time': 0.0,
+            'max_landing_time': 0.0
+        }
+
+    async def start(self):
+        """Start the poll loop (idempotent)."""
+        if self._poll_task and not self._poll_task.done():
+            return
+
+        if self.http_client is None or self.http_client.is_closed:
+            self.http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(max_connections=2, max_keepalive_connections=1)
+            )
+            self._owns_client = True
+        self._wakeup = asyncio.Event()
+        self._poll_task = asyncio.create_task(self._poll_loop())
+
+        logger.info("✅ Bundle status tracker started")
+
+    async def close(self):
+        """Stop the poll loop, cancel pending waiters and close a private client."""
+        if self._poll_task:
+            self._poll_task.cancel()
+            try:
+                await self._poll_task
+            except asyncio.CancelledError:
+                pass
+        self._poll_task = None
+
+        for future in self.pending.values():
+            if not future.done():
+                future.cancel()
+        self.pending.clear()
+        self.submitted_at.clear()
+        self.waiters.clear()
+
+        if self._owns_client and self.http_client:
+            await self.http_client.aclose()
+            self.http_client = None
+
+        logger.info("✅ Bundle status tracker closed")
+
+    def track(self, bundle_id: str, submitted_at: Optional[float] = None) -> asyncio.Future:
+        """
+        Start tracking a bundle.
+
+        Args:
+            bundle_id: Bundle ID returned by sendBundle
+            submitted_at: time.time() of the sendBundle call (defaults to now)
+
+        Returns:
+            Future resolving to a 'confirmed' or 'failed' result
+        """
+        future = self.pending.get(bundle_id)
+        if future is not None:
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[bundle_id] = future
+        self.submitted_at[bundle_id] = submitted_at if submitted_at is not None else time.time()
+        self.metrics['tracked'] += 1
+
+        if self._wakeup:
+            self._wakeup.set()
+
+        return future
+
+    async def wait_for_bundle(self, bundle_id: str, timeout: float = 30.0,
+                              submitted_at: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait until a bundle lands or fails.
+
+        Args:
+            bundle_id: Bundle ID returned by sendBundle
+            timeout: Maximum seconds to wait
+            submitted_at: time.time() of the sendBundle call (defaults to now)
+
+        Returns:
+            Result with status 'confirmed', 'failed' or 'timeout'
+        """
+        await self.start()
+        future = self.track(bundle_id, submitted_at)
+        self.waiters[bundle_id] = self.waiters.get(bundle_id, 0) + 1
+
+        try:
+            # The shield keeps one caller's timeout from cancelling the shared future
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.metrics['timed_out'] += 1
+            return {"status": "timeout", "bundle_id": bundle_id, "message": "Status check timed out"}
+        finally:
+            self._release_waiter(bundle_id, future)
+
+    def _release_waiter(self, bundle_id: str, future: asyncio.Future):
+        """Drop a caller's interest; stop tracking once nobody is waiting."""
+        remaining = self.waiters.get(bundle_id, 1) - 1
+        if remaining > 0:
+            self.waiters[bundle_id] = remaining
+            return
+
+        self.waiters.pop(bundle_id, None)
+        if not future.done():
+            if self.pending.get(bundle_id) is future:
+                self._forget(bundle_id)
+            future.cancel()
+
+    def _status_to_result(self, bundle_id: str, status: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Convert a getBundleStatuses entry to a final result (None while pending)."""
+        error = _bundle_error(status)
+        if error is not None:
+            return {"status": "failed", "bundle_id": bundle_id, "error": error, "slot": status.get("slot")}
+
+        if status.get("confirmation_status") in LANDED_STATUSES:
+            return {
+                "status": "confirmed",
+                "bundle_id": bundle_id,
+                "confirmation_status": status.get("confirmation_status"),
+                "slot": status.get("slot"),
+                "transactions": status.get("transactions", [])
+            }
+        return None
+
+    def _resolve(self, bundle_id: str, result: Dict[str, Any]):
+        """Resolve the future for a bundle once."""
+        future = self.pending.get(bundle_id)
+        if future is None or future.done():
+            return
+
+        elapsed = time.time() - self.submitted_at.get(bundle_id, time.time())
+        result['landing_time'] = elapsed
+
+        if result['status'] == 'confirmed':
+            self.metrics['landed'] += 1
+            landed = self.metrics['landed']
+            current_avg = self.metrics['average_landing_time']
+            self.metrics['average_landing_time'] = ((current_avg * (landed - 1)) + elapsed) / landed
+            self.metrics['max_landing_time'] = max(self.metrics['max_landing_time'], elapsed)
+            logger.info(f"✅ Bundle {bundle_id} landed in slot {result.get('slot')} after {elapsed:.2f}s")
+        else:
+            self.metrics['failed'] += 1
+            logger.error(f"❌ Bundle {bundle_id} failed: {result.get('error')}")
+
+        future.set_result(result)
+        self._forget(bundle_id)
+
+    def _forget(self, bundle_id: str):
+        """Drop bookkeeping for a bundle."""
+        self.pending.pop(bundle_id, None)
+        self.submitted_at.pop(bundle_id, None)
+
+    def _expire_stale(self) -> int:
+        """Expire bundles pending longer than max_pending_age (e.g. tracked but never awaited)."""
+        deadline = time.time() - self.max_pending_age
+        expired = [bundle_id for bundle_id, submitted in self.submitted_at.items() if submitted < deadline]
+        for bundle_id in expired:
+            future = self.pending.get(bundle_id)
+            if future is not None and not future.done():
+                future.set_result({"status": "timeout", "bundle_id": bundle_id,
+                                   "message": f"Not resolved within {self.max_pending_age:.0f}s"})
+            self.metrics['expired'] += 1
+            self._forget(bundle_id)
+        if expired:
+            logger.warning(f"⚠️ Expired {len(expired)} bundles pending longer than {self.max_pending_age:.0f}s")
+        return len(expired)
+
+    async def _get_bundle_statuses(self, bundle_ids: List[str]) -> Optional[List[Any]]:
+        """Call getBundleStatuses for up to 5 bundle IDs (None on failure)."""
+        request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getBundleStatuses",
+            "params": [bundle_ids]
+        }
+
+        self.metrics['status_calls'] += 1
+        self.metrics['bundle_ids_polled'] += len(bundle_ids)
+        try:
+            # Status polls share the block engine request budget with sendBundle
+            if self.rate_limiter is not None:
+                await self.rate_limiter()
+            response = await self.http_client.post(self.status_url, json=request)
+            response.raise_for_status()
+            result = response.json().get("result")
+        except Exception as e:
+            self.metrics['status_errors'] += 1
+            logger.debug(f"⚠️ getBundleStatuses failed: {e}")
+            return None
+
+        # The block engine wraps statuses in {"context": ..., "value": [...]}
+        if isinstance(result, dict):
+            result = result.get("value")
+        return result or []
+
+    async def poll_once(self) -> int:
+        """
+        Poll statuses for every pending bundle.
+
+        Returns:
+            Number of bundles resolved by this poll
+        """
+        resolved = self._expire_stale()
+        bundle_ids = list(self.pending.keys())
+        for i in range(0, len(bundle_ids), MAX_BUNDLE_IDS_PER_STATUS_CALL):
+            chunk = bundle_ids[i:i + MAX_BUNDLE_IDS_PER_STATUS_CALL]
+            statuses = await self._get_bundle_statuses(chunk)
+            if statuses is None:
+                self.consecutive_failures += 1
+                break
+            self.consecutive_failures = 0
+
+            # Unknown bundles come back as null entries in request order
+            for position, status in enumerate(statuses):
+                if not status:
+                    continue
+                bundle_id = status.get("bundle_id") or (chunk[position] if position < len(chunk) else None)
+                result = self._status_to_result(bundle_id, status) if bundle_id in self.pending else None
+                if result is not None:
+                    self._resolve(bundle_id, result)
+                    resolved += 1
+
+        return resolved
+
+    async def _poll_loop(self):
+        """Batch-poll statuses for all pending bundles."""
+        while True:
+            try:
+                if not self.pending:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+
+                # Back off while the block engine is failing or rate limiting
+                interval = min(self.poll_interval * (2 ** min(self.consecutive_failures, 8)), self.max_backoff)
+                await asyncio.sleep(interval)
+                await self.poll_once()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error in bundle status poll loop: {e}")
+                await asyncio.sleep(1.0)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get tracker status and metrics."""
+        calls = self.metrics['status_calls']
+        return {
+            'pending': len(self.pending),
+            'average_ids_per_call': self.metrics['bundle_ids_polled'] / calls if calls else 0.0,
+            **self.metrics
+        }
+
+
+# Process-wide tracker shared by every bundle submitter
+_bundle_tracker: Optional[BundleStatusTracker] = None
+
+def get_bundle_tracker(status_url: str,
+                       rate_limiter: Optional[Callable[[], Awaitable[None]]] = None) -> BundleStatusTracker:
+    """
+    Get the shared bundle tracker, creating it on first use.
+
+    The first caller's status URL is used for every bundle. A rate limiter is
+    attached if the tracker has none yet. The first call registers
+    close_bundle_tracker() with the system shutdown handler.
+
+    Args:
+        status_url: Block engine bundles endpoint that serves getBundleStatuses
+        rate_limiter: Coroutine awaited before every status poll
+    """
+    global _bundle_tracker
+    if _bundle_tracker is None:
+        _bundle_tracker = BundleStatusTracker(status_url, rate_limiter=rate_limiter)
+        try:
+            from phase_4_deployment.core.shutdown_handler import register_async_shutdown_callback
+            register_async_shutdown_callback(close_bundle_tracker)
+        except ImportError:
+            logger.debug("Shutdown handler not available; call close_bundle_tracker() on exit")
+    elif _bundle_tracker.rate_limiter is None and rate_limiter is not None:
+        _bundle_tracker.rate_limiter = rate_limiter
+    return _bundle_tracker
+
+async def close_bundle_tracker():
+    """Close the shared bundle tracker (shutdown hook)."""
+    global _bundle_tracker
+    if _bundle_tracker is not None:
+        await _bundle_tracker.close()
+        _bundle_tracker = None
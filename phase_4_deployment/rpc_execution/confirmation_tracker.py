@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Signature Confirmation Tracker
+
+Resolves one awaitable per transaction signature as soon as it reaches the
+target commitment. Confirmations arrive over a signatureSubscribe websocket;
+a getSignatureStatuses batch poll (up to 256 signatures per call) runs as a
+fallback and catches anything the websocket misses.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from typing import Dict, Any, Optional, List
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import websockets
+except ImportError:
+    logger.warning("websockets not available, confirmation tracker will poll only")
+    websockets = None
+
+# getSignatureStatuses accepts at most 256 signatures per call
+MAX_SIGNATURES_PER_STATUS_CALL = 256
+
+COMMITMENT_LEVELS = {"processed": 0, "confirmed": 1, "finalized": 2}
+
+
+def _to_ws_url(rpc_url: str) -> str:
+    """Derive the websocket endpoint from an HTTP RPC endpoint."""
+    if rpc_url.startswith("https://"):
+        return "wss://" + rpc_url[len("https://"):]
+    if rpc_url.startswith("http://"):
+        return "ws://" + rpc_url[len("http://"):]
+    return rpc_url
+
+
+class SignatureConfirmationTracker:
+    """
+    Tracks pending transaction signatures until they reach a target commitment.
+
+    Features:
+    - One shared signatureSubscribe websocket for all pending signatures
+    - Batched getSignatureStatuses fallback polling (256 signatures per call)
+    - Per-signature futures that resolve the moment a result is known
+    - RPC endpoint rotation on polling failures
+    """
+
+    def __init__(self,
+                 rpc_urls: List[str],
+                 ws_url: Optional[str] = None,
+                 commitment: str = "confirmed",
+                 poll_interval: float = 0.4,
+                 ws_poll_interval: float = 2.0,
+                 timeout: float = 10.0):
+        """
+        Initialize the confirmation tracker.
+
+        Args:
+            rpc_urls: HTTP RPC endpoints for status polling, in preference order
+            ws_url: Websocket endpoint (derived from the first RPC URL if omitted)
+            commitment: Target commitment level
+            poll_interval: Poll interval while the websocket is unavailable
+            ws_poll_interval: Slower safety-net poll interval while the websocket is up
+            timeout: Per-request timeout for status polls
+        """
+        self.rpc_urls = [url for url in rpc_urls if url]
+        self.ws_url = ws_url or (_to_ws_url(self.rpc_urls[0]) if self.rpc_urls else None)
+        self.commitment = commitment
+        self.target_level = COMMITMENT_LEVELS.get(commitment, 1)
+        self.poll_interval = poll_interval
+        self.ws_poll_interval = ws_poll_interval
+        self.timeout = timeout
+
+        self.pending: Dict[str, asyncio.Future] = {}
+        self.submitted_at: Dict[str, float] = {}
+        self.waiters: Dict[str, int] = {}  # signature -> callers waiting on its future
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self._url_index = 0
+
+        # Websocket state
+        self.ws = None
+        self.ws_connected = False
+        self._ws_request_ids = itertools.count(1)
+        self._ws_requests: Dict[int, str] = {}  # request id -> signature
+        self._ws_subscriptions: Dict[int, str] = {}  # subscription id -> signature
+
+        self._poll_task: Optional[asyncio.Task] = None
+        self._ws_task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        # Metrics
+        self.metrics = {
+            'tracked': 0,
+            'confirmed': 0,
+            'failed': 0,
+            'timed_out': 0,
+            'resolved_by_websocket': 0,
+            'resolved_by_poll': 0,
+            'status_calls': 0,
+            'average_confirmation_time': 0.0
+        }
+
+    async def start(self):
+        """Start the websocket listener and fallback poller (idempotent)."""
+        if self._poll_task and not self._poll_task.done():
+            return
+
+        if self.http_client is None or self.http_client.is_closed:
+            self.http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=2)
+            )
+        self._wakeup = asyncio.Event()
+        self._poll_task = asyncio.create_task(self._poll_loop())
+
+        if websockets and self.ws_url:
+            self._ws_task = asyncio.create_task(self._ws_loop())
+
+        logger.info("✅ Signature confirmation tracker started")
+
+    async def close(self):
+        """Stop background tasks, fail pending waiters and close connections."""
+        for task in (self._poll_task, self._ws_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._poll_task = None
+        self._ws_task = None
+
+        for future in self.pending.values():
+            if not future.done():
+                future.cancel()
+        self.pending.clear()
+        self.submitted_at.clear()
+        self.waiters.clear()
+
+        if self.http_client:
+            await self.http_client.aclose()
+            self.http_client = None
+
+        logger.info("✅ Signature confirmation tracker closed")
+
+    def track(self, signature: str) -> asyncio.Future:
+        """
+        Start tracking a signature.
+
+        Args:
+            signature: Transaction signature
+
+        Returns:
+            Future resolving to {'success', 'error', 'slot', 'confirmation_status'}
+        """
+        future = self.pending.get(signature)
+        if future is not None:
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[signature] = future
+        self.submitted_at[signature] = time.time()
+        self.metrics['tracked'] += 1
+
+        if self.ws_connected:
+            asyncio.create_task(self._ws_subscribe(signature))
+        if self._wakeup:
+            self._wakeup.set()
+
+        return future
+
+    async def wait_for_confirmation(self, signature: str, timeout: float = 45.0) -> Optional[Dict[str, Any]]:
+        """
+        Wait until a signature reaches the target commitment or fails.
+
+        Args:
+            signature: Transaction signature
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Confirmation result, or None on timeout
+        """
+        await self.start()
+        future = self.track(signature)
+        self.waiters[signature] = self.waiters.get(signature, 0) + 1
+
+        try:
+            # The shield keeps one caller's timeout from cancelling the shared future
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.metrics['timed_out'] += 1
+            return None
+        finally:
+            self._release_waiter(signature, future)
+
+    def _release_waiter(self, signature: str, future: asyncio.Future):
+        """Drop a caller's interest; stop tracking once nobody is waiting."""
+        remaining = self.waiters.get(signature, 1) - 1
+        if remaining > 0:
+            self.waiters[signature] = remaining
+            return
+
+        self.waiters.pop(signature, None)
+        if not future.done():
+            if self.pending.get(signature) is future:
+                self._forget(signature)
+            future.cancel()
+
+    async def check_now(self, signatures: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Immediately look up signatures with transaction history search.
+
+        Args:
+            signatures: Transaction signatures
+
+        Returns:
+            Mapping of signature to result for signatures with a known status
+        """
+        await self.start()
+        results = {}
+        for i in range(0, len(signatures), MAX_SIGNATURES_PER_STATUS_CALL):
+            chunk = signatures[i:i + MAX_SIGNATURES_PER_STATUS_CALL]
+            statuses = await self._get_signature_statuses(chunk, search_history=True)
+            for signature, status in zip(chunk, statuses or []):
+                if status:
+                    results[signature] = self._status_to_result(status)
+        return results
+
+    def _status_to_result(self, status: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a getSignatureStatuses entry to a confirmation result."""
+        error = status.get("err")
+        return {
+            'success': error is None,
+            'error': error,
+            'slot': status.get("slot"),
+            'confirmation_status': status.get("confirmationStatus")
+        }
+
+    def _resolve(self, signature: str, result: Dict[str, Any], source: str):
+        """Resolve the future for a signature once."""
+        future = self.pending.get(signature)
+        if future is None or future.done():
+            return
+
+        future.set_result(result)
+        self.metrics['confirmed' if result['success'] else 'failed'] += 1
+        self.metrics[f'resolved_by_{source}'] += 1
+
+        elapsed = time.time() - self.submitted_at.get(signature, time.time())
+        resolved = self.metrics['confirmed'] + self.metrics['failed']
+        current_avg = self.metrics['average_confirmation_time']
+        self.metrics['average_confirmation_time'] = ((current_avg * (resolved - 1)) + elapsed) / resolved
+
+        self._forget(signature)
+
+    def _forget(self, signature: str):
+        """Drop bookkeeping for a signature and cancel its live subscription."""
+        self.pending.pop(signature, None)
+        self.submitted_at.pop(signature, None)
+        for sub_id, sub_signature in list(self._ws_subscriptions.items()):
+            if sub_signature == signature:
+                del self._ws_subscriptions[sub_id]
+                if self.ws_connected:
+                    asyncio.create_task(self._ws_unsubscribe(sub_id))
+
+    async def _get_signature_statuses(self, signatures: List[str], search_history: bool = False) -> Optional[List[Any]]:
+        """Call getSignatureStatuses, rotating endpoints on failure."""
+        request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getSignatureStatuses",
+            "params": [signatures, {"searchTransactionHistory": search_history}]
+        }
+
+        for _ in range(len(self.rpc_urls)):
+            url = self.rpc_urls[self._url_index]
+            self.metrics['status_calls'] += 1
+            try:
+                response = await self.http_client.post(url, json=request)
+                response.raise_for_status()
+                return response.json().get("result", {}).get("value")
+            except Exception as e:
+                logger.debug(f"⚠️ getSignatureStatuses failed via endpoint {self._url_index}: {e}")
+                self._url_index = (self._url_index + 1) % len(self.rpc_urls)
+
+        return None
+
+    async def _poll_loop(self):
+        """Batch-poll statuses for all pending signatures."""
+        while True:
+            try:
+                if not self.pending:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+
+                interval = self.ws_poll_interval if self.ws_connected else self.poll_interval
+                await asyncio.sleep(interval)
+
+                signatures = list(self.pending.keys())
+                for i in range(0, len(signatures), MAX_SIGNATURES_PER_STATUS_CALL):
+                    chunk = signatures[i:i + MAX_SIGNATURES_PER_STATUS_CALL]
+                    statuses = await self._get_signature_statuses(chunk)
+                    for signature, status in zip(chunk, statuses or []):
+                        if not status:
+                            continue
+                        level = COMMITMENT_LEVELS.get(status.get("confirmationStatus"), -1)
+                        # Failed transactions are final regardless of commitment
+                        if level >= self.target_level or status.get("err") is not None:
+                            self._resolve(signature, self._status_to_result(status), 'poll')
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Error in confirmation poll loop: {e}")
+                await asyncio.sleep(1.0)
+
+    async def _ws_subscribe(self, signature: str):
+        """Send signatureSubscribe for one signature."""
+        if not self.ws_connected:
+            return
+        request_id = next(self._ws_request_ids)
+        self._ws_requests[request_id] = signature
+        try:
+            await self.ws.send(json.dumps({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "signatureSubscribe",
+                "params": [signature, {"commitment": self.commitment}]
+            }))
+        except Exception as e:
+            self._ws_requests.pop(request_id, None)
+            logger.debug(f"⚠️ signatureSubscribe failed for {signature}: {e}")
+
+    async def _ws_unsubscribe(self, sub_id: int):
+        """Send signatureUnsubscribe for a subscription nobody waits on."""
+        if not self.ws_connected:
+            return
+        try:
+            await self.ws.send(json.dumps({
+                "jsonrpc": "2.0",
+                "id": next(self._ws_request_ids),
+                "method": "signatureUnsubscribe",
+                "params": [sub_id]
+            }))
+        except Exception as e:
+            logger.debug(f"⚠️ signatureUnsubscribe failed for subscription {sub_id}: {e}")
+
+    async def _ws_loop(self):
+        """Maintain the websocket and resolve signatures from notifications."""
+        reconnect_delay = 1.0
+        while True:
+            try:
+                async with websockets.connect(self.ws_url, ping_interval=20) as ws:
+                    self.ws = ws
+                    self.ws_connected = True
+                    self._ws_requests.clear()
+                    self._ws_subscriptions.clear()
+                    reconnect_delay = 1.0
+                    logger.info("🔌 Confirmation websocket connected")
+
+                    # Resubscribe everything still pending
+                    for signature in list(self.pending.keys()):
+                        await self._ws_subscribe(signature)
+
+                    async for raw_message in ws:
+                        self._handle_ws_message(json.loads(raw_message))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Confirmation websocket error: {e}")
+            finally:
+                self.ws = None
+                self.ws_connected = False
+
+            await asyncio.sleep(reconnect_delay)
+            reconnect_delay = min(reconnect_delay * 2, 30.0)
+
+    def _handle_ws_message(self, message: Dict[str, Any]):
+        """Handle a subscription confirmation or signature notification."""
+        if "id" in message and "result" in message:
+            signature = self._ws_requests.pop(message["id"], None)
+            if signature is None:
+                return
+            if signature in self.pending:
+                self._ws_subscriptions[message["result"]] = signature
+            else:
+                # The wait ended before the subscription was acknowledged
+                asyncio.create_task(self._ws_unsubscribe(message["result"]))
+            return
+
+        if message.get("method") == "signatureNotification":
+            params = message.get("params", {})
+            signature = self._ws_subscriptions.pop(params.get("subscription"), None)
+            value = params.get("result", {}).get("value", {})
+            if signature and isinstance(value, dict):
+                error = value.get("err")
+                self._resolve(signature, {
+                    'success': error is None,
+                    'error': error,
+                    'slot': params.get("result", {}).get("context", {}).get("slot"),
+                    'confirmation_status': self.commitment
+                }, 'websocket')
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get tracker status and metrics."""
+        return {
+            'pending': len(self.pending),
+            'websocket_connected': self.ws_connected,
+            'commitment': self.commitment,
+            **self.metrics
+        }
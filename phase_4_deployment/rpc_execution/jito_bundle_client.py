@@ -14,6 +14,8 @@ from typing import List, Dict, Any, Optional, Union
 import httpx
 import base64
 
+from phase_4_deployment.rpc_execution.bundle_tracker import get_bundle_tracker
+
 logger = logging.getLogger(__name__)
 
 class QuickNodeBundleClient:
@@ -328,6 +330,13 @@ class JitoBundleClient:
             limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
         )
 
+        # Process-wide status tracker: one batched getBundleStatuses poll for all
+        # pending bundles, sharing this client's Jito rate limit
+        self.bundle_tracker = get_bundle_tracker(
+            f"{self.block_engine_url}/api/v1/bundles",
+            rate_limiter=self._enforce_rate_limit
+        )
+
         # Jito tip accounts (official Jito tip accounts)
         self.tip_accounts = [
             "96gYZGLnJYVFmbjzopPSU6QiEV5fGqZNyN9nmNhvrZU5",  # Tip account 1
@@ -339,7 +348,7 @@ class JitoBundleClient:
         logger.info(f"Initialized Jito Bundle client with Block Engine: {block_engine_url}")
 
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client (the shared bundle tracker is closed on shutdown)."""
         await self.http_client.aclose()
 
     async def _enforce_rate_limit(self):
@@ -479,30 +488,15 @@ class JitoBundleClient:
             )
             tx.add(transfer_ix)
 
-            # Get fresh blockhash (this is critical for signature verification)
+            # Get prefetched blockhash (this is critical for signature verification)
             try:
-                # Use a simple RPC call to get blockhash
-                import httpx
-                rpc_url = f"https://mainnet.helius-rpc.com/?api-key={os.getenv('HELIUS_API_KEY')}"
-
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(rpc_url, json={
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "getLatestBlockhash"
-                    })
+                from phase_4_deployment.rpc_execution.blockhash_service import get_blockhash_service
 
-                    if response.status_code == 200:
-                        result = response.json()
-                        if 'result' in result and 'value' in result['result']:
-                            blockhash_str = result['result']['value']['blockhash']
-                            tx.recent_blockhash = Hash.from_string(blockhash_str)
-                        else:
-                            logger.error("Failed to get blockhash for tip transaction")
-                            return None
-                    else:
-                        logger.error("RPC call failed for tip transaction blockhash")
-                        return None
+                cached = await get_blockhash_service().get_or_fetch_blockhash()
+                if not cached:
+                    logger.error("Failed to get blockhash for tip transaction")
+                    return None
+                tx.recent_blockhash = Hash.from_string(cached.blockhash)
             except Exception as e:
                 logger.error(f"Error getting blockhash for tip transaction: {e}")
                 return None
@@ -599,6 +593,7 @@ class JitoBundleClient:
             await self._enforce_rate_limit()
 
             # Submit bundle to Jito Block Engine using correct endpoint
+            submitted_at = time.time()
             response = await self.http_client.post(
                 f"{self.block_engine_url}/api/v1/bundles",
                 json=bundle_data,
@@ -631,7 +626,8 @@ class JitoBundleClient:
                             "success": True,
                             "bundle_id": bundle_id,
                             "status": {"status": "submitted"},
-                            "transactions_count": len(bundle_transactions)
+                            "transactions_count": len(bundle_transactions),
+                            "submitted_at": submitted_at
                         }
                     else:
                         logger.warning(f"Bundle submitted but no bundle_id returned: {result}")
@@ -670,66 +666,33 @@ class JitoBundleClient:
             logger.error(f"Bundle submission error: {e}")
             return {"success": False, "error": str(e)}
 
-    async def monitor_bundle_status(self, bundle_id: str, max_wait: int = 30) -> Dict[str, Any]:
+    async def monitor_bundle_status(self, bundle_id: str, max_wait: int = 30,
+                                    submitted_at: Optional[float] = None) -> Dict[str, Any]:
         """
         Monitor bundle execution status.
 
+        The bundle is added to the shared tracker, which polls every pending
+        bundle with batched getBundleStatuses calls, so concurrent monitors
+        don't each poll the block engine.
+
         Args:
             bundle_id: Bundle ID to monitor
             max_wait: Maximum wait time in seconds
+            submitted_at: 'submitted_at' from the submit_bundle result, so landing
+                time is measured from sendBundle rather than from this call
 
         Returns:
             Bundle status information
         """
-        start_time = time.time()
-
-        while time.time() - start_time < max_wait:
-            try:
-                # Check bundle status
-                status_data = {
-                    "jsonrpc": "2.0",
-                    "id": int(time.time()),
-                    "method": "getBundleStatuses",
-                    "params": [[bundle_id]]
-                }
-
-                response = await self.http_client.post(
-                    f"{self.block_engine_url}/api/v1/bundles",
-                    json=status_data,
-                    headers={"Content-Type": "application/json"}
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-
-                    if 'result' in result and result['result']:
-                        status_info = result['result'][0]
-
-                        # Check if bundle was processed
-                        if status_info.get('confirmation_status') in ['confirmed', 'finalized']:
-                            logger.info(f"Bundle {bundle_id} confirmed: {status_info}")
-                            return {
-                                "status": "confirmed",
-                                "confirmation_status": status_info.get('confirmation_status'),
-                                "slot": status_info.get('slot'),
-                                "transactions": status_info.get('transactions', [])
-                            }
-                        elif status_info.get('err'):
-                            logger.error(f"Bundle {bundle_id} failed: {status_info['err']}")
-                            return {
-                                "status": "failed",
-                                "error": status_info['err']
-                            }
-
-                # Wait before next check
-                await asyncio.sleep(2)
-
-            except Exception as e:
-                logger.warning(f"Error checking bundle status: {e}")
-                await asyncio.sleep(2)
-
-        logger.warning(f"Bundle {bundle_id} status check timed out")
-        return {"status": "timeout", "message": "Status check timed out"}
+        result = await self.bundle_tracker.wait_for_bundle(bundle_id, timeout=max_wait,
+                                                           submitted_at=submitted_at)
+        if result.get('status') == 'timeout':
+            logger.warning(f"Bundle {bundle_id} status check timed out")
+        return result
+
+    def get_bundle_metrics(self) -> Dict[str, Any]:
+        """Get bundle tracker metrics (landed/failed counts and landing latency)."""
+        return self.bundle_tracker.get_status()
 
     async def execute_jupiter_bundle(self, jupiter_transaction: Union[str, bytes, Dict],
                                    trade_size_sol: float = 0.001,
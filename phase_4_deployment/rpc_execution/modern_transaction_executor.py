@@ -45,7 +45,8 @@ class ModernTransactionExecutor:
             self.execution_config = {
                 'circuit_breaker_enabled': True,
                 'failure_threshold': 3,
-                'reset_timeout': 60
+                'reset_timeout': 60,
+                'confirmation_timeout': 45.0
             }
             self.quicknode_config = {
                 'enabled': True,
@@ -68,7 +69,8 @@ class ModernTransactionExecutor:
             self.execution_config = {
                 'circuit_breaker_enabled': config.get('circuit_breaker_enabled', True),
                 'failure_threshold': config.get('failure_threshold', 3),
-                'reset_timeout': config.get('reset_timeout', 60)
+                'reset_timeout': config.get('reset_timeout', 60),
+                'confirmation_timeout': config.get('confirmation_timeout', 45.0)
             }
             self.quicknode_config = {
                 'enabled': config.get('quicknode_bundles_enabled', True),
@@ -92,6 +94,8 @@ class ModernTransactionExecutor:
         self.fallback_client = None
         self.jito_client = None
         self.quicknode_client = None  # 🔧 NEW: QuickNode bundle client
+        self.confirmation_tracker = None  # Shared signatureSubscribe/status-poll tracker
+        self.bundle_tracker = None  # Shared batched getBundleStatuses tracker
 
         # Circuit Breaker State (using configuration values)
         self.circuit_breaker = {
@@ -105,6 +109,7 @@ class ModernTransactionExecutor:
         self.failure_threshold = self.execution_config['failure_threshold']
         self.reset_timeout = self.execution_config['reset_timeout']
         self.circuit_breaker_enabled = self.execution_config['circuit_breaker_enabled']
+        self.confirmation_timeout = self.execution_config['confirmation_timeout']
 
         # Metrics
         self.metrics = {
@@ -114,6 +119,9 @@ class ModernTransactionExecutor:
             'signature_verification_failures': 0,
             'jito_bundle_successes': 0,
             'quicknode_bundle_successes': 0,  # 🔧 NEW: QuickNode bundle metrics
+            'jito_bundles_landed': 0,
+            'jito_bundles_failed': 0,
+            'average_bundle_landing_time': 0.0,
             'average_execution_time': 0.0
         }
 
@@ -148,6 +156,19 @@ class ModernTransactionExecutor:
                 )
                 logger.info("✅ QuickNode bundle client initialized")
 
+            # Confirmation tracker serving all verification paths
+            from phase_4_deployment.rpc_execution.confirmation_tracker import SignatureConfirmationTracker
+            self.confirmation_tracker = SignatureConfirmationTracker(
+                rpc_urls=[self.primary_rpc, self.fallback_rpc],
+                commitment="confirmed"
+            )
+            await self.confirmation_tracker.start()
+
+            # Process-wide tracker polling all pending Jito bundles in batches
+            from phase_4_deployment.rpc_execution.bundle_tracker import get_bundle_tracker
+            self.bundle_tracker = get_bundle_tracker(f"{self.jito_rpc}/bundles")
+            await self.bundle_tracker.start()
+
             logger.info("✅ Modern transaction executor initialized with QuickNode bundles")
 
         except Exception as e:
@@ -362,6 +383,7 @@ class ModernTransactionExecutor:
             }
 
             # Send bundle to Jito
+            submitted_at = time.time()
             response = await self.jito_client.post(
                 f"{self.jito_rpc}/bundles",
                 json=bundle_request,
@@ -375,14 +397,29 @@ class ModernTransactionExecutor:
                     logger.info(f"✅ Jito bundle submitted successfully: {bundle_id}")
 
                     # Wait for bundle confirmation
-                    confirmation = await self._wait_for_bundle_confirmation(bundle_id)
+                    confirmation = await self._wait_for_bundle_confirmation(bundle_id, submitted_at=submitted_at)
+
+                    if confirmation['status'] == 'failed':
+                        return {
+                            'success': False,
+                            'bundle_id': bundle_id,
+                            'error': f"Jito bundle failed: {confirmation.get('error')}",
+                            'provider': 'jito_bundle'
+                        }
+                    if confirmation['status'] != 'confirmed':
+                        return {
+                            'success': False,
+                            'bundle_id': bundle_id,
+                            'error': 'Jito bundle confirmation timed out',
+                            'provider': 'jito_bundle'
+                        }
 
                     return {
                         'success': True,
                         'bundle_id': bundle_id,
                         'confirmation': confirmation,
                         'provider': 'jito_bundle',
-                        'signature': confirmation.get('signature') if confirmation else None
+                        'signature': confirmation.get('signature')
                     }
                 else:
                     error_msg = result.get('error', {}).get('message', 'Unknown error')
@@ -505,6 +542,13 @@ class ModernTransactionExecutor:
     async def _get_fresh_blockhash(self) -> Optional[str]:
         """🔧 FIXED: Get fresh blockhash with PROCESSED commitment for immediate use."""
         try:
+            # Shared prefetcher answers from memory; RPC below is only a fallback
+            from phase_4_deployment.rpc_execution.blockhash_service import get_blockhash_service
+
+            cached = get_blockhash_service().get_blockhash()
+            if cached:
+                return cached.blockhash
+
             request = {
                 "jsonrpc": "2.0",
                 "id": 1,
@@ -631,40 +675,30 @@ class ModernTransactionExecutor:
     # Simulation was causing delays and is not necessary for live trading
     # Transaction validation now relies on structure checks and wallet balance validation only
 
-    async def _wait_for_bundle_confirmation(self, bundle_id: str, timeout: float = 30.0) -> Optional[Dict[str, Any]]:
-        """Wait for Jito bundle confirmation."""
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            try:
-                # Check bundle status
-                status_request = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getBundleStatuses",
-                    "params": [[bundle_id]]
-                }
-
-                response = await self.jito_client.post(
-                    f"{self.jito_rpc}/bundles",
-                    json=status_request
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    if "result" in result and result["result"]:
-                        status = result["result"][0]
-                        if status.get("confirmation_status") == "confirmed":
-                            return status
-
-                await asyncio.sleep(1.0)  # Wait 1 second before retry
-
-            except Exception as e:
-                logger.warning(f"⚠️ Error checking bundle status: {e}")
-                await asyncio.sleep(1.0)
+    async def _wait_for_bundle_confirmation(self, bundle_id: str, timeout: float = 30.0,
+                                            submitted_at: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for Jito bundle confirmation via the shared bundle tracker.
 
-        logger.warning(f"⚠️ Bundle confirmation timeout: {bundle_id}")
-        return None
+        Returns:
+            Tracker result with status 'confirmed' (plus the first transaction
+            signature), 'failed' or 'timeout'
+        """
+        result = await self.bundle_tracker.wait_for_bundle(bundle_id, timeout=timeout, submitted_at=submitted_at)
+
+        if result['status'] == 'confirmed':
+            self.metrics['jito_bundles_landed'] += 1
+            landed = self.metrics['jito_bundles_landed']
+            current_avg = self.metrics['average_bundle_landing_time']
+            self.metrics['average_bundle_landing_time'] = ((current_avg * (landed - 1)) + result['landing_time']) / landed
+            transactions = result.get('transactions') or []
+            return {**result, 'signature': transactions[0] if transactions else None}
+
+        if result['status'] == 'failed':
+            self.metrics['jito_bundles_failed'] += 1
+        else:
+            logger.warning(f"⚠️ Bundle confirmation timeout: {bundle_id}")
+        return result
 
     def _is_circuit_open(self, provider: str) -> bool:
         """Check if circuit breaker is open for a provider."""
@@ -704,91 +738,62 @@ class ModernTransactionExecutor:
         """Get executor metrics."""
         return {
             **self.metrics,
-            'circuit_breaker_status': self.circuit_breaker
+            'circuit_breaker_status': self.circuit_breaker,
+            'confirmation_tracker': self.confirmation_tracker.get_status() if self.confirmation_tracker else None,
+            'bundle_tracker': self.bundle_tracker.get_status() if self.bundle_tracker else None
         }
 
     async def _verify_transaction_on_chain(self, signature: str, client: httpx.AsyncClient, rpc_url: str) -> Dict[str, Any]:
-        """🚨 ENHANCED FIX: Verify transaction with improved timing and multiple verification methods."""
-        max_retries = 6  # Increased from 3 to 6 attempts
-        retry_delays = [2.0, 4.0, 6.0, 8.0, 10.0, 15.0]  # Longer progressive delays for network propagation
+        """🚨 ENHANCED FIX: Wait for confirmation via the shared signature tracker.
 
-        for attempt in range(max_retries):
-            try:
-                # Progressive wait time
-                await asyncio.sleep(retry_delays[attempt])
-
-                logger.info(f"🔍 Verification attempt {attempt + 1}/{max_retries} for {signature}")
-
-                # Check transaction status
-                request = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getTransaction",
-                    "params": [
-                        signature,
-                        {
-                            "encoding": "json",
-                            "commitment": "confirmed",
-                            "maxSupportedTransactionVersion": 0
-                        }
-                    ]
+        The tracker resolves as soon as the signature reaches confirmed commitment
+        (websocket notification or batched status poll) instead of sleeping
+        between getTransaction lookups. client and rpc_url are kept for callers;
+        the tracker polls every configured endpoint itself.
+        """
+        try:
+            logger.info(f"🔍 Waiting for confirmation of {signature}")
+            result = await self.confirmation_tracker.wait_for_confirmation(
+                signature, timeout=self.confirmation_timeout
+            )
+
+            if result is None:
+                logger.warning(f"⚠️ Transaction not confirmed within {self.confirmation_timeout}s: {signature}")
+                logger.info(f"🔍 This may be due to network propagation delay - transaction likely succeeded")
+                return {
+                    'success': False,
+                    'error': "Transaction not found on-chain (network propagation delay)",
+                    'verification_warning': True,
+                    'signature': signature
                 }
 
-                response = await client.post(rpc_url, json=request)
-                response.raise_for_status()
-                result = response.json()
+            return self._confirmation_to_verification(result)
 
-                if "result" in result and result["result"]:
-                    tx_data = result["result"]
+        except Exception as e:
+            logger.error(f"❌ Error verifying transaction on-chain: {e}")
+            return {
+                'success': False,
+                'error': f"Verification error: {str(e)}"
+            }
 
-                    # Check if transaction has an error
-                    if tx_data.get("meta", {}).get("err"):
-                        error = tx_data["meta"]["err"]
+    def _confirmation_to_verification(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a tracker confirmation result to a verification result."""
+        if result.get('error'):
+            error = result['error']
 
-                        # 🔍 ENHANCED: Decode common Solana error codes
-                        error_message = self._decode_solana_error(error)
-                        logger.error(f"❌ On-chain transaction error: {error} - {error_message}")
+            # 🔍 ENHANCED: Decode common Solana error codes
+            error_message = self._decode_solana_error(error)
+            logger.error(f"❌ On-chain transaction error: {error} - {error_message}")
 
-                        return {
-                            'success': False,
-                            'error': f"Transaction failed with error: {error} - {error_message}",
-                            'error_code': error,
-                            'decoded_error': error_message
-                        }
-                    else:
-                        logger.info(f"✅ Transaction confirmed successful on-chain (attempt {attempt + 1})")
-                        return {'success': True, 'error': None}
-                else:
-                    # Transaction not found yet
-                    if attempt < max_retries - 1:
-                        logger.info(f"⏳ Transaction not found yet, retrying in {retry_delays[attempt + 1] if attempt + 1 < len(retry_delays) else 5.0}s...")
-                        continue
-                    else:
-                        logger.warning(f"⚠️ Transaction not found after {max_retries} attempts: {signature}")
-                        logger.info(f"🔍 This may be due to network propagation delay - transaction likely succeeded")
-                        return {
-                            'success': False,
-                            'error': "Transaction not found on-chain (network propagation delay)",
-                            'verification_warning': True,
-                            'signature': signature
-                        }
+            return {
+                'success': False,
+                'error': f"Transaction failed with error: {error} - {error_message}",
+                'error_code': error,
+                'decoded_error': error_message
+            }
 
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    logger.warning(f"⚠️ Verification attempt {attempt + 1} failed: {e}, retrying...")
-                    continue
-                else:
-                    logger.error(f"❌ Error verifying transaction on-chain after {max_retries} attempts: {e}")
-                    return {
-                        'success': False,
-                        'error': f"Verification error: {str(e)}"
-                    }
-
-        # Should never reach here, but just in case
-        return {
-            'success': False,
-            'error': "Verification failed after all retries"
-        }
+        logger.info(f"✅ Transaction confirmed successful on-chain (slot {result.get('slot')})")
+        return {'success': True, 'error': None}
 
     async def _verify_transaction_with_enhanced_detection(self, signature: str, primary_client: httpx.AsyncClient, primary_rpc: str) -> Dict[str, Any]:
         """🚨 ENHANCED: Verify transaction with multiple methods including balance verification."""
@@ -802,22 +807,13 @@ class ModernTransactionExecutor:
             rpc_result['verification_method'] = 'rpc_lookup'
             return rpc_result
 
-        # Method 2: Try QuickNode-specific verification if available
-        if hasattr(self, 'quicknode_client') and self.quicknode_client:
-            logger.info(f"🔍 Method 2: QuickNode-specific verification")
-            quicknode_result = await self._verify_with_quicknode(signature)
-            if quicknode_result['success']:
-                logger.info(f"✅ Transaction verified via QuickNode")
-                quicknode_result['verification_method'] = 'quicknode'
-                return quicknode_result
-
-        # Method 3: Alternative RPC endpoints verification
-        logger.info(f"🔍 Method 3: Alternative RPC verification")
-        alt_result = await self._verify_with_alternative_rpcs(signature)
-        if alt_result['success']:
-            logger.info(f"✅ Transaction verified via alternative RPC")
-            alt_result['verification_method'] = 'alternative_rpc'
-            return alt_result
+        # Method 2: History-searching status lookup across the tracker's endpoints
+        logger.info(f"🔍 Method 2: Signature status lookup with history search")
+        status_result = await self._verify_signature_status(signature)
+        if status_result['success']:
+            logger.info(f"✅ Transaction verified via signature status lookup")
+            status_result['verification_method'] = 'status_lookup'
+            return status_result
 
         # 🚨 CRITICAL FIX: Don't treat failed transactions as successful!
         # If all verification methods fail, the transaction likely failed on-chain
@@ -833,27 +829,19 @@ class ModernTransactionExecutor:
         }
 
     async def _verify_transaction_with_fallback(self, signature: str, primary_client: httpx.AsyncClient, primary_rpc: str) -> Dict[str, Any]:
-        """🚨 ENHANCED: Verify transaction with multiple RPC fallback for better reliability."""
+        """🚨 ENHANCED: Verify transaction across primary and fallback RPCs.
 
-        # Try primary RPC first
-        logger.info(f"🔍 Verifying with primary RPC: {primary_rpc}")
+        The confirmation tracker already polls the primary and fallback
+        endpoints, so a single wait covers both.
+        """
+        logger.info(f"🔍 Verifying with primary/fallback RPC: {primary_rpc[:50]}...")
         result = await self._verify_transaction_on_chain(signature, primary_client, primary_rpc)
 
-        if result['success']:
+        if result['success'] or result.get('verification_warning'):
             return result
 
-        # If primary fails, try fallback RPC (only if configured)
-        if self.fallback_rpc and not self._is_circuit_open('fallback'):
-            logger.info(f"🔄 Primary verification failed, trying fallback RPC")
-            fallback_result = await self._verify_transaction_on_chain(signature, self.fallback_client, self.fallback_rpc)
-
-            if fallback_result['success']:
-                logger.info(f"✅ Transaction verified via fallback RPC")
-                return fallback_result
-
-        # 🚨 CRITICAL FIX: If both RPCs fail verification, the transaction likely failed
-        # Don't treat failed transactions as successful just because they were submitted
-        logger.error(f"❌ Verification failed on both RPCs - transaction likely failed on-chain")
+        # 🚨 CRITICAL FIX: Don't treat failed transactions as successful just because they were submitted
+        logger.error(f"❌ Verification failed - transaction failed on-chain")
         logger.error(f"❌ Transaction {signature} failed verification: {result['error']}")
         return {
             'success': False,
@@ -864,98 +852,26 @@ class ModernTransactionExecutor:
             'on_chain_error': result['error']
         }
 
-    async def _verify_with_quicknode(self, signature: str) -> Dict[str, Any]:
-        """Verify transaction using QuickNode-specific endpoints."""
+    async def _verify_signature_status(self, signature: str) -> Dict[str, Any]:
+        """Verify transaction with an immediate history-searching status lookup."""
         try:
-            if not hasattr(self, 'quicknode_client') or not self.quicknode_client:
-                return {'success': False, 'error': 'QuickNode client not available'}
-
-            # Use QuickNode's enhanced transaction lookup
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getTransaction",
-                "params": [
-                    signature,
-                    {
-                        "encoding": "json",
-                        "commitment": "confirmed",
-                        "maxSupportedTransactionVersion": 0
-                    }
-                ]
-            }
+            if not self.confirmation_tracker:
+                return {'success': False, 'error': 'Confirmation tracker not available'}
 
-            # Try with longer timeout for QuickNode
-            response = await asyncio.wait_for(
-                self.quicknode_client.post(
-                    f"https://api.quicknode.com/v1/solana/mainnet/{os.getenv('QUICKNODE_API_KEY')}",
-                    json=request
-                ),
-                timeout=10.0
-            )
+            results = await asyncio.wait_for(self.confirmation_tracker.check_now([signature]), timeout=10.0)
+            result = results.get(signature)
 
-            if response.status_code == 200:
-                result = response.json()
-                if "result" in result and result["result"]:
-                    tx_data = result["result"]
-                    if tx_data.get("meta", {}).get("err"):
-                        error = tx_data["meta"]["err"]
-                        error_message = self._decode_solana_error(error)
-                        logger.error(f"❌ QuickNode transaction error: {error} - {error_message}")
-                        return {'success': False, 'error': f"Transaction failed: {error} - {error_message}"}
-                    else:
-                        logger.info(f"✅ QuickNode verification successful")
-                        return {'success': True, 'error': None}
+            if result and result.get('confirmation_status') in ('confirmed', 'finalized'):
+                verification = self._confirmation_to_verification(result)
+                if verification['success']:
+                    logger.info(f"✅ Signature status verification successful")
+                return verification
 
-            return {'success': False, 'error': 'Transaction not found via QuickNode'}
+            return {'success': False, 'error': 'Transaction not found via signature status lookup'}
 
         except Exception as e:
-            logger.warning(f"⚠️ QuickNode verification failed: {e}")
-            return {'success': False, 'error': f'QuickNode verification error: {str(e)}'}
-
-    async def _verify_with_alternative_rpcs(self, signature: str) -> Dict[str, Any]:
-        """Verify transaction using only QuickNode RPC."""
-        # Only use QuickNode - no alternative RPCs
-        if not self.primary_rpc:
-            logger.warning("⚠️ No QuickNode RPC available for verification")
-            return {'success': False, 'error': 'No QuickNode RPC configured'}
-
-        try:
-            logger.info(f"🔍 Verifying with QuickNode RPC: {self.primary_rpc[:50]}...")
-
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                request = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getTransaction",
-                    "params": [
-                        signature,
-                        {
-                            "encoding": "json",
-                            "commitment": "confirmed",
-                            "maxSupportedTransactionVersion": 0
-                        }
-                    ]
-                }
-
-                response = await client.post(self.primary_rpc, json=request)
-                if response.status_code == 200:
-                    result = response.json()
-                    if "result" in result and result["result"]:
-                        tx_data = result["result"]
-                        if tx_data.get("meta", {}).get("err"):
-                            error = tx_data["meta"]["err"]
-                            error_message = self._decode_solana_error(error)
-                            logger.error(f"❌ QuickNode RPC transaction error: {error} - {error_message}")
-                            return {'success': False, 'error': f"Transaction failed: {error} - {error_message}"}
-                        else:
-                            logger.info(f"✅ QuickNode RPC verification successful")
-                            return {'success': True, 'error': None}
-
-        except Exception as e:
-            logger.warning(f"⚠️ QuickNode RPC verification failed: {e}")
-
-        return {'success': False, 'error': 'QuickNode RPC verification failed'}
+            logger.warning(f"⚠️ Signature status verification failed: {e}")
+            return {'success': False, 'error': f'Signature status verification error: {str(e)}'}
 
     def _decode_solana_error(self, error: dict) -> str:
         """🔍 ENHANCED: Decode common Solana error codes for better debugging."""
@@ -1035,7 +951,7 @@ class ModernTransactionExecutor:
             return f"Error decoding: {str(error)} (decode error: {e})"
 
     async def close(self):
-        """Close all HTTP clients."""
+        """Close all HTTP clients (the shared bundle tracker is closed on shutdown)."""
         if self.primary_client:
             await self.primary_client.aclose()
         if self.fallback_client:
@@ -1044,5 +960,7 @@ class ModernTransactionExecutor:
             await self.jito_client.aclose()
         if self.quicknode_client:  # 🔧 NEW: Close QuickNode client
             await self.quicknode_client.close()
+        if self.confirmation_tracker:
+            await self.confirmation_tracker.close()
 
         logger.info("✅ Modern transaction executor closed")
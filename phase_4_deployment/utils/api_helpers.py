@@ -5,12 +5,13 @@ API Helpers
 This module provides helper functions and classes for working with APIs.
 """
 
-import os
 import time
-import json
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Union, Callable, TypeVar
+from typing import Dict, List, Optional, Union, Callable, TypeVar
+
+# Bounded LRU+TTL cache with a single-file disk tier
+from .ttl_cache import APICache  # noqa: F401 - re-exported for existing importers
 
 # Configure logging
 logging.basicConfig(
@@ -101,143 +102,6 @@ class CircuitBreaker:
             # Re-raise the exception
             raise
 
-class APICache:
-    """
-    Cache for API responses.
-    
-    This class provides a simple cache for API responses to reduce the number
-    of API calls and improve performance.
-    """
-    
-    def __init__(self, cache_dir: str = None, default_ttl: int = 3600):
-        """
-        Initialize the APICache.
-        
-        Args:
-            cache_dir: Directory to store cache files
-            default_ttl: Default time-to-live in seconds
-        """
-        if cache_dir is None:
-            cache_dir = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                'cache'
-            )
-        
-        self.cache_dir = cache_dir
-        self.default_ttl = default_ttl
-        self.memory_cache = {}
-        self.cache_expiry = {}
-        
-        # Create cache directory if it doesn't exist
-        os.makedirs(cache_dir, exist_ok=True)
-        logger.info(f"Initialized APICache with directory: {cache_dir}")
-    
-    def get(self, key: str) -> Optional[Any]:
-        """
-        Get a value from the cache.
-        
-        Args:
-            key: Cache key
-            
-        Returns:
-            Cached value or None if not found or expired
-        """
-        # Check memory cache first
-        if key in self.memory_cache:
-            # Check if expired
-            if key in self.cache_expiry and self.cache_expiry[key] > time.time():
-                return self.memory_cache[key]
-            else:
-                # Expired, remove from memory cache
-                del self.memory_cache[key]
-                if key in self.cache_expiry:
-                    del self.cache_expiry[key]
-        
-        # Check file cache
-        cache_file = os.path.join(self.cache_dir, f"{key}.json")
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                
-                # Check if expired
-                if 'expiry' in cache_data and cache_data['expiry'] > time.time():
-                    # Add to memory cache
-                    self.memory_cache[key] = cache_data['value']
-                    self.cache_expiry[key] = cache_data['expiry']
-                    return cache_data['value']
-                else:
-                    # Expired, remove file
-                    os.remove(cache_file)
-            except Exception as e:
-                logger.warning(f"Error reading cache file {cache_file}: {str(e)}")
-        
-        return None
-    
-    def set(self, key: str, value: Any, ttl: int = None) -> None:
-        """
-        Set a value in the cache.
-        
-        Args:
-            key: Cache key
-            value: Value to cache
-            ttl: Time-to-live in seconds (default: use default_ttl)
-        """
-        if ttl is None:
-            ttl = self.default_ttl
-        
-        expiry = time.time() + ttl
-        
-        # Add to memory cache
-        self.memory_cache[key] = value
-        self.cache_expiry[key] = expiry
-        
-        # Add to file cache
-        cache_file = os.path.join(self.cache_dir, f"{key}.json")
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump({
-                    'value': value,
-                    'expiry': expiry
-                }, f)
-        except Exception as e:
-            logger.warning(f"Error writing cache file {cache_file}: {str(e)}")
-    
-    def invalidate(self, key: str) -> None:
-        """
-        Invalidate a cache entry.
-        
-        Args:
-            key: Cache key
-        """
-        # Remove from memory cache
-        if key in self.memory_cache:
-            del self.memory_cache[key]
-        if key in self.cache_expiry:
-            del self.cache_expiry[key]
-        
-        # Remove from file cache
-        cache_file = os.path.join(self.cache_dir, f"{key}.json")
-        if os.path.exists(cache_file):
-            try:
-                os.remove(cache_file)
-            except Exception as e:
-                logger.warning(f"Error removing cache file {cache_file}: {str(e)}")
-    
-    def clear(self) -> None:
-        """Clear the entire cache."""
-        # Clear memory cache
-        self.memory_cache = {}
-        self.cache_expiry = {}
-        
-        # Clear file cache
-        for filename in os.listdir(self.cache_dir):
-            if filename.endswith('.json'):
-                try:
-                    os.remove(os.path.join(self.cache_dir, filename))
-                except Exception as e:
-                    logger.warning(f"Error removing cache file {filename}: {str(e)}")
-
 async def retry_with_backoff(func: Callable[..., T], *args, max_retries: int = 3, base_delay: float = 1.0, **kwargs) -> Optional[T]:
     """
     Retry a function with exponential backoff.
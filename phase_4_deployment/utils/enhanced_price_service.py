@@ -9,11 +9,13 @@ import asyncio
 import httpx
 import os
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+SOL_MINT = "So11111111111111111111111111111111111111112"
+
 class EnhancedPriceService:
     """🔧 PHASE 2: Enhanced price service with QuickNode, Jupiter, and CoinGecko integration."""
 
@@ -34,6 +36,33 @@ class EnhancedPriceService:
         # Cache configuration
         self.cache_duration = int(os.getenv('QUICKNODE_PRICE_CACHE', '30'))
         self.price_cache = {}
+
+        # Stale-while-revalidate: refresh in the background this many seconds
+        # before expiry, and keep serving an expired price for up to
+        # max_stale_age seconds while the refresh runs
+        self.refresh_ahead = float(os.getenv('PRICE_REFRESH_AHEAD', str(self.cache_duration * 0.2)))
+        self.max_stale_age = float(os.getenv('PRICE_MAX_STALE_AGE', '300'))
+
+        # Tighter staleness bound for callers that size or price trades
+        self.trading_max_stale_age = float(os.getenv('PRICE_TRADING_MAX_STALE_AGE', '30'))
+
+        # Hedged source racing: start the next source if the current ones
+        # haven't answered within this delay (0 races all sources at once)
+        self.hedge_delay = float(os.getenv('PRICE_HEDGE_DELAY_MS', '250')) / 1000
+
+        # One in-flight fetch per token, shared by all waiters
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # Counters
+        self.cache_stats = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'background_refreshes': 0,
+            'fallbacks': 0
+        }
+        self.source_stats: Dict[str, Dict[str, float]] = {}
         
         # HTTP client
         self.http_client = httpx.AsyncClient(
@@ -43,7 +72,7 @@ class EnhancedPriceService:
         
         # Fallback prices
         self.fallback_prices = {
-            "So11111111111111111111111111111111111111112": {  # SOL
+            SOL_MINT: {  # SOL
                 "value": 180.0,
                 "symbol": "SOL",
                 "last_updated": datetime.now().isoformat()
@@ -64,6 +93,9 @@ class EnhancedPriceService:
 
     async def close(self):
         """Close the HTTP client."""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()
         await self.http_client.aclose()
 
     def _is_cache_valid(self, token_address: str) -> bool:
@@ -83,50 +115,196 @@ class EnhancedPriceService:
             'timestamp': time.time()
         }
 
-    async def get_token_price(self, token_address: str) -> Optional[Dict[str, Any]]:
+    def _cache_age(self, token_address: str) -> Optional[float]:
+        """Age in seconds of the cached price, or None if not cached."""
+        cache_entry = self.price_cache.get(token_address)
+        if cache_entry is None:
+            return None
+        return time.time() - cache_entry.get('timestamp', 0)
+
+    async def get_token_price(self, token_address: str,
+                              max_stale_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
-        🔧 PHASE 2: Get token price from multiple sources with priority:
-        1. Cache (if valid)
-        2. QuickNode Price Feeds
-        3. Jupiter Quote API
-        4. CoinGecko
-        5. Fallback prices
+        🔧 PHASE 2: Get token price with:
+        1. Cache (if valid) - refreshed in the background shortly before expiry
+        2. Stale cache (up to max_stale_age) while a background refresh runs,
+           marked with 'stale': True and its 'age_seconds'
+        3. A single in-flight fetch per token, racing QuickNode, Jupiter and
+           CoinGecko with hedged starts
+        4. Fallback prices
+
+        Args:
+            token_address: Token mint address
+            max_stale_age: Seconds past expiry a cached price may be served
+                (defaults to max_stale_age; trading callers pass
+                trading_max_stale_age)
         """
+        if max_stale_age is None:
+            max_stale_age = self.max_stale_age
+
         try:
-            # Check cache first
-            if self._is_cache_valid(token_address):
+            age = self._cache_age(token_address)
+
+            if age is not None and age < max_stale_age + self.cache_duration:
                 cached = self.price_cache[token_address]
-                logger.info(f"🔧 Using cached price for {token_address} from {cached['source']}")
-                return cached['data']
-
-            # Try QuickNode Price Feeds first
-            if self.quicknode_enabled and self.quicknode_api_key:
-                price_data = await self._get_quicknode_price(token_address)
-                if price_data:
-                    self._cache_price(token_address, price_data, 'quicknode')
-                    return price_data
-
-            # Fallback to Jupiter Quote API
-            if self.jupiter_fallback:
-                price_data = await self._get_jupiter_price(token_address)
-                if price_data:
-                    self._cache_price(token_address, price_data, 'jupiter')
-                    return price_data
-
-            # Fallback to CoinGecko (for SOL only)
-            if self.coingecko_fallback and token_address == "So11111111111111111111111111111111111111112":
-                price_data = await self._get_coingecko_price()
-                if price_data:
-                    self._cache_price(token_address, price_data, 'coingecko')
-                    return price_data
+                if age < self.cache_duration:
+                    self.cache_stats['hits'] += 1
+                    if age >= self.cache_duration - self.refresh_ahead:
+                        self._refresh_in_background(token_address)
+                    return cached['data']
+
+                self.cache_stats['stale_hits'] += 1
+                self._refresh_in_background(token_address)
+                logger.debug(f"🔧 Serving stale price for {token_address} ({age:.0f}s old) while refreshing")
+                return {**cached['data'], 'stale': True, 'age_seconds': round(age, 1)}
+
+            self.cache_stats['misses'] += 1
+            task = self._inflight.get(token_address)
+            if task is not None:
+                self.cache_stats['coalesced'] += 1
+            else:
+                task = self._start_fetch(token_address)
+
+            # Shield so a cancelled waiter doesn't cancel the fetch for the others
+            price_data = await asyncio.shield(task)
+            if price_data:
+                return price_data
 
             # Final fallback to hardcoded prices
+            self.cache_stats['fallbacks'] += 1
             return self._get_fallback_price(token_address)
 
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"❌ Error getting price for {token_address}: {e}")
             return self._get_fallback_price(token_address)
 
+    def _start_fetch(self, token_address: str) -> asyncio.Task:
+        """Start the single in-flight fetch for a token."""
+        task = asyncio.ensure_future(self._fetch_and_cache(token_address))
+        self._inflight[token_address] = task
+        return task
+
+    def _refresh_in_background(self, token_address: str):
+        """Refresh a cached price unless a fetch is already in flight."""
+        if token_address not in self._inflight:
+            self.cache_stats['background_refreshes'] += 1
+            self._start_fetch(token_address)
+
+    async def _fetch_and_cache(self, token_address: str) -> Optional[Dict[str, Any]]:
+        """Fetch from the hedged sources and cache the winner."""
+        try:
+            source, price_data = await self._fetch_hedged(token_address)
+            if price_data:
+                self._cache_price(token_address, price_data, source)
+            return price_data
+        except Exception as e:
+            logger.error(f"❌ Error fetching price for {token_address}: {e}")
+            return None
+        finally:
+            self._inflight.pop(token_address, None)
+
+    def _price_sources(self, token_address: str) -> List[Tuple[str, Callable[[], Awaitable[Optional[Dict[str, Any]]]]]]:
+        """Enabled price sources for a token, in priority order."""
+        sources = []
+        if self.quicknode_enabled and self.quicknode_api_key:
+            sources.append(('quicknode', lambda: self._get_quicknode_price(token_address)))
+        if self.jupiter_fallback:
+            sources.append(('jupiter', lambda: self._get_jupiter_price(token_address)))
+        if self.coingecko_fallback and token_address == SOL_MINT:
+            sources.append(('coingecko', self._get_coingecko_price))
+        return sources
+
+    async def _timed_fetch(self, source: str, fetch: Callable[[], Awaitable[Optional[Dict[str, Any]]]]) -> Optional[Dict[str, Any]]:
+        """Run one source fetch and record its latency and outcome."""
+        stats = self.source_stats.setdefault(source, {
+            'requests': 0, 'successes': 0, 'failures': 0, 'wins': 0, 'cancelled': 0,
+            'total_latency_ms': 0.0
+        })
+        stats['requests'] += 1
+        start_time = time.perf_counter()
+        try:
+            price_data = await fetch()
+        except asyncio.CancelledError:
+            stats['cancelled'] += 1
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️ {source} price fetch error: {e}")
+            price_data = None
+
+        stats['total_latency_ms'] += (time.perf_counter() - start_time) * 1000
+        stats['successes' if price_data else 'failures'] += 1
+        return price_data
+
+    async def _fetch_hedged(self, token_address: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Race the price sources, starting them in priority order.
+
+        The next source starts when the running ones haven't answered within
+        hedge_delay or all of them have failed. The first successful answer
+        wins (ties go to the higher-priority source) and the rest are cancelled.
+        """
+        remaining = self._price_sources(token_address)
+        priority = {name: i for i, (name, _) in enumerate(remaining)}
+        running: Dict[asyncio.Task, str] = {}
+
+        def launch():
+            name, fetch = remaining.pop(0)
+            running[asyncio.ensure_future(self._timed_fetch(name, fetch))] = name
+
+        try:
+            while remaining or running:
+                if not running:
+                    launch()
+
+                done, _ = await asyncio.wait(
+                    set(running),
+                    timeout=self.hedge_delay if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Hedge: current sources are slow, start the next one too
+                    launch()
+                    continue
+
+                for task in sorted(done, key=lambda t: priority[running[t]]):
+                    source = running.pop(task)
+                    price_data = task.result()
+                    if price_data:
+                        self.source_stats[source]['wins'] += 1
+                        return source, price_data
+
+                if remaining:
+                    launch()
+
+            return None, None
+
+        finally:
+            for task in running:
+                task.cancel()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit-rate and per-source latency counters."""
+        lookups = self.cache_stats['hits'] + self.cache_stats['stale_hits'] + self.cache_stats['misses']
+        sources = {}
+        for source, stats in self.source_stats.items():
+            completed = stats['successes'] + stats['failures']
+            sources[source] = {
+                **stats,
+                'avg_latency_ms': stats['total_latency_ms'] / completed if completed else 0.0,
+                'success_rate': stats['successes'] / completed if completed else 0.0,
+                'win_rate': stats['wins'] / stats['requests'] if stats['requests'] else 0.0
+            }
+
+        return {
+            **self.cache_stats,
+            'hit_rate': (self.cache_stats['hits'] + self.cache_stats['stale_hits']) / lookups if lookups else 0.0,
+            'cached_tokens': len(self.price_cache),
+            'inflight': len(self._inflight),
+            'sources': sources
+        }
+
     async def _get_quicknode_price(self, token_address: str) -> Optional[Dict[str, Any]]:
         """🔧 PHASE 2: Get price from QuickNode Price Feeds."""
         try:
@@ -171,7 +349,7 @@ class EnhancedPriceService:
                 params={
                     "inputMint": token_address,
                     "outputMint": usdc_address,
-                    "amount": 1000000000 if token_address == "So11111111111111111111111111111111111111112" else 1000000,  # 1 SOL or 1 token
+                    "amount": 1000000000 if token_address == SOL_MINT else 1000000,  # 1 SOL or 1 token
                     "slippageBps": 50
                 }
             )
@@ -184,7 +362,7 @@ class EnhancedPriceService:
                     out_amount = float(data['outAmount'])
                     
                     # Adjust for decimals
-                    if token_address == "So11111111111111111111111111111111111111112":  # SOL
+                    if token_address == SOL_MINT:  # SOL
                         price = (out_amount / 1000000) / (in_amount / 1000000000)  # USDC has 6 decimals, SOL has 9
                     else:
                         price = (out_amount / 1000000) / (in_amount / 1000000)  # Both 6 decimals
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Clients
+
+This module provides the process-wide registry of long-lived httpx clients
+used by the API managers, price services and notifiers: one keep-alive
+connection pool per host (HTTP/2 when h2 is installed), tuned connection
+limits, per-host pool metrics and a single close at shutdown.
+"""
+
+import os
+import time
+import asyncio
+import logging
+from typing import Dict, Any, Optional, Tuple
+
+import httpx
+
+# HTTP/2 needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Configure logging
+logger = logging.getLogger("http_clients")
+
+# Connection pool defaults (per host), overridable via environment
+DEFAULT_MAX_CONNECTIONS = int(os.getenv('HTTP_MAX_CONNECTIONS', '100'))
+DEFAULT_MAX_KEEPALIVE = int(os.getenv('HTTP_MAX_KEEPALIVE_CONNECTIONS', '20'))
+DEFAULT_KEEPALIVE_EXPIRY = float(os.getenv('HTTP_KEEPALIVE_EXPIRY', '30.0'))
+DEFAULT_TIMEOUT = float(os.getenv('HTTP_TIMEOUT', '30.0'))
+DEFAULT_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', '10.0'))
+
+# httpcore trace events marking that a request has got a connection
+_CONNECTION_ACQUIRED_EVENTS = (
+    'connection.connect_tcp.started',
+    'http11.send_request_headers.started',
+    'http2.send_request_headers.started',
+)
+
+
+def host_key(url: str) -> str:
+    """Registry key for a URL: scheme://host[:port]."""
+    parsed = httpx.URL(url)
+    key = f"{parsed.scheme}://{parsed.host}"
+    if parsed.port is not None:
+        key += f":{parsed.port}"
+    return key
+
+
+class _HostPool:
+    """A shared client for one host plus its request/wait counters."""
+
+    def __init__(self, key: str, client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]):
+        self.key = key
+        self.client = client
+        self.loop = loop
+        self.stats = {
+            'requests': 0,
+            'connections_opened': 0,
+            'wait_time_total_ms': 0.0,
+            'wait_time_max_ms': 0.0,
+            'waits_measured': 0
+        }
+
+    def record_wait(self, wait_ms: float) -> None:
+        self.stats['waits_measured'] += 1
+        self.stats['wait_time_total_ms'] += wait_ms
+        if wait_ms > self.stats['wait_time_max_ms']:
+            self.stats['wait_time_max_ms'] = wait_ms
+
+    def connection_counts(self) -> Tuple[int, int, int]:
+        """(active connections, idle connections, queued requests) in the pool."""
+        try:
+            pool = self.client._transport._pool
+            connections = pool.connections
+            queued = sum(1 for request in pool._requests if request.is_queued())
+        except AttributeError:
+            return 0, 0, 0
+        idle = sum(1 for connection in connections if connection.is_idle())
+        return len(connections) - idle, idle, queued
+
+    def get_metrics(self) -> Dict[str, Any]:
+        active, idle, queued = self.connection_counts()
+        waits = self.stats['waits_measured']
+        return {
+            'host': self.key,
+            'active_connections': active,
+            'idle_connections': idle,
+            'queued_requests': queued,
+            'avg_wait_time_ms': self.stats['wait_time_total_ms'] / waits if waits else 0.0,
+            'closed': self.client.is_closed,
+            **self.stats
+        }
+
+
+class HTTPClientRegistry:
+    """
+    Process-wide httpx clients keyed by host.
+
+    - one AsyncClient (and so one keep-alive pool) per scheme://host:port
+    - clients are tied to the event loop that created them; a different
+      running loop gets a fresh client instead of a pool bound to a dead loop
+    - pool wait time is measured from the request until httpcore starts
+      connecting or sending on a connection
+    """
+
+    def __init__(self,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE,
+                 keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 http2: bool = True):
+        """
+        Initialize the registry.
+
+        Args:
+            max_connections: Maximum connections per host
+            max_keepalive_connections: Idle connections kept open per host
+            keepalive_expiry: Seconds an idle connection is kept open
+            timeout: Default request timeout in seconds
+            connect_timeout: Default connect timeout in seconds
+            http2: Negotiate HTTP/2 when h2 is installed
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.pools: Dict[str, _HostPool] = {}
+
+    def _create_pool(self, key: str, loop: Optional[asyncio.AbstractEventLoop]) -> _HostPool:
+        pool = None
+
+        async def on_request(request: httpx.Request):
+            pool.stats['requests'] += 1
+            if 'trace' in request.extensions:
+                return
+
+            started = time.monotonic()
+            acquired = False
+
+            async def trace(event_name: str, info: Dict[str, Any]):
+                nonlocal acquired
+                if event_name == 'connection.connect_tcp.complete':
+                    pool.stats['connections_opened'] += 1
+                if not acquired and event_name in _CONNECTION_ACQUIRED_EVENTS:
+                    acquired = True
+                    pool.record_wait((time.monotonic() - started) * 1000)
+
+            request.extensions['trace'] = trace
+
+        client = httpx.AsyncClient(
+            limits=self.limits,
+            timeout=self.timeout,
+            http2=self.http2,
+            event_hooks={'request': [on_request]}
+        )
+        pool = _HostPool(key, client, loop)
+        logger.debug(f"Created shared HTTP client for {key} (http2={self.http2})")
+        return pool
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """Get the shared client for a URL's host, creating it on first use."""
+        key = host_key(url)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        pool = self.pools.get(key)
+        if pool is None or pool.client.is_closed or (loop is not None and pool.loop not in (None, loop)):
+            pool = self._create_pool(key, loop)
+            self.pools[key] = pool
+        elif pool.loop is None and loop is not None:
+            pool.loop = loop
+        return pool.client
+
+    async def aclose(self) -> None:
+        """
+        Close every shared client.
+
+        Clients of the running loop are closed directly and clients of another
+        running loop are closed on that loop. Clients whose loop is closed are
+        dropped (their connections died with it); clients of a loop that is
+        alive but not running stay registered so they can be closed from it.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        for key, pool in list(self.pools.items()):
+            try:
+                if pool.client.is_closed or (pool.loop is not None and pool.loop.is_closed()):
+                    pass
+                elif pool.loop in (None, loop):
+                    await pool.client.aclose()
+                elif pool.loop.is_running():
+                    future = asyncio.run_coroutine_threadsafe(pool.client.aclose(), pool.loop)
+                    await asyncio.wrap_future(future)
+                else:
+                    logger.debug(f"Leaving HTTP client for {key} to its own event loop")
+                    continue
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client for {pool.key}: {e}")
+            del self.pools[key]
+
+    def get_pool_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get connection and wait-time metrics per host."""
+        return {key: pool.get_metrics() for key, pool in self.pools.items()}
+
+
+# Global registry instance
+_http_client_registry: Optional[HTTPClientRegistry] = None
+_shutdown_hook_registered = False
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """
+    Get the global HTTP client registry.
+
+    The first call registers close_http_clients() with the system shutdown
+    handler so pooled connections are closed on exit.
+    """
+    global _http_client_registry, _shutdown_hook_registered
+
+    if _http_client_registry is None:
+        _http_client_registry = HTTPClientRegistry()
+
+    if not _shutdown_hook_registered:
+        try:
+            from phase_4_deployment.core.shutdown_handler import register_async_shutdown_callback
+            register_async_shutdown_callback(close_http_clients)
+        except ImportError:
+            logger.debug("Shutdown handler not available; call close_http_clients() on exit")
+        _shutdown_hook_registered = True
+
+    return _http_client_registry
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """Get the shared long-lived client for a URL's host."""
+    return get_http_client_registry().get_client(url)
+
+async def close_http_clients() -> None:
+    """Close all shared HTTP clients (shutdown hook)."""
+    if _http_client_registry is not None:
+        await _http_client_registry.aclose()
+
+def get_http_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """Get per-host pool metrics for the shared HTTP clients."""
+    if _http_client_registry is None:
+        return {}
+    return _http_client_registry.get_pool_metrics()
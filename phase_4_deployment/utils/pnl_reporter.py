@@ -11,7 +11,6 @@ import sys
 import json
 import logging
 import asyncio
-import httpx
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 
@@ -27,6 +26,19 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
+# Project root for the shared core modules
+project_root = os.path.dirname(parent_dir)
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from core.execution.trade_journal import TradeJournalReader, trade_timestamp
+
+# Shared keep-alive HTTP clients
+try:
+    from phase_4_deployment.utils.http_clients import get_http_client
+except ImportError:
+    from utils.http_clients import get_http_client
+
 # Import trading alerts module
 try:
     from utils.trading_alerts import get_trading_alerts
@@ -46,7 +58,6 @@ class PnLReporter:
         """
         self.telegram_bot_token = telegram_bot_token
         self.telegram_chat_id = telegram_chat_id
-        self.http_client = httpx.AsyncClient(timeout=30.0)
 
         # Base directories
         self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -54,12 +65,20 @@ class PnLReporter:
         self.tx_history_dir = os.path.join(self.output_dir, "transactions")
         self.wallet_dir = os.path.join(self.output_dir, "wallet")
 
+        # Live trades are tailed from the trade journal; repeated reports
+        # only read trades appended since the previous one
+        self.trade_reader = TradeJournalReader(
+            os.path.join(os.path.dirname(self.base_dir), "output", "live_production", "trades"),
+            use_snapshot=False,
+            recent_limit=1
+        )
+        self.journal_transactions = []
+
         logger.info(f"Base directory: {self.base_dir}")
         logger.info(f"Output directory: {self.output_dir}")
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.http_client.aclose()
+        """Release resources (the shared HTTP client is closed at shutdown)."""
 
     async def send_telegram_message(self, message: str) -> bool:
         """
@@ -80,7 +99,7 @@ class PnLReporter:
         }
 
         try:
-            response = await self.http_client.post(url, json=payload)
+            response = await get_http_client(url).post(url, json=payload, timeout=30.0)
             response.raise_for_status()
             logger.info("Sent Telegram message")
             return True
@@ -95,24 +114,36 @@ class PnLReporter:
         Returns:
             List of transaction data
         """
-        transactions = []
+        # Live trades from the trade journal (only new ones are read)
+        resets = self.trade_reader.stats['resets']
+        new_trades = self.trade_reader.poll()
+        if self.trade_reader.stats['resets'] != resets:
+            self.journal_transactions = []
+        self.journal_transactions.extend(self.journal_record_to_transaction(trade) for trade in new_trades)
+        transactions = list(self.journal_transactions)
+        # Trades in the journal may also be in tx_history files; keep the journal copy
+        seen_signatures = {tx["signature"] for tx in transactions if tx.get("signature")}
 
         # Check if transaction history directory exists
         if not os.path.exists(self.tx_history_dir):
             logger.warning(f"Transaction history directory not found: {self.tx_history_dir}")
-            return transactions
-
-        # Load transaction history files
-        for filename in os.listdir(self.tx_history_dir):
-            if filename.endswith(".json") and "tx_history" in filename:
-                try:
-                    file_path = os.path.join(self.tx_history_dir, filename)
-                    with open(file_path, "r") as f:
-                        data = json.load(f)
-                        if "transactions" in data:
-                            transactions.extend(data["transactions"])
-                except Exception as e:
-                    logger.error(f"Error loading transaction history file {filename}: {str(e)}")
+        else:
+            # Load transaction history files
+            for filename in os.listdir(self.tx_history_dir):
+                if filename.endswith(".json") and "tx_history" in filename:
+                    try:
+                        file_path = os.path.join(self.tx_history_dir, filename)
+                        with open(file_path, "r") as f:
+                            data = json.load(f)
+                            for tx in data.get("transactions", []):
+                                signature = tx.get("signature")
+                                if signature and signature in seen_signatures:
+                                    continue
+                                if signature:
+                                    seen_signatures.add(signature)
+                                transactions.append(tx)
+                    except Exception as e:
+                        logger.error(f"Error loading transaction history file {filename}: {str(e)}")
 
         # Sort transactions by timestamp
         transactions.sort(key=lambda x: x.get("timestamp", 0))
@@ -120,6 +151,36 @@ class PnLReporter:
         logger.info(f"Loaded {len(transactions)} transactions")
         return transactions
 
+    @staticmethod
+    def journal_record_to_transaction(trade: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a trade journal record to the transaction history format.
+
+        Args:
+            trade: Trade journal record
+
+        Returns:
+            Transaction data
+        """
+        signal = trade.get("signal") or {}
+        result = trade.get("result") or {}
+        balance = trade.get("balance_validation") or {}
+        timestamp = trade_timestamp(trade)
+        transaction = {
+            "timestamp": timestamp.timestamp() if timestamp else 0,
+            "signature": result.get("signature"),
+            "status": "confirmed" if result.get("success", False) else "failed",
+            "type": "swap",
+            "action": signal.get("action", "unknown"),
+            "market": signal.get("market", "unknown"),
+            "price": signal.get("price", 0.0),
+            "size": signal.get("size", 0.0),
+            "fee": result.get("fee_sol", result.get("fee", 0.0)) or 0.0
+        }
+        if balance.get("balance_before") is not None:
+            transaction["pre_balance"] = balance["balance_before"]
+        return transaction
+
     def load_wallet_balance(self) -> Dict[str, Any]:
         """
         Load wallet balance from files.
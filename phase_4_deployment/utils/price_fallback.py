@@ -6,10 +6,11 @@ Provides fallback price data when primary APIs are down.
 
 import logging
 import asyncio
-import httpx
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from phase_4_deployment.utils.http_clients import get_http_client
+
 logger = logging.getLogger(__name__)
 
 class PriceFallbackService:
@@ -36,22 +37,23 @@ class PriceFallbackService:
     async def _update_prices_from_coingecko(self):
         """Try to get real-time prices from CoinGecko as fallback."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                # Get SOL price from CoinGecko
-                response = await client.get(
-                    "https://api.coingecko.com/api/v3/simple/price",
-                    params={
-                        "ids": "solana",
-                        "vs_currencies": "usd"
-                    }
-                )
+            # Get SOL price from CoinGecko
+            url = "https://api.coingecko.com/api/v3/simple/price"
+            response = await get_http_client(url).get(
+                url,
+                params={
+                    "ids": "solana",
+                    "vs_currencies": "usd"
+                },
+                timeout=10.0
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    if "solana" in data and "usd" in data["solana"]:
-                        sol_price = data["solana"]["usd"]
-                        self.fallback_prices["So11111111111111111111111111111111111111112"]["value"] = sol_price
-                        logger.info(f"✅ Updated SOL price from CoinGecko: ${sol_price}")
+            if response.status_code == 200:
+                data = response.json()
+                if "solana" in data and "usd" in data["solana"]:
+                    sol_price = data["solana"]["usd"]
+                    self.fallback_prices["So11111111111111111111111111111111111111112"]["value"] = sol_price
+                    logger.info(f"✅ Updated SOL price from CoinGecko: ${sol_price}")
 
         except Exception as e:
             logger.warning(f"Could not update prices from CoinGecko: {e}")
@@ -10,10 +10,15 @@ import os
 import json
 import logging
 import asyncio
-import httpx
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union
 
+# Shared keep-alive HTTP clients
+try:
+    from phase_4_deployment.utils.http_clients import get_http_client
+except ImportError:
+    from .http_clients import get_http_client
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -34,7 +39,6 @@ class TradingAlerts:
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
-        self.http_client = httpx.AsyncClient(timeout=30.0)
 
         # Initialize metrics storage
         self.metrics = {
@@ -58,8 +62,7 @@ class TradingAlerts:
         logger.info("Initialized trading alerts")
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.http_client.aclose()
+        """Release resources (the shared HTTP client is closed at shutdown)."""
 
     async def send_message(self, message: str) -> bool:
         """
@@ -80,7 +83,7 @@ class TradingAlerts:
         }
 
         try:
-            response = await self.http_client.post(url, json=payload)
+            response = await get_http_client(url).post(url, json=payload, timeout=30.0)
             response.raise_for_status()
             logger.info("Sent Telegram message")
             return True
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+LRU + TTL Cache
+
+This module provides the bounded cache shared by the API managers, API
+clients and filters: O(1) LRU eviction, per-entry TTL with proactive expiry,
+negative caching (e.g. for 404s), an optional single-file on-disk tier and
+hit/miss/eviction counters.
+"""
+
+import os
+import json
+import time
+import heapq
+import sqlite3
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, List
+
+# Configure logging
+logger = logging.getLogger("ttl_cache")
+
+# Stored in place of a value for keys known not to exist upstream
+_NEGATIVE = object()
+
+
+class LRUTTLCache:
+    """
+    Bounded LRU cache with per-entry TTL.
+
+    - get/set are O(1) (plus O(log n) to schedule expiry)
+    - entries past their TTL are removed proactively from an expiry heap,
+      not only when they are next read
+    - when full, the least recently used entry is evicted
+    - set_negative() remembers that a key has no value for a while, so
+      callers can skip upstream requests that are known to 404
+    - with disk_path, entries are written through to a single SQLite file
+      and memory misses are served from it (surviving restarts)
+    """
+
+    def __init__(self, max_size: int = 1000, default_ttl: float = 60.0,
+                 disk_path: Optional[str] = None, name: str = "cache"):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of in-memory entries
+            default_ttl: Default time-to-live in seconds
+            disk_path: Optional SQLite file for the on-disk tier
+            name: Name used in logs and statistics
+        """
+        self.name = name
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+
+        # key -> (value, expires_at)
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        # (expires_at, key); stale items are skipped when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'negative_hits': 0,
+            'sets': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'disk_hits': 0,
+            'disk_writes': 0,
+            'disk_errors': 0
+        }
+
+        self.disk_path = disk_path
+        self._db: Optional[sqlite3.Connection] = None
+        if disk_path:
+            self._open_disk(disk_path)
+
+    # Disk tier
+
+    def _open_disk(self, disk_path: str) -> None:
+        """Open (or create) the on-disk tier and drop expired rows."""
+        try:
+            directory = os.path.dirname(disk_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(disk_path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT, negative INTEGER, expires_at REAL)"
+            )
+            self._db.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        except Exception as e:
+            logger.warning(f"Disk tier for {self.name} cache unavailable ({disk_path}): {e}")
+            self._db = None
+
+    def _disk_get(self, key: str) -> Optional[Tuple[Any, float]]:
+        try:
+            row = self._db.execute(
+                "SELECT value, negative, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        except Exception as e:
+            self.stats['disk_errors'] += 1
+            logger.warning(f"Error reading {self.name} cache entry {key}: {e}")
+            return None
+
+        if row is None:
+            return None
+        value, negative, expires_at = row
+        if expires_at <= time.time():
+            self._disk_delete(key)
+            return None
+        return (_NEGATIVE if negative else json.loads(value)), expires_at
+
+    def _disk_set(self, key: str, value: Any, expires_at: float) -> None:
+        try:
+            negative = value is _NEGATIVE
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache (key, value, negative, expires_at) VALUES (?, ?, ?, ?)",
+                (key, None if negative else json.dumps(value), int(negative), expires_at)
+            )
+            self.stats['disk_writes'] += 1
+        except Exception as e:
+            # Values that aren't JSON-serializable stay memory-only
+            self.stats['disk_errors'] += 1
+            logger.debug(f"Not writing {self.name} cache entry {key} to disk: {e}")
+
+    def _disk_delete(self, key: str) -> None:
+        try:
+            self._db.execute("DELETE FROM cache WHERE key = ?", (key,))
+        except Exception as e:
+            self.stats['disk_errors'] += 1
+            logger.warning(f"Error deleting {self.name} cache entry {key}: {e}")
+
+    # Memory tier
+
+    def _expire(self, now: float) -> None:
+        """Remove entries whose TTL has passed."""
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == expires_at:
+                del self._entries[key]
+                self.stats['expirations'] += 1
+
+        # Overwritten keys leave stale heap items behind; compact occasionally
+        if len(heap) > 2 * len(self._entries) + 64:
+            self._expiry_heap = [(expires_at, key) for key, (_, expires_at) in self._entries.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _store(self, key: str, value: Any, expires_at: float) -> None:
+        """Insert into the memory tier, evicting the LRU entry if full."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self._entries[key] = (value, expires_at)
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a key.
+
+        Returns:
+            (hit, value) - a negative entry is a hit with value None
+        """
+        now = time.time()
+        self._expire(now)
+
+        entry = self._entries.get(key)
+        if entry is None and self._db is not None:
+            entry = self._disk_get(key)
+            if entry is not None:
+                self.stats['disk_hits'] += 1
+                self._store(key, entry[0], entry[1])
+
+        if entry is None:
+            self.stats['misses'] += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        value = entry[0]
+        if value is _NEGATIVE:
+            self.stats['negative_hits'] += 1
+            return True, None
+
+        self.stats['hits'] += 1
+        return True, value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a cached value (default on a miss or negative entry)."""
+        hit, value = self.lookup(key)
+        return value if hit and value is not None else default
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache a value for ttl seconds (default_ttl if not given)."""
+        now = time.time()
+        self._expire(now)
+
+        expires_at = now + (self.default_ttl if ttl is None else ttl)
+        self._store(key, value, expires_at)
+        self.stats['sets'] += 1
+
+        if self._db is not None:
+            self._disk_set(key, value, expires_at)
+
+    def set_negative(self, key: str, ttl: Optional[float] = None) -> None:
+        """Remember that a key has no value (e.g. the upstream returned 404)."""
+        self.set(key, _NEGATIVE, ttl)
+
+    def invalidate(self, key: str) -> None:
+        """Remove an entry."""
+        self._entries.pop(key, None)
+        if self._db is not None:
+            self._disk_delete(key)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._expiry_heap = []
+        if self._db is not None:
+            try:
+                self._db.execute("DELETE FROM cache")
+            except Exception as e:
+                self.stats['disk_errors'] += 1
+                logger.warning(f"Error clearing {self.name} disk cache: {e}")
+
+    def __len__(self) -> int:
+        self._expire(time.time())
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[1] > time.time()
+
+    def close(self) -> None:
+        """Close the on-disk tier."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters and hit rate."""
+        lookups = self.stats['hits'] + self.stats['negative_hits'] + self.stats['misses']
+        return {
+            'name': self.name,
+            'size': len(self),
+            'max_size': self.max_size,
+            'disk_path': self.disk_path if self._db is not None else None,
+            'hit_rate': (self.stats['hits'] + self.stats['negative_hits']) / lookups if lookups else 0.0,
+            **self.stats
+        }
+
+
+class APICache(LRUTTLCache):
+    """
+    API response cache with the previous APICache interface.
+
+    Entries are kept in a bounded LRU+TTL memory tier backed by a single
+    SQLite file in cache_dir (instead of one JSON file per key).
+    """
+
+    def __init__(self, cache_dir: str = None, default_ttl: int = 3600, max_size: int = 1000):
+        """
+        Initialize the APICache.
+
+        Args:
+            cache_dir: Directory for the cache file
+            default_ttl: Default time-to-live in seconds
+            max_size: Maximum number of in-memory entries
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(
+                os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                'cache'
+            )
+
+        self.cache_dir = cache_dir
+        super().__init__(max_size=max_size, default_ttl=default_ttl,
+                         disk_path=os.path.join(cache_dir, 'api_cache.sqlite'), name='api_cache')
+        logger.info(f"Initialized APICache with directory: {cache_dir}")
+
+
+# Shared caches by name
+_shared_caches: Dict[str, LRUTTLCache] = {}
+
+def get_shared_cache(name: str = "api", max_size: int = 5000, default_ttl: float = 60.0,
+                     disk_path: Optional[str] = None) -> LRUTTLCache:
+    """
+    Get a process-wide cache by name, creating it on first use.
+
+    Sizing arguments only apply when the cache is created; the disk tier
+    for a name can also be set with <NAME>_CACHE_DISK_PATH (e.g.
+    API_CACHE_DISK_PATH).
+    """
+    if name not in _shared_caches:
+        disk_path = disk_path or os.environ.get(f"{name.upper()}_CACHE_DISK_PATH")
+        _shared_caches[name] = LRUTTLCache(max_size=max_size, default_ttl=default_ttl,
+                                           disk_path=disk_path, name=name)
+    return _shared_caches[name]
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Get statistics for all shared caches."""
+    return {name: cache.get_stats() for name, cache in _shared_caches.items()}
@@ -6,6 +6,7 @@ Estimates % increase in ROI with given recommendations and focuses entirely on p
 """
 
 import os
+import sys
 import json
 import glob
 import pandas as pd
@@ -19,6 +20,12 @@ import argparse
 import asyncio
 import httpx
 
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from core.execution.trade_journal import TradeJournalReader
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -63,6 +70,10 @@ class LiveMetricsProfitabilityAnalyzer:
         self.trades_dir = self.live_production_dir / "trades"
         self.opportunities_dir = self.live_production_dir / "opportunistic_trades"
 
+        # Trades are tailed from the journal, so repeated loads only read new trades
+        self.trade_reader = TradeJournalReader(str(self.trades_dir), use_snapshot=False, recent_limit=1)
+        self.trades: List[Dict[str, Any]] = []
+
         # Current session data
         self.session_start_balance = 3.100263  # SOL - from our session start
         self.current_balance = 3.096893  # SOL - from real_balance.json
@@ -97,24 +108,19 @@ class LiveMetricsProfitabilityAnalyzer:
 
     def load_live_trades(self) -> List[Dict[str, Any]]:
         """Load all live trading data"""
-        trades = []
-
         if not self.trades_dir.exists():
             logger.warning(f"Trades directory not found: {self.trades_dir}")
-            return trades
+            return self.trades
 
-        trade_files = sorted(glob.glob(str(self.trades_dir / "trade_*.json")))
-
-        for trade_file in trade_files:
-            try:
-                with open(trade_file, 'r') as f:
-                    trade_data = json.load(f)
-                    trades.append(trade_data)
-            except Exception as e:
-                logger.warning(f"Failed to load trade file {trade_file}: {e}")
+        resets = self.trade_reader.stats['resets']
+        new_trades = self.trade_reader.poll()
+        if self.trade_reader.stats['resets'] != resets:
+            # Journal was replaced - start over from its beginning
+            self.trades = []
+        self.trades.extend(new_trades)
 
-        logger.info(f"Loaded {len(trades)} live trades")
-        return trades
+        logger.info(f"Loaded {len(self.trades)} live trades ({len(new_trades)} new)")
+        return self.trades
 
     def load_opportunities(self) -> List[Dict[str, Any]]:
         """Load opportunistic trading opportunities"""
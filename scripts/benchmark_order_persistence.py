@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Order Persistence Benchmark
+
+Compares order-update throughput of the previous persistence path (a new
+aiosqlite connection and commit per row) against the shared batched WAL
+writer now used by OrderManager and ExecutionMetrics.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import aiosqlite
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from core.execution.order_manager import OrderManager, Order, OrderStatus, OrderPriority
+from core.execution.persistence import close_all_writers
+
+# Configure logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+UPDATE_SQL = '''
+    INSERT OR REPLACE INTO orders (
+        order_id, signal, status, priority, created_at, updated_at,
+        execution_attempts, max_attempts, error_message, transaction_result,
+        execution_time, estimated_value, actual_value, fees_paid, slippage
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Lifecycle each order goes through on the execution path
+ORDER_LIFECYCLE = [OrderStatus.PENDING, OrderStatus.EXECUTING, OrderStatus.COMPLETED]
+
+
+def make_order(index: int) -> Order:
+    """Create a representative order."""
+    now = datetime.now()
+    return Order(
+        order_id=f"bench_{index}",
+        signal={'action': 'BUY', 'market': 'SOL-USDC', 'size': 0.1, 'price': 150.0},
+        status=OrderStatus.PENDING,
+        priority=OrderPriority.NORMAL,
+        created_at=now,
+        updated_at=now,
+        estimated_value=15.0
+    )
+
+
+def order_params(order: Order) -> tuple:
+    """Row parameters for an order, as written by OrderManager."""
+    return (
+        order.order_id, json.dumps(order.signal), order.status.value, order.priority.value,
+        order.created_at.isoformat(), order.updated_at.isoformat(), order.execution_attempts,
+        order.max_attempts, order.error_message, None, order.execution_time,
+        order.estimated_value, order.actual_value, order.fees_paid, order.slippage
+    )
+
+
+async def benchmark_per_row_commit(db_path: str, num_orders: int) -> float:
+    """Previous behaviour: connect and commit for every order update."""
+    manager = OrderManager({'db_path': db_path})
+    await manager.initialize()
+    await close_all_writers()
+
+    start_time = time.perf_counter()
+    for i in range(num_orders):
+        order = make_order(i)
+        for status in ORDER_LIFECYCLE:
+            order.status = status
+            order.updated_at = datetime.now()
+            async with aiosqlite.connect(db_path) as db:
+                await db.execute(UPDATE_SQL, order_params(order))
+                await db.commit()
+    return time.perf_counter() - start_time
+
+
+async def benchmark_batched_writer(db_path: str, num_orders: int, batch_size: int, flush_interval_ms: int) -> float:
+    """Current behaviour: OrderManager queues rows on the shared WAL writer."""
+    manager = OrderManager({
+        'db_path': db_path,
+        'db_batch_size': batch_size,
+        'db_flush_interval_ms': flush_interval_ms
+    })
+    await manager.initialize()
+
+    start_time = time.perf_counter()
+    for i in range(num_orders):
+        order = make_order(i)
+        await manager.register_order(order)
+        for status in ORDER_LIFECYCLE[1:]:
+            order.status = status
+            await manager.update_order(order)
+            # Yield like the engine does between lifecycle steps
+            await asyncio.sleep(0)
+    await manager.flush()
+    elapsed = time.perf_counter() - start_time
+
+    stats = manager.writer.get_stats()
+    print(f"   writer: {stats['rows_enqueued']} rows enqueued, {stats['rows_coalesced']} coalesced, "
+          f"{stats['rows_written']} written in {stats['flushes']} flushes")
+    await close_all_writers()
+    return elapsed
+
+
+async def count_rows(db_path: str) -> int:
+    """Count persisted orders."""
+    async with aiosqlite.connect(db_path) as db:
+        async with db.execute('SELECT COUNT(*) FROM orders') as cursor:
+            return (await cursor.fetchone())[0]
+
+
+async def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark order persistence throughput")
+    parser.add_argument('--orders', type=int, default=1000, help="Number of orders to push through the lifecycle")
+    parser.add_argument('--batch-size', type=int, default=100, help="Batched writer flush size")
+    parser.add_argument('--flush-interval-ms', type=int, default=250, help="Batched writer flush interval")
+    args = parser.parse_args()
+
+    updates = args.orders * len(ORDER_LIFECYCLE)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        before_db = str(Path(tmp_dir) / "orders_before.db")
+        after_db = str(Path(tmp_dir) / "orders_after.db")
+
+        print("=" * 60)
+        print(f"📊 ORDER PERSISTENCE BENCHMARK ({args.orders} orders, {updates} updates)")
+        print("=" * 60)
+
+        before = await benchmark_per_row_commit(before_db, args.orders)
+        print(f"🐢 Per-row connect + commit: {before:.3f}s ({updates / before:,.0f} updates/s)")
+
+        after = await benchmark_batched_writer(after_db, args.orders, args.batch_size, args.flush_interval_ms)
+        print(f"🚀 Batched WAL writer:       {after:.3f}s ({updates / after:,.0f} updates/s)")
+
+        print(f"⚡ Speedup: {before / after:.1f}x")
+        print(f"✅ Rows persisted: before={await count_rows(before_db)} after={await count_rows(after_db)}")
+        print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
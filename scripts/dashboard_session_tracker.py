@@ -7,12 +7,18 @@ to ensure the Streamlit dashboard reflects the current session metrics.
 """
 
 import os
+import sys
 import json
-import glob
 import requests
 from datetime import datetime
 from pathlib import Path
 
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from core.execution.trade_journal import TradeJournalReader
+
 def get_wallet_usdc_balance():
     """Get current USDC balance from wallet."""
     try:
@@ -114,47 +120,18 @@ def get_current_session_info():
         session_start = current_time.isoformat()
         session_start_balance = 0.002068
 
-    # Load ALL trade files from current session (after reset)
-    all_trade_files = glob.glob("output/live_production/trades/trade_*.json")
-    all_trade_files.sort()
+    # Session totals from the trade journal: the writer's aggregates snapshot
+    # plus any trades appended after it
+    trade_reader = TradeJournalReader("output/live_production/trades")
+    trade_reader.poll()
+    aggregates = trade_reader.aggregates
 
     # Calculate session metrics
-    trades_executed = len(all_trade_files)
-    successful_trades = 0
-    total_volume_sol = 0.0
-    recent_signatures = []
-    session_end_balance = None
-
-    for trade_file in all_trade_files:
-        try:
-            with open(trade_file, 'r') as f:
-                trade_data = json.load(f)
-
-                # Check if trade was successful
-                result = trade_data.get('result', {})
-                if result.get('success', False):
-                    successful_trades += 1
-
-                # Get trade size from signal
-                signal = trade_data.get('signal', {})
-                size = signal.get('size', 0.0)
-                total_volume_sol += size
-
-                # Get signature from result
-                signature = result.get('signature', '')
-                if signature and signature != 'N/A' and len(signature) > 20:
-                    recent_signatures.append(signature)
-
-                # Track session balance changes for PnL calculation
-                balance_validation = trade_data.get('balance_validation', {})
-                balance_after = balance_validation.get('balance_after', 0.0)
-
-                # Update session end balance from latest trade
-                if balance_after > 0:
-                    session_end_balance = balance_after
-
-        except Exception as e:
-            print(f"Error reading trade file {trade_file}: {e}")
+    trades_executed = aggregates.trades
+    successful_trades = aggregates.successful
+    total_volume_sol = aggregates.volume_sol
+    recent_signatures = list(aggregates.recent_signatures)
+    session_end_balance = aggregates.last_balance_sol
 
     # Calculate win rate
     win_rate = (successful_trades / trades_executed * 100) if trades_executed > 0 else 0.0
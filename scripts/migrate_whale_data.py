@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Whale Data Migration
+
+One-shot migration of per-transaction whale_tx_*.json files into the hourly
+JSONL segments used by WhaleSegmentStore. Safe to re-run: records already in
+a segment are not duplicated.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from core.whale.whale_store import WhaleSegmentStore
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Run the migration."""
+    parser = argparse.ArgumentParser(description="Migrate whale_tx_*.json files into hourly segments")
+    parser.add_argument('--directory', default='output/whale_data/transactions', help="Whale transactions directory")
+    parser.add_argument('--keep', action='store_true', help="Keep legacy files after migrating")
+    args = parser.parse_args()
+
+    store = WhaleSegmentStore(args.directory)
+    migrated = store.migrate_legacy_files(delete=not args.keep)
+    store.close()
+
+    stats = store.get_stats()
+    print(f"✅ Migrated {migrated} transactions")
+    print(f"📦 Store now has {stats['records']} transactions in {stats['segments']} segments "
+          f"({stats['total_bytes'] / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
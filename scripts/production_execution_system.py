@@ -265,6 +265,10 @@ class ProductionExecutionSystem:
             # Stop execution engine
             await self.execution_engine.stop()
             
+            # Release pooled RPC connections
+            if self.transaction_executor:
+                await self.transaction_executor.close()
+            
             self.running = False
             logger.info("✅ Production execution system stopped")
             
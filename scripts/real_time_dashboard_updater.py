@@ -5,135 +5,88 @@ Continuously monitors live trading session and updates dashboard metrics in real
 """
 
 import os
+import sys
 import json
-import glob
 import time
 import threading
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-import statistics
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from core.execution.trade_journal import TradeJournalReader, SessionAggregates, trade_timestamp
 
 class RealTimeDashboardUpdater:
-    def __init__(self, update_interval=10):
+    def __init__(self, update_interval=10, session_window_hours=2):
         """Initialize the real-time dashboard updater."""
         self.update_interval = update_interval  # seconds
         self.running = False
         self.last_trade_count = 0
         self.session_start_time = datetime.now()
         
+        # Tail the trade journal; the session window is maintained incrementally
+        self.session_window = timedelta(hours=session_window_hours)
+        self.trade_reader = TradeJournalReader("output/live_production/trades", use_snapshot=False, recent_limit=1)
+        self.window_trades = deque()
+        self.window_aggregates = SessionAggregates()
+        
     def get_current_session_metrics(self):
         """Get metrics for the current live trading session."""
         
-        # Find all trade files
-        trade_files = glob.glob("output/live_production/trades/trade_*.json")
-        trade_files.sort()
-        
-        if not trade_files:
+        # Only trades appended since the last refresh are read
+        cutoff_time = datetime.now() - self.session_window
+        resets = self.trade_reader.stats['resets']
+        new_trades = self.trade_reader.poll()
+        if self.trade_reader.stats['resets'] != resets:
+            # Journal was replaced - rebuild the window from scratch
+            self.window_trades.clear()
+            self.window_aggregates.reset()
+        
+        for trade in new_trades:
+            trade_time = trade_timestamp(trade)
+            if trade_time is not None and trade_time >= cutoff_time:
+                self.window_trades.append((trade_time, trade))
+                self.window_aggregates.add(trade)
+        
+        # Drop trades that have left the session window (last 2 hours)
+        while self.window_trades and self.window_trades[0][0] < cutoff_time:
+            _, trade = self.window_trades.popleft()
+            self.window_aggregates.remove(trade)
+        
+        if not self.window_trades:
             return self.get_empty_metrics()
         
-        # Filter trades from current session (last 2 hours)
-        current_session_trades = []
-        cutoff_time = datetime.now() - timedelta(hours=2)
-        
-        for trade_file in trade_files:
-            try:
-                # Extract timestamp from filename
-                filename = os.path.basename(trade_file)
-                timestamp_str = filename.replace('trade_', '').replace('.json', '')
-                trade_time = datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-                
-                if trade_time >= cutoff_time:
-                    with open(trade_file, 'r') as f:
-                        trade = json.load(f)
-                    current_session_trades.append(trade)
-                    
-            except Exception as e:
-                continue
-        
-        return self.calculate_session_metrics(current_session_trades)
+        return self.metrics_from_aggregates(self.window_aggregates)
     
-    def calculate_session_metrics(self, trades):
-        """Calculate comprehensive metrics for the current session."""
-        
-        if not trades:
-            return self.get_empty_metrics()
-        
-        successful_trades = 0
-        failed_trades = 0
-        trade_sizes = []
-        execution_times = []
-        signatures = []
-        strategies = {}
-        regimes = {}
-        
-        # Analyze trades
-        for trade in trades:
-            result = trade.get('result', {})
-            signal = trade.get('signal', {})
-            position_info = signal.get('position_info', {})
-            
-            # Count success/failure
-            if result.get('success', False):
-                successful_trades += 1
-                signature = result.get('signature')
-                if signature:
-                    signatures.append(signature)
-            else:
-                failed_trades += 1
-            
-            # Trade size
-            trade_size_usd = position_info.get('position_size_usd', 0)
-            if trade_size_usd > 0:
-                trade_sizes.append(trade_size_usd)
-            
-            # Execution time
-            exec_time = trade.get('execution_time', 0)
-            if exec_time > 0:
-                execution_times.append(exec_time)
-            
-            # Strategy tracking
-            strategy = signal.get('source', 'unknown')
-            strategies[strategy] = strategies.get(strategy, 0) + 1
-            
-            # Regime tracking
-            regime_info = signal.get('regime_info', {})
-            regime = regime_info.get('regime', 'unknown')
-            regimes[regime] = regimes.get(regime, 0) + 1
-        
-        # Calculate metrics
-        total_trades = len(trades)
-        win_rate = (successful_trades / total_trades * 100) if total_trades > 0 else 0
-        avg_trade_size = statistics.mean(trade_sizes) if trade_sizes else 0
-        avg_execution_time = statistics.mean(execution_times) if execution_times else 0
-        total_volume = sum(trade_sizes)
+    def metrics_from_aggregates(self, aggregates):
+        """Build dashboard metrics from running session aggregates."""
         
         # Session timing
         session_duration = (datetime.now() - self.session_start_time).total_seconds() / 60
-        trades_per_hour = (total_trades / (session_duration / 60)) if session_duration > 0 else 0
+        trades_per_hour = (aggregates.trades / (session_duration / 60)) if session_duration > 0 else 0
         
         # Current market regime (from latest trade)
-        current_regime = "DETECTING..."
-        if trades:
-            latest_trade = trades[-1]
-            regime_info = latest_trade.get('signal', {}).get('regime_info', {})
-            current_regime = regime_info.get('regime', 'DETECTING...').upper()
+        current_regime = (aggregates.last_regime or 'DETECTING...').upper()
         
         return {
             "timestamp": datetime.now().isoformat(),
             "session_start": self.session_start_time.isoformat(),
             "session_duration_minutes": round(session_duration, 1),
-            "total_trades": total_trades,
-            "successful_trades": successful_trades,
-            "failed_trades": failed_trades,
-            "win_rate": round(win_rate, 1),
-            "average_trade_size": round(avg_trade_size, 2),
-            "total_volume_usd": round(total_volume, 2),
-            "average_execution_time": round(avg_execution_time, 3),
+            "total_trades": aggregates.trades,
+            "successful_trades": aggregates.successful,
+            "failed_trades": aggregates.failed,
+            "win_rate": round(aggregates.win_rate, 1),
+            "average_trade_size": round(aggregates.avg_trade_size_usd, 2),
+            "total_volume_usd": round(aggregates.volume_usd, 2),
+            "average_execution_time": round(aggregates.avg_execution_time, 3),
             "trades_per_hour": round(trades_per_hour, 1),
             "current_regime": current_regime,
-            "strategies": strategies,
-            "regimes": regimes,
-            "blockchain_verified_trades": len(signatures),
+            "strategies": dict(aggregates.strategies),
+            "regimes": dict(aggregates.regimes),
+            "blockchain_verified_trades": aggregates.verified_signatures,
             "status": "active",
             "trading_enabled": True,
             "last_update": datetime.now().isoformat()
@@ -21,8 +21,8 @@ def backup_old_trades():
     backup_dir = Path(f"backups/trades_backup_{backup_timestamp}")
     backup_dir.mkdir(parents=True, exist_ok=True)
     
-    # Backup existing trade files
-    trade_files = glob.glob("output/live_production/trades/trade_*.json")
+    # Backup existing trade files and the trade journal
+    trade_files = glob.glob("output/live_production/trades/trade_*.json") + glob.glob("output/live_production/trades/trades*.json*")
     if trade_files:
         print(f"📦 Backing up {len(trade_files)} existing trade files...")
         for trade_file in trade_files:
@@ -38,8 +38,8 @@ def backup_old_trades():
 def clear_trade_data():
     """Clear existing trade data and metrics."""
     
-    # Clear trade files
-    trade_files = glob.glob("output/live_production/trades/trade_*.json")
+    # Clear trade files and the trade journal (with its aggregates snapshot)
+    trade_files = glob.glob("output/live_production/trades/trade_*.json") + glob.glob("output/live_production/trades/trades*.json*")
     for trade_file in trade_files:
         os.remove(trade_file)
     print(f"🗑️ Removed {len(trade_files)} trade files")
@@ -9,6 +9,9 @@ import logging
 import json
 import os
 import sys
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
@@ -64,6 +67,38 @@ class CustomJSONEncoder(json.JSONEncoder):
             return str(obj)
 
 
+class CyclePhaseTimer:
+    """Accumulates wall-clock time per phase of one trading cycle."""
+
+    PHASES = ('balance_fetch', 'market_data', 'regime_detection', 'selection', 'sizing', 'build', 'submit', 'post_trade')
+
+    def __init__(self, cycle_number: int):
+        self.cycle_number = cycle_number
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self.phases_ms = {phase: 0.0 for phase in self.PHASES}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block and add it to the named phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases_ms[name] = self.phases_ms.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def to_dict(self) -> dict:
+        """Structured per-cycle timing record."""
+        total_ms = (time.perf_counter() - self._start) * 1000
+        return {
+            'cycle': self.cycle_number,
+            'timestamp': self.started_at.isoformat(),
+            'total_ms': round(total_ms, 2),
+            'phases_ms': {phase: round(ms, 2) for phase, ms in self.phases_ms.items()},
+            'unattributed_ms': round(max(0.0, total_ms - sum(self.phases_ms.values())), 2)
+        }
+
+
 class UnifiedLiveTrader:
     """Unified live trading system with proper transaction signing and execution."""
 
@@ -108,6 +143,22 @@ class UnifiedLiveTrader:
         self.tx_builder = None
         self.telegram_notifier = None
 
+        # Long-lived strategy components (built once in initialize_components)
+        self.strategy_components_initialized = False
+        self.regime_detector = None
+        self.adaptive_weight_manager = None
+        self.strategy_attribution = None
+        self.strategy_selector = None
+        self.position_sizer = None
+        self.position_sizer_config = {}
+        self.whale_watcher = None
+
+        # Per-cycle phase timing metrics
+        self.cycle_count = 0
+        self.current_cycle_timer = None
+        self.cycle_metrics = deque(maxlen=self.config.get('cycle_metrics_history', 1000))
+        self.cycle_metrics_file = self.config.get('cycle_metrics_file', 'output/live_production/cycle_metrics.jsonl')
+
         # Validate critical environment variables
         self.validation_errors = []
         self._validate_environment()
@@ -169,6 +220,7 @@ class UnifiedLiveTrader:
 
             # Initialize minimal required components for modern mode
             await self._initialize_minimal_components()
+            await self._initialize_strategy_components()
             self.components_initialized = True
             logger.info("⚡ FIXED: Modern components initialized with signature verification fix")
             return True
@@ -309,6 +361,9 @@ class UnifiedLiveTrader:
                 logger.warning("⚠️ Telegram notifier not available")
                 self.telegram_notifier = None
 
+            # Build long-lived strategy components once
+            await self._initialize_strategy_components()
+
             # Mark components as initialized for legacy mode
             self.components_initialized = True
             return True
@@ -347,6 +402,200 @@ class UnifiedLiveTrader:
             logger.error(f"❌ Error initializing minimal components: {str(e)}")
             raise
 
+    async def _initialize_strategy_components(self):
+        """
+        Build the strategy components once and keep them on the trader.
+
+        The regime detector, adaptive weight manager, attribution tracker and
+        strategy selector hold learned state across cycles, and the whale alert
+        callback must only be registered once.
+        """
+        if self.strategy_components_initialized:
+            return
+
+        # Import signal generation components - REQUIRED FOR LIVE TRADING
+        try:
+            from core.risk.production_position_sizer import ProductionPositionSizer
+            from core.strategies.market_regime_detector import MarketRegimeDetector
+            from core.strategies.adaptive_weight_manager import AdaptiveWeightManager
+            from core.analytics.strategy_attribution import StrategyAttributionTracker
+            from core.strategies.strategy_selector import StrategySelector
+            logger.info("✅ Core signal generation modules imported successfully")
+        except ImportError as e:
+            logger.error(f"❌ CRITICAL: Core signal generation modules not available: {e}")
+            raise ImportError(f"Live trading requires core modules: {e}")
+
+        # 🚀 PHASE 2: Initialize Market Regime Detector for timing filters
+        self.regime_detector = MarketRegimeDetector(
+            config={'market_regime': {
+                'enabled': True,
+                'regime_confidence_threshold': 0.6,  # Require 60% confidence
+                'adx_period': 14,
+                'bb_period': 20,
+                'choppiness_period': 14
+            }}
+        )
+        logger.info("📊 Initialized market regime detector for timing filters")
+
+        # 🚀 PHASE 2: Signal enrichment will be handled by strategy selector
+        logger.info("🎯 Signal enrichment integrated into strategy selection")
+
+        # 🚀 PHASE 3: Initialize Adaptive Strategy System
+        self.adaptive_weight_manager = AdaptiveWeightManager(
+            config={'adaptive_weighting': {
+                'learning_rate': 0.02,                    # Slightly faster learning
+                'weight_update_interval': 1800,           # 30 minutes for live trading
+                'min_strategy_weight': 0.05,              # 5% minimum allocation
+                'max_strategy_weight': 0.7,               # 70% maximum allocation
+                'performance_lookback_days': 7,           # 1 week lookback
+                'regime_adjustment_factor': 0.3,          # 30% regime influence
+                'risk_adjustment_factor': 0.2             # 20% risk influence
+            }}
+        )
+        logger.info("🎯 Initialized adaptive weight manager for strategy optimization")
+
+        # 🚀 PHASE 3: Initialize Strategy Attribution for performance tracking
+        self.strategy_attribution = StrategyAttributionTracker(
+            config={'strategy_attribution': {
+                'attribution_window_days': 7,      # 1 week attribution window
+                'min_trades_for_attribution': 3    # Minimum trades for reliable stats
+            }}
+        )
+        logger.info("📊 Initialized strategy attribution for performance tracking")
+
+        # 🔧 PHASE 3: Initialize Enhanced Whale Watcher with QuickNode Streaming
+        try:
+            from phase_4_deployment.data_router.enhanced_whale_watcher import get_whale_watcher
+            self.whale_watcher = await get_whale_watcher()
+
+            # Register whale alert callback
+            def whale_alert_callback(whale_alert):
+                try:
+                    logger.info(f"🐋 WHALE ALERT: {whale_alert.amount_sol:.2f} SOL (${whale_alert.amount_usd:,.2f}) - {whale_alert.alert_level.upper()}")
+                    # Could trigger additional trading logic here
+                except Exception as e:
+                    logger.error(f"❌ Error in whale alert callback: {e}")
+
+            self.whale_watcher.register_alert_callback(whale_alert_callback)
+            logger.info("🔧 Enhanced Whale Watcher initialized with QuickNode streaming")
+
+        except Exception as e:
+            logger.warning(f"⚠️ Enhanced Whale Watcher initialization failed: {e}")
+            self.whale_watcher = None
+
+        # 🔧 PHASE 4: Initialize Strategy Selector for RANGING MARKET OPTIMIZATION
+        self.strategy_selector = StrategySelector(
+            config={'adaptive_weighting': {
+                'confidence_threshold': 0.05,             # 🔧 PHASE 4: 5% confidence threshold (VERY LOW FOR RANGING)
+                'min_strategy_weight': 0.1,               # 🔧 PHASE 4: 10% minimum weight (FIXED: was 1.0)
+                'max_strategy_weight': 1.0,               # 🔧 PHASE 4: 100% maximum weight
+                'performance_weight': 0.4,                # 40% performance influence
+                'regime_confidence_weight': 0.3,          # 30% regime influence
+                'risk_weight': 0.3                        # 30% risk influence
+            }}
+        )
+
+        # 🔧 PHASE 4: Define available strategies with RANGING MARKET OPTIMIZATION
+        available_strategies = {
+            'mean_reversion': {
+                'enabled': True,
+                'risk_level': 'medium',
+                'min_confidence': 0.7,  # 🎯 WINNING: 0.7826 strategy - lowered to enable selection
+                'preferred_regimes': ['ranging', 'choppy', 'volatile'],  # 🎯 WINNING: Mean reversion excels in ranging
+                'regime_suitability': {
+                    'trending_up': 0.3,
+                    'trending_down': 0.3,
+                    'ranging': 1.0,  # 🎯 WINNING: Perfect for ranging markets
+                    'volatile': 0.9,
+                    'choppy': 0.8,
+                    'unknown': 0.6
+                }
+            },
+            'opportunistic_volatility_breakout': {
+                'enabled': True,
+                'risk_level': 'medium',
+                'min_confidence': 0.05,  # 🔧 PHASE 4: LOWERED FOR RANGING MARKETS
+                'preferred_regimes': ['ranging', 'volatile', 'trending_up'],  # 🔧 PHASE 4: Added ranging
+                'regime_suitability': {
+                    'trending_up': 0.9,
+                    'trending_down': 0.3,
+                    'ranging': 0.8,  # 🔧 PHASE 4: BOOSTED for ranging markets
+                    'volatile': 0.8,
+                    'choppy': 0.2,
+                    'unknown': 0.6
+                }
+            },
+            'momentum_sol_usdc': {
+                'enabled': True,
+                'risk_level': 'medium',
+                'min_confidence': 0.05,  # 🔧 PHASE 4: LOWERED FOR RANGING MARKETS
+                'preferred_regimes': ['trending_up', 'ranging'],  # 🔧 PHASE 4: Added ranging
+                'regime_suitability': {
+                    'trending_up': 0.95,
+                    'trending_down': 0.4,
+                    'ranging': 0.7,  # 🔧 PHASE 4: BOOSTED for ranging markets
+                    'volatile': 0.6,
+                    'choppy': 0.1,
+                    'unknown': 0.5
+                }
+            },
+            'wallet_momentum': {
+                'enabled': True,
+                'risk_level': 'low',
+                'min_confidence': 0.01,  # 🔧 PHASE 4: VERY LOW FOR RANGING MARKETS
+                'preferred_regimes': ['ranging', 'trending_up', 'trending_down'],  # 🔧 PHASE 4: Ranging first
+                'regime_suitability': {
+                    'trending_up': 0.8,
+                    'trending_down': 0.6,
+                    'ranging': 0.95,  # 🔧 PHASE 4: EXCELLENT for ranging markets
+                    'volatile': 0.7,
+                    'choppy': 0.3,
+                    'unknown': 0.7
+                }
+            }
+        }
+
+        # Register strategies with the selector
+        for strategy_name, strategy_config in available_strategies.items():
+            self.strategy_selector.register_strategy(strategy_name, strategy_config)
+        logger.info(f"🎯 Initialized strategy selector with {len(available_strategies)} available strategies")
+
+        # Create config for position sizer with Phase 2 enhancements - 🚀 FIXED: Use config values
+        position_sizer_config = {
+            'wallet': {
+                'active_trading_pct': self.config.get('wallet', {}).get('active_trading_pct', 0.9),  # 🚀 FIXED: Use config value (90%)
+                'reserve_pct': self.config.get('wallet', {}).get('reserve_pct', 0.1)  # 🚀 FIXED: Use config value (10%)
+            },
+            'trading': {
+                'base_position_size_pct': self.config.get('trading', {}).get('base_position_size_pct', 0.20),  # 🚀 FIXED: Use config value (20%)
+                'max_position_size_pct': self.config.get('trading', {}).get('max_position_size_pct', 0.40),   # 🚀 FIXED: Use config value (40%)
+                'min_position_size_pct': self.config.get('trading', {}).get('min_position_size_pct', 0.05),   # 🚀 FIXED: Use config value (5%)
+                'min_trade_size_usd': self.config.get('trading', {}).get('min_trade_size_usd', 10),         # 🚀 FIXED: Use config value ($10)
+                'target_trade_size_usd': self.config.get('trading', {}).get('target_trade_size_usd', 100),    # 🚀 FIXED: Use config value ($100)
+                'confidence_scaling': True,      # 🚀 PHASE 2: Enable confidence scaling
+                'regime_based_sizing': True      # 🚀 PHASE 2: Enable regime-based sizing
+            },
+            'risk_management': {
+                'max_risk_per_trade': 0.10,      # 🔧 REMOVED FILTER: Increased to 10% max risk per trade
+                'max_portfolio_exposure': 1.0,   # 🔧 REMOVED FILTER: Allow 100% portfolio exposure
+                'confidence_threshold': 0.01,    # 🔧 REMOVED FILTER: Minimal 1% confidence threshold
+                'regime_multipliers': {          # 🚀 PHASE 2: Market regime adjustments
+                    'trending_up': 1.3,          # Boost in uptrends
+                    'trending_down': 0.7,        # Reduce in downtrends
+                    'ranging': 1.0,              # Normal in ranging (GOOD FOR CURRENT MARKET)
+                    'volatile': 0.8,             # Reduce in volatile markets
+                    'choppy': 0.4,               # Minimal in choppy markets
+                    'unknown': 0.6               # Conservative when uncertain
+                }
+            }
+        }
+
+        self.position_sizer_config = position_sizer_config
+        self.position_sizer = ProductionPositionSizer(position_sizer_config)
+        logger.info("💰 Initialized enhanced position sizer (wallet state refreshed each cycle)")
+
+        self.strategy_components_initialized = True
+
     async def get_current_wallet_balance(self):
         """Get current wallet balance for PnL calculations."""
         try:
@@ -531,17 +780,20 @@ class UnifiedLiveTrader:
             logger.info("🔧 SIMPLIFIED: Using direct trading without balance preparation")
 
             # Quick balance check and signal adjustment
-            balance_ok = await self.prepare_trade_balance(signal)
+            with self._cycle_phase('balance_fetch'):
+                balance_ok = await self.prepare_trade_balance(signal)
             if not balance_ok:
                 logger.error("❌ Insufficient balance for trade")
                 return None
 
             # Step 3: Get wallet balance BEFORE trade for validation
-            balance_before = await self.get_wallet_balance()
+            with self._cycle_phase('balance_fetch'):
+                balance_before = await self.get_wallet_balance()
             logger.info(f"💰 Wallet balance before trade: {balance_before} SOL")
 
             # Build transaction with immediate blockhash handling
-            transaction = await self._build_transaction_immediate(signal)
+            with self._cycle_phase('build'):
+                transaction = await self._build_transaction_immediate(signal)
             if not transaction:
                 logger.error("❌ Failed to build transaction with immediate blockhash")
                 return None
@@ -560,7 +812,8 @@ class UnifiedLiveTrader:
                 logger.info("🔄 Executing via immediate transaction execution")
                 logger.info(f"🔧 DEBUG: Transaction type: {type(transaction)}")
                 logger.info(f"🔧 DEBUG: Transaction content: {transaction}")
-                result = await self._execute_transaction_immediate(transaction)
+                with self._cycle_phase('submit'):
+                    result = await self._execute_transaction_immediate(transaction)
                 logger.info(f"🔧 DEBUG: Execution result: {result}")
                 execution_time = (datetime.now() - start_time).total_seconds()
 
@@ -583,8 +836,9 @@ class UnifiedLiveTrader:
                 logger.info(f"⏱️ Execution time: {execution_time:.2f} seconds")
 
                 # 🚨 ENHANCED: Get post-trade balance for record keeping
-                await asyncio.sleep(5)  # Wait for blockchain confirmation
-                balance_after = await self.get_wallet_balance()
+                with self._cycle_phase('post_trade'):
+                    await asyncio.sleep(5)  # Wait for blockchain confirmation
+                    balance_after = await self.get_wallet_balance()
                 logger.info(f"💰 Wallet balance after trade: {balance_after} SOL")
 
                 # 🚨 REAL TRADE VALIDATION: Transaction signature confirms execution
@@ -646,7 +900,7 @@ class UnifiedLiveTrader:
             return None
 
     async def save_trade_record(self, signal, result, execution_time, balance_before=None, balance_after=None):
-        """Save trade record to file with balance validation."""
+        """Save trade record to the trade journal with balance validation."""
         try:
             trade_record = {
                 'timestamp': datetime.now().isoformat(),
@@ -663,456 +917,297 @@ class UnifiedLiveTrader:
                 }
             }
 
-            # Save to trades directory
-            trades_dir = 'output/live_production/trades'
-            os.makedirs(trades_dir, exist_ok=True)
-
-            filename = f"trade_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            filepath = os.path.join(trades_dir, filename)
+            # Append to the trade journal (aggregates are updated per append)
+            from core.execution.trade_journal import get_trade_journal
+            journal = get_trade_journal('output/live_production/trades')
+            sequence = journal.append(trade_record, cls=CustomJSONEncoder)
 
-            with open(filepath, 'w') as f:
-                json.dump(trade_record, f, indent=2, cls=CustomJSONEncoder)
-
-            logger.info(f"💾 Trade record saved: {filepath}")
+            logger.info(f"💾 Trade record #{sequence} saved: {journal.path}")
 
         except Exception as e:
             logger.error(f"❌ Error saving trade record: {str(e)}")
 
     async def run_trading_cycle(self):
-        """Run a single trading cycle."""
-        logger.info("🔄 Running trading cycle...")
+        """Run a single trading cycle and record where its time went."""
+        self.cycle_count += 1
+        timer = CyclePhaseTimer(self.cycle_count)
+        self.current_cycle_timer = timer
 
         try:
-            # Import signal generation components - REQUIRED FOR LIVE TRADING
-            try:
-                from core.risk.production_position_sizer import ProductionPositionSizer
-                from core.strategies.market_regime_detector import MarketRegimeDetector
-                from core.strategies.adaptive_weight_manager import AdaptiveWeightManager
-                from core.analytics.strategy_attribution import StrategyAttributionTracker
-                from core.strategies.strategy_selector import StrategySelector
-                logger.info("✅ Core signal generation modules imported successfully")
-            except ImportError as e:
-                logger.error(f"❌ CRITICAL: Core signal generation modules not available: {e}")
-                raise ImportError(f"Live trading requires core modules: {e}")
-
-            # Initialize position sizer with current wallet balance
-            current_balance = await self.get_wallet_balance()
-
-            # 🚀 PHASE 2: Initialize Market Regime Detector for timing filters
-            regime_detector = MarketRegimeDetector(
-                config={'market_regime': {
-                    'enabled': True,
-                    'regime_confidence_threshold': 0.6,  # Require 60% confidence
-                    'adx_period': 14,
-                    'bb_period': 20,
-                    'choppiness_period': 14
-                }}
-            )
-            logger.info("📊 Initialized market regime detector for timing filters")
-
-            # 🚀 PHASE 2: Signal enrichment will be handled by strategy selector
-            logger.info("🎯 Signal enrichment integrated into strategy selection")
-
-            # 🚀 PHASE 3: Initialize Adaptive Strategy System
-            adaptive_weight_manager = AdaptiveWeightManager(
-                config={'adaptive_weighting': {
-                    'learning_rate': 0.02,                    # Slightly faster learning
-                    'weight_update_interval': 1800,           # 30 minutes for live trading
-                    'min_strategy_weight': 0.05,              # 5% minimum allocation
-                    'max_strategy_weight': 0.7,               # 70% maximum allocation
-                    'performance_lookback_days': 7,           # 1 week lookback
-                    'regime_adjustment_factor': 0.3,          # 30% regime influence
-                    'risk_adjustment_factor': 0.2             # 20% risk influence
-                }}
-            )
-            logger.info("🎯 Initialized adaptive weight manager for strategy optimization")
-
-            # 🚀 PHASE 3: Initialize Strategy Attribution for performance tracking
-            strategy_attribution = StrategyAttributionTracker(
-                config={'strategy_attribution': {
-                    'attribution_window_days': 7,      # 1 week attribution window
-                    'min_trades_for_attribution': 3    # Minimum trades for reliable stats
-                }}
-            )
-            logger.info("📊 Initialized strategy attribution for performance tracking")
-
-            # 🔧 PHASE 3: Initialize Enhanced Whale Watcher with QuickNode Streaming
-            try:
-                from phase_4_deployment.data_router.enhanced_whale_watcher import get_whale_watcher
-                whale_watcher = await get_whale_watcher()
-
-                # Register whale alert callback
-                def whale_alert_callback(whale_alert):
-                    try:
-                        logger.info(f"🐋 WHALE ALERT: {whale_alert.amount_sol:.2f} SOL (${whale_alert.amount_usd:,.2f}) - {whale_alert.alert_level.upper()}")
-                        # Could trigger additional trading logic here
-                    except Exception as e:
-                        logger.error(f"❌ Error in whale alert callback: {e}")
+            result = await self._run_trading_cycle(timer)
+        finally:
+            self.current_cycle_timer = None
 
-                whale_watcher.register_alert_callback(whale_alert_callback)
-                logger.info("🔧 Enhanced Whale Watcher initialized with QuickNode streaming")
+        cycle_timing = timer.to_dict()
+        result['phase_timings'] = cycle_timing
+        self._record_cycle_metrics(cycle_timing, result)
+        return result
 
-            except Exception as e:
-                logger.warning(f"⚠️ Enhanced Whale Watcher initialization failed: {e}")
-                whale_watcher = None
-
-            # 🔧 PHASE 4: Initialize Strategy Selector for RANGING MARKET OPTIMIZATION
-            strategy_selector = StrategySelector(
-                config={'adaptive_weighting': {
-                    'confidence_threshold': 0.05,             # 🔧 PHASE 4: 5% confidence threshold (VERY LOW FOR RANGING)
-                    'min_strategy_weight': 0.1,               # 🔧 PHASE 4: 10% minimum weight (FIXED: was 1.0)
-                    'max_strategy_weight': 1.0,               # 🔧 PHASE 4: 100% maximum weight
-                    'performance_weight': 0.4,                # 40% performance influence
-                    'regime_confidence_weight': 0.3,          # 30% regime influence
-                    'risk_weight': 0.3                        # 30% risk influence
-                }}
-            )
+    async def _run_trading_cycle(self, timer: CyclePhaseTimer):
+        """Run the signal-to-execution steps of one trading cycle."""
+        logger.info("🔄 Running trading cycle...")
 
-            # 🔧 PHASE 4: Define available strategies with RANGING MARKET OPTIMIZATION
-            available_strategies = {
-                'mean_reversion': {
-                    'enabled': True,
-                    'risk_level': 'medium',
-                    'min_confidence': 0.7,  # 🎯 WINNING: 0.7826 strategy - lowered to enable selection
-                    'preferred_regimes': ['ranging', 'choppy', 'volatile'],  # 🎯 WINNING: Mean reversion excels in ranging
-                    'regime_suitability': {
-                        'trending_up': 0.3,
-                        'trending_down': 0.3,
-                        'ranging': 1.0,  # 🎯 WINNING: Perfect for ranging markets
-                        'volatile': 0.9,
-                        'choppy': 0.8,
-                        'unknown': 0.6
-                    }
-                },
-                'opportunistic_volatility_breakout': {
-                    'enabled': True,
-                    'risk_level': 'medium',
-                    'min_confidence': 0.05,  # 🔧 PHASE 4: LOWERED FOR RANGING MARKETS
-                    'preferred_regimes': ['ranging', 'volatile', 'trending_up'],  # 🔧 PHASE 4: Added ranging
-                    'regime_suitability': {
-                        'trending_up': 0.9,
-                        'trending_down': 0.3,
-                        'ranging': 0.8,  # 🔧 PHASE 4: BOOSTED for ranging markets
-                        'volatile': 0.8,
-                        'choppy': 0.2,
-                        'unknown': 0.6
-                    }
-                },
-                'momentum_sol_usdc': {
-                    'enabled': True,
-                    'risk_level': 'medium',
-                    'min_confidence': 0.05,  # 🔧 PHASE 4: LOWERED FOR RANGING MARKETS
-                    'preferred_regimes': ['trending_up', 'ranging'],  # 🔧 PHASE 4: Added ranging
-                    'regime_suitability': {
-                        'trending_up': 0.95,
-                        'trending_down': 0.4,
-                        'ranging': 0.7,  # 🔧 PHASE 4: BOOSTED for ranging markets
-                        'volatile': 0.6,
-                        'choppy': 0.1,
-                        'unknown': 0.5
-                    }
-                },
-                'wallet_momentum': {
-                    'enabled': True,
-                    'risk_level': 'low',
-                    'min_confidence': 0.01,  # 🔧 PHASE 4: VERY LOW FOR RANGING MARKETS
-                    'preferred_regimes': ['ranging', 'trending_up', 'trending_down'],  # 🔧 PHASE 4: Ranging first
-                    'regime_suitability': {
-                        'trending_up': 0.8,
-                        'trending_down': 0.6,
-                        'ranging': 0.95,  # 🔧 PHASE 4: EXCELLENT for ranging markets
-                        'volatile': 0.7,
-                        'choppy': 0.3,
-                        'unknown': 0.7
-                    }
-                }
-            }
+        try:
+            # Strategy components are built once; this is a no-op after initialize_components
+            await self._initialize_strategy_components()
 
-            # Register strategies with the selector
-            for strategy_name, strategy_config in available_strategies.items():
-                strategy_selector.register_strategy(strategy_name, strategy_config)
-            logger.info("🎯 Initialized strategy selector with 3 available strategies")
-
-            # Create config for position sizer with Phase 2 enhancements - 🚀 FIXED: Use config values
-            position_sizer_config = {
-                'wallet': {
-                    'active_trading_pct': self.config.get('wallet', {}).get('active_trading_pct', 0.9),  # 🚀 FIXED: Use config value (90%)
-                    'reserve_pct': self.config.get('wallet', {}).get('reserve_pct', 0.1)  # 🚀 FIXED: Use config value (10%)
-                },
-                'trading': {
-                    'base_position_size_pct': self.config.get('trading', {}).get('base_position_size_pct', 0.20),  # 🚀 FIXED: Use config value (20%)
-                    'max_position_size_pct': self.config.get('trading', {}).get('max_position_size_pct', 0.40),   # 🚀 FIXED: Use config value (40%)
-                    'min_position_size_pct': self.config.get('trading', {}).get('min_position_size_pct', 0.05),   # 🚀 FIXED: Use config value (5%)
-                    'min_trade_size_usd': self.config.get('trading', {}).get('min_trade_size_usd', 10),         # 🚀 FIXED: Use config value ($10)
-                    'target_trade_size_usd': self.config.get('trading', {}).get('target_trade_size_usd', 100),    # 🚀 FIXED: Use config value ($100)
-                    'confidence_scaling': True,      # 🚀 PHASE 2: Enable confidence scaling
-                    'regime_based_sizing': True      # 🚀 PHASE 2: Enable regime-based sizing
-                },
-                'risk_management': {
-                    'max_risk_per_trade': 0.10,      # 🔧 REMOVED FILTER: Increased to 10% max risk per trade
-                    'max_portfolio_exposure': 1.0,   # 🔧 REMOVED FILTER: Allow 100% portfolio exposure
-                    'confidence_threshold': 0.01,    # 🔧 REMOVED FILTER: Minimal 1% confidence threshold
-                    'regime_multipliers': {          # 🚀 PHASE 2: Market regime adjustments
-                        'trending_up': 1.3,          # Boost in uptrends
-                        'trending_down': 0.7,        # Reduce in downtrends
-                        'ranging': 1.0,              # Normal in ranging (GOOD FOR CURRENT MARKET)
-                        'volatile': 0.8,             # Reduce in volatile markets
-                        'choppy': 0.4,               # Minimal in choppy markets
-                        'unknown': 0.6               # Conservative when uncertain
-                    }
-                }
-            }
+            # Refresh position sizer with current wallet balance
+            with timer.phase('balance_fetch'):
+                current_balance = await self.get_wallet_balance()
 
-            position_sizer = ProductionPositionSizer(position_sizer_config)
-            position_sizer.update_wallet_state(
+            self.position_sizer.update_wallet_state(
                 wallet_balance=current_balance,
                 current_exposure=0.0,  # Could track this dynamically
                 sol_price=180.0  # Could be made dynamic
             )
-            logger.info(f"💰 Initialized enhanced position sizer with {current_balance:.4f} SOL wallet balance")
+            logger.info(f"💰 Position sizer updated with {current_balance:.4f} SOL wallet balance")
 
             # 🚀 LIVE TRADING: Generate real market opportunities
             logger.info("🔧 Generating real market opportunities for live trading")
-            opportunities = await self._generate_real_market_opportunities()
+            with timer.phase('market_data'):
+                opportunities = await self._generate_real_market_opportunities()
 
             logger.info(f"📊 Found {len(opportunities)} opportunities")
 
             # 🚀 PHASE 3: Multi-Strategy Signal Generation with Adaptive Weighting
             signals = []
 
-            # First, detect current market regime for timing filters
-            try:
-                # Create dummy price data for regime detection (in production, use real market data)
-                import pandas as pd
-                import numpy as np
+            with timer.phase('regime_detection'):
+                # First, detect current market regime for timing filters
+                try:
+                    # Create dummy price data for regime detection (in production, use real market data)
+                    import pandas as pd
+                    import numpy as np
+
+                    # Generate sample OHLCV data (replace with real market data in production)
+                    dates = pd.date_range(end=datetime.now(), periods=100, freq='1min')
+                    sample_data = pd.DataFrame({
+                        'timestamp': dates,
+                        'open': np.random.normal(180, 5, 100),
+                        'high': np.random.normal(182, 5, 100),
+                        'low': np.random.normal(178, 5, 100),
+                        'close': np.random.normal(180, 5, 100),
+                        'volume': np.random.normal(1000000, 200000, 100)
+                    })
+
+                    # Detect market regime
+                    current_regime, regime_metrics, regime_probabilities = self.regime_detector.detect_regime(sample_data)
+                    regime_name = current_regime.value if current_regime else 'unknown'
+                    regime_confidence = max(regime_probabilities.values()) if regime_probabilities else 0.0
+                    logger.info(f"📊 MARKET REGIME: {regime_name} (confidence: {regime_confidence:.2f})")
 
-                # Generate sample OHLCV data (replace with real market data in production)
-                dates = pd.date_range(end=datetime.now(), periods=100, freq='1min')
-                sample_data = pd.DataFrame({
-                    'timestamp': dates,
-                    'open': np.random.normal(180, 5, 100),
-                    'high': np.random.normal(182, 5, 100),
-                    'low': np.random.normal(178, 5, 100),
-                    'close': np.random.normal(180, 5, 100),
-                    'volume': np.random.normal(1000000, 200000, 100)
-                })
-
-                # Detect market regime
-                current_regime, regime_metrics, regime_probabilities = regime_detector.detect_regime(sample_data)
-                regime_name = current_regime.value if current_regime else 'unknown'
-                regime_confidence = max(regime_probabilities.values()) if regime_probabilities else 0.0
-                logger.info(f"📊 MARKET REGIME: {regime_name} (confidence: {regime_confidence:.2f})")
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not detect market regime: {e}")
+                    current_regime = None
+                    regime_name = 'unknown'
+                    regime_confidence = 0.0
+                    regime_probabilities = {}
+
+            with timer.phase('selection'):
+                # 🚀 PHASE 3: Load historical strategy performance for adaptive weighting
+                try:
+                    # Create mock strategy performance data (in production, load from database)
+                    strategy_performance = {
+                        'mean_reversion': {
+                            'total_trades': 68,  # 🎯 WINNING: From 0.7826 test results
+                            'net_pnl': 0.1476,  # 🎯 WINNING: 14.76% total return
+                            'sharpe_ratio': 1.67,  # 🎯 WINNING: From 0.7826 results
+                            'win_rate': 0.544,  # 🎯 WINNING: 54.4% win rate
+                            'max_drawdown': -0.164,  # 🎯 WINNING: From 0.7826 results
+                            'recent_pnl_7d': 0.025,  # 🎯 WINNING: Estimated recent performance
+                            'volatility': 0.10,  # 🎯 WINNING: Lower volatility strategy
+                            'profit_factor': 2.23  # 🎯 WINNING: From 0.7826 results
+                        },
+                        'opportunistic_volatility_breakout': {
+                            'total_trades': 15,
+                            'net_pnl': 0.045,
+                            'sharpe_ratio': 1.2,
+                            'win_rate': 0.67,
+                            'max_drawdown': -0.08,
+                            'recent_pnl_7d': 0.012,
+                            'volatility': 0.15
+                        },
+                        'momentum_sol_usdc': {
+                            'total_trades': 12,
+                            'net_pnl': 0.032,
+                            'sharpe_ratio': 0.9,
+                            'win_rate': 0.58,
+                            'max_drawdown': -0.12,
+                            'recent_pnl_7d': 0.008,
+                            'volatility': 0.18
+                        },
+                        'wallet_momentum': {
+                            'total_trades': 8,
+                            'net_pnl': 0.021,
+                            'sharpe_ratio': 0.7,
+                            'win_rate': 0.75,
+                            'max_drawdown': -0.05,
+                            'recent_pnl_7d': 0.006,
+                            'volatility': 0.12
+                        }
+                    }
 
-            except Exception as e:
-                logger.warning(f"⚠️ Could not detect market regime: {e}")
-                current_regime = None
-                regime_name = 'unknown'
-                regime_confidence = 0.0
-                regime_probabilities = {}
+                    # 🚀 PHASE 3: Update adaptive strategy weights based on performance
+                    updated_weights = self.adaptive_weight_manager.update_weights(
+                        strategy_performance=strategy_performance,
+                        market_regime=regime_name,
+                        force_update=False
+                    )
 
-            # 🚀 PHASE 3: Load historical strategy performance for adaptive weighting
-            try:
-                # Create mock strategy performance data (in production, load from database)
-                strategy_performance = {
-                    'mean_reversion': {
-                        'total_trades': 68,  # 🎯 WINNING: From 0.7826 test results
-                        'net_pnl': 0.1476,  # 🎯 WINNING: 14.76% total return
-                        'sharpe_ratio': 1.67,  # 🎯 WINNING: From 0.7826 results
-                        'win_rate': 0.544,  # 🎯 WINNING: 54.4% win rate
-                        'max_drawdown': -0.164,  # 🎯 WINNING: From 0.7826 results
-                        'recent_pnl_7d': 0.025,  # 🎯 WINNING: Estimated recent performance
-                        'volatility': 0.10,  # 🎯 WINNING: Lower volatility strategy
-                        'profit_factor': 2.23  # 🎯 WINNING: From 0.7826 results
-                    },
-                    'opportunistic_volatility_breakout': {
-                        'total_trades': 15,
-                        'net_pnl': 0.045,
-                        'sharpe_ratio': 1.2,
-                        'win_rate': 0.67,
-                        'max_drawdown': -0.08,
-                        'recent_pnl_7d': 0.012,
-                        'volatility': 0.15
-                    },
-                    'momentum_sol_usdc': {
-                        'total_trades': 12,
-                        'net_pnl': 0.032,
-                        'sharpe_ratio': 0.9,
-                        'win_rate': 0.58,
-                        'max_drawdown': -0.12,
-                        'recent_pnl_7d': 0.008,
-                        'volatility': 0.18
-                    },
-                    'wallet_momentum': {
-                        'total_trades': 8,
-                        'net_pnl': 0.021,
-                        'sharpe_ratio': 0.7,
-                        'win_rate': 0.75,
-                        'max_drawdown': -0.05,
-                        'recent_pnl_7d': 0.006,
-                        'volatility': 0.12
-                    }
-                }
+                    logger.info(f"🎯 ADAPTIVE WEIGHTS: {updated_weights}")
 
-                # 🚀 PHASE 3: Update adaptive strategy weights based on performance
-                updated_weights = adaptive_weight_manager.update_weights(
-                    strategy_performance=strategy_performance,
-                    market_regime=regime_name,
-                    force_update=False
-                )
+                    # 🚀 PHASE 3: Select strategies based on regime and performance
+                    selected_strategies = self.strategy_selector.select_strategies(
+                        market_regime=regime_name,
+                        regime_confidence=regime_confidence,
+                        strategy_weights=updated_weights,
+                        strategy_performance=strategy_performance
+                    )
 
-                logger.info(f"🎯 ADAPTIVE WEIGHTS: {updated_weights}")
+                    # 🔧 SINGLE STRATEGY MODE: Force 100% allocation to best strategy
+                    if selected_strategies:
+                        # Select only the best strategy (highest selection score)
+                        best_strategy = max(selected_strategies, key=lambda s: s.get('selection_score', 0))
+                        best_strategy['effective_allocation'] = 1.0  # Force 100% allocation
+                        selected_strategies = [best_strategy]  # Use only the best strategy
 
-                # 🚀 PHASE 3: Select strategies based on regime and performance
-                selected_strategies = strategy_selector.select_strategies(
-                    market_regime=regime_name,
-                    regime_confidence=regime_confidence,
-                    strategy_weights=updated_weights,
-                    strategy_performance=strategy_performance
-                )
+                        logger.info(f"🎯 SINGLE STRATEGY MODE: {best_strategy['strategy_name']} selected with 100% allocation")
+                        logger.info(f"  - Selection Score: {best_strategy.get('selection_score', 0):.3f}")
+                        logger.info(f"  - Suitability Score: {best_strategy.get('suitability_score', 0):.3f}")
+                    else:
+                        logger.info(f"📊 NO STRATEGIES SELECTED: {len(selected_strategies)} strategies chosen")
 
-                # 🔧 SINGLE STRATEGY MODE: Force 100% allocation to best strategy
-                if selected_strategies:
-                    # Select only the best strategy (highest selection score)
-                    best_strategy = max(selected_strategies, key=lambda s: s.get('selection_score', 0))
-                    best_strategy['effective_allocation'] = 1.0  # Force 100% allocation
-                    selected_strategies = [best_strategy]  # Use only the best strategy
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not update adaptive weights: {e}")
+                    # 🔧 SINGLE STRATEGY MODE: Fallback to single strategy with 100% allocation
+                    selected_strategies = [{
+                        'strategy_name': 'opportunistic_volatility_breakout',
+                        'effective_allocation': 1.0,  # 🔧 SINGLE STRATEGY: 100% allocation
+                        'suitability_score': 0.8,
+                        'selection_score': 0.8
+                    }]
+                    updated_weights = {'opportunistic_volatility_breakout': 1.0}
+                    logger.info("🎯 SINGLE STRATEGY MODE: Using fallback strategy with 100% allocation")
+
+            with timer.phase('sizing'):
+                # 🚀 PHASE 3: Generate signals for each selected strategy with adaptive allocation
+                for strategy_info in selected_strategies:
+                    strategy_name = strategy_info['strategy_name']
+                    strategy_allocation = strategy_info['effective_allocation']
+                    strategy_suitability = strategy_info['suitability_score']
+
+                    # Process opportunities for this strategy
+                    for opp in opportunities[:2]:  # Limit to top 2 per strategy
+                        symbol = opp.get('symbol', 'UNKNOWN')
+
+                        # 🔧 FIXED: Smart market pair mapping to prevent USDC-USDC invalid pairs
+                        if symbol == 'USDC':
+                            market_pair = 'SOL-USDC'  # Map USDC to SOL-USDC
+                            logger.info(f"🔧 FIXED: Mapped USDC opportunity to SOL-USDC pair")
+                        elif symbol == 'SOL':
+                            market_pair = 'SOL-USDC'  # SOL to SOL-USDC
+                        elif symbol in ['USDT', 'BONK', 'JUP', 'RAY', 'ORCA']:
+                            market_pair = f"{symbol}-USDC"  # Valid pairs
+                        else:
+                            # For unknown tokens, default to SOL-USDC to avoid invalid pairs
+                            market_pair = 'SOL-USDC'
+                            logger.info(f"🔧 FIXED: Mapped unknown token {symbol} to SOL-USDC pair")
+
+                        base_confidence = opp.get('score', 0.5)
+
+                        # 🚀 PHASE 3: Adjust confidence based on strategy suitability
+                        strategy_adjusted_confidence = base_confidence * strategy_suitability
+
+                        # 🚀 PHASE 2: Create raw signal for enrichment
+                        raw_signal = {
+                            'action': 'BUY',
+                            'market': market_pair,  # 🔧 FIXED: Use smart market pair mapping
+                            'price': opp.get('price', 0),
+                            'confidence': strategy_adjusted_confidence,
+                            'timestamp': datetime.now().isoformat(),
+                            'source': strategy_name,  # 🚀 PHASE 3: Use selected strategy name
+                            'volume': opp.get('volume', 0),
+                            'market_cap': opp.get('market_cap', 0),
+                            'volatility': opp.get('volatility', 0.03),
+                            'strategy_allocation': strategy_allocation,  # 🚀 PHASE 3: Include allocation
+                            'strategy_suitability': strategy_suitability  # 🚀 PHASE 3: Include suitability
+                        }
 
-                    logger.info(f"🎯 SINGLE STRATEGY MODE: {best_strategy['strategy_name']} selected with 100% allocation")
-                    logger.info(f"  - Selection Score: {best_strategy.get('selection_score', 0):.3f}")
-                    logger.info(f"  - Suitability Score: {best_strategy.get('suitability_score', 0):.3f}")
-                else:
-                    logger.info(f"📊 NO STRATEGIES SELECTED: {len(selected_strategies)} strategies chosen")
+                    # 🚀 LIVE TRADING: Use direct signal confidence
+                    enhanced_confidence = base_confidence
+                    priority_score = base_confidence  # Use confidence as priority
+                    enriched_signal = raw_signal
+                    logger.info(f"🎯 Live signal: confidence {enhanced_confidence:.3f}, priority {priority_score:.3f}")
+
+                    # 🚀 PHASE 2: Apply confidence threshold filter
+                    confidence_threshold = self.position_sizer_config['risk_management']['confidence_threshold']
+                    if enhanced_confidence < confidence_threshold:
+                        logger.info(f"❌ SIGNAL FILTERED: Confidence {enhanced_confidence:.3f} below threshold {confidence_threshold}")
+                        continue
+
+                    # 🚀 PHASE 2: Apply market timing filter
+                    regime_name = current_regime.value if current_regime else 'unknown'
+                    regime_multiplier = self.position_sizer_config['risk_management']['regime_multipliers'].get(regime_name, 0.6)
+
+                    if regime_multiplier < 0.5:
+                        logger.info(f"❌ MARKET TIMING FILTER: Regime '{regime_name}' unfavorable (multiplier: {regime_multiplier})")
+                        continue
+
+                    # 🚀 PHASE 1 + 2 + 3: Dynamic Position Sizing with adaptive strategy allocation
+                    position_info = self.position_sizer.calculate_position_size(
+                        signal_strength=enhanced_confidence,  # Use enhanced confidence
+                        strategy=strategy_name,  # 🚀 PHASE 3: Use selected strategy
+                        market_regime=regime_name,  # Use detected regime
+                        volatility=enriched_signal.get('volatility', 0.03)
+                    )
 
-            except Exception as e:
-                logger.warning(f"⚠️ Could not update adaptive weights: {e}")
-                # 🔧 SINGLE STRATEGY MODE: Fallback to single strategy with 100% allocation
-                selected_strategies = [{
-                    'strategy_name': 'opportunistic_volatility_breakout',
-                    'effective_allocation': 1.0,  # 🔧 SINGLE STRATEGY: 100% allocation
-                    'suitability_score': 0.8,
-                    'selection_score': 0.8
-                }]
-                updated_weights = {'opportunistic_volatility_breakout': 1.0}
-                logger.info("🎯 SINGLE STRATEGY MODE: Using fallback strategy with 100% allocation")
-
-            # 🚀 PHASE 3: Generate signals for each selected strategy with adaptive allocation
-            for strategy_info in selected_strategies:
-                strategy_name = strategy_info['strategy_name']
-                strategy_allocation = strategy_info['effective_allocation']
-                strategy_suitability = strategy_info['suitability_score']
-
-                # Process opportunities for this strategy
-                for opp in opportunities[:2]:  # Limit to top 2 per strategy
-                    symbol = opp.get('symbol', 'UNKNOWN')
-
-                    # 🔧 FIXED: Smart market pair mapping to prevent USDC-USDC invalid pairs
-                    if symbol == 'USDC':
-                        market_pair = 'SOL-USDC'  # Map USDC to SOL-USDC
-                        logger.info(f"🔧 FIXED: Mapped USDC opportunity to SOL-USDC pair")
-                    elif symbol == 'SOL':
-                        market_pair = 'SOL-USDC'  # SOL to SOL-USDC
-                    elif symbol in ['USDT', 'BONK', 'JUP', 'RAY', 'ORCA']:
-                        market_pair = f"{symbol}-USDC"  # Valid pairs
-                    else:
-                        # For unknown tokens, default to SOL-USDC to avoid invalid pairs
-                        market_pair = 'SOL-USDC'
-                        logger.info(f"🔧 FIXED: Mapped unknown token {symbol} to SOL-USDC pair")
+                    dynamic_size = position_info.get('position_size_sol', 0.01)
 
-                    base_confidence = opp.get('score', 0.5)
+                    # 🚀 PHASE 3: Apply strategy allocation multiplier
+                    strategy_allocated_size = dynamic_size * strategy_allocation
 
-                    # 🚀 PHASE 3: Adjust confidence based on strategy suitability
-                    strategy_adjusted_confidence = base_confidence * strategy_suitability
+                    # Apply regime multiplier to position size
+                    final_size = strategy_allocated_size * regime_multiplier
 
-                    # 🚀 PHASE 2: Create raw signal for enrichment
-                    raw_signal = {
-                        'action': 'BUY',
-                        'market': market_pair,  # 🔧 FIXED: Use smart market pair mapping
-                        'price': opp.get('price', 0),
-                        'confidence': strategy_adjusted_confidence,
-                        'timestamp': datetime.now().isoformat(),
-                        'source': strategy_name,  # 🚀 PHASE 3: Use selected strategy name
-                        'volume': opp.get('volume', 0),
-                        'market_cap': opp.get('market_cap', 0),
-                        'volatility': opp.get('volatility', 0.03),
-                        'strategy_allocation': strategy_allocation,  # 🚀 PHASE 3: Include allocation
-                        'strategy_suitability': strategy_suitability  # 🚀 PHASE 3: Include suitability
-                    }
+                    logger.info(f"💰 PHASE 3 SIZING: {final_size:.4f} SOL")
+                    logger.info(f"📊 Strategy: {strategy_name} ({strategy_allocation:.1%} allocation)")
+                    logger.info(f"📊 Confidence: {base_confidence:.3f} → {enhanced_confidence:.3f}")
+                    logger.info(f"📊 Regime: {regime_name} (×{regime_multiplier})")
+                    logger.info(f"📊 Value: ${position_info.get('position_size_usd', 0) * strategy_allocation * regime_multiplier:.2f} USD")
 
-                # 🚀 LIVE TRADING: Use direct signal confidence
-                enhanced_confidence = base_confidence
-                priority_score = base_confidence  # Use confidence as priority
-                enriched_signal = raw_signal
-                logger.info(f"🎯 Live signal: confidence {enhanced_confidence:.3f}, priority {priority_score:.3f}")
-
-                # 🚀 PHASE 2: Apply confidence threshold filter
-                confidence_threshold = position_sizer_config['risk_management']['confidence_threshold']
-                if enhanced_confidence < confidence_threshold:
-                    logger.info(f"❌ SIGNAL FILTERED: Confidence {enhanced_confidence:.3f} below threshold {confidence_threshold}")
-                    continue
-
-                # 🚀 PHASE 2: Apply market timing filter
-                regime_name = current_regime.value if current_regime else 'unknown'
-                regime_multiplier = position_sizer_config['risk_management']['regime_multipliers'].get(regime_name, 0.6)
-
-                if regime_multiplier < 0.5:
-                    logger.info(f"❌ MARKET TIMING FILTER: Regime '{regime_name}' unfavorable (multiplier: {regime_multiplier})")
-                    continue
-
-                # 🚀 PHASE 1 + 2 + 3: Dynamic Position Sizing with adaptive strategy allocation
-                position_info = position_sizer.calculate_position_size(
-                    signal_strength=enhanced_confidence,  # Use enhanced confidence
-                    strategy=strategy_name,  # 🚀 PHASE 3: Use selected strategy
-                    market_regime=regime_name,  # Use detected regime
-                    volatility=enriched_signal.get('volatility', 0.03)
-                )
+                    # 🚀 CRITICAL FIX: Generate signal from strategy instead of hardcoding BUY
+                    strategy_signal = await self._generate_strategy_signal(strategy_name, opp, market_pair)
 
-                dynamic_size = position_info.get('position_size_sol', 0.01)
-
-                # 🚀 PHASE 3: Apply strategy allocation multiplier
-                strategy_allocated_size = dynamic_size * strategy_allocation
-
-                # Apply regime multiplier to position size
-                final_size = strategy_allocated_size * regime_multiplier
-
-                logger.info(f"💰 PHASE 3 SIZING: {final_size:.4f} SOL")
-                logger.info(f"📊 Strategy: {strategy_name} ({strategy_allocation:.1%} allocation)")
-                logger.info(f"📊 Confidence: {base_confidence:.3f} → {enhanced_confidence:.3f}")
-                logger.info(f"📊 Regime: {regime_name} (×{regime_multiplier})")
-                logger.info(f"📊 Value: ${position_info.get('position_size_usd', 0) * strategy_allocation * regime_multiplier:.2f} USD")
-
-                # 🚀 CRITICAL FIX: Generate signal from strategy instead of hardcoding BUY
-                strategy_signal = await self._generate_strategy_signal(strategy_name, opp, market_pair)
-
-                signal = {
-                    'action': strategy_signal.get('action', 'BUY'),  # Use strategy-generated action
-                    'market': market_pair,  # 🔧 FIXED: Use smart market pair mapping (already defined above)
-                    'price': opp.get('price', 0),
-                    'size': final_size,  # 🎯 PHASE 3: Enhanced with strategy allocation + regime
-                    'confidence': enhanced_confidence,
-                    'timestamp': datetime.now().isoformat(),
-                    'source': strategy_name,  # 🚀 PHASE 3: Use strategy name
-                    'position_info': position_info,
-                    'strategy_info': {  # 🚀 PHASE 3: Strategy allocation details
-                        'strategy_name': strategy_name,
-                        'allocation': strategy_allocation,
-                        'suitability': strategy_suitability,
-                        'base_size': dynamic_size,
-                        'allocated_size': strategy_allocated_size,
-                        'final_size': final_size
-                    },
-                    'regime_info': {
-                        'regime': regime_name,
-                        'multiplier': regime_multiplier,
-                        'confidence': regime_confidence
-                    },
-                    'enrichment_info': {
-                        'base_confidence': base_confidence,
-                        'strategy_adjusted_confidence': strategy_adjusted_confidence,
-                        'enhanced_confidence': enhanced_confidence,
-                        'priority_score': priority_score
+                    signal = {
+                        'action': strategy_signal.get('action', 'BUY'),  # Use strategy-generated action
+                        'market': market_pair,  # 🔧 FIXED: Use smart market pair mapping (already defined above)
+                        'price': opp.get('price', 0),
+                        'size': final_size,  # 🎯 PHASE 3: Enhanced with strategy allocation + regime
+                        'confidence': enhanced_confidence,
+                        'timestamp': datetime.now().isoformat(),
+                        'source': strategy_name,  # 🚀 PHASE 3: Use strategy name
+                        'position_info': position_info,
+                        'strategy_info': {  # 🚀 PHASE 3: Strategy allocation details
+                            'strategy_name': strategy_name,
+                            'allocation': strategy_allocation,
+                            'suitability': strategy_suitability,
+                            'base_size': dynamic_size,
+                            'allocated_size': strategy_allocated_size,
+                            'final_size': final_size
+                        },
+                        'regime_info': {
+                            'regime': regime_name,
+                            'multiplier': regime_multiplier,
+                            'confidence': regime_confidence
+                        },
+                        'enrichment_info': {
+                            'base_confidence': base_confidence,
+                            'strategy_adjusted_confidence': strategy_adjusted_confidence,
+                            'enhanced_confidence': enhanced_confidence,
+                            'priority_score': priority_score
+                        }
                     }
-                }
-                signals.append(signal)
+                    signals.append(signal)
 
             # Execute signals directly (no enrichment needed for live trading)
             if signals:
@@ -1151,6 +1246,53 @@ class UnifiedLiveTrader:
                 'trade_result': None
             }
 
+    def _cycle_phase(self, name: str):
+        """Time a block against the running cycle's phase timer, if any."""
+        if self.current_cycle_timer is None:
+            return nullcontext()
+        return self.current_cycle_timer.phase(name)
+
+    def _record_cycle_metrics(self, cycle_timing: dict, cycle_result: dict):
+        """Keep a cycle's phase timings in memory and append them to the metrics file."""
+        record = {
+            **cycle_timing,
+            'signals_generated': cycle_result.get('signals_generated', 0),
+            'trade_executed': cycle_result.get('trade_executed', False),
+            'error': cycle_result.get('error')
+        }
+        self.cycle_metrics.append(record)
+
+        phases = ', '.join(f"{phase}={ms:.0f}ms" for phase, ms in record['phases_ms'].items() if ms)
+        logger.info(f"⏱️ Cycle {record['cycle']} took {record['total_ms']:.0f}ms ({phases})")
+
+        try:
+            os.makedirs(os.path.dirname(self.cycle_metrics_file), exist_ok=True)
+            with open(self.cycle_metrics_file, 'a') as f:
+                f.write(json.dumps(record, cls=CustomJSONEncoder) + '\n')
+        except Exception as e:
+            logger.warning(f"⚠️ Could not write cycle metrics: {e}")
+
+    def get_cycle_metrics(self) -> dict:
+        """Summarize recent cycle phase timings (mean and max per phase)."""
+        if not self.cycle_metrics:
+            return {'cycles': 0, 'phases_ms': {}}
+
+        summary = {}
+        for phase in CyclePhaseTimer.PHASES:
+            values = [record['phases_ms'].get(phase, 0.0) for record in self.cycle_metrics]
+            summary[phase] = {
+                'mean': round(sum(values) / len(values), 2),
+                'max': round(max(values), 2)
+            }
+
+        totals = [record['total_ms'] for record in self.cycle_metrics]
+        return {
+            'cycles': len(self.cycle_metrics),
+            'total_ms': {'mean': round(sum(totals) / len(totals), 2), 'max': round(max(totals), 2)},
+            'phases_ms': summary,
+            'last_cycle': self.cycle_metrics[-1]
+        }
+
     async def _generate_strategy_signal(self, strategy_name: str, opportunity: dict, market_pair: str) -> dict:
         """Generate trading signal from strategy instead of hardcoding BUY."""
         try:
@@ -1266,7 +1408,10 @@ class UnifiedLiveTrader:
             price_service = await get_enhanced_price_service()
 
             # Get SOL price from enhanced price service
-            sol_price_data = await price_service.get_token_price("So11111111111111111111111111111111111111112")
+            sol_price_data = await price_service.get_token_price(
+                "So11111111111111111111111111111111111111112",
+                max_stale_age=price_service.trading_max_stale_age
+            )
             sol_price = sol_price_data.get('value', 180.0) if sol_price_data else 180.0
 
             # Generate real market opportunities based on current conditions
@@ -1408,6 +1553,15 @@ class UnifiedLiveTrader:
             if self.telegram_notifier:
                 await self.telegram_notifier.close()
 
+            # Run the registered shutdown hooks: trade journals, SQLite writers,
+            # the shared HTTP clients and the bundle tracker
+            from phase_4_deployment.core.shutdown_handler import shutdown
+            await shutdown()
+
+            cycle_summary = self.get_cycle_metrics()
+            if cycle_summary['cycles']:
+                logger.info(f"⏱️ Cycle phase timings: {json.dumps(cycle_summary['phases_ms'])}")
+
             logger.info(f"🏁 Trading session completed. Ran {cycle_count} cycles.")
 
         return True
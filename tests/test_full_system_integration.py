@@ -456,5 +456,295 @@ class TestSystemRecovery:
         await executor.close()
 
 
+class TestSharedAPICache:
+    """Test the shared LRU+TTL API cache."""
+
+    def test_lru_eviction_ttl_and_disk_tier(self, tmp_path):
+        """Entries are evicted LRU-first, expire proactively and persist to one file."""
+        from phase_4_deployment.utils.ttl_cache import LRUTTLCache
+
+        disk_path = str(tmp_path / "api_cache.sqlite")
+        cache = LRUTTLCache(max_size=2, default_ttl=60, disk_path=disk_path)
+        cache.set('a', {'value': 1})
+        cache.set('b', {'value': 2})
+        assert cache.get('a') == {'value': 1}  # 'a' is now most recently used
+        cache.set('c', {'value': 3})
+        assert 'b' not in cache
+        assert cache.stats['evictions'] == 1
+
+        # Already expired on arrival: it still evicts 'a', then expires itself
+        cache.set('short', [1], ttl=-1)
+        assert len(cache) == 1
+        assert cache.stats['expirations'] == 1
+        assert cache.get('short') is None
+
+        # Evicted from memory, still served from the disk tier
+        assert cache.get('b') == {'value': 2}
+        assert cache.stats['disk_hits'] == 1
+        cache.close()
+
+        reopened = LRUTTLCache(max_size=2, disk_path=disk_path)
+        assert reopened.get('c') == {'value': 3}
+        assert not [name for name in os.listdir(tmp_path) if name.endswith('.json')]
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_cached_negatively(self):
+        """A 404 is cached so the API manager doesn't request it again."""
+        from phase_4_deployment.apis.enhanced_api_manager import EnhancedAPIManager, APIProvider
+
+        manager = EnhancedAPIManager()
+        manager.initialized = True
+        manager.providers = {'birdeye': [APIProvider('birdeye_primary', 'https://example.invalid')]}
+        manager.cache.clear()
+
+        response = Mock()
+        response.status_code = 404
+        manager.http_client = Mock()
+        manager.http_client.get = AsyncMock(return_value=response)
+
+        for _ in range(3):
+            assert await manager.call_api('birdeye', '/defi/token_meta', cache_key='meta_missing') is None
+
+        assert manager.http_client.get.await_count == 1
+        assert manager.cache.stats['negative_hits'] >= 2
+        assert manager.providers['birdeye'][0].failure_count == 0
+
+
+class TestSharedHTTPClients:
+    """Tests for the process-wide HTTP client registry."""
+
+    @pytest.mark.asyncio
+    async def test_clients_are_shared_per_host(self):
+        """Requests to one host share a client; other hosts get their own."""
+        from phase_4_deployment.utils.http_clients import HTTPClientRegistry
+
+        registry = HTTPClientRegistry()
+        birdeye = registry.get_client('https://public-api.birdeye.so/defi/price')
+        assert registry.get_client('https://public-api.birdeye.so/defi/multi_price') is birdeye
+        assert registry.get_client('https://api.telegram.org/bot/sendMessage') is not birdeye
+        assert registry.get_client('https://public-api.birdeye.so:8443/defi/price') is not birdeye
+        assert set(registry.get_pool_metrics()) == {
+            'https://public-api.birdeye.so', 'https://api.telegram.org', 'https://public-api.birdeye.so:8443'
+        }
+
+        await registry.aclose()
+        assert birdeye.is_closed
+        assert registry.get_pool_metrics() == {}
+        assert not registry.get_client('https://public-api.birdeye.so/defi/price').is_closed
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_pool_metrics_track_reused_connections(self):
+        """Keep-alive connections are reused and show up as idle with wait times."""
+        from phase_4_deployment.utils.http_clients import HTTPClientRegistry
+
+        async def handle(reader, writer):
+            try:
+                while True:
+                    await reader.readuntil(b'\r\n\r\n')
+                    writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                                 b'Content-Length: 11\r\n\r\n{"ok":true}')
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                writer.close()
+
+        server = await asyncio.start_server(handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        url = f'http://127.0.0.1:{port}/status'
+
+        registry = HTTPClientRegistry(http2=False)
+        try:
+            for _ in range(3):
+                response = await registry.get_client(url).get(url)
+                assert response.json() == {'ok': True}
+
+            metrics = registry.get_pool_metrics()[f'http://127.0.0.1:{port}']
+            assert metrics['requests'] == 3
+            assert metrics['connections_opened'] == 1
+            assert metrics['idle_connections'] == 1
+            assert metrics['active_connections'] == 0
+            assert metrics['waits_measured'] == 3
+            assert metrics['avg_wait_time_ms'] >= 0.0
+        finally:
+            await registry.aclose()
+            server.close()
+            await server.wait_closed()
+
+    @pytest.mark.asyncio
+    async def test_aclose_handles_clients_of_other_loops(self):
+        """Clients of a dead loop are dropped; clients of an idle live loop are kept."""
+        from phase_4_deployment.utils.http_clients import HTTPClientRegistry
+
+        registry = HTTPClientRegistry()
+        dead_loop = asyncio.new_event_loop()
+        dead_loop.close()
+        idle_loop = asyncio.new_event_loop()
+        try:
+            registry.pools['https://dead'] = registry._create_pool('https://dead', dead_loop)
+            registry.pools['https://idle'] = registry._create_pool('https://idle', idle_loop)
+            own = registry.get_client('https://own/path')
+
+            await registry.aclose()
+            assert own.is_closed
+            assert set(registry.pools) == {'https://idle'}
+            assert not registry.pools['https://idle'].client.is_closed
+        finally:
+            idle_loop.close()
+
+
+class TestMultiplexedTransport:
+    """Tests for the DEALER/ROUTER transport of the Rust communication layer."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_matched_by_correlation_id(self):
+        """Replies arriving out of order reach the request that sent them."""
+        pytest.importorskip("zmq")
+        from phase_4_deployment.python_comm_layer.client import RustCommClient, TransactionPrepClient
+        from phase_4_deployment.python_comm_layer.transport import EchoServer
+
+        async def handler(request):
+            # Later requests finish first
+            await asyncio.sleep(0.05 - request['data']['n'] * 0.01)
+            return {'status': 'success', 'data': {'n': request['data']['n'], 'type': request['request']}}
+
+        server = EchoServer('inproc://comm-test-concurrent', handler=handler)
+        await server.start()
+        comm_client = RustCommClient(req_endpoint='inproc://comm-test-concurrent',
+                                     pub_endpoint='inproc://comm-test-pub', sub_endpoint='inproc://comm-test-sub')
+        await comm_client.connect()
+        try:
+            responses = await asyncio.gather(*(comm_client.request('probe', {'n': n}) for n in range(5)))
+            assert [response['data']['n'] for response in responses] == list(range(5))
+            assert comm_client.req_transport.get_stats()['in_flight'] == 0
+
+            server.handler = EchoServer.echo
+            prep_client = TransactionPrepClient(comm_client=comm_client)
+            prepared = await prep_client.prepare_transaction([{'program_id': 'p', 'data': 'AQID'}], ['signer'])
+            assert prepared == {'instructions': [{'program_id': 'p', 'data': 'AQID'}], 'signers': ['signer']}
+        finally:
+            await comm_client.disconnect()
+            await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_timeout_leaves_socket_usable(self):
+        """A timed-out request drops its late reply and the next request succeeds."""
+        pytest.importorskip("zmq")
+        from phase_4_deployment.python_comm_layer.transport import (
+            DealerTransport, EchoServer, CommunicationError
+        )
+
+        async def handler(request):
+            await asyncio.sleep(request.get('sleep', 0))
+            return {'echo': request['id']}
+
+        server = EchoServer('inproc://comm-test-timeout', handler=handler)
+        await server.start()
+        transport = DealerTransport('inproc://comm-test-timeout', timeout=1.0, codec='json')
+        await transport.connect()
+        try:
+            with pytest.raises(CommunicationError):
+                await transport.request({'id': 1, 'sleep': 0.2}, timeout=0.05)
+
+            assert await transport.request({'id': 2}) == {'echo': 2}
+            await asyncio.sleep(0.25)
+            assert await transport.request({'id': 3}) == {'echo': 3}
+
+            stats = transport.get_stats()
+            assert stats['timeouts'] == 1
+            assert stats['late_replies'] == 1
+            assert stats['responses'] == 2
+        finally:
+            await transport.close()
+            await server.stop()
+
+
+class TestUnifiedLiveTraderCycle:
+    """Tests for UnifiedLiveTrader cycle phase timing and component reuse."""
+
+    def test_cycle_phase_timer_accumulates_phases(self):
+        """Repeated phases add up and untimed work is reported as unattributed."""
+        import time
+        from scripts.unified_live_trading import CyclePhaseTimer
+
+        timer = CyclePhaseTimer(7)
+        with timer.phase('build'):
+            time.sleep(0.02)
+        with timer.phase('build'):
+            time.sleep(0.02)
+        with pytest.raises(RuntimeError):
+            with timer.phase('submit'):
+                time.sleep(0.01)
+                raise RuntimeError("submit failed")
+        time.sleep(0.02)
+
+        record = timer.to_dict()
+        assert record['cycle'] == 7
+        assert list(record['phases_ms']) == list(CyclePhaseTimer.PHASES)
+        assert record['phases_ms']['build'] >= 40
+        assert record['phases_ms']['submit'] >= 10
+        assert record['phases_ms']['balance_fetch'] == 0
+        assert record['unattributed_ms'] >= 20
+        assert record['total_ms'] >= sum(record['phases_ms'].values()) + 20 - 1
+
+    @pytest.mark.asyncio
+    async def test_strategy_components_built_once_across_cycles(self, tmp_path):
+        """Cycles reuse the strategy components and record their phase timings."""
+        from contextlib import ExitStack
+        from scripts.unified_live_trading import UnifiedLiveTrader
+
+        watcher = Mock()
+        regime_detector = Mock()
+        regime_detector.detect_regime.return_value = (None, {}, {})
+        selector = Mock()
+        selector.select_strategies.return_value = [{'strategy_name': 'mean_reversion', 'effective_allocation': 1.0,
+                                                    'suitability_score': 0.9, 'selection_score': 0.9}]
+        sizer = Mock()
+        sizer.calculate_position_size.return_value = {'position_size_sol': 0.05, 'position_size_usd': 9.0}
+        factories = {
+            'core.strategies.market_regime_detector.MarketRegimeDetector': Mock(return_value=regime_detector),
+            'core.strategies.adaptive_weight_manager.AdaptiveWeightManager': Mock(),
+            'core.analytics.strategy_attribution.StrategyAttributionTracker': Mock(),
+            'core.strategies.strategy_selector.StrategySelector': Mock(return_value=selector),
+            'core.risk.production_position_sizer.ProductionPositionSizer': Mock(return_value=sizer),
+        }
+        metrics_file = tmp_path / 'cycle_metrics.jsonl'
+
+        with ExitStack() as stack:
+            for target, factory in factories.items():
+                stack.enter_context(patch(target, factory))
+            stack.enter_context(patch('phase_4_deployment.data_router.enhanced_whale_watcher.get_whale_watcher',
+                                      new=AsyncMock(return_value=watcher)))
+
+            trader = UnifiedLiveTrader(config={'cycle_metrics_file': str(metrics_file)})
+            trader.get_wallet_balance = AsyncMock(return_value=1.5)
+            trader._generate_real_market_opportunities = AsyncMock(return_value=[
+                {'symbol': 'SOL', 'price': 180.0, 'score': 0.8}
+            ])
+            trader._generate_strategy_signal = AsyncMock(return_value={'action': 'BUY'})
+            trader.execute_trade = AsyncMock(return_value={'success': True})
+
+            results = [await trader.run_trading_cycle() for _ in range(3)]
+
+        for factory in factories.values():
+            assert factory.call_count == 1
+        assert watcher.register_alert_callback.call_count == 1
+        assert trader.position_sizer.update_wallet_state.call_count == 3
+        assert regime_detector.detect_regime.call_count == 3
+        assert trader.execute_trade.await_count == 3
+        # Strategies are registered with the selector once, not every cycle
+        assert selector.register_strategy.call_count == 4
+
+        assert [result['phase_timings']['cycle'] for result in results] == [1, 2, 3]
+        assert all(result['trade_executed'] and 'error' not in result for result in results)
+        assert len(metrics_file.read_text().splitlines()) == 3
+
+        summary = trader.get_cycle_metrics()
+        assert summary['cycles'] == 3
+        assert summary['last_cycle']['cycle'] == 3
+        assert set(summary['phases_ms']) == {'balance_fetch', 'market_data', 'regime_detection', 'selection',
+                                             'sizing', 'build', 'submit', 'post_trade'}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
@@ -503,5 +503,272 @@ class TestBackupAndRecovery:
             logger.warning("⚠️ No recovery documentation found")
 
 
+class TestSystemMetricsSampler:
+    """Test non-blocking metrics sampling and incremental log analysis."""
+
+    def test_log_tailer_reads_only_new_lines_and_follows_rotation(self, tmp_path):
+        """Tailer classifies appended lines once and survives rotation/truncation."""
+        pytest.importorskip("psutil")
+        from core.monitoring.system_metrics import LogTailer
+
+        log_path = tmp_path / "synergy7.log"
+        log_path.write_text("INFO start\nERROR API timeout\nWARNING slow\n")
+
+        tailer = LogTailer(str(log_path), window_lines=4)
+        assert tailer.poll() == 3
+        assert tailer.error_counts['api'] == 1
+        assert tailer.warning_counts['total'] == 1
+
+        # Nothing new, nothing re-read; partial lines wait for their newline
+        assert tailer.poll() == 0
+        with open(log_path, 'a') as f:
+            f.write("ERROR Database locked\nERROR Net")
+        assert tailer.poll() == 1
+        assert tailer.error_counts['total'] == 2
+
+        # Rotation: the old file is drained before following the new one
+        with open(log_path, 'a') as f:
+            f.write("work down\n")
+        log_path.rename(tmp_path / "synergy7.log.1")
+        log_path.write_text("INFO fresh\n")
+        assert tailer.poll() == 2
+        assert tailer.rotations == 1
+
+        # Window holds the last 4 lines: WARNING, ERROR DB, ERROR Network, INFO
+        assert tailer.total_lines == 4
+        assert tailer.error_counts['total'] == 2
+        assert tailer.error_counts['api'] == 0
+        assert tailer.error_rate_pct == 50.0
+
+        # Truncation restarts from the beginning of the file
+        log_path.write_text("")
+        assert tailer.poll() == 0
+        assert tailer.rotations == 2
+        with open(log_path, 'a') as f:
+            f.write("ERROR again\n")
+        assert tailer.poll() == 1
+        tailer.close()
+
+    def test_collection_does_not_block_and_updates_snapshot(self, tmp_path):
+        """collect_system_metrics returns immediately and feeds the snapshot."""
+        pytest.importorskip("psutil")
+        from core.monitoring.system_metrics import SystemMetricsMonitor
+
+        monitor = SystemMetricsMonitor({'monitoring': {'log_file': str(tmp_path / "missing.log")}})
+
+        start_time = time.time()
+        monitor.sample()
+        monitor.sample()
+        assert time.time() - start_time < 0.9
+
+        snapshot = monitor.get_latest_snapshot()
+        assert snapshot['timestamp'] == monitor.latest_system_metrics['timestamp']
+        assert 'net_recv_bytes_per_sec' in snapshot
+        assert snapshot['disk_read_bytes_per_sec'] >= 0
+        assert snapshot['sampler_running'] is False
+
+    def test_sampler_survives_failed_sample(self, tmp_path):
+        """A collection error is logged and the sampler keeps running."""
+        pytest.importorskip("psutil")
+        from core.monitoring.system_metrics import SystemMetricsMonitor
+
+        monitor = SystemMetricsMonitor({'monitoring': {'log_file': str(tmp_path / "missing.log"),
+                                                       'sample_interval': 0.01}})
+        monitor.sample = Mock(side_effect=[RuntimeError('psutil failure'), None, None])
+
+        async def run():
+            task = monitor.start_sampler()
+            while monitor.sample.call_count < 3:
+                await asyncio.sleep(0.01)
+            assert not task.done()
+            await monitor.stop_sampler()
+
+        asyncio.run(run())
+
+
+class TestDashboardStream:
+    """Test delta fan-out of dashboard metrics to streaming clients."""
+
+    def test_patches_rebuild_latest_metrics(self):
+        """Subscribers holding snapshot + patches end up with the producer's state."""
+        import copy
+        from phase_4_deployment.dashboard.metrics_stream import MetricsBroadcaster, apply_patch
+
+        broadcaster = MetricsBroadcaster()
+        broadcaster.publish_metrics({'timestamp': 't0', 'wallet': {'balance': 1.0},
+                                     'trading': {'totalTrades': 0, 'old': True}, 'recentTrades': []})
+
+        async def run():
+            # Subscriber queues belong to the running loop
+            subscriber = broadcaster.subscribe()
+
+            # Timestamp-only changes are not sent
+            assert broadcaster.publish_metrics({**broadcaster.state, 'timestamp': 't1'}) == 0
+            assert broadcaster.publish_metrics({'timestamp': 't2', 'wallet': {'balance': 1.5},
+                                                'trading': {'totalTrades': 1}, 'recentTrades': [{'a': 1}],
+                                                'new/key': 5}) == 6
+            broadcaster.publish_event('trade', {'signature': 'abc'})
+            return [await subscriber.get(timeout=0.1) for _ in range(3)]
+
+        snapshot, patch, event = asyncio.run(run())
+        assert snapshot['type'] == 'snapshot' and snapshot['version'] == 1
+        assert patch['type'] == 'patch' and patch['version'] == 2
+        assert {'op': 'remove', 'path': '/trading/old'} in patch['ops']
+        assert {'op': 'add', 'path': '/new~1key', 'value': 5} in patch['ops']
+        assert apply_patch(copy.deepcopy(snapshot['data']), patch['ops']) == broadcaster.state
+        assert event['event'] == 'trade' and event['data']['signature'] == 'abc'
+
+    def test_slow_subscriber_is_resynced_with_snapshot(self):
+        """A full queue collapses into one snapshot without blocking other clients."""
+        from phase_4_deployment.dashboard.metrics_stream import MetricsBroadcaster
+
+        broadcaster = MetricsBroadcaster(max_queue=3)
+
+        async def run():
+            # Subscriber queues belong to the running loop
+            slow = broadcaster.subscribe()
+            fast = broadcaster.subscribe()
+            fast_messages = []
+            for i in range(10):
+                broadcaster.publish_metrics({'trading': {'totalTrades': i}})
+                fast_messages.append(await fast.get(timeout=0.1))
+            slow_messages = []
+            while not slow.queue.empty():
+                slow_messages.append(await slow.get(timeout=0.1))
+            return slow, fast_messages, slow_messages
+
+        slow, fast_messages, slow_messages = asyncio.run(run())
+        assert [m['version'] for m in fast_messages[1:]] == list(range(1, 10))
+        assert len(slow_messages) <= 3
+        resync = [m for m in slow_messages if m['type'] == 'snapshot'][-1]
+        assert slow.dropped > 0 and slow.resyncs > 0
+        # Patches after the resync snapshot apply on top of it
+        assert all(m['version'] > resync['version'] for m in slow_messages[slow_messages.index(resync) + 1:])
+        assert broadcaster.get_stats()['resyncs'] == slow.resyncs
+
+    def test_whale_events_attach_only_to_running_watcher(self):
+        """The API server never starts a whale watcher and detaches on shutdown."""
+        pytest.importorskip("fastapi")
+        pytest.importorskip("uvicorn")
+        from datetime import datetime
+        from phase_4_deployment.dashboard import api_server
+        from phase_4_deployment.data_router import enhanced_whale_watcher
+        from phase_4_deployment.data_router.enhanced_whale_watcher import EnhancedWhaleWatcher, WhaleAlert
+
+        assert not api_server.WHALE_EVENTS_ENABLED
+
+        with patch.object(enhanced_whale_watcher, '_whale_watcher', None), \
+                patch.object(EnhancedWhaleWatcher, 'initialize') as initialize:
+            assert api_server.register_whale_events() is False
+            assert enhanced_whale_watcher._whale_watcher is None
+            initialize.assert_not_called()
+
+        watcher = EnhancedWhaleWatcher()
+        with patch.object(enhanced_whale_watcher, '_whale_watcher', watcher):
+            assert api_server.register_whale_events() is True
+
+        alert = WhaleAlert(signature='sig', timestamp=datetime.now(), whale_wallet='whale', target_wallet='target',
+                           amount_sol=5000.0, amount_usd=900000.0, token_mint='SOL', transaction_type='transfer',
+                           confidence=0.9, market_impact='high', alert_level='critical')
+        with patch.object(api_server.broadcaster, 'publish_event') as publish_event:
+            asyncio.run(watcher._send_whale_alert(alert))
+            assert publish_event.call_args[0][0] == 'whale'
+
+            api_server.unregister_whale_events()
+            assert watcher.alert_callbacks == []
+            assert api_server.whale_event_source is None
+            asyncio.run(watcher._send_whale_alert(alert))
+            assert publish_event.call_count == 1
+
+
+class TestDashboardDataProvider:
+    """Test the cached, incremental data layer behind the Streamlit dashboard."""
+
+    def test_json_sources_reload_only_when_changed(self, tmp_path):
+        """Files are parsed once and re-parsed when their mtime/size change."""
+        from phase_4_deployment.dashboard.dashboard_data import DashboardDataProvider
+
+        summary_file = tmp_path / "output/live_production/dashboard/current_session_summary.json"
+        summary_file.parent.mkdir(parents=True)
+        summary_file.write_text(json.dumps({'trades_executed': 1}))
+
+        provider = DashboardDataProvider(base_dir=str(tmp_path), min_refresh_interval=0)
+        assert provider.get('session_summary') == {'trades_executed': 1}
+        assert provider.get('alerts') is None
+        loads = provider.stats['file_loads']
+        version = provider.version('session_summary')
+
+        # Unchanged files are served from memory
+        assert provider.refresh() == set()
+        assert provider.stats['file_loads'] == loads
+
+        summary_file.write_text(json.dumps({'trades_executed': 12}))
+        os.utime(summary_file, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+        assert provider.refresh() == {'session_summary'}
+        assert provider.get('session_summary') == {'trades_executed': 12}
+        assert provider.version('session_summary') != version
+
+        # A torn write keeps the last good data and is retried
+        summary_file.write_text('{"trades_exec')
+        assert provider.refresh() == set()
+        assert provider.get('session_summary') == {'trades_executed': 12}
+        assert provider.stats['file_errors'] == 1
+
+    def test_trades_follow_journal_incrementally(self, tmp_path):
+        """Only trades appended since the last refresh are read from the journal."""
+        from datetime import datetime
+        from core.execution.trade_journal import TradeJournal
+        from phase_4_deployment.dashboard.dashboard_data import DashboardDataProvider
+
+        journal = TradeJournal(str(tmp_path / "trades"), fsync_every=1)
+        for i in range(5):
+            journal.append({'signature': f'sig{i}', 'success': True, 'timestamp': datetime.now().isoformat()})
+        journal.flush()
+
+        provider = DashboardDataProvider(base_dir=str(tmp_path), trades_dir="trades",
+                                         recent_limit=3, min_refresh_interval=0)
+        assert [t['signature'] for t in provider.recent_trades(10)] == ['sig2', 'sig3', 'sig4']
+        version = provider.version('trades')
+
+        assert 'trades' not in provider.refresh()
+        bytes_read = provider.trade_reader.stats['bytes_read']
+
+        journal.append({'signature': 'sig5', 'success': False, 'timestamp': datetime.now().isoformat()})
+        journal.flush()
+        assert 'trades' in provider.refresh()
+        assert provider.version('trades') != version
+        assert [t['signature'] for t in provider.recent_trades(2)] == ['sig4', 'sig5']
+        assert provider.trade_reader.stats['bytes_read'] > bytes_read
+        journal.close()
+
+    def test_readers_wait_for_refresh_in_progress(self, tmp_path):
+        """Readers never see the trade deque while a refresh is mutating it."""
+        import threading
+        from phase_4_deployment.dashboard.dashboard_data import DashboardDataProvider
+
+        provider = DashboardDataProvider(base_dir=str(tmp_path), trades_dir="trades", min_refresh_interval=0)
+        provider.refresh()
+
+        results = {}
+        readers = [
+            threading.Thread(target=lambda: results.update(trades=provider.recent_trades(5))),
+            threading.Thread(target=lambda: results.update(summary=provider.get('session_summary'))),
+            threading.Thread(target=lambda: results.update(stats=provider.get_stats()))
+        ]
+        with provider._lock:
+            # Stand-in for a refresh that is extending the deque
+            for reader in readers:
+                reader.start()
+            time.sleep(0.05)
+            assert results == {}
+            provider.trades.append({'signature': 'sig0'})
+
+        for reader in readers:
+            reader.join(timeout=1.0)
+        assert results['trades'] == [{'signature': 'sig0'}]
+        assert results['summary'] is None
+        assert results['stats']['cached_trades'] == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -459,5 +459,132 @@ class TestWalletSecurity:
         assert result == True
 
 
+class TestVaRCalculatorBatch:
+    """Test suite for the vectorized VaR/CVaR batch API."""
+
+    @pytest.fixture
+    def calculator(self):
+        """VaR calculator with three confidence levels."""
+        from core.risk.var_calculator import VaRCalculator
+
+        return VaRCalculator({'risk_management': {'var_confidence_levels': [0.9, 0.95, 0.99]}})
+
+    def test_batch_matches_single_series_methods(self, calculator):
+        """Batch results equal the per-level scalar methods at a 1-day horizon."""
+        import numpy as np
+        import pandas as pd
+
+        returns = pd.Series(np.random.default_rng(1).standard_t(4, 400) * 0.02)
+        batch = calculator.calculate_var_batch(returns, horizons=[1])
+
+        for i, level in enumerate(calculator.confidence_levels):
+            assert batch['historical_var'][0, i, 0] == pytest.approx(calculator.historical_var(returns, level))
+            assert batch['conditional_var'][0, i, 0] == pytest.approx(calculator.conditional_var(returns, level))
+            assert batch['parametric_var_normal'][0, i, 0] == pytest.approx(calculator.parametric_var(returns, level))
+            assert batch['monte_carlo_var'][0, i, 0] == pytest.approx(calculator.monte_carlo_var(returns, level))
+
+    def test_batch_matrix_shapes_and_insufficient_series(self, calculator):
+        """Assets x levels x horizons arrays, with short series reported as zero."""
+        import numpy as np
+
+        matrix = np.random.default_rng(2).normal(0, 0.02, (4, 300))
+        matrix[3, :290] = np.nan
+        batch = calculator.calculate_var_batch(matrix, horizons=[1, 10], include_t=False)
+
+        assert batch['historical_var'].shape == (4, 3, 2)
+        assert np.all(batch['historical_var'][3] == 0.0)
+        # Square-root-of-time scaling for historical VaR
+        assert batch['historical_var'][0, 1, 1] == pytest.approx(batch['historical_var'][0, 1, 0] * np.sqrt(10))
+        # CVaR is never below VaR
+        assert np.all(batch['conditional_var'] >= batch['historical_var'])
+
+    def test_dataframe_columns_drop_missing_values(self, calculator):
+        """A DataFrame column with gaps gives the same VaR as the same Series."""
+        import numpy as np
+        import pandas as pd
+
+        rng = np.random.default_rng(4)
+        frame = pd.DataFrame({'SOL': rng.normal(0, 0.02, 400), 'JUP': rng.normal(0, 0.03, 400)})
+        frame.loc[frame.index[-50:], 'JUP'] = np.nan
+
+        batch = calculator.calculate_var_batch(frame, horizons=[1], include_t=False)
+        for column, row in (('SOL', 0), ('JUP', 1)):
+            single = calculator.calculate_var_batch(frame[column], horizons=[1], include_t=False)
+            assert batch['observations'][row] == single['observations'][0]
+            for method in ('historical_var', 'parametric_var_normal', 'conditional_var'):
+                assert batch[method][row] == pytest.approx(single[method][0])
+
+    def test_portfolio_var_includes_correlated_monte_carlo(self, calculator):
+        """Portfolio VaR reports Cholesky-correlated Monte Carlo VaR and CVaR."""
+        import numpy as np
+        import pandas as pd
+
+        rng = np.random.default_rng(3)
+        common = rng.normal(0, 0.02, 300)
+        portfolio_returns = {
+            'SOL': pd.Series(common + rng.normal(0, 0.005, 300)),
+            'JUP': pd.Series(common + rng.normal(0, 0.005, 300))
+        }
+        result = calculator.calculate_portfolio_var(portfolio_returns, {'SOL': 0.5, 'JUP': 0.5})
+
+        assert result['monte_carlo_var'] > 0
+        assert result['monte_carlo_cvar'] >= result['monte_carlo_var']
+        assert result['monte_carlo_var'] == pytest.approx(result['portfolio_var'], rel=0.25)
+
+
+class TestStreamingCorrelation:
+    """Test suite for the streaming correlation tracker."""
+
+    def test_matches_pandas_pairwise_correlation(self):
+        """Windowed incremental correlation equals DataFrame.corr() on the window."""
+        import numpy as np
+        import pandas as pd
+        from core.risk.correlation_tracker import StreamingCorrelationTracker
+
+        rng = np.random.default_rng(0)
+        returns_df = pd.DataFrame(rng.normal(0, 0.01, (300, 6)), columns=list('ABCDEF'))
+        returns_df.iloc[rng.integers(0, 300, 40), rng.integers(0, 6, 40)] = np.nan
+
+        tracker = StreamingCorrelationTracker(window=120, min_observations=30)
+        tracker.update_many(returns_df)
+
+        expected = returns_df.tail(120).corr(min_periods=30)
+        np.testing.assert_allclose(tracker.correlation_matrix().to_numpy(), expected.to_numpy(), atol=1e-9)
+
+    def test_correlated_groups_are_connected_components(self):
+        """A-B and B-C correlations put A, B and C in one group."""
+        import numpy as np
+        from core.risk.correlation_tracker import find_correlated_groups
+
+        matrix = np.array([
+            [1.0, 0.8, 0.1, 0.0],
+            [0.8, 1.0, 0.9, 0.0],
+            [0.1, 0.9, 1.0, np.nan],
+            [0.0, 0.0, np.nan, 1.0]
+        ])
+        assert find_correlated_groups(matrix, ['A', 'B', 'C', 'D'], 0.7) == [['A', 'B', 'C']]
+
+    def test_manager_ingests_only_new_returns(self):
+        """Repeated calls with overlapping history only feed new rows."""
+        import numpy as np
+        import pandas as pd
+        from core.risk.portfolio_risk_manager import PortfolioRiskManager
+
+        rng = np.random.default_rng(1)
+        index = pd.date_range('2026-01-01', periods=200, freq='h')
+        price_data = {
+            asset: pd.DataFrame({'close': 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 200)))}, index=index)
+            for asset in ['SOL', 'JUP', 'BONK']
+        }
+
+        manager = PortfolioRiskManager({'risk_management': {}})
+        manager.calculate_correlation_matrix({a: d.iloc[:150] for a, d in price_data.items()})
+        matrix = manager.calculate_correlation_matrix(price_data)
+
+        assert manager.correlation_tracker.observations == 199
+        expected = pd.DataFrame({a: d['close'].pct_change() for a, d in price_data.items()}).dropna().corr()
+        np.testing.assert_allclose(matrix.to_numpy(), expected.to_numpy(), atol=1e-9)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
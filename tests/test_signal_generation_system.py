@@ -10,6 +10,7 @@ import os
 import sys
 import json
 import logging
+import time
 from unittest.mock import Mock, patch, AsyncMock
 from pathlib import Path
 from datetime import datetime
@@ -467,5 +468,416 @@ class TestSignalMetrics:
         assert processing_time_ms < 1000  # Should be under 1000ms
 
 
+class TestWhaleSlotIngestion:
+    """Test suite for WhaleDetector slot-cursor block ingestion."""
+
+    def _detector(self, tmp_path, tip_slot, blocks, failing=()):
+        from core.whale.whale_detector import WhaleDetector
+
+        detector = WhaleDetector({'whale_detection': {
+            'max_concurrent_block_fetches': 4,
+            'slot_checkpoint_file': str(tmp_path / 'slot_cursor.json')
+        }})
+        detector.http_client = Mock()
+        detector.fetched_slots = []
+
+        async def rpc_request(method, params=None):
+            if method == 'getSlot':
+                return tip_slot, None
+            slot = params[0]
+            detector.fetched_slots.append(slot)
+            if slot in failing:
+                return None, 'http_429'
+            if slot in blocks:
+                return blocks[slot], None
+            return None, {'code': -32007, 'message': f'Slot {slot} was skipped'}
+
+        detector._rpc_request = rpc_request
+        return detector
+
+    @staticmethod
+    def _block(signature):
+        return {'blockTime': 1700000000, 'transactions': [
+            {'transaction': {'signatures': [signature]}, 'meta': {}}
+        ]}
+
+    @pytest.mark.asyncio
+    async def test_fetches_every_slot_in_order(self, tmp_path):
+        """All slots since the cursor are ingested in order, skipping empty slots."""
+        blocks = {slot: self._block(f'sig_{slot}') for slot in range(101, 131) if slot % 3}
+        detector = self._detector(tmp_path, 130, blocks)
+        detector.last_processed_slot = 100
+
+        transactions = await detector._get_recent_transactions()
+
+        assert [tx['slot'] for tx in transactions] == sorted(blocks)
+        assert detector.last_processed_slot == 130
+        assert detector.metrics['slots_skipped'] == 10
+        assert detector.metrics['slot_lag'] == 0
+
+    @pytest.mark.asyncio
+    async def test_cursor_stops_at_failed_slot_and_checkpoints(self, tmp_path):
+        """A failed fetch holds the cursor so the slot is retried, and the cursor persists."""
+        blocks = {slot: self._block(f'sig_{slot}') for slot in range(11, 21)}
+        detector = self._detector(tmp_path, 20, blocks, failing={15})
+        detector.last_processed_slot = 10
+
+        await detector._monitor_cycle()
+
+        assert detector.last_processed_slot == 14
+        assert detector.metrics['slot_lag'] == 6
+        assert detector.metrics['block_fetch_errors'] == 1
+        assert detector._load_slot_checkpoint() == 14
+
+    @pytest.mark.asyncio
+    async def test_no_windows_fetched_past_a_gap(self, tmp_path):
+        """Slots are fetched in bounded windows and nothing is scheduled after a failed window."""
+        blocks = {slot: self._block(f'sig_{slot}') for slot in range(101, 301)}
+        detector = self._detector(tmp_path, 300, blocks, failing={120})
+        detector.last_processed_slot = 100
+
+        await detector._monitor_cycle()
+
+        # Windows of max_concurrent_block_fetches * 2 = 8 slots: 101-108, 109-116, 117-124
+        assert sorted(detector.fetched_slots) == list(range(101, 125))
+        assert detector.last_processed_slot == 119
+        assert detector.metrics['transactions_processed'] == 19
+        assert detector._load_slot_checkpoint() == 119
+
+
+class TestWhaleBlockAnalyzer:
+    """Test suite for the vectorized whale balance scan."""
+
+    @staticmethod
+    def _tx(signature, keys, pre, post, err=None):
+        return {
+            'transaction': {'signatures': [signature], 'message': {'accountKeys': keys}},
+            'meta': {'err': err, 'fee': 5000, 'preBalances': pre, 'postBalances': post}
+        }
+
+    def test_sender_and_receiver_found_regardless_of_order(self):
+        """The largest decrease and increase are picked even when the sender comes first."""
+        from core.whale.whale_detector import WhaleDetector
+
+        detector = WhaleDetector({'whale_detection': {'min_whale_amount_sol': 100.0}})
+        sol = 10 ** 9
+        exchange = next(iter(detector.exchange_addresses))
+        transactions = [
+            self._tx('small', ['a', 'b'], [10 * sol, 0], [5 * sol, 5 * sol]),
+            self._tx('whale', ['sender', 'fee_payer', exchange],
+                     [600 * sol, 1 * sol, 0], [100 * sol - 5000, 2 * sol, 499 * sol]),
+            self._tx('failed', ['c', 'd'], [900 * sol, 0], [0, 900 * sol], err={'InstructionError': []}),
+        ]
+
+        whales = detector._analyze_block(transactions)
+
+        assert [w.signature for w in whales] == ['whale']
+        assert whales[0].from_address == 'sender'
+        assert whales[0].to_address == exchange
+        assert whales[0].is_exchange_related
+        assert whales[0].amount_sol == pytest.approx(500.000005)
+
+
+def make_whale_transaction(signature, timestamp, amount_sol=500.0, from_address='a', to_address='b',
+                           exchange_name=None, confidence_score=0.7):
+    """Build a WhaleTransaction transfer for the whale store and aggregate tests."""
+    from core.whale.whale_detector import WhaleTransaction
+
+    return WhaleTransaction(
+        signature=signature, timestamp=timestamp, from_address=from_address, to_address=to_address,
+        amount_sol=amount_sol, amount_usd=amount_sol * 180.0, transaction_type='transfer',
+        is_exchange_related=exchange_name is not None, exchange_name=exchange_name,
+        confidence_score=confidence_score, metadata={}
+    )
+
+
+class TestWhaleSegmentStore:
+    """Test suite for the hourly whale transaction segment store."""
+
+    def test_window_load_reads_only_overlapping_segments(self, tmp_path):
+        """Loads open only segments in the window; retention drops whole segments."""
+        from datetime import timedelta
+        from core.whale.whale_store import WhaleSegmentStore, whale_transaction_to_dict
+
+        store = WhaleSegmentStore(str(tmp_path))
+        now = datetime.now()
+        for hours_ago in (0, 1, 5, 30):
+            whale = make_whale_transaction(f'sig_{hours_ago}', now - timedelta(hours=hours_ago, minutes=1))
+            store.append(whale_transaction_to_dict(whale), whale.timestamp)
+
+        records = store.read(now - timedelta(hours=2))
+        assert [r['signature'] for r in records] == ['sig_1', 'sig_0']
+        assert store.stats['segments_read'] <= 3
+
+        segments, deleted = store.drop_before(now - timedelta(hours=24))
+        assert (segments, deleted) == (1, 1)
+
+        store.close()
+        reopened = WhaleSegmentStore(str(tmp_path))
+        assert reopened.get_stats()['records'] == 3
+
+    def test_legacy_files_migrate_once(self, tmp_path):
+        """Legacy whale_tx_*.json files move into segments without duplicates."""
+        from core.whale.whale_store import WhaleSegmentStore, whale_transaction_to_dict
+
+        for i in range(3):
+            whale = make_whale_transaction(f'legacy_{i}', datetime(2025, 1, 1, 10 + i, 30))
+            path = tmp_path / f"whale_tx_{whale.timestamp.strftime('%Y%m%d_%H%M%S')}_{whale.signature[:8]}.json"
+            path.write_text(json.dumps(whale_transaction_to_dict(whale), indent=2))
+
+        store = WhaleSegmentStore(str(tmp_path))
+        assert store.migrate_legacy_files(delete=False) == 3
+        assert store.migrate_legacy_files(delete=True) == 0
+        assert not list(tmp_path.glob('whale_tx_*.json'))
+
+        records = store.read(datetime(2025, 1, 1))
+        assert [r['signature'] for r in records] == ['legacy_0', 'legacy_1', 'legacy_2']
+
+
+class TestWhaleRollingAggregates:
+    """Test suite for rolling whale aggregates used by signal generation."""
+
+    def test_window_sums_match_rescan_after_eviction(self):
+        """Running sums equal a full rescan of the transactions still in the window."""
+        from datetime import timedelta
+        from core.whale.whale_aggregates import RollingWhaleWindow
+
+        now = datetime.now()
+        window = RollingWhaleWindow(timedelta(minutes=15))
+        transactions = [
+            make_whale_transaction(
+                f'sig_{i}', now - timedelta(minutes=30) + timedelta(seconds=20 * i), amount_sol=100.0 + i,
+                from_address=f'from_{i % 50}', to_address=f'to_{i % 70}',
+                exchange_name='Binance' if i % 3 == 0 else None, confidence_score=0.6 + (i % 4) * 0.1
+            )
+            for i in range(90)
+        ]
+        for tx in transactions:
+            window.add(tx)
+        window.advance(now)
+
+        live = [tx for tx in transactions if tx.timestamp > now - timedelta(minutes=15)]
+        assert window.count == len(live)
+        assert window.total_volume == pytest.approx(sum(tx.amount_sol for tx in live))
+        assert window.max_transaction_size == max(tx.amount_sol for tx in live)
+        assert window.accumulation == pytest.approx(
+            sum(tx.amount_sol for tx in live if not tx.is_exchange_related and tx.confidence_score > 0.7))
+        assert window.exchange_positive == pytest.approx(
+            sum(tx.amount_sol for tx in live if tx.is_exchange_related))
+
+        unique = len({tx.from_address for tx in live} | {tx.to_address for tx in live})
+        assert abs(window.unique_address_count(now) - unique) <= 0.15 * unique
+
+    def test_generator_ingests_each_transaction_once(self):
+        """Passing the growing history repeatedly only adds new transactions."""
+        from datetime import timedelta
+        from core.whale.whale_signal_generator import WhaleSignalGenerator
+
+        generator = WhaleSignalGenerator({})
+        now = datetime.now()
+        history = [make_whale_transaction(f'sig_{i}', now - timedelta(minutes=10 - i), amount_sol=100.0 + i)
+                   for i in range(5)]
+
+        generator.generate_signals(history[:3])
+        generator.generate_signals(history)
+
+        assert generator.aggregators['short'].count == 5
+        assert generator.aggregators['long'].total_volume == pytest.approx(sum(tx.amount_sol for tx in history))
+
+
+class TestWhaleAlertStore:
+    """Test suite for the bounded whale alert store."""
+
+    @staticmethod
+    def _alert(i, wallet, amount_sol=150.0, alert_level='info'):
+        from phase_4_deployment.data_router.enhanced_whale_watcher import WhaleAlert
+
+        return WhaleAlert(
+            signature=f'sig_{i}', timestamp=datetime.now(), whale_wallet=wallet, target_wallet='target',
+            amount_sol=amount_sol, amount_usd=amount_sol * 180, token_mint='SOL', transaction_type='swap',
+            confidence=0.9, market_impact='low', alert_level=alert_level
+        )
+
+    def test_ring_buffer_keeps_running_totals(self):
+        """Overwritten alerts leave the running totals and the ring stays at capacity."""
+        from phase_4_deployment.data_router.enhanced_whale_watcher import WhaleAlertStore
+
+        store = WhaleAlertStore(capacity=5)
+        for i in range(12):
+            store.add(self._alert(i, 'wallet', amount_sol=100.0 + i, alert_level='critical' if i % 2 else 'info'))
+
+        assert len(store) == 5
+        assert [alert.signature for alert in store.recent(3)] == ['sig_11', 'sig_10', 'sig_9']
+        assert store.average_sol == pytest.approx(sum(100.0 + i for i in range(7, 12)) / 5)
+        assert store.alert_levels == {'critical': 3, 'warning': 0, 'info': 2}
+
+    def test_wallet_index_evicts_least_recently_active(self):
+        """Cold wallets are evicted and per-wallet history is bounded."""
+        from phase_4_deployment.data_router.enhanced_whale_watcher import WhaleAlertStore
+
+        store = WhaleAlertStore(capacity=100, max_wallets=2, per_wallet_limit=3)
+        for i in range(5):
+            store.add(self._alert(i, 'hot'))
+        store.add(self._alert(5, 'cold'))
+        store.add(self._alert(6, 'hot'))
+        store.add(self._alert(7, 'new'))
+
+        assert list(store.wallets) == ['hot', 'new']
+        assert store.evicted_wallets == 1
+        assert [alert.signature for alert in store.wallet_history('hot')] == ['sig_3', 'sig_4', 'sig_6']
+        assert store.wallet_history('cold') == []
+
+    def test_capacity_must_be_positive(self):
+        """A store that can't hold a single alert is rejected."""
+        from phase_4_deployment.data_router.enhanced_whale_watcher import WhaleAlertStore
+
+        with pytest.raises(ValueError):
+            WhaleAlertStore(capacity=0)
+        assert WhaleAlertStore().capacity == 100
+
+
+class TestPriceServiceCache:
+    """Test single-flight, stale-while-revalidate and hedged price fetching."""
+
+    def _service(self):
+        from phase_4_deployment.utils.enhanced_price_service import EnhancedPriceService
+        service = EnhancedPriceService()
+        service.quicknode_enabled = True
+        service.quicknode_api_key = 'test-key'
+        service.coingecko_fallback = False
+        return service
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch_and_stale_is_served(self):
+        """Concurrent misses coalesce; expired entries are served while refreshing."""
+        service = self._service()
+        service.jupiter_fallback = False
+        calls = []
+
+        async def quicknode(token_address):
+            calls.append(token_address)
+            await asyncio.sleep(0.05)
+            return {'value': 150.0 + len(calls), 'source': 'quicknode'}
+
+        service._get_quicknode_price = quicknode
+
+        results = await asyncio.gather(*[service.get_token_price('SOL') for _ in range(10)])
+        assert len(calls) == 1
+        assert all(result['value'] == 151.0 for result in results)
+        assert service.cache_stats['coalesced'] == 9
+
+        # Expire the entry: the stale value is returned immediately and refreshed once
+        service.price_cache['SOL']['timestamp'] -= service.cache_duration + 1
+        stale = await service.get_token_price('SOL')
+        assert stale['value'] == 151.0
+        assert stale['stale'] is True
+        assert stale['age_seconds'] > service.cache_duration
+        await asyncio.sleep(0.1)
+        assert len(calls) == 2
+        fresh = await service.get_token_price('SOL')
+        assert fresh['value'] == 152.0
+        assert 'stale' not in fresh
+        assert service.get_stats()['stale_hits'] == 1
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_trading_callers_get_a_tighter_stale_bound(self):
+        """A price older than the caller's max_stale_age is fetched, not served stale."""
+        service = self._service()
+        service.jupiter_fallback = False
+        calls = []
+
+        async def quicknode(token_address):
+            calls.append(token_address)
+            return {'value': 150.0 + len(calls), 'source': 'quicknode'}
+
+        service._get_quicknode_price = quicknode
+
+        await service.get_token_price('SOL')
+        service.price_cache['SOL']['timestamp'] -= service.cache_duration + 60
+
+        # 60s past expiry is within the default bound but beyond the trading one
+        assert (await service.get_token_price('SOL'))['stale'] is True
+        result = await service.get_token_price('SOL', max_stale_age=service.trading_max_stale_age)
+        assert result['value'] == 152.0
+        assert 'stale' not in result
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_hedged_fetch_uses_faster_source(self):
+        """A slow primary source is hedged by the next one after the delay."""
+        service = self._service()
+        service.hedge_delay = 0.01
+
+        async def quicknode(token_address):
+            await asyncio.sleep(1.0)
+            return {'value': 1.0, 'source': 'quicknode'}
+
+        async def jupiter(token_address):
+            return {'value': 2.0, 'source': 'jupiter'}
+
+        service._get_quicknode_price = quicknode
+        service._get_jupiter_price = jupiter
+
+        start_time = time.time()
+        result = await service.get_token_price('TOKEN')
+        assert result['value'] == 2.0
+        assert time.time() - start_time < 0.5
+        assert service.price_cache['TOKEN']['source'] == 'jupiter'
+
+        stats = service.get_stats()['sources']
+        assert stats['jupiter']['wins'] == 1
+        await asyncio.sleep(0)
+        assert service.source_stats['quicknode']['cancelled'] == 1
+        await service.close()
+
+
+class TestBirdeyeConcurrentScanner:
+    """Test rate-limited concurrent scanning of a large token universe."""
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_spaces_out_bursts(self):
+        """Requests beyond the burst capacity wait for the sustained rate."""
+        from phase_4_deployment.apis.api_manager import TokenBucket
+
+        bucket = TokenBucket(rate=50.0, capacity=5)
+        start_time = time.time()
+        await asyncio.gather(*[bucket.acquire() for _ in range(15)])
+        elapsed = time.time() - start_time
+
+        # 5 immediate, 10 more at 50/s
+        assert 0.15 <= elapsed < 0.6
+        assert bucket.throttled == 10
+
+    @pytest.mark.asyncio
+    async def test_large_universe_batches_and_rescoring_is_incremental(self):
+        """500 tokens take 5 multi-price calls; unchanged tokens are not re-scored."""
+        from phase_4_deployment.data_router.birdeye_scanner import BirdeyeScanner
+
+        universe = {f"token_{i}": f"T{i}" for i in range(500)}
+        scanner = BirdeyeScanner('test_api_key', universe=universe, use_multi_price=True)
+
+        prices = {address: {'value': 1.0, 'priceChange24h': i % 20, 'volume24h': 60000} for i, address in enumerate(universe)}
+
+        async def multi_price(addresses):
+            return {address: dict(prices[address]) for address in addresses}
+
+        scanner.client.get_multiple_token_prices = AsyncMock(side_effect=multi_price)
+        scanner.client.get_token_price = AsyncMock(return_value=None)
+
+        opportunities = await scanner.scan_for_opportunities(limit=10)
+        assert scanner.client.get_multiple_token_prices.await_count == 5
+        assert len(opportunities) == 10
+        assert opportunities[0]['price_change_24h'] == 19
+        assert scanner.scan_stats['rescored'] == 500
+
+        prices['token_3']['priceChange24h'] = 90
+        opportunities = await scanner.scan_for_opportunities(limit=1)
+        assert opportunities[0]['token_address'] == 'token_3'
+        assert scanner.scan_stats['rescored'] == 501
+        assert scanner.scan_stats['unchanged'] == 499
+        scanner.client.get_token_price.assert_not_awaited()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
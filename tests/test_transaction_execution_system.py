@@ -462,5 +462,1036 @@ class TestTransactionSigning:
                 assert tx_builder.keypair == mock_keypair_instance
 
 
+class TestHedgedRpcRequests:
+    """Tests for RobustRpcManager latency histograms and hedged reads."""
+
+    @staticmethod
+    def _manager(endpoint_latencies, **config):
+        """Manager with two endpoints whose requests sleep (or raise) per endpoint."""
+        from core.execution.robust_rpc_manager import RobustRpcManager, RpcEndpoint
+
+        with patch.object(RobustRpcManager, '_health_monitor_loop', new=AsyncMock()), \
+                patch.dict(os.environ, {}, clear=True):
+            manager = RobustRpcManager({'hedged_requests': True, **config})
+
+        manager.endpoints = {
+            name: RpcEndpoint(name=name, url=f'https://{name}.rpc', priority=priority)
+            for priority, name in enumerate(endpoint_latencies, start=1)
+        }
+        manager.calls = []
+        manager.cancelled = []
+
+        async def single_request(endpoint, payload):
+            manager.calls.append(endpoint.name)
+            latency = endpoint_latencies[endpoint.name]
+            if isinstance(latency, Exception):
+                raise latency
+            try:
+                await asyncio.sleep(latency)
+            except asyncio.CancelledError:
+                manager.cancelled.append(endpoint.name)
+                raise
+            return {'jsonrpc': '2.0', 'id': 1, 'result': endpoint.name}
+
+        manager._make_single_request = single_request
+        return manager
+
+    def test_latency_histogram_percentiles(self):
+        """Percentiles come from the recent window; buckets cover every sample."""
+        from core.execution.robust_rpc_manager import LatencyHistogram
+
+        histogram = LatencyHistogram(window_size=100)
+        assert histogram.percentile(50) is None
+        for ms in range(1, 101):
+            histogram.record(ms / 1000)
+
+        assert histogram.percentile(0) == pytest.approx(1)
+        assert histogram.percentile(50) == pytest.approx(51)
+        assert histogram.percentile(95) == pytest.approx(95)
+        assert histogram.percentile(100) == pytest.approx(100)
+
+        exported = histogram.to_dict()
+        assert exported['count'] == 100
+        assert exported['mean_ms'] == pytest.approx(50.5)
+        assert sum(exported['buckets'].values()) == 100
+        assert exported['buckets']['le_100ms'] == 50
+
+        # Only the window feeds percentiles
+        for _ in range(100):
+            histogram.record(2.0)
+        assert histogram.percentile(50) == pytest.approx(2000)
+        assert histogram.to_dict()['count'] == 200
+
+    @pytest.mark.asyncio
+    async def test_hedge_fires_after_delay_and_cancels_loser(self):
+        """A slow primary is hedged after its p95 delay; the loser is cancelled."""
+        import time
+
+        manager = self._manager({'slow': 0.5, 'fast': 0.01}, hedge_min_delay=0.05, hedge_max_delay=1.0)
+        for _ in range(20):
+            manager.endpoints['slow'].latency.record(0.02)
+        assert manager._hedge_delay(manager.endpoints['slow']) == pytest.approx(0.05)
+
+        started = time.perf_counter()
+        result = await manager.make_request({'jsonrpc': '2.0', 'id': 1, 'method': 'getBalance', 'params': []})
+        elapsed = time.perf_counter() - started
+        await asyncio.sleep(0)
+
+        assert result['result'] == 'fast'
+        assert manager.calls == ['slow', 'fast']
+        assert 0.05 <= elapsed < 0.3
+        assert manager.cancelled == ['slow']
+        assert manager.hedged_request_count == 1
+        assert manager.hedge_win_count == 1
+
+        # A primary that answers within its delay is never hedged
+        fast_primary = self._manager({'quick': 0.01, 'backup': 0.01}, hedge_max_delay=0.2)
+        for _ in range(5):
+            fast_primary.endpoints['quick'].latency.record(0.01)
+        result = await fast_primary.make_request({'jsonrpc': '2.0', 'id': 1, 'method': 'getSlot', 'params': []})
+        assert result['result'] == 'quick'
+        assert fast_primary.calls == ['quick']
+        assert fast_primary.hedge_win_count == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_primary_falls_back_without_waiting(self):
+        """A failing primary hedges to the next endpoint at once; writes are never hedged."""
+        import time
+
+        manager = self._manager({'broken': ConnectionError('refused'), 'backup': 0.01}, hedge_max_delay=1.0)
+
+        started = time.perf_counter()
+        result = await manager.make_request({'jsonrpc': '2.0', 'id': 1, 'method': 'getBalance', 'params': []})
+        assert time.perf_counter() - started < 0.5
+
+        assert result['result'] == 'backup'
+        assert manager.calls == ['broken', 'backup']
+        assert manager.endpoints['broken'].consecutive_failures == 1
+        # Answering after the primary failed is failover, not a hedge win
+        assert manager.hedge_win_count == 0
+
+        # sendTransaction goes through plain sequential failover
+        manager.calls.clear()
+        result = await manager.make_request({'jsonrpc': '2.0', 'id': 2, 'method': 'sendTransaction', 'params': []})
+        assert result['result'] == 'backup'
+        assert manager.hedged_request_count == 1
+
+
+class TestBlockhashService:
+    """Tests for the background blockhash prefetcher."""
+
+    class _FakeRpc:
+        """Serves getLatestBlockhash; URLs listed in `failing` raise."""
+
+        def __init__(self, failing=()):
+            self.failing = set(failing)
+            self.calls = []
+            self.height = 1000
+            self.is_closed = False
+
+        async def post(self, url, json=None, **kwargs):
+            self.calls.append(url)
+            if url in self.failing:
+                raise ConnectionError(f"{url} unreachable")
+            self.height += 1
+            response = Mock()
+            response.raise_for_status = Mock()
+            response.json = Mock(return_value={'result': {
+                'context': {'slot': self.height},
+                'value': {'blockhash': f'hash{self.height}', 'lastValidBlockHeight': self.height + 150}
+            }})
+            return response
+
+        async def aclose(self):
+            self.is_closed = True
+
+    @pytest.mark.asyncio
+    async def test_prefetch_refresh_and_serve_from_cache(self):
+        """start() primes the cache, the poller refreshes it, reads need no I/O."""
+        from phase_4_deployment.rpc_execution.blockhash_service import BlockhashService
+
+        rpc = self._FakeRpc(failing={'https://down.rpc'})
+        service = BlockhashService(rpc_urls=['https://down.rpc', 'https://up.rpc'], poll_interval=0.02)
+        service.http_client = rpc
+
+        await service.start()
+        try:
+            # The failing endpoint is rotated away from on the first poll
+            assert rpc.calls == ['https://down.rpc', 'https://up.rpc']
+            assert service.latest.blockhash == 'hash1001'
+            assert service.metrics['poll_failures'] == 1
+
+            calls = len(rpc.calls)
+            first = service.get_blockhash()
+            assert first.blockhash == 'hash1001'
+            assert first.last_valid_block_height == 1151
+            assert service.get_blockhash() is first
+            assert len(rpc.calls) == calls
+            assert service.metrics['served'] == 2
+
+            await asyncio.sleep(0.1)
+            assert service.running
+            assert service.latest.blockhash != 'hash1001'
+            assert service.metrics['blockhash_changes'] >= 2
+            assert 'https://down.rpc' not in rpc.calls[calls:]
+        finally:
+            await service.stop()
+        assert rpc.is_closed
+        assert not service.running
+
+    @pytest.mark.asyncio
+    async def test_expiry_by_last_valid_block_height(self):
+        """Hashes near the end of their validity window are not handed out."""
+        import time
+        from phase_4_deployment.rpc_execution.blockhash_service import (
+            BlockhashService, CachedBlockhash, MAX_PROCESSING_AGE_BLOCKS, SLOT_TIME_SECONDS
+        )
+
+        rpc = self._FakeRpc()
+        service = BlockhashService(rpc_urls=['https://up.rpc'], min_remaining_blocks=30, max_age=60.0)
+        service.http_client = rpc
+
+        # Fetched 125 slots ago: only 25 of its 150 blocks remain
+        fetched_at = time.monotonic() - 125 * SLOT_TIME_SECONDS
+        service.latest = CachedBlockhash('old', 5150, 5000, fetched_at)
+        assert service.estimated_block_height() == 5150 - MAX_PROCESSING_AGE_BLOCKS + 125
+        assert not service.is_blockhash_valid(5150)
+        assert service.is_blockhash_valid(5150 + 10)
+        assert service.get_blockhash() is None
+        assert service.metrics['served_stale_rejected'] == 1
+
+        # The on-demand path replaces the expired hash
+        refreshed = await service.get_or_fetch_blockhash()
+        assert refreshed.blockhash == 'hash1001'
+        assert service.metrics['on_demand_fetches'] == 1
+        assert service.get_blockhash() is refreshed
+
+        # Age alone also expires a hash
+        service.max_age = 1.0
+        service.latest = CachedBlockhash('aged', 6000, 5850, time.monotonic() - 2.0)
+        assert service.is_blockhash_valid(6000)
+        assert service.get_blockhash() is None
+
+    @pytest.mark.asyncio
+    async def test_builder_uses_prefetched_hash_and_refetches_stale(self):
+        """The simplified build path takes its blockhash from the shared service."""
+        import time
+        from core.dex.simplified_native_builder import SimplifiedNativeBuilder
+        from phase_4_deployment.rpc_execution.blockhash_service import BlockhashService, CachedBlockhash
+
+        rpc = self._FakeRpc()
+        service = BlockhashService(rpc_urls=['https://up.rpc'])
+        service.http_client = rpc
+        service.latest = CachedBlockhash('prefetched', 5150, 5000, time.monotonic())
+        builder = SimplifiedNativeBuilder('wallet', blockhash_service=service)
+        signal = {'action': 'BUY', 'size': 0.1}
+
+        result = await builder.build_transaction(signal)
+        assert result['recent_blockhash'] == 'prefetched'
+        assert result['last_valid_block_height'] == 5150
+        assert result['blockhash_source'] == 'prefetched'
+        assert rpc.calls == []
+
+        # A stale cache costs one on-demand fetch
+        service.latest = CachedBlockhash('stale', 5150, 5000, time.monotonic() - 60.0)
+        result = await builder.build_transaction(signal)
+        assert result['recent_blockhash'] == 'hash1001'
+        assert result['blockhash_source'] == 'on_demand'
+        assert rpc.calls == ['https://up.rpc']
+
+        # No usable hash fails the build
+        rpc.failing.add('https://up.rpc')
+        service.latest = None
+        assert (await builder.build_transaction(signal))['success'] is False
+
+    def test_shared_service_takes_builder_endpoints(self, monkeypatch):
+        """Builders add their Helius endpoint to the process-wide service."""
+        from phase_4_deployment.rpc_execution import blockhash_service
+
+        for name in ('QUICKNODE_RPC_URL', 'HELIUS_RPC_URL', 'HELIUS_API_KEY'):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setattr(blockhash_service, '_blockhash_service', None)
+
+        service = blockhash_service.get_blockhash_service([blockhash_service.helius_rpc_url('builder-key')])
+        assert service.rpc_urls == ['https://mainnet.helius-rpc.com/?api-key=builder-key']
+        assert blockhash_service.get_blockhash_service([None]) is service
+        assert service.rpc_urls == ['https://mainnet.helius-rpc.com/?api-key=builder-key']
+
+
+class TestSignatureConfirmationTracker:
+    """Tests for the shared signature confirmation tracker."""
+
+    class _FakeRpc:
+        """Answers getSignatureStatuses from a dict of signature -> status."""
+
+        def __init__(self):
+            self.statuses = {}
+            self.is_closed = False
+
+        async def post(self, url, json=None, **kwargs):
+            value = [self.statuses.get(signature) for signature in json['params'][0]]
+            response = Mock()
+            response.raise_for_status = Mock()
+            response.json = Mock(return_value={'result': {'context': {'slot': 1}, 'value': value}})
+            return response
+
+        async def aclose(self):
+            self.is_closed = True
+
+    @pytest.mark.asyncio
+    async def test_one_waiter_timing_out_leaves_others_waiting(self):
+        """Concurrent waiters share one future; a short timeout only ends its own wait."""
+        from phase_4_deployment.rpc_execution.confirmation_tracker import SignatureConfirmationTracker
+
+        rpc = self._FakeRpc()
+        tracker = SignatureConfirmationTracker(rpc_urls=['https://rpc'], poll_interval=0.01)
+        tracker.ws_url = None
+        tracker.http_client = rpc
+
+        async def confirm_later():
+            await asyncio.sleep(0.15)
+            rpc.statuses['sig'] = {'slot': 42, 'confirmationStatus': 'confirmed', 'err': None}
+
+        try:
+            impatient, patient, _ = await asyncio.gather(
+                tracker.wait_for_confirmation('sig', timeout=0.05),
+                tracker.wait_for_confirmation('sig', timeout=2.0),
+                confirm_later()
+            )
+            assert impatient is None
+            assert patient == {'success': True, 'error': None, 'slot': 42, 'confirmation_status': 'confirmed'}
+            assert tracker.metrics['tracked'] == 1
+            assert tracker.metrics['timed_out'] == 1
+            assert tracker.metrics['confirmed'] == 1
+            assert tracker.waiters == {}
+
+            # Once the last waiter gives up the signature is no longer tracked
+            assert await tracker.wait_for_confirmation('lost', timeout=0.05) is None
+            assert tracker.pending == {}
+            assert tracker.waiters == {}
+        finally:
+            await tracker.close()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_wait_unsubscribes(self):
+        """A timed-out wait cancels its server-side signature subscription."""
+        from phase_4_deployment.rpc_execution.confirmation_tracker import SignatureConfirmationTracker
+
+        tracker = SignatureConfirmationTracker(rpc_urls=['https://rpc'], poll_interval=60.0)
+        tracker.ws_url = None
+        tracker.http_client = self._FakeRpc()
+        tracker.ws = Mock(send=AsyncMock())
+        tracker.ws_connected = True
+
+        async def acknowledge():
+            await asyncio.sleep(0.01)
+            request = json.loads(tracker.ws.send.call_args.args[0])
+            tracker._handle_ws_message({'jsonrpc': '2.0', 'id': request['id'], 'result': 77})
+
+        try:
+            result, _ = await asyncio.gather(tracker.wait_for_confirmation('sig', timeout=0.05), acknowledge())
+            await asyncio.sleep(0)
+
+            assert result is None
+            assert tracker._ws_subscriptions == {}
+            sent = [json.loads(call.args[0]) for call in tracker.ws.send.call_args_list]
+            assert [(m['method'], m['params'][0]) for m in sent] == [
+                ('signatureSubscribe', 'sig'), ('signatureUnsubscribe', 77)]
+        finally:
+            tracker.ws_connected = False
+            await tracker.close()
+
+
+class TestExecutionEngineScheduling:
+    """Test suite for the ExecutionEngine priority scheduler."""
+
+    @pytest.fixture
+    def signal(self):
+        """Minimal trading signal for scheduler tests."""
+        return {'action': 'BUY', 'market': 'SOL-USDC', 'size': 0.1}
+
+    @pytest.mark.asyncio
+    async def test_orders_dequeued_by_priority(self, signal):
+        """Higher priority orders run first, FIFO within a priority."""
+        from core.execution.execution_engine import ExecutionEngine
+        from core.execution.order_manager import OrderPriority
+
+        engine = ExecutionEngine()
+        low_id = await engine.submit_order(signal, priority=OrderPriority.LOW)
+        first_normal_id = await engine.submit_order(signal)
+        urgent_id = await engine.submit_order(dict(signal, priority='urgent'))
+        second_normal_id = await engine.submit_order(signal)
+
+        engine.running = True
+        dequeued = [(await engine._next_order()).order_id for _ in range(4)]
+
+        assert dequeued == [urgent_id, first_normal_id, second_normal_id, low_id]
+        assert await engine.get_order_status(low_id) is None
+
+    @pytest.mark.asyncio
+    async def test_retry_does_not_hold_execution_slot(self, signal):
+        """A failed order is parked in the retry queue and frees its slot."""
+        from core.execution.execution_engine import ExecutionEngine
+
+        engine = ExecutionEngine({'max_concurrent_executions': 1, 'retry_delay': 60.0})
+        engine.unified_tx_builder = Mock()
+        engine.unified_tx_builder.build_and_sign_transaction = AsyncMock(return_value=None)
+
+        await engine.start()
+        order_id = await engine.submit_order(signal)
+
+        for _ in range(50):
+            if engine.retry_queue:
+                break
+            await asyncio.sleep(0.01)
+
+        assert len(engine.retry_queue) == 1
+        assert (await engine.get_order_status(order_id))['status'] == 'pending'
+
+        # The single slot is free again, so a new order runs while the retry waits
+        await engine.submit_order(signal)
+        for _ in range(50):
+            if engine.execution_stats['failed_executions'] == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert engine.execution_stats['failed_executions'] == 2
+        assert len(engine.retry_queue) == 2
+
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_after_final_status_write(self, signal):
+        """stop() waits for in-flight status writes and persists parked retries before flushing."""
+        from core.execution.execution_engine import ExecutionEngine
+
+        calls = []
+
+        async def update_order(order):
+            await asyncio.sleep(0.05)
+            calls.append(('update', order.status.value))
+
+        async def flush():
+            calls.append(('flush', None))
+
+        async def hanging_build(signal):
+            await asyncio.sleep(10)
+
+        engine = ExecutionEngine({'execution_timeout': 0.05})
+        engine.unified_tx_builder = Mock()
+        engine.unified_tx_builder.build_and_sign_transaction = hanging_build
+        engine.order_manager = Mock(register_order=AsyncMock(), update_order=update_order, flush=flush)
+
+        await engine.start()
+        await engine.submit_order(signal)
+        while not engine.active_orders:
+            await asyncio.sleep(0.01)
+        await engine.stop()
+
+        # The timed-out order was parked for retry, so it is saved again as pending
+        assert calls == [('update', 'timeout'), ('update', 'pending'), ('flush', None)]
+        assert engine._loop_task is None
+        assert not engine._execution_tasks
+        engine.unified_tx_builder.on_execution_failed.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_dequeue_releases_slot(self, signal):
+        """An error while waiting for an order gives the reserved slot back."""
+        from core.execution.execution_engine import ExecutionEngine
+
+        engine = ExecutionEngine({'max_concurrent_executions': 1})
+        engine._next_order = AsyncMock(side_effect=[RuntimeError('queue broken'), None])
+
+        await engine.start()
+        while engine._next_order.await_count < 2:
+            await asyncio.sleep(0.05)
+        await engine.stop()
+
+        assert engine._execution_slots._value == 1
+
+
+class TestAtaRegistry:
+    """Test suite for the cached ATA existence registry."""
+
+    USDC_MINT = 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v'
+    SOL_MINT = 'So11111111111111111111111111111111111111112'
+
+    @pytest.fixture
+    def registry(self):
+        """Registry with a mocked RPC client reporting only the USDC ATA."""
+        from solders.pubkey import Pubkey
+        from core.dex.ata_registry import AtaRegistry
+
+        registry = AtaRegistry(Pubkey.from_string('J2FkQP683JsCsABxTCx7iGisdQZQPgFDMSvgPhGPE3bz'), rpc_url='http://rpc')
+        response = Mock()
+        response.json.return_value = {'result': {'value': [{'lamports': 2039280}, None]}}
+        registry.http_client = Mock(is_closed=False)
+        registry.http_client.post = AsyncMock(return_value=response)
+        return registry
+
+    @pytest.mark.asyncio
+    async def test_existence_checked_once_in_batch(self, registry):
+        """Both mints are resolved in one call and positives are cached."""
+        result = await registry.ensure_checked([self.USDC_MINT, self.SOL_MINT])
+
+        assert result == {self.USDC_MINT: True, self.SOL_MINT: False}
+        assert registry.http_client.post.await_count == 1
+        request = registry.http_client.post.call_args.kwargs['json']
+        assert request['method'] == 'getMultipleAccounts'
+        assert len(request['params'][0]) == 2
+
+        assert await registry.exists(self.USDC_MINT)
+        assert registry.http_client.post.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_swap_invalidates_cached_ata(self, registry):
+        """A missing-account failure sends every ATA of the swap back to one batched RPC check."""
+        registry.http_client.post.return_value.json.return_value = {
+            'result': {'value': [{'lamports': 2039280}, {'lamports': 2039280}]}
+        }
+        await registry.ensure_checked([self.USDC_MINT, self.SOL_MINT])
+
+        # Unrelated errors keep the cache
+        registry.observe_failure([self.USDC_MINT, self.SOL_MINT], 'Slippage tolerance exceeded')
+        assert registry.confirmed == {self.USDC_MINT, self.SOL_MINT}
+
+        # Solana's missing-account errors don't name the account
+        registry.observe_failure([self.USDC_MINT, self.SOL_MINT], 'Transaction simulation failed: AccountNotFound')
+        assert registry.confirmed == set()
+
+        await registry.ensure_checked([self.USDC_MINT, self.SOL_MINT])
+        assert registry.http_client.post.await_count == 2
+        assert registry.confirmed == {self.USDC_MINT, self.SOL_MINT}
+
+    @pytest.mark.asyncio
+    async def test_engine_failure_reaches_registry_through_unified_builder(self):
+        """ExecutionEngine failures reach the wallet's shared registry via UnifiedTransactionBuilder."""
+        from solders.pubkey import Pubkey
+        from core.dex.ata_registry import get_ata_registry, _ata_registries
+        from core.dex.unified_transaction_builder import UnifiedTransactionBuilder
+        from core.execution.execution_engine import ExecutionEngine
+
+        wallet = '9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM'
+        registry = get_ata_registry(Pubkey.from_string(wallet), rpc_url='http://rpc')
+        try:
+            registry.confirmed.update({self.USDC_MINT, self.SOL_MINT})
+            sol_ata = registry.get_address(self.SOL_MINT)
+
+            builder = UnifiedTransactionBuilder(wallet)
+            builder.build_and_sign_transaction = AsyncMock(return_value=b'tx')
+            executor = Mock()
+            executor.execute_transaction_with_bundles = AsyncMock(return_value={
+                'success': False, 'error': f'could not find account {sol_ata}'
+            })
+
+            engine = ExecutionEngine()
+            engine.unified_tx_builder = builder
+            engine.modern_executor = executor
+            await engine.submit_order({'action': 'BUY', 'market': 'SOL-USDC', 'size': 0.1})
+            engine.running = True
+            await engine._execute_order(await engine._next_order())
+
+            assert engine.execution_stats['failed_executions'] == 1
+            assert registry.confirmed == set()
+            assert registry.stats['invalidations'] == 2
+        finally:
+            _ata_registries.pop(wallet, None)
+
+
+class TestBatchedSQLiteWriter:
+    """Test suite for the shared batched SQLite writer."""
+
+    @pytest.mark.asyncio
+    async def test_order_updates_coalesce_into_one_row(self, tmp_path):
+        """Repeated updates to an order before a flush write a single row."""
+        from datetime import datetime
+        from core.execution.order_manager import OrderManager, Order, OrderStatus, OrderPriority
+        from core.execution.persistence import close_all_writers
+
+        manager = OrderManager({'db_path': str(tmp_path / 'orders.db'), 'db_flush_interval_ms': 60000})
+        await manager.initialize()
+
+        order = Order(
+            order_id='order_1', signal={'action': 'BUY'}, status=OrderStatus.PENDING,
+            priority=OrderPriority.NORMAL, created_at=datetime.now(), updated_at=datetime.now()
+        )
+        await manager.register_order(order)
+        order.status = OrderStatus.EXECUTING
+        await manager.update_order(order)
+
+        assert manager.writer.stats['rows_coalesced'] == 1
+        assert manager.writer.stats['rows_written'] == 0
+
+        rows = await manager.writer.fetchall('SELECT status FROM orders')
+        assert rows == [('executing',)]
+        assert manager.writer.stats['flushes'] == 1
+
+        await close_all_writers()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending_rows(self, tmp_path):
+        """Closing the writer (shutdown hook) persists queued rows."""
+        import sqlite3
+        from core.execution.persistence import BatchedSQLiteWriter
+
+        db_path = str(tmp_path / 'metrics.db')
+        writer = BatchedSQLiteWriter(db_path, batch_size=1000, flush_interval_ms=60000)
+        await writer.execute('CREATE TABLE t (value INTEGER)')
+        for i in range(10):
+            writer.enqueue('INSERT INTO t (value) VALUES (?)', (i,))
+        await writer.close()
+
+        with sqlite3.connect(db_path) as db:
+            assert db.execute('SELECT COUNT(*) FROM t').fetchone()[0] == 10
+            assert db.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self, tmp_path):
+        """Rows from a flush that fails to commit reach disk on the next flush."""
+        import sqlite3
+        from core.execution.persistence import BatchedSQLiteWriter
+
+        db_path = str(tmp_path / 'orders.db')
+        writer = BatchedSQLiteWriter(db_path, batch_size=1000, flush_interval_ms=60000)
+        await writer.execute('CREATE TABLE orders (order_id TEXT PRIMARY KEY, status TEXT)')
+        upsert = 'INSERT OR REPLACE INTO orders (order_id, status) VALUES (?, ?)'
+        writer.enqueue(upsert, ('order_1', 'pending'), key='order_1')
+        writer.enqueue(upsert, ('order_2', 'pending'), key='order_2')
+
+        executemany = writer.db.executemany
+        calls = {'count': 0}
+
+        async def locked_once(sql, rows):
+            calls['count'] += 1
+            if calls['count'] == 1:
+                raise sqlite3.OperationalError('database is locked')
+            return await executemany(sql, rows)
+
+        writer.db.executemany = locked_once
+        await writer.flush()
+
+        assert writer.stats['flush_errors'] == 1
+        assert writer.get_stats()['queued_rows'] == 2
+
+        # A newer update queued after the failure wins over the retried row
+        writer.enqueue(upsert, ('order_2', 'filled'), key='order_2')
+        await writer.flush()
+        await writer.close()
+
+        with sqlite3.connect(db_path) as db:
+            rows = db.execute('SELECT order_id, status FROM orders ORDER BY order_id').fetchall()
+        assert rows == [('order_1', 'pending'), ('order_2', 'filled')]
+        assert writer.stats['rows_dropped'] == 0
+
+    @pytest.mark.asyncio
+    async def test_queries_wait_for_running_flush(self, tmp_path):
+        """Direct statements don't use the connection while a flush holds it."""
+        from core.execution.persistence import BatchedSQLiteWriter
+
+        writer = BatchedSQLiteWriter(str(tmp_path / 'orders.db'), batch_size=1000, flush_interval_ms=60000)
+        await writer.execute('CREATE TABLE t (value INTEGER)')
+        writer.enqueue('INSERT INTO t (value) VALUES (?)', (1,))
+
+        async with writer._flush_lock:
+            query = asyncio.create_task(writer.fetchall('SELECT COUNT(*) FROM t'))
+            await asyncio.sleep(0.05)
+            assert not query.done()
+
+        assert await query == [(1,)]
+        await writer.close()
+
+
+class TestSlidingWindowStats:
+    """Test suite for constant-time execution window statistics."""
+
+    def test_window_expires_old_buckets(self):
+        """Observations leave the window once their bucket ages out."""
+        from core.utils.rolling_stats import SlidingWindowStats
+
+        window = SlidingWindowStats(window_seconds=60, num_buckets=60)
+        for i in range(120):
+            window.add(1.0 + i % 10, success=i % 4 != 0, timestamp=1000.0 + i)
+
+        stats = window.snapshot(now=1119.0)
+        assert stats.count == 60
+        assert stats.success == 45
+        assert window.snapshot(now=2000.0).count == 0
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Sketch quantiles stay within the configured relative error."""
+        from core.utils.rolling_stats import QuantileSketch
+
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        values = [0.001 * i for i in range(1, 10001)]
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert abs(sketch.quantile(q) - exact) / exact <= 0.011
+
+    @pytest.mark.asyncio
+    async def test_window_performance_by_method(self, tmp_path):
+        """Window statistics are available overall and per method."""
+        from core.execution.execution_metrics import ExecutionMetrics
+
+        metrics = ExecutionMetrics({'metrics_db_path': str(tmp_path / 'metrics.db')})
+        for i in range(20):
+            order = Mock(order_id=f'order_{i}', execution_time=0.5, signal={'action': 'BUY'},
+                         actual_value=1.0, fees_paid=0.001, slippage=None, error_message=None)
+            order.status.value = 'completed' if i % 2 else 'failed'
+            await metrics.record_execution(order, {'execution_method': 'jito' if i < 5 else 'rpc'})
+
+        overall = metrics.get_window_performance('5min')
+        assert overall['total_executions'] == 20
+        assert overall['success_rate_pct'] == 50.0
+        assert overall['p95_execution_time'] == pytest.approx(0.5, rel=0.02)
+
+        assert metrics.get_window_performance('1min', method='jito')['total_executions'] == 5
+        assert metrics.get_method_performance()['rpc']['total_executions'] == 15
+
+
+
+class TestTradeJournal:
+    """Tests for the append-only trade journal and its readers."""
+
+    @staticmethod
+    def _trade(i, success=True, balance_change=0.001, timestamp=None):
+        from datetime import datetime
+        return {
+            'timestamp': timestamp or datetime(2025, 6, 1, 12, 0, i).isoformat(),
+            'signal': {'action': 'BUY', 'market': 'SOL-USDC', 'size': 0.1, 'source': 'momentum_sol_usdc',
+                       'position_info': {'position_size_usd': 15.0}, 'regime_info': {'regime': 'ranging'}},
+            'result': {'success': success, 'signature': f'sig{i:030d}' if success else None, 'fee_sol': 0.000005},
+            'execution_time': 0.5,
+            'balance_validation': {'balance_before': 1.0, 'balance_after': 1.0 + balance_change,
+                                   'balance_change': balance_change}
+        }
+
+    def test_readers_only_read_new_trades(self, tmp_path):
+        """Readers tail the journal and resume from the aggregates snapshot."""
+        from core.execution.trade_journal import TradeJournal, TradeJournalReader
+
+        trades_dir = str(tmp_path)
+        journal = TradeJournal(trades_dir, fsync_every=3, fsync_interval=3600)
+        reader = TradeJournalReader(trades_dir, use_snapshot=False)
+
+        for i in range(4):
+            journal.append(self._trade(i, success=i != 3))
+        assert journal.stats['fsyncs'] == 1
+        assert len(reader.poll()) == 4
+        assert reader.poll() == []
+
+        journal.append(self._trade(4))
+        bytes_read = reader.stats['bytes_read']
+        assert [trade['timestamp'][-2:] for trade in reader.poll()] == ['04']
+        assert reader.stats['bytes_read'] - bytes_read < 1000
+
+        # A torn last line is left for the next poll
+        with open(journal.path, 'ab') as f:
+            f.write(b'{"timestamp": "2025-06-01T12:00:05"')
+        assert reader.poll() == []
+
+        aggregates = reader.aggregates
+        assert aggregates.trades == 5
+        assert aggregates.successful == 4
+        assert aggregates.win_rate == 80.0
+        assert aggregates.volume_sol == pytest.approx(0.5)
+        assert aggregates.pnl_sol == pytest.approx(0.005)
+        assert aggregates.fees_sol == pytest.approx(0.000025)
+        assert aggregates.last_balance_sol == pytest.approx(1.001)
+
+        # A fresh reader starts from the snapshot written at the last fsync
+        journal.flush()
+        with open(journal.path, 'ab') as f:
+            f.write(b'\n')
+        snapshot_reader = TradeJournalReader(trades_dir)
+        snapshot_reader.poll()
+        assert snapshot_reader.stats['snapshot_loaded']
+        assert snapshot_reader.stats['records_read'] == 0
+        assert snapshot_reader.aggregates.to_dict() == aggregates.to_dict()
+        journal.close()
+
+    def test_idle_append_fsynced_within_interval(self, tmp_path):
+        """The last append before an idle period is fsynced by the timer."""
+        import time
+        from core.execution.trade_journal import TradeJournal
+
+        journal = TradeJournal(str(tmp_path), fsync_every=100, fsync_interval=0.05)
+        journal.append(self._trade(0))
+        assert journal.stats['fsyncs'] == 0
+
+        for _ in range(50):
+            if journal.stats['fsyncs']:
+                break
+            time.sleep(0.01)
+
+        assert journal.stats['fsyncs'] == 1
+        assert journal.get_stats()['pending_fsync'] == 0
+        with open(journal.aggregates_path) as f:
+            assert json.load(f)['aggregates']['trades'] == 1
+        journal.close()
+
+    def test_legacy_migration_tail_and_window(self, tmp_path):
+        """Legacy trade files seed the journal; read_last and windows stay cheap."""
+        from core.execution.trade_journal import TradeJournal, TradeJournalReader, SessionAggregates
+
+        for i in range(12):
+            with open(tmp_path / f'trade_20250601_1200{i:02d}.json', 'w') as f:
+                json.dump(self._trade(i), f)
+
+        reader = TradeJournalReader(str(tmp_path), use_snapshot=False)
+        assert len(reader.poll()) == 12
+
+        journal = TradeJournal(str(tmp_path))
+        assert journal.sequence == 12
+        journal.append(self._trade(12, success=False))
+        journal.close()
+
+        last = reader.read_last(3, chunk_size=64)
+        assert [trade['timestamp'][-2:] for trade in last] == ['10', '11', '12']
+        assert reader.read_last(100)[0]['timestamp'].endswith('00')
+
+        window = SessionAggregates()
+        trades = reader.read_last(13)
+        for trade in trades:
+            window.add(trade)
+        for trade in trades[:10]:
+            window.remove(trade)
+        assert window.trades == 3
+        assert window.successful == 2
+        assert window.strategies == {'momentum_sol_usdc': 3}
+        assert window.volume_usd == pytest.approx(45.0)
+
+        # Like the original dashboard count, any signature on a success is verified
+        short = self._trade(13)
+        short['result']['signature'] = 'sim_tx'
+        window.add(short)
+        assert window.verified_signatures == 3
+
+    def test_pnl_reporter_counts_journal_trades_once(self, tmp_path):
+        """Trades in both the journal and a tx_history file are reported once."""
+        from core.execution.trade_journal import TradeJournal, TradeJournalReader
+        from phase_4_deployment.utils.pnl_reporter import PnLReporter
+
+        trades_dir = tmp_path / 'trades'
+        tx_history_dir = tmp_path / 'transactions'
+        tx_history_dir.mkdir()
+        journal = TradeJournal(str(trades_dir))
+        for i in range(2):
+            journal.append(self._trade(i))
+        journal.flush()
+
+        reporter = PnLReporter('token', 'chat')
+        reporter.trade_reader = TradeJournalReader(str(trades_dir), use_snapshot=False)
+        reporter.tx_history_dir = str(tx_history_dir)
+        with open(tx_history_dir / 'tx_history_20250601.json', 'w') as f:
+            json.dump({'transactions': [
+                {'signature': f'sig{0:030d}', 'timestamp': 1.0, 'status': 'confirmed'},
+                {'signature': 'other_signature', 'timestamp': 2.0, 'status': 'confirmed'},
+                {'signature': 'other_signature', 'timestamp': 2.0, 'status': 'confirmed'}
+            ]}, f)
+
+        transactions = reporter.load_transaction_history()
+        signatures = [tx['signature'] for tx in transactions]
+        assert sorted(signatures) == sorted([f'sig{0:030d}', f'sig{1:030d}', 'other_signature'])
+        # The journal copy of a shared trade wins
+        assert next(tx for tx in transactions if tx['signature'] == f'sig{0:030d}')['type'] == 'swap'
+        journal.close()
+
+
+class TestBundleStatusTracker:
+    """Tests for batched Jito bundle status polling."""
+
+    class _FakeBlockEngine:
+        """Answers getBundleStatuses from a dict of bundle ID -> status entry."""
+
+        def __init__(self):
+            self.statuses = {}
+            self.calls = []
+            self.is_closed = False
+
+        async def post(self, url, json=None, **kwargs):
+            bundle_ids = json['params'][0]
+            self.calls.append(bundle_ids)
+            value = [self.statuses.get(bundle_id) for bundle_id in bundle_ids]
+            response = Mock()
+            response.raise_for_status = Mock()
+            response.json = Mock(return_value={'jsonrpc': '2.0', 'id': 1,
+                                               'result': {'context': {'slot': 1}, 'value': value}})
+            return response
+
+    @pytest.mark.asyncio
+    async def test_pending_bundles_share_batched_polls(self):
+        """Seven pending bundles are polled with two calls per tick, at most 5 IDs each."""
+        from phase_4_deployment.rpc_execution.bundle_tracker import BundleStatusTracker
+
+        engine = self._FakeBlockEngine()
+        tracker = BundleStatusTracker('https://block-engine/api/v1/bundles', http_client=engine)
+        futures = {f'bundle{i}': tracker.track(f'bundle{i}') for i in range(7)}
+
+        engine.statuses['bundle1'] = {'bundle_id': 'bundle1', 'slot': 42, 'transactions': ['sig1'],
+                                      'confirmation_status': 'processed', 'err': {'Ok': None}}
+        assert await tracker.poll_once() == 0
+        assert [len(call) for call in engine.calls] == [5, 2]
+
+        engine.statuses['bundle1']['confirmation_status'] = 'confirmed'
+        engine.statuses['bundle6'] = {'bundle_id': 'bundle6', 'slot': 43, 'transactions': ['sig6'],
+                                      'confirmation_status': 'processed', 'err': {'Err': 'BundleReverted'}}
+        assert await tracker.poll_once() == 2
+
+        landed = futures['bundle1'].result()
+        assert landed['status'] == 'confirmed'
+        assert landed['slot'] == 42
+        assert landed['transactions'] == ['sig1']
+        assert landed['landing_time'] >= 0
+        assert futures['bundle6'].result()['status'] == 'failed'
+        assert futures['bundle6'].result()['error'] == {'Err': 'BundleReverted'}
+
+        # Resolved bundles leave the batch
+        engine.calls.clear()
+        await tracker.poll_once()
+        assert engine.calls == [['bundle0', 'bundle2', 'bundle3', 'bundle4', 'bundle5']]
+        status = tracker.get_status()
+        assert status['pending'] == 5
+        assert status['landed'] == 1
+        assert status['failed'] == 1
+        assert status['max_landing_time'] >= status['average_landing_time'] >= 0
+        await tracker.close()
+        assert all(future.cancelled() for name, future in futures.items() if name not in ('bundle1', 'bundle6'))
+
+    @pytest.mark.asyncio
+    async def test_wait_for_bundle_resolves_from_poll_loop(self):
+        """Concurrent waiters resolve from the shared loop; unknown bundles time out."""
+        from phase_4_deployment.rpc_execution.bundle_tracker import BundleStatusTracker
+
+        engine = self._FakeBlockEngine()
+        tracker = BundleStatusTracker('https://block-engine/api/v1/bundles', http_client=engine,
+                                      poll_interval=0.01)
+
+        async def land_later():
+            await asyncio.sleep(0.05)
+            for bundle_id in ('a', 'b'):
+                engine.statuses[bundle_id] = {'bundle_id': bundle_id, 'slot': 7, 'transactions': [f'sig-{bundle_id}'],
+                                              'confirmation_status': 'finalized', 'err': {'Ok': None}}
+
+        results = await asyncio.gather(
+            tracker.wait_for_bundle('a', timeout=2.0),
+            tracker.wait_for_bundle('b', timeout=2.0),
+            tracker.wait_for_bundle('missing', timeout=0.2),
+            land_later()
+        )
+        try:
+            assert [result['status'] for result in results[:3]] == ['confirmed', 'confirmed', 'timeout']
+            # Every poll covered all pending bundles in a single call
+            assert all(len(call) <= 3 for call in engine.calls)
+            assert any(len(call) == 3 for call in engine.calls)
+            status = tracker.get_status()
+            assert status['landed'] == 2
+            assert status['timed_out'] == 1
+            assert status['pending'] == 0
+            assert status['average_landing_time'] >= 0.05
+        finally:
+            await tracker.close()
+
+    @pytest.mark.asyncio
+    async def test_one_waiter_timing_out_leaves_others_waiting(self):
+        """A short timeout on one waiter doesn't cancel the bundle for the others."""
+        from phase_4_deployment.rpc_execution.bundle_tracker import BundleStatusTracker
+
+        engine = self._FakeBlockEngine()
+        tracker = BundleStatusTracker('https://block-engine/api/v1/bundles', http_client=engine,
+                                      poll_interval=0.01)
+
+        async def land_later():
+            await asyncio.sleep(0.15)
+            engine.statuses['shared'] = {'bundle_id': 'shared', 'slot': 9, 'transactions': ['sig'],
+                                         'confirmation_status': 'confirmed', 'err': {'Ok': None}}
+
+        try:
+            impatient, patient, _ = await asyncio.gather(
+                tracker.wait_for_bundle('shared', timeout=0.05),
+                tracker.wait_for_bundle('shared', timeout=2.0),
+                land_later()
+            )
+            assert impatient['status'] == 'timeout'
+            assert patient['status'] == 'confirmed'
+            assert tracker.metrics['tracked'] == 1
+            assert tracker.metrics['landed'] == 1
+            assert tracker.waiters == {}
+
+            # Once the last waiter gives up the bundle is no longer polled
+            assert (await tracker.wait_for_bundle('never', timeout=0.05))['status'] == 'timeout'
+            assert tracker.pending == {}
+            assert tracker.waiters == {}
+        finally:
+            await tracker.close()
+
+    @pytest.mark.asyncio
+    async def test_landing_time_measured_from_submission(self):
+        """Landing latency counts from the sendBundle time passed by the caller."""
+        import time
+        from phase_4_deployment.rpc_execution.bundle_tracker import BundleStatusTracker
+
+        engine = self._FakeBlockEngine()
+        tracker = BundleStatusTracker('https://block-engine/api/v1/bundles', http_client=engine)
+        future = tracker.track('sent', submitted_at=time.time() - 5.0)
+        engine.statuses['sent'] = {'bundle_id': 'sent', 'slot': 3, 'transactions': ['sig'],
+                                   'confirmation_status': 'confirmed', 'err': {'Ok': None}}
+
+        assert await tracker.poll_once() == 1
+        assert future.result()['landing_time'] >= 5.0
+        await tracker.close()
+
+    @pytest.mark.asyncio
+    async def test_polls_wait_for_rate_limiter(self):
+        """Every getBundleStatuses call waits for the shared Jito rate limiter."""
+        from phase_4_deployment.rpc_execution.bundle_tracker import BundleStatusTracker
+
+        engine = self._FakeBlockEngine()
+        limiter = AsyncMock()
+        tracker = BundleStatusTracker('https://block-engine/api/v1/bundles', http_client=engine,
+                                      rate_limiter=limiter)
+        for i in range(7):
+            tracker.track(f'bundle{i}')
+
+        await tracker.poll_once()
+        assert len(engine.calls) == 2
+        assert limiter.await_count == 2
+        await tracker.close()
+
+    @pytest.mark.asyncio
+    async def test_unawaited_bundles_expire(self):
+        """A tracked bundle nobody resolves stops being polled after max_pending_age."""
+        import time
+        from phase_4_deployment.rpc_execution.bundle_tracker import BundleStatusTracker
+
+        engine = self._FakeBlockEngine()
+        tracker = BundleStatusTracker('https://block-engine/api/v1/bundles', http_client=engine,
+                                      max_pending_age=60.0)
+        stale = tracker.track('stale', submitted_at=time.time() - 61.0)
+        fresh = tracker.track('fresh')
+
+        assert await tracker.poll_once() == 1
+        assert stale.result()['status'] == 'timeout'
+        assert not fresh.done()
+        assert engine.calls == [['fresh']]
+        assert tracker.metrics['expired'] == 1
+        assert 'stale' not in tracker.submitted_at
+        await tracker.close()
+
+    def test_bundle_tracker_is_shared(self, monkeypatch):
+        """All callers get the same tracker; a later limiter fills in a missing one."""
+        from phase_4_deployment.rpc_execution import bundle_tracker
+
+        monkeypatch.setattr(bundle_tracker, '_bundle_tracker', None)
+        limiter = AsyncMock()
+        first = bundle_tracker.get_bundle_tracker('https://block-engine/api/v1/bundles')
+        second = bundle_tracker.get_bundle_tracker('https://other/api/v1/bundles', rate_limiter=limiter)
+
+        assert first is second
+        assert first.status_url == 'https://block-engine/api/v1/bundles'
+        assert first.rate_limiter is limiter
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])